@@ -0,0 +1,93 @@
+"""This series of tests illustrates the startup cost of a process which
+makes use of only a few classes within a very large mapped model.
+
+The model is generated at setup time as a series of small clusters of
+classes, each cluster consisting of a "parent" class with several
+"child" classes linked to it via a many-to-one relationship with a backref.
+Configuring all mappers up front is compared to incremental configuration,
+where only the cluster of classes which are actually used is configured.
+
+"""
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import clear_mappers
+from sqlalchemy.orm import configure_incrementally
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from . import Profiler
+
+
+Profiler.init("large_model_startup", num=2000)
+
+CLUSTER_SIZE = 10
+
+classes = None
+
+
+@Profiler.setup
+def setup_model(dburl, echo, num):
+    global classes
+
+    clear_mappers()
+    configure_incrementally(False)
+
+    Base = declarative_base()
+    classes = []
+
+    for index in range(num):
+        parent_index = index - index % CLUSTER_SIZE
+        name = "Entity%d" % index
+        attrs = {
+            "__tablename__": "entity_%d" % index,
+            "id": Column(Integer, primary_key=True),
+            "data": Column(String(50)),
+        }
+        if index != parent_index:
+            attrs["parent_id"] = Column(
+                ForeignKey("entity_%d.id" % parent_index)
+            )
+            attrs["parent"] = relationship(
+                "Entity%d" % parent_index, backref="children_%d" % index
+            )
+        classes.append(type(name, (Base,), attrs))
+
+
+def _use_two_classes():
+    first, second = classes[0], classes[1]
+    session = Session()
+    session.query(first).join(first.children_1).filter(
+        second.data == "x"
+    ).statement.compile()
+    first(data="d1")
+    second(data="d2")
+
+
+@Profiler.profile
+def test_configure_all(n):
+    """Configure all mappers up front, then use two classes."""
+
+    configure_mappers()
+    _use_two_classes()
+
+
+@Profiler.profile
+def test_configure_on_first_use(n):
+    """Configure all mappers on first use of two classes."""
+
+    _use_two_classes()
+
+
+@Profiler.profile
+def test_configure_incrementally(n):
+    """Configure only the mappers reachable from two classes in use."""
+
+    configure_incrementally()
+    _use_two_classes()
+
+
+if __name__ == "__main__":
+    Profiler.main()
@@ -0,0 +1,487 @@
+/*
+attributes.c
+Copyright (C) 2005-2020 the SQLAlchemy authors and contributors <see AUTHORS file>
+
+This module is part of SQLAlchemy and is released under
+the MIT License: http://www.opensource.org/licenses/mit-license.php
+*/
+
+#include <Python.h>
+
+#define MODULE_NAME "cattributes"
+#define MODULE_DOC "Module containing C versions of ORM attribute descriptors."
+
+/*
+ * The names used by the descriptor are looked up within the namespace of
+ * the sqlalchemy.orm.attributes module each time they are needed, so that
+ * alternate instance_state() / instance_dict() lookups installed by
+ * sqlalchemy.ext.instrumentation take effect.
+ */
+static PyObject *sqlalchemy_orm_attributes = NULL;
+static PyObject *attributes_namespace = NULL;
+
+static PyObject *str_instance_state = NULL;
+static PyObject *str_instance_dict = NULL;
+static PyObject *str_ScalarAttributeImpl = NULL;
+static PyObject *str_NO_VALUE = NULL;
+static PyObject *str_impl = NULL;
+static PyObject *str_key = NULL;
+static PyObject *str__supports_population = NULL;
+static PyObject *str_get = NULL;
+static PyObject *str_set = NULL;
+static PyObject *str_delete = NULL;
+static PyObject *str_dispatch = NULL;
+static PyObject *str__active_history = NULL;
+static PyObject *str_send_modified_events = NULL;
+static PyObject *str_session_id = NULL;
+static PyObject *str__strong_obj = NULL;
+static PyObject *str_modified = NULL;
+static PyObject *str_committed_state = NULL;
+static PyObject *str__last_known_values = NULL;
+static PyObject *str__modified_event = NULL;
+
+
+/* Return a borrowed reference to a name within the attributes module. */
+static PyObject *
+attributes_name(PyObject *name)
+{
+    PyObject *module, *value;
+
+    if (attributes_namespace == NULL) {
+        module = PyImport_ImportModule("sqlalchemy.orm.attributes");
+        if (module == NULL)
+            return NULL;
+        sqlalchemy_orm_attributes = module;
+        attributes_namespace = PyModule_GetDict(module);
+    }
+
+    value = PyDict_GetItem(attributes_namespace, name);
+    if (value == NULL && !PyErr_Occurred())
+        PyErr_SetObject(PyExc_NameError, name);
+    return value;
+}
+
+/* Call instance_state(instance) or instance_dict(instance). */
+static PyObject *
+call_lookup(PyObject *name, PyObject *instance)
+{
+    PyObject *fn;
+
+    fn = attributes_name(name);
+    if (fn == NULL)
+        return NULL;
+    return PyObject_CallFunctionObjArgs(fn, instance, NULL);
+}
+
+/* Return the truth value of obj.name, or -1 on error. */
+static int
+attr_is_true(PyObject *obj, PyObject *name)
+{
+    PyObject *value;
+    int result;
+
+    value = PyObject_GetAttr(obj, name);
+    if (value == NULL)
+        return -1;
+    result = PyObject_IsTrue(value);
+    Py_DECREF(value);
+    return result;
+}
+
+/* Return a new reference to dict_[key], or NULL with no exception set
+ * if the key is not present. */
+static PyObject *
+dict_lookup(PyObject *dict_, PyObject *key)
+{
+    PyObject *value;
+    int contains;
+
+    if (PyDict_CheckExact(dict_)) {
+        value = PyDict_GetItem(dict_, key);
+        Py_XINCREF(value);
+        return value;
+    }
+
+    contains = PySequence_Contains(dict_, key);
+    if (contains != 1)
+        return NULL;
+    return PyObject_GetItem(dict_, key);
+}
+
+
+/*
+ * Equivalent to InstanceState._modified_event(dict_, impl, previous) for a
+ * scalar, non-collection attribute.  The attribute-level bookkeeping is
+ * done here; when the state itself must be flagged as modified, the
+ * Python method is called in full.
+ */
+static int
+scalar_modified_event(PyObject *state, PyObject *dict_, PyObject *impl,
+                      PyObject *key, PyObject *previous)
+{
+    PyObject *session_id, *strong_obj, *committed_state, *last_known;
+    PyObject *no_value, *result;
+    int has_session, modified, send_events, contains;
+
+    session_id = PyObject_GetAttr(state, str_session_id);
+    if (session_id == NULL)
+        return -1;
+    has_session = PyObject_IsTrue(session_id);
+    Py_DECREF(session_id);
+    if (has_session < 0)
+        return -1;
+
+    strong_obj = PyObject_GetAttr(state, str__strong_obj);
+    if (strong_obj == NULL)
+        return -1;
+    Py_DECREF(strong_obj);
+
+    modified = attr_is_true(state, str_modified);
+    if (modified < 0)
+        return -1;
+
+    if ((has_session && strong_obj == Py_None) || !modified) {
+        result = PyObject_CallMethodObjArgs(
+            state, str__modified_event, dict_, impl, previous, NULL);
+        if (result == NULL)
+            return -1;
+        Py_DECREF(result);
+        return 0;
+    }
+
+    send_events = attr_is_true(impl, str_send_modified_events);
+    if (send_events <= 0)
+        return send_events;
+
+    committed_state = PyObject_GetAttr(state, str_committed_state);
+    if (committed_state == NULL)
+        return -1;
+    contains = PySequence_Contains(committed_state, key);
+    if (contains == 0)
+        contains = PyObject_SetItem(committed_state, key, previous);
+    Py_DECREF(committed_state);
+    if (contains < 0)
+        return -1;
+
+    last_known = PyObject_GetAttr(state, str__last_known_values);
+    if (last_known == NULL)
+        return -1;
+    contains = PySequence_Contains(last_known, key);
+    if (contains == 1) {
+        no_value = attributes_name(str_NO_VALUE);
+        if (no_value == NULL)
+            contains = -1;
+        else
+            contains = PyObject_SetItem(last_known, key, no_value);
+    }
+    Py_DECREF(last_known);
+    if (contains < 0)
+        return -1;
+
+    return 0;
+}
+
+/*
+ * Equivalent to ScalarAttributeImpl.set(state, dict_, value, None) for
+ * an attribute that has no "set" listeners and no active history.
+ * Returns 1 if the set was performed, 0 if the Python implementation must
+ * be used instead, or -1 on error.
+ */
+static int
+scalar_set(PyObject *impl, PyObject *state, PyObject *dict_, PyObject *value)
+{
+    PyObject *scalar_cls, *dispatch, *listeners, *key, *old, *no_value;
+    int use_python, result;
+
+    scalar_cls = attributes_name(str_ScalarAttributeImpl);
+    if (scalar_cls == NULL)
+        return -1;
+    if ((PyObject *)Py_TYPE(impl) != scalar_cls)
+        return 0;
+
+    dispatch = PyObject_GetAttr(impl, str_dispatch);
+    if (dispatch == NULL)
+        return -1;
+    use_python = attr_is_true(dispatch, str__active_history);
+    if (use_python == 0) {
+        listeners = PyObject_GetAttr(dispatch, str_set);
+        if (listeners == NULL)
+            use_python = -1;
+        else {
+            use_python = PyObject_IsTrue(listeners);
+            Py_DECREF(listeners);
+        }
+    }
+    Py_DECREF(dispatch);
+    if (use_python != 0)
+        return use_python < 0 ? -1 : 0;
+
+    no_value = attributes_name(str_NO_VALUE);
+    if (no_value == NULL)
+        return -1;
+
+    key = PyObject_GetAttr(impl, str_key);
+    if (key == NULL)
+        return -1;
+
+    old = dict_lookup(dict_, key);
+    if (old == NULL) {
+        if (PyErr_Occurred()) {
+            Py_DECREF(key);
+            return -1;
+        }
+        Py_INCREF(no_value);
+        old = no_value;
+    }
+
+    result = scalar_modified_event(state, dict_, impl, key, old);
+    Py_DECREF(old);
+    if (result == 0)
+        result = PyObject_SetItem(dict_, key, value);
+    Py_DECREF(key);
+    return result < 0 ? -1 : 1;
+}
+
+
+/****************************
+ * BaseInstrumentedAttribute *
+ ****************************/
+
+static PyObject *
+BaseInstrumentedAttribute_get(PyObject *self, PyObject *instance,
+                              PyObject *owner)
+{
+    PyObject *dict_, *key, *value, *state, *impl;
+    int supports_population;
+
+    if (instance == NULL || instance == Py_None) {
+        Py_INCREF(self);
+        return self;
+    }
+
+    dict_ = call_lookup(str_instance_dict, instance);
+    if (dict_ == NULL)
+        return NULL;
+
+    supports_population = attr_is_true(self, str__supports_population);
+    if (supports_population < 0) {
+        Py_DECREF(dict_);
+        return NULL;
+    }
+
+    if (supports_population) {
+        key = PyObject_GetAttr(self, str_key);
+        if (key == NULL) {
+            Py_DECREF(dict_);
+            return NULL;
+        }
+        value = dict_lookup(dict_, key);
+        Py_DECREF(key);
+        if (value != NULL || PyErr_Occurred()) {
+            Py_DECREF(dict_);
+            return value;
+        }
+    }
+
+    state = call_lookup(str_instance_state, instance);
+    if (state == NULL) {
+        Py_DECREF(dict_);
+        return NULL;
+    }
+
+    impl = PyObject_GetAttr(self, str_impl);
+    if (impl == NULL) {
+        value = NULL;
+    }
+    else {
+        value = PyObject_CallMethodObjArgs(impl, str_get, state, dict_, NULL);
+        Py_DECREF(impl);
+    }
+    Py_DECREF(state);
+    Py_DECREF(dict_);
+    return value;
+}
+
+static int
+BaseInstrumentedAttribute_set(PyObject *self, PyObject *instance,
+                              PyObject *value)
+{
+    PyObject *state, *dict_, *impl, *result;
+    int done;
+
+    state = call_lookup(str_instance_state, instance);
+    if (state == NULL)
+        return -1;
+
+    dict_ = call_lookup(str_instance_dict, instance);
+    if (dict_ == NULL) {
+        Py_DECREF(state);
+        return -1;
+    }
+
+    impl = PyObject_GetAttr(self, str_impl);
+    if (impl == NULL) {
+        Py_DECREF(dict_);
+        Py_DECREF(state);
+        return -1;
+    }
+
+    if (value == NULL) {
+        /* __delete__ */
+        done = 1;
+        result = PyObject_CallMethodObjArgs(
+            impl, str_delete, state, dict_, NULL);
+    }
+    else {
+        done = scalar_set(impl, state, dict_, value);
+        if (done == 0) {
+            done = 1;
+            result = PyObject_CallMethodObjArgs(
+                impl, str_set, state, dict_, value, Py_None, NULL);
+        }
+        else {
+            result = Py_None;
+            Py_INCREF(result);
+        }
+    }
+
+    Py_DECREF(impl);
+    Py_DECREF(dict_);
+    Py_DECREF(state);
+
+    if (done < 0 || result == NULL) {
+        Py_XDECREF(result);
+        return -1;
+    }
+    Py_DECREF(result);
+    return 0;
+}
+
+
+static PyTypeObject BaseInstrumentedAttributeType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "sqlalchemy.cattributes.BaseInstrumentedAttribute",  /* tp_name */
+    sizeof(PyObject),                   /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    0,                                  /* tp_dealloc */
+    0,                                  /* tp_print */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_compare */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    0,                                  /* tp_getattro */
+    0,                                  /* tp_setattro */
+    0,                                  /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,               /* tp_flags */
+    "BaseInstrumentedAttribute provides the descriptor methods of "
+    "InstrumentedAttribute",            /* tp_doc */
+    0,                                  /* tp_traverse */
+    0,                                  /* tp_clear */
+    0,                                  /* tp_richcompare */
+    0,                                  /* tp_weaklistoffset */
+    0,                                  /* tp_iter */
+    0,                                  /* tp_iternext */
+    0,                                  /* tp_methods */
+    0,                                  /* tp_members */
+    0,                                  /* tp_getset */
+    0,                                  /* tp_base */
+    0,                                  /* tp_dict */
+    BaseInstrumentedAttribute_get,      /* tp_descr_get */
+    BaseInstrumentedAttribute_set,      /* tp_descr_set */
+    0,                                  /* tp_dictoffset */
+    0,                                  /* tp_init */
+    0,                                  /* tp_alloc */
+    0                                   /* tp_new */
+};
+
+
+static PyMethodDef module_methods[] = {
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
+#ifndef PyMODINIT_FUNC  /* declarations for DLL import/export */
+#define PyMODINIT_FUNC void
+#endif
+
+
+#if PY_MAJOR_VERSION >= 3
+
+static struct PyModuleDef module_def = {
+    PyModuleDef_HEAD_INIT,
+    MODULE_NAME,
+    MODULE_DOC,
+    -1,
+    module_methods
+};
+
+#define INITERROR return NULL
+#define INTERN PyUnicode_InternFromString
+
+PyMODINIT_FUNC
+PyInit_cattributes(void)
+
+#else
+
+#define INITERROR return
+#define INTERN PyString_InternFromString
+
+PyMODINIT_FUNC
+initcattributes(void)
+
+#endif
+
+{
+    PyObject *m;
+
+#define INIT_STR(name) \
+    if ((str_ ## name = INTERN(#name)) == NULL) \
+        INITERROR;
+
+    INIT_STR(instance_state);
+    INIT_STR(instance_dict);
+    INIT_STR(ScalarAttributeImpl);
+    INIT_STR(NO_VALUE);
+    INIT_STR(impl);
+    INIT_STR(key);
+    INIT_STR(_supports_population);
+    INIT_STR(get);
+    INIT_STR(set);
+    INIT_STR(delete);
+    INIT_STR(dispatch);
+    INIT_STR(_active_history);
+    INIT_STR(send_modified_events);
+    INIT_STR(session_id);
+    INIT_STR(_strong_obj);
+    INIT_STR(modified);
+    INIT_STR(committed_state);
+    INIT_STR(_last_known_values);
+    INIT_STR(_modified_event);
+
+#undef INIT_STR
+
+    BaseInstrumentedAttributeType.tp_new = PyType_GenericNew;
+    if (PyType_Ready(&BaseInstrumentedAttributeType) < 0)
+        INITERROR;
+
+#if PY_MAJOR_VERSION >= 3
+    m = PyModule_Create(&module_def);
+#else
+    m = Py_InitModule3(MODULE_NAME, module_methods, MODULE_DOC);
+#endif
+    if (m == NULL)
+        INITERROR;
+
+    Py_INCREF(&BaseInstrumentedAttributeType);
+    PyModule_AddObject(m, "BaseInstrumentedAttribute",
+                       (PyObject *)&BaseInstrumentedAttributeType);
+
+#if PY_MAJOR_VERSION >= 3
+    return m;
+#endif
+}
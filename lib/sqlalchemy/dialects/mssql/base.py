@@ -2385,6 +2385,7 @@ def _schema_elements(schema):
 class MSDialect(default.DefaultDialect):
     name = "mssql"
     supports_default_values = True
+    supports_update_from = True
     supports_empty_insert = False
     execution_ctx_cls = MSExecutionContext
     use_scope_identity = True
@@ -2421,6 +2422,9 @@ class MSDialect(default.DefaultDialect):
     _supports_offset_fetch = False
     _supports_nvarchar_max = False
 
+    # assumes the case insensitive collation which is the default
+    _case_insensitive_names = True
+
     server_version_info = ()
 
     statement_compiler = MSSQLCompiler
@@ -2709,11 +2713,7 @@ class MSDialect(default.DefaultDialect):
         )
         indexes = {}
         for row in rp.mappings():
-            indexes[row["index_id"]] = {
-                "name": row["name"],
-                "unique": row["is_unique"] == 1,
-                "column_names": [],
-            }
+            indexes[row["index_id"]] = self._get_index_info(row)
         rp = connection.execution_options(future_result=True).execute(
             sql.text(
                 "select ind_col.index_id, ind_col.object_id, col.name "
@@ -2738,6 +2738,82 @@ class MSDialect(default.DefaultDialect):
 
         return list(indexes.values())
 
+    @_db_plus_owner_listing
+    def get_multi_indexes(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        if self.server_version_info < MS_2005_VERSION:
+            return dict(
+                (table_name, [])
+                for table_name in self._get_multi_table_names(
+                    connection, schema, filter_names, **kw
+                )
+            )
+
+        indexes = dict(
+            (table_name, {})
+            for table_name in self._get_multi_table_names(
+                connection, schema, filter_names, **kw
+            )
+        )
+
+        rp = connection.execution_options(future_result=True).execute(
+            sql.text(
+                "select tab.name as table_name, ind.index_id, "
+                "ind.is_unique, ind.name "
+                "from sys.indexes as ind join sys.tables as tab on "
+                "ind.object_id=tab.object_id "
+                "join sys.schemas as sch on sch.schema_id=tab.schema_id "
+                "where sch.name=:schname "
+                "and ind.is_primary_key=0 and ind.type != 0"
+            )
+            .bindparams(
+                sql.bindparam("schname", owner, ischema.CoerceUnicode()),
+            )
+            .columns(table_name=sqltypes.Unicode(), name=sqltypes.Unicode())
+        )
+        for row in rp.mappings():
+            if row["table_name"] in indexes:
+                indexes[row["table_name"]][
+                    row["index_id"]
+                ] = self._get_index_info(row)
+
+        rp = connection.execution_options(future_result=True).execute(
+            sql.text(
+                "select tab.name as table_name, ind_col.index_id, "
+                "ind_col.object_id, col.name "
+                "from sys.columns as col "
+                "join sys.tables as tab on tab.object_id=col.object_id "
+                "join sys.index_columns as ind_col on "
+                "(ind_col.column_id=col.column_id and "
+                "ind_col.object_id=tab.object_id) "
+                "join sys.schemas as sch on sch.schema_id=tab.schema_id "
+                "where sch.name=:schname"
+            )
+            .bindparams(
+                sql.bindparam("schname", owner, ischema.CoerceUnicode()),
+            )
+            .columns(table_name=sqltypes.Unicode(), name=sqltypes.Unicode())
+        )
+        for row in rp.mappings():
+            table_indexes = indexes.get(row["table_name"])
+            if table_indexes and row["index_id"] in table_indexes:
+                table_indexes[row["index_id"]]["column_names"].append(
+                    row["name"]
+                )
+
+        return dict(
+            (table_name, list(table_indexes.values()))
+            for table_name, table_indexes in indexes.items()
+        )
+
+    def _get_index_info(self, row):
+        return {
+            "name": row["name"],
+            "unique": row["is_unique"] == 1,
+            "column_names": [],
+        }
+
     @reflection.cache
     @_db_plus_owner
     def get_view_definition(
@@ -2805,68 +2881,10 @@ class MSDialect(default.DefaultDialect):
         )
 
         c = connection.execution_options(future_result=True).execute(s)
-        cols = []
-        for row in c.mappings():
-            name = row[columns.c.column_name]
-            type_ = row[columns.c.data_type]
-            nullable = row[columns.c.is_nullable] == "YES"
-            charlen = row[columns.c.character_maximum_length]
-            numericprec = row[columns.c.numeric_precision]
-            numericscale = row[columns.c.numeric_scale]
-            default = row[columns.c.column_default]
-            collation = row[columns.c.collation_name]
-            definition = row[computed_definition]
-            is_persisted = row[computed_cols.c.is_persisted]
-
-            coltype = self.ischema_names.get(type_, None)
-
-            kwargs = {}
-            if coltype in (
-                MSString,
-                MSChar,
-                MSNVarchar,
-                MSNChar,
-                MSText,
-                MSNText,
-                MSBinary,
-                MSVarBinary,
-                sqltypes.LargeBinary,
-            ):
-                if charlen == -1:
-                    charlen = None
-                kwargs["length"] = charlen
-                if collation:
-                    kwargs["collation"] = collation
-
-            if coltype is None:
-                util.warn(
-                    "Did not recognize type '%s' of column '%s'"
-                    % (type_, name)
-                )
-                coltype = sqltypes.NULLTYPE
-            else:
-                if issubclass(coltype, sqltypes.Numeric):
-                    kwargs["precision"] = numericprec
-
-                    if not issubclass(coltype, sqltypes.Float):
-                        kwargs["scale"] = numericscale
-
-                coltype = coltype(**kwargs)
-            cdict = {
-                "name": name,
-                "type": coltype,
-                "nullable": nullable,
-                "default": default,
-                "autoincrement": False,
-            }
-
-            if definition is not None and is_persisted is not None:
-                cdict["computed"] = {
-                    "sqltext": definition,
-                    "persisted": is_persisted,
-                }
-
-            cols.append(cdict)
+        cols = [
+            self._get_column_info(row, computed_definition)
+            for row in c.mappings()
+        ]
         # autoincrement and identity
         colmap = {}
         for col in cols:
@@ -2912,6 +2930,154 @@ class MSDialect(default.DefaultDialect):
                 )
         return cols
 
+    @_db_plus_owner_listing
+    def get_multi_columns(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        # identity columns are located using sys.identity_columns, which
+        # is not present before SQL Server 2005
+        if not owner or self.server_version_info < MS_2005_VERSION:
+            return super(MSDialect, self).get_multi_columns(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        columns = ischema.columns
+        computed_cols = ischema.computed_columns
+
+        full_name = columns.c.table_schema + "." + columns.c.table_name
+        join_on = sql.and_(
+            computed_cols.c.object_id == func.object_id(full_name),
+            columns.c.column_name == computed_cols.c.name,
+        )
+        join = columns.join(computed_cols, onclause=join_on, isouter=True)
+
+        if self._supports_nvarchar_max:
+            computed_definition = computed_cols.c.definition
+        else:
+            # tds_version 4.2 does not support NVARCHAR(MAX)
+            computed_definition = sql.cast(
+                computed_cols.c.definition, NVARCHAR(4000)
+            )
+
+        s = (
+            sql.select(
+                columns, computed_definition, computed_cols.c.is_persisted
+            )
+            .where(columns.c.table_schema == owner)
+            .select_from(join)
+            .order_by(columns.c.table_name, columns.c.ordinal_position)
+        )
+
+        cols = dict(
+            (table_name, [])
+            for table_name in self._get_multi_table_names(
+                connection, schema, filter_names, **kw
+            )
+        )
+        c = connection.execution_options(future_result=True).execute(s)
+        for row in c.mappings():
+            table_name = row[columns.c.table_name]
+            if table_name in cols:
+                cols[table_name].append(
+                    self._get_column_info(row, computed_definition)
+                )
+
+        # autoincrement and identity
+        cursor = connection.execute(
+            sql.text(
+                "select tab.name, ic.name, "
+                "CAST(ic.seed_value AS DECIMAL(38, 0)), "
+                "CAST(ic.increment_value AS DECIMAL(38, 0)) "
+                "from sys.identity_columns as ic "
+                "join sys.tables as tab on ic.object_id=tab.object_id "
+                "join sys.schemas as sch on sch.schema_id=tab.schema_id "
+                "where sch.name=:schname"
+            ).bindparams(
+                sql.bindparam("schname", owner, ischema.CoerceUnicode())
+            )
+        )
+        for table_name, col_name, seed, increment in cursor:
+            for col in cols.get(table_name, ()):
+                if col["name"] == col_name:
+                    col["autoincrement"] = True
+                    col["dialect_options"] = {
+                        "mssql_identity_start": 1,
+                        "mssql_identity_increment": 1,
+                    }
+                    if seed is not None:
+                        col["dialect_options"].update(
+                            {
+                                "mssql_identity_start": int(seed),
+                                "mssql_identity_increment": int(increment),
+                            }
+                        )
+                    break
+        return cols
+
+    def _get_column_info(self, row, computed_definition):
+        columns = ischema.columns
+        computed_cols = ischema.computed_columns
+
+        name = row[columns.c.column_name]
+        type_ = row[columns.c.data_type]
+        nullable = row[columns.c.is_nullable] == "YES"
+        charlen = row[columns.c.character_maximum_length]
+        numericprec = row[columns.c.numeric_precision]
+        numericscale = row[columns.c.numeric_scale]
+        default = row[columns.c.column_default]
+        collation = row[columns.c.collation_name]
+        definition = row[computed_definition]
+        is_persisted = row[computed_cols.c.is_persisted]
+
+        coltype = self.ischema_names.get(type_, None)
+
+        kwargs = {}
+        if coltype in (
+            MSString,
+            MSChar,
+            MSNVarchar,
+            MSNChar,
+            MSText,
+            MSNText,
+            MSBinary,
+            MSVarBinary,
+            sqltypes.LargeBinary,
+        ):
+            if charlen == -1:
+                charlen = None
+            kwargs["length"] = charlen
+            if collation:
+                kwargs["collation"] = collation
+
+        if coltype is None:
+            util.warn(
+                "Did not recognize type '%s' of column '%s'" % (type_, name)
+            )
+            coltype = sqltypes.NULLTYPE
+        else:
+            if issubclass(coltype, sqltypes.Numeric):
+                kwargs["precision"] = numericprec
+
+                if not issubclass(coltype, sqltypes.Float):
+                    kwargs["scale"] = numericscale
+
+            coltype = coltype(**kwargs)
+        cdict = {
+            "name": name,
+            "type": coltype,
+            "nullable": nullable,
+            "default": default,
+            "autoincrement": False,
+        }
+
+        if definition is not None and is_persisted is not None:
+            cdict["computed"] = {
+                "sqltext": definition,
+                "persisted": is_persisted,
+            }
+
+        return cdict
+
     @reflection.cache
     @_db_plus_owner
     def get_pk_constraint(
@@ -2941,6 +3107,49 @@ class MSDialect(default.DefaultDialect):
                     constraint_name = row[C.c.constraint_name.name]
         return {"constrained_columns": pkeys, "name": constraint_name}
 
+    @_db_plus_owner_listing
+    def get_multi_pk_constraint(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        TC = ischema.constraints
+        C = ischema.key_constraints.alias("C")
+
+        # Primary key constraints
+        s = (
+            sql.select(
+                C.c.table_name,
+                C.c.column_name,
+                TC.c.constraint_type,
+                C.c.constraint_name,
+            )
+            .where(
+                sql.and_(
+                    TC.c.constraint_name == C.c.constraint_name,
+                    TC.c.table_schema == C.c.table_schema,
+                    C.c.table_schema == owner,
+                ),
+            )
+            .order_by(C.c.table_name, C.c.ordinal_position)
+        )
+
+        pk_constraints = dict(
+            (table_name, {"constrained_columns": [], "name": None})
+            for table_name in self._get_multi_table_names(
+                connection, schema, filter_names, **kw
+            )
+        )
+        c = connection.execution_options(future_result=True).execute(s)
+        for row in c.mappings():
+            pk_constraint = pk_constraints.get(row[C.c.table_name.name])
+            if (
+                pk_constraint is not None
+                and "PRIMARY" in row[TC.c.constraint_type.name]
+            ):
+                pk_constraint["constrained_columns"].append(row["COLUMN_NAME"])
+                if pk_constraint["name"] is None:
+                    pk_constraint["name"] = row[C.c.constraint_name.name]
+        return pk_constraints
+
     @reflection.cache
     @_db_plus_owner
     def get_foreign_keys(
@@ -2976,6 +3185,67 @@ class MSDialect(default.DefaultDialect):
             .order_by(RR.c.constraint_name, R.c.ordinal_position)
         )
 
+        return self._get_foreign_keys_from_rows(
+            connection.execute(s).fetchall(), dbname, owner, schema
+        )
+
+    @_db_plus_owner_listing
+    def get_multi_foreign_keys(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        RR = ischema.ref_constraints
+        C = ischema.key_constraints.alias("C")
+        R = ischema.key_constraints.alias("R")
+
+        # Foreign key constraints
+        s = (
+            sql.select(
+                C.c.table_name,
+                C.c.column_name,
+                R.c.table_schema,
+                R.c.table_name,
+                R.c.column_name,
+                RR.c.constraint_name,
+                RR.c.match_option,
+                RR.c.update_rule,
+                RR.c.delete_rule,
+            )
+            .where(
+                sql.and_(
+                    C.c.table_schema == owner,
+                    RR.c.constraint_schema == C.c.table_schema,
+                    C.c.constraint_name == RR.c.constraint_name,
+                    R.c.constraint_name == RR.c.unique_constraint_name,
+                    R.c.constraint_schema == RR.c.unique_constraint_schema,
+                    C.c.ordinal_position == R.c.ordinal_position,
+                )
+            )
+            .order_by(
+                C.c.table_name, RR.c.constraint_name, R.c.ordinal_position
+            )
+        )
+
+        rows = dict(
+            (table_name, [])
+            for table_name in self._get_multi_table_names(
+                connection, schema, filter_names, **kw
+            )
+        )
+        for row in connection.execute(s):
+            if row[0] in rows:
+                rows[row[0]].append(row[1:])
+
+        return dict(
+            (
+                table_name,
+                self._get_foreign_keys_from_rows(
+                    table_rows, dbname, owner, schema
+                ),
+            )
+            for table_name, table_rows in rows.items()
+        )
+
+    def _get_foreign_keys_from_rows(self, rows, dbname, owner, schema):
         # group rows by constraint ID, to handle multi-column FKs
         fkeys = []
 
@@ -2990,7 +3260,7 @@ class MSDialect(default.DefaultDialect):
 
         fkeys = util.defaultdict(fkey_rec)
 
-        for r in connection.execute(s).fetchall():
+        for r in rows:
             scol, rschema, rtbl, rcol, rfknm, fkmatch, fkuprule, fkdelrule = r
 
             rec = fkeys[rfknm]
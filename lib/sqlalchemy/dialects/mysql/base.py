@@ -2312,6 +2312,8 @@ class MySQLDialect(default.DefaultDialect):
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
     supports_multivalues_insert = True
+    supports_tuple_in = True
+    supports_update_from = True
 
     supports_comments = True
     inline_comments = True
@@ -3045,6 +3047,11 @@ class MySQLDialect(default.DefaultDialect):
     def _detect_charset(self, connection):
         raise NotImplementedError()
 
+    @property
+    def _case_insensitive_names(self):
+        # lower_case_table_names is 1 or 2; see _detect_casing()
+        return getattr(self, "_casing", 0) in (1, 2)
+
     def _detect_casing(self, connection):
         """Sniff out identifier case sensitivity.
 
@@ -1727,7 +1727,6 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=info_cache,
         )
-        columns = []
         if self._supports_char_length:
             char_length_col = "char_length"
         else:
@@ -1753,64 +1752,133 @@ class OracleDialect(default.DefaultDialect):
         text %= {"dblink": dblink, "char_length_col": char_length_col}
 
         c = connection.execute(sql.text(text), params)
+        return [self._get_column_info(row) for row in c]
 
-        for row in c:
-            colname = self.normalize_name(row[0])
-            orig_colname = row[0]
-            coltype = row[1]
-            length = row[2]
-            precision = row[3]
-            scale = row[4]
-            nullable = row[5] == "Y"
-            default = row[6]
-            comment = row[7]
-            generated = row[8]
-
-            if coltype == "NUMBER":
-                if precision is None and scale == 0:
-                    coltype = INTEGER()
-                else:
-                    coltype = NUMBER(precision, scale)
-            elif coltype == "FLOAT":
-                # TODO: support "precision" here as "binary_precision"
-                coltype = FLOAT()
-            elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
-                coltype = self.ischema_names.get(coltype)(length)
-            elif "WITH TIME ZONE" in coltype:
-                coltype = TIMESTAMP(timezone=True)
-            else:
-                coltype = re.sub(r"\(\d+\)", "", coltype)
-                try:
-                    coltype = self.ischema_names[coltype]
-                except KeyError:
-                    util.warn(
-                        "Did not recognize type '%s' of column '%s'"
-                        % (coltype, colname)
-                    )
-                    coltype = sqltypes.NULLTYPE
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if kw.get("oracle_resolve_synonyms", False) or kw.get("dblink", ""):
+            return super(OracleDialect, self).get_multi_columns(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
 
-            if generated == "YES":
-                computed = dict(sqltext=default)
-                default = None
-            else:
-                computed = None
-
-            cdict = {
-                "name": colname,
-                "type": coltype,
-                "nullable": nullable,
-                "default": default,
-                "autoincrement": "auto",
-                "comment": comment,
-            }
-            if orig_colname.lower() == orig_colname:
-                cdict["quote"] = True
-            if computed is not None:
-                cdict["computed"] = computed
+        if self._supports_char_length:
+            char_length_col = "char_length"
+        else:
+            char_length_col = "data_length"
 
-            columns.append(cdict)
+        text = """
+            SELECT col.table_name, col.column_name, col.data_type,
+              col.%(char_length_col)s, col.data_precision, col.data_scale,
+              col.nullable, col.data_default, com.comments,
+              col.virtual_column
+            FROM all_tab_cols col
+            LEFT JOIN all_col_comments com
+            ON col.table_name = com.table_name
+            AND col.column_name = com.column_name
+            AND col.owner = com.owner
+            WHERE col.owner = :owner
+            AND col.hidden_column = 'NO'
+            %%(filter_names)s
+            ORDER BY col.table_name, col.column_id
+        """ % {
+            "char_length_col": char_length_col
+        }
+
+        columns = {}
+        for row in self._get_multi_table_rows(
+            connection, text, schema, filter_names, "col.table_name"
+        ):
+            columns.setdefault(self.normalize_name(row[0]), []).append(
+                self._get_column_info(row[1:])
+            )
         return columns
 
+    def _get_multi_table_rows(
+        self, connection, text, schema, filter_names, table_name_col
+    ):
+        """Execute a query against all tables of a schema.
+
+        The query includes the bound parameter "owner" and a
+        "%(filter_names)s" token, which is replaced with criteria limiting
+        the tables to those of ``filter_names``, if given.
+
+        """
+        params = {
+            "owner": self.denormalize_name(schema or self.default_schema_name)
+        }
+        if filter_names is None:
+            return connection.execute(
+                sql.text(text % {"filter_names": ""}), params
+            ).fetchall()
+
+        s = sql.text(
+            text % {"filter_names": "AND %s IN :filter_names" % table_name_col}
+        ).bindparams(sql.bindparam("filter_names", expanding=True))
+        names = [self.denormalize_name(name) for name in filter_names]
+        rows = []
+        # Oracle allows at most 1000 expressions in an IN list
+        for idx in range(0, len(names), 1000):
+            params["filter_names"] = names[idx : idx + 1000]
+            rows.extend(connection.execute(s, params))
+        return rows
+
+    def _get_column_info(self, row):
+        colname = self.normalize_name(row[0])
+        orig_colname = row[0]
+        coltype = row[1]
+        length = row[2]
+        precision = row[3]
+        scale = row[4]
+        nullable = row[5] == "Y"
+        default = row[6]
+        comment = row[7]
+        generated = row[8]
+
+        if coltype == "NUMBER":
+            if precision is None and scale == 0:
+                coltype = INTEGER()
+            else:
+                coltype = NUMBER(precision, scale)
+        elif coltype == "FLOAT":
+            # TODO: support "precision" here as "binary_precision"
+            coltype = FLOAT()
+        elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
+            coltype = self.ischema_names.get(coltype)(length)
+        elif "WITH TIME ZONE" in coltype:
+            coltype = TIMESTAMP(timezone=True)
+        else:
+            coltype = re.sub(r"\(\d+\)", "", coltype)
+            try:
+                coltype = self.ischema_names[coltype]
+            except KeyError:
+                util.warn(
+                    "Did not recognize type '%s' of column '%s'"
+                    % (coltype, colname)
+                )
+                coltype = sqltypes.NULLTYPE
+
+        if generated == "YES":
+            computed = dict(sqltext=default)
+            default = None
+        else:
+            computed = None
+
+        cdict = {
+            "name": colname,
+            "type": coltype,
+            "nullable": nullable,
+            "default": default,
+            "autoincrement": "auto",
+            "comment": comment,
+        }
+        if orig_colname.lower() == orig_colname:
+            cdict["quote"] = True
+        if computed is not None:
+            cdict["computed"] = computed
+
+        return cdict
+
     @reflection.cache
     def get_table_comment(
         self,
@@ -1867,7 +1935,6 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=info_cache,
         )
-        indexes = []
 
         params = {"table_name": table_name}
         text = (
@@ -1892,8 +1959,6 @@ class OracleDialect(default.DefaultDialect):
 
         q = sql.text(text)
         rp = connection.execute(q, params)
-        indexes = []
-        last_index_name = None
         pk_constraint = self.get_pk_constraint(
             connection,
             table_name,
@@ -1902,6 +1967,50 @@ class OracleDialect(default.DefaultDialect):
             dblink=dblink,
             info_cache=kw.get("info_cache"),
         )
+        return self._get_indexes_from_rows(rp, pk_constraint)
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if kw.get("resolve_synonyms", False) or kw.get("dblink", ""):
+            return super(OracleDialect, self).get_multi_indexes(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        pk_constraints = self.get_multi_pk_constraint(
+            connection, schema, filter_names, **kw
+        )
+
+        text = (
+            "SELECT a.table_name, a.index_name, a.column_name, "
+            "\nb.index_type, b.uniqueness, b.compression, b.prefix_length "
+            "\nFROM ALL_IND_COLUMNS a, "
+            "\nALL_INDEXES b "
+            "\nWHERE "
+            "\na.index_name = b.index_name "
+            "\nAND a.table_owner = b.table_owner "
+            "\nAND a.table_name = b.table_name "
+            "\nAND a.table_owner = :owner "
+            "\n%(filter_names)s "
+            "\nORDER BY a.table_name, a.index_name, a.column_position"
+        )
+        rows = util.defaultdict(list)
+        for row in self._get_multi_table_rows(
+            connection, text, schema, filter_names, "a.table_name"
+        ):
+            rows[self.normalize_name(row[0])].append(row)
+
+        return dict(
+            (
+                table_name,
+                self._get_indexes_from_rows(rows[table_name], pk_constraint),
+            )
+            for table_name, pk_constraint in pk_constraints.items()
+        )
+
+    def _get_indexes_from_rows(self, rows, pk_constraint):
+        indexes = []
+        last_index_name = None
 
         uniqueness = dict(NONUNIQUE=False, UNIQUE=True)
         enabled = dict(DISABLED=False, ENABLED=True)
@@ -1909,7 +2018,7 @@ class OracleDialect(default.DefaultDialect):
         oracle_sys_col = re.compile(r"SYS_NC\d+\$", re.IGNORECASE)
 
         index = None
-        for rset in rp:
+        for rset in rows:
             index_name_normalized = self.normalize_name(rset.index_name)
 
             # skip primary key index.  This is refined as of
@@ -1992,6 +2101,54 @@ class OracleDialect(default.DefaultDialect):
         rp = connection.execute(sql.text(text), params)
         return rp.fetchall()
 
+    def _get_multi_constraint_data(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return the rows of :meth:`._get_constraint_data` for all tables
+        of a schema, grouped by normalized table name.
+
+        """
+        constraint_data = dict(
+            (name, [])
+            for name in self._get_multi_table_names(
+                connection, schema, filter_names, **kw
+            )
+        )
+
+        text = (
+            "SELECT"
+            "\nac.table_name,"
+            "\nac.constraint_name,"
+            "\nac.constraint_type,"
+            "\nloc.column_name AS local_column,"
+            "\nrem.table_name AS remote_table,"
+            "\nrem.column_name AS remote_column,"
+            "\nrem.owner AS remote_owner,"
+            "\nloc.position as loc_pos,"
+            "\nrem.position as rem_pos,"
+            "\nac.search_condition,"
+            "\nac.delete_rule"
+            "\nFROM all_constraints ac,"
+            "\nall_cons_columns loc,"
+            "\nall_cons_columns rem"
+            "\nWHERE ac.owner = :owner"
+            "\nAND ac.constraint_type IN ('R','P', 'U', 'C')"
+            "\n%(filter_names)s"
+            "\nAND ac.owner = loc.owner"
+            "\nAND ac.constraint_name = loc.constraint_name"
+            "\nAND ac.r_owner = rem.owner(+)"
+            "\nAND ac.r_constraint_name = rem.constraint_name(+)"
+            "\nAND (rem.position IS NULL or loc.position=rem.position)"
+            "\nORDER BY ac.table_name, ac.constraint_name, loc.position"
+        )
+        for row in self._get_multi_table_rows(
+            connection, text, schema, filter_names, "ac.table_name"
+        ):
+            table_name = self.normalize_name(row[0])
+            if table_name in constraint_data:
+                constraint_data[table_name].append(row[1:])
+        return constraint_data
+
     @reflection.cache
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
         resolve_synonyms = kw.get("oracle_resolve_synonyms", False)
@@ -2006,8 +2163,6 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=info_cache,
         )
-        pkeys = []
-        constraint_name = None
         constraint_data = self._get_constraint_data(
             connection,
             table_name,
@@ -2015,6 +2170,27 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=kw.get("info_cache"),
         )
+        return self._get_pk_constraint_from_data(constraint_data)
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if kw.get("oracle_resolve_synonyms", False) or kw.get("dblink", ""):
+            return super(OracleDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        constraint_data = self._get_multi_constraint_data(
+            connection, schema, filter_names, **kw
+        )
+        return dict(
+            (table_name, self._get_pk_constraint_from_data(rows))
+            for table_name, rows in constraint_data.items()
+        )
+
+    def _get_pk_constraint_from_data(self, constraint_data):
+        pkeys = []
+        constraint_name = None
 
         for row in constraint_data:
             (
@@ -2063,7 +2239,46 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=kw.get("info_cache"),
         )
+        return self._get_foreign_keys_from_data(
+            connection,
+            constraint_data,
+            requested_schema,
+            schema,
+            dblink,
+            resolve_synonyms,
+        )
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if kw.get("oracle_resolve_synonyms", False) or kw.get("dblink", ""):
+            return super(OracleDialect, self).get_multi_foreign_keys(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
 
+        constraint_data = self._get_multi_constraint_data(
+            connection, schema, filter_names, **kw
+        )
+        owner = self.denormalize_name(schema or self.default_schema_name)
+        return dict(
+            (
+                table_name,
+                self._get_foreign_keys_from_data(
+                    connection, rows, schema, owner, "", False
+                ),
+            )
+            for table_name, rows in constraint_data.items()
+        )
+
+    def _get_foreign_keys_from_data(
+        self,
+        connection,
+        constraint_data,
+        requested_schema,
+        schema,
+        dblink,
+        resolve_synonyms,
+    ):
         def fkey_rec():
             return {
                 "name": None,
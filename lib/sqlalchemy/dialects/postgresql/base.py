@@ -2496,6 +2496,8 @@ class PGDialect(default.DefaultDialect):
     supports_default_values = True
     supports_empty_insert = False
     supports_multivalues_insert = True
+    supports_tuple_in = True
+    supports_update_from = True
     default_paramstyle = "pyformat"
     ischema_names = ischema_names
     colspecs = colspecs
@@ -2854,6 +2856,58 @@ class PGDialect(default.DefaultDialect):
         )
         return [name for name, in result]
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # string_agg() is available as of PostgreSQL 9.0
+        if self.server_version_info < (9, 0):
+            return None
+
+        # any DDL against an object in the schema inserts, updates or
+        # deletes at least one of these catalog rows, and every insert or
+        # update of a row assigns it a new xmin.  Enumerated and domain
+        # types are included from all schemas as columns may refer to them
+        # from outside of the schema being reflected.
+        return connection.scalar(
+            sql.text(
+                "SELECT md5(coalesce(string_agg(t.item, ',' "
+                "ORDER BY t.item), '')) FROM ("
+                "SELECT 'c' || c.oid || ':' || c.xmin AS item "
+                "FROM pg_catalog.pg_class c "
+                "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = :schema "
+                "UNION ALL "
+                "SELECT 'a' || a.attrelid || '.' || a.attnum || ':' || a.xmin "
+                "FROM pg_catalog.pg_attribute a "
+                "JOIN pg_catalog.pg_class c ON c.oid = a.attrelid "
+                "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = :schema "
+                "UNION ALL "
+                "SELECT 'f' || ad.oid || ':' || ad.xmin "
+                "FROM pg_catalog.pg_attrdef ad "
+                "JOIN pg_catalog.pg_class c ON c.oid = ad.adrelid "
+                "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = :schema "
+                "UNION ALL "
+                "SELECT 'r' || con.oid || ':' || con.xmin "
+                "FROM pg_catalog.pg_constraint con "
+                "JOIN pg_catalog.pg_namespace n ON n.oid = con.connamespace "
+                "WHERE n.nspname = :schema "
+                "UNION ALL "
+                "SELECT 'd' || d.objoid || '.' || d.objsubid || ':' || d.xmin "
+                "FROM pg_catalog.pg_description d "
+                "JOIN pg_catalog.pg_class c ON c.oid = d.objoid "
+                "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = :schema "
+                "UNION ALL "
+                "SELECT 't' || t.oid || ':' || t.xmin "
+                "FROM pg_catalog.pg_type t WHERE t.typtype IN ('d', 'e') "
+                "UNION ALL "
+                "SELECT 'e' || e.oid || ':' || e.xmin "
+                "FROM pg_catalog.pg_enum e"
+                ") AS t"
+            ),
+            schema=schema if schema is not None else self.default_schema_name,
+        )
+
     @reflection.cache
     def _get_foreign_table_names(self, connection, schema=None, **kw):
         result = connection.execute(
@@ -2967,18 +3021,7 @@ class PGDialect(default.DefaultDialect):
         c = connection.execute(s, table_oid=table_oid)
         rows = c.fetchall()
 
-        # dictionary with (name, ) if default search path or (schema, name)
-        # as keys
-        domains = self._load_domains(connection)
-
-        # dictionary with (name, ) if default search path or (schema, name)
-        # as keys
-        enums = dict(
-            ((rec["name"],), rec)
-            if rec["visible"]
-            else ((rec["schema"], rec["name"]), rec)
-            for rec in self._load_enums(connection, schema="*")
-        )
+        domains, enums = self._load_domains_and_enums(connection)
 
         # format columns
         columns = []
@@ -3007,6 +3050,137 @@ class PGDialect(default.DefaultDialect):
             columns.append(column_info)
         return columns
 
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        generated = (
+            "a.attgenerated as generated"
+            if self.server_version_info >= (12,)
+            else "NULL as generated"
+        )
+        SQL_COLS = (
+            """
+            SELECT c.relname, a.attname,
+              pg_catalog.format_type(a.atttypid, a.atttypmod),
+              (SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+                FROM pg_catalog.pg_attrdef d
+               WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+               AND a.atthasdef)
+              AS DEFAULT,
+              a.attnotnull, pgd.description as comment,
+              %s
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            LEFT JOIN pg_catalog.pg_description pgd ON (
+                pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+            WHERE %%(criteria)s
+            AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY c.relname, a.attnum
+        """
+            % generated
+        )
+        rows = self._execute_multi_table_query(
+            connection,
+            SQL_COLS,
+            schema,
+            filter_names,
+            relname=sqltypes.Unicode,
+            attname=sqltypes.Unicode,
+            default=sqltypes.Unicode,
+        ).fetchall()
+
+        domains, enums = self._load_domains_and_enums(connection)
+
+        columns = {}
+        for (
+            table_name,
+            name,
+            format_type,
+            default_,
+            notnull,
+            comment,
+            generated,
+        ) in rows:
+            columns.setdefault(table_name, []).append(
+                self._get_column_info(
+                    name,
+                    format_type,
+                    default_,
+                    notnull,
+                    domains,
+                    enums,
+                    schema,
+                    comment,
+                    generated,
+                )
+            )
+        return columns
+
+    def _load_domains_and_enums(self, connection):
+        # dictionary with (name, ) if default search path or (schema, name)
+        # as keys
+        domains = self._load_domains(connection)
+
+        # dictionary with (name, ) if default search path or (schema, name)
+        # as keys
+        enums = dict(
+            ((rec["name"],), rec)
+            if rec["visible"]
+            else ((rec["schema"], rec["name"]), rec)
+            for rec in self._load_enums(connection, schema="*")
+        )
+        return domains, enums
+
+    def _execute_multi_table_query(
+        self, connection, query, schema, filter_names, **column_types
+    ):
+        """Execute a catalog query against all tables in a schema.
+
+        The query refers to pg_class as "c" and to pg_namespace as "n", and
+        includes a "%(criteria)s" token in its WHERE clause which selects
+        the tables of the schema, or of the default schema along with
+        temporary tables if no schema is given, limited to those named in
+        ``filter_names`` if given.
+
+        """
+        criteria = [
+            "c.relkind IN ('r', 'v', 'm', 'f', 'p')",
+            "n.nspname = :schema",
+        ]
+        if schema is None:
+            # as is the case for get_table_oid(), temporary tables are
+            # reflected along with those of the default schema, and a
+            # table which is hidden by another of the same name earlier
+            # in the search path is not the one that's reflected; leave
+            # such tables to the single-table methods
+            criteria[1] = (
+                "(n.nspname = :schema "
+                "OR n.oid = pg_catalog.pg_my_temp_schema())"
+            )
+            criteria.append("pg_catalog.pg_table_is_visible(c.oid)")
+            schema = self.default_schema_name
+        params = {"schema": util.text_type(schema)}
+        bindparams = [sql.bindparam("schema", type_=sqltypes.Unicode)]
+
+        if filter_names is not None:
+            criteria.append("c.relname IN :filter_names")
+            params["filter_names"] = [
+                util.text_type(name) for name in filter_names
+            ]
+            bindparams.append(
+                sql.bindparam(
+                    "filter_names", type_=sqltypes.Unicode, expanding=True
+                )
+            )
+
+        s = (
+            sql.text(query % {"criteria": " AND ".join(criteria)})
+            .bindparams(*bindparams)
+            .columns(**column_types)
+        )
+        return connection.execute(s, params)
+
     def _get_column_info(
         self,
         name,
@@ -3221,6 +3395,51 @@ class PGDialect(default.DefaultDialect):
 
         return {"constrained_columns": cols, "name": name}
 
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 4):
+            return super(PGDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        PK_SQL = """
+            SELECT c.relname, a.attname, con.conname
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            LEFT OUTER JOIN (
+                SELECT ix.indrelid,
+                       unnest(ix.indkey) attnum,
+                       generate_subscripts(ix.indkey, 1) ord
+                FROM pg_catalog.pg_index ix
+                WHERE ix.indisprimary
+                ) k ON k.indrelid = c.oid
+            LEFT OUTER JOIN pg_catalog.pg_attribute a
+                ON a.attrelid = c.oid AND a.attnum = k.attnum
+            LEFT OUTER JOIN pg_catalog.pg_constraint con
+                ON con.conrelid = c.oid AND con.contype = 'p'
+            WHERE %(criteria)s
+            ORDER BY c.relname, k.ord
+        """
+        rows = self._execute_multi_table_query(
+            connection,
+            PK_SQL,
+            schema,
+            filter_names,
+            relname=sqltypes.Unicode,
+            attname=sqltypes.Unicode,
+            conname=sqltypes.Unicode,
+        )
+
+        pks = {}
+        for table_name, attname, conname in rows:
+            pk = pks.setdefault(
+                table_name, {"constrained_columns": [], "name": conname}
+            )
+            if attname is not None:
+                pk["constrained_columns"].append(attname)
+        return pks
+
     @reflection.cache
     def get_foreign_keys(
         self,
@@ -3230,7 +3449,6 @@ class PGDialect(default.DefaultDialect):
         postgresql_ignore_search_path=False,
         **kw
     ):
-        preparer = self.identifier_preparer
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
@@ -3249,6 +3467,69 @@ class PGDialect(default.DefaultDialect):
                 n.oid = c.relnamespace
           ORDER BY 1
         """
+
+        t = sql.text(FK_SQL).columns(
+            conname=sqltypes.Unicode, condef=sqltypes.Unicode
+        )
+        c = connection.execute(t, table=table_oid)
+        return self._get_foreign_keys_from_rows(
+            c.fetchall(), schema, postgresql_ignore_search_path
+        )
+
+    def get_multi_foreign_keys(
+        self,
+        connection,
+        schema=None,
+        filter_names=None,
+        postgresql_ignore_search_path=False,
+        **kw
+    ):
+        FK_SQL = """
+          SELECT c.relname, r.conname,
+                pg_catalog.pg_get_constraintdef(r.oid, true) as condef,
+                n2.nspname as conschema
+          FROM pg_catalog.pg_class c
+          JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+          LEFT OUTER JOIN pg_catalog.pg_constraint r
+                ON r.conrelid = c.oid AND r.contype = 'f'
+          LEFT OUTER JOIN pg_catalog.pg_class c2
+                ON c2.oid = r.confrelid
+          LEFT OUTER JOIN pg_catalog.pg_namespace n2
+                ON n2.oid = c2.relnamespace
+          WHERE %(criteria)s
+          ORDER BY c.relname, r.conname
+        """
+        rows = self._execute_multi_table_query(
+            connection,
+            FK_SQL,
+            schema,
+            filter_names,
+            relname=sqltypes.Unicode,
+            conname=sqltypes.Unicode,
+            condef=sqltypes.Unicode,
+        )
+
+        rows_by_table = {}
+        for table_name, conname, condef, conschema in rows:
+            table_rows = rows_by_table.setdefault(table_name, [])
+            if conname is not None:
+                table_rows.append((conname, condef, conschema))
+
+        return dict(
+            (
+                table_name,
+                self._get_foreign_keys_from_rows(
+                    table_rows, schema, postgresql_ignore_search_path
+                ),
+            )
+            for table_name, table_rows in rows_by_table.items()
+        )
+
+    def _get_foreign_keys_from_rows(
+        self, rows, schema, postgresql_ignore_search_path
+    ):
+        preparer = self.identifier_preparer
+
         # http://www.postgresql.org/docs/9.0/static/sql-createtable.html
         FK_REGEX = re.compile(
             r"FOREIGN KEY \((.*?)\) REFERENCES (?:(.*?)\.)?(.*?)\((.*?)\)"
@@ -3261,12 +3542,8 @@ class PGDialect(default.DefaultDialect):
             r"[\s]?(INITIALLY (DEFERRED|IMMEDIATE)+)?"
         )
 
-        t = sql.text(FK_SQL).columns(
-            conname=sqltypes.Unicode, condef=sqltypes.Unicode
-        )
-        c = connection.execute(t, table=table_oid)
         fkeys = []
-        for conname, condef, conschema in c.fetchall():
+        for conname, condef, conschema in rows:
             m = re.search(FK_REGEX, condef).groups()
 
             (
@@ -3438,11 +3715,82 @@ class PGDialect(default.DefaultDialect):
             relname=sqltypes.Unicode, attname=sqltypes.Unicode
         )
         c = connection.execute(t, table_oid=table_oid)
+        return self._get_indexes_from_rows(c.fetchall())
 
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (8, 5):
+            return super(PGDialect, self).get_multi_indexes(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        IDX_SQL = """
+          SELECT
+              c.relname as table_name,
+              i.relname as relname,
+              ix.indisunique, ix.indexprs, ix.indpred,
+              a.attname, a.attnum, con.conrelid, ix.indkey::varchar,
+              ix.indoption::varchar, i.reloptions, am.amname,
+              %s as indnkeyatts
+          FROM
+              pg_catalog.pg_class c
+                    join pg_catalog.pg_namespace n
+                        on n.oid = c.relnamespace
+                    left outer join
+                        pg_catalog.pg_index ix
+                        on c.oid = ix.indrelid and ix.indisprimary = 'f'
+                    left outer join
+                        pg_catalog.pg_class i
+                        on i.oid = ix.indexrelid
+                    left outer join
+                        pg_catalog.pg_attribute a
+                        on c.oid = a.attrelid and a.attnum = ANY(ix.indkey)
+                    left outer join
+                        pg_catalog.pg_constraint con
+                        on (ix.indrelid = con.conrelid and
+                            ix.indexrelid = con.conindid and
+                            con.contype in ('p', 'u', 'x'))
+                    left outer join
+                        pg_catalog.pg_am am
+                        on i.relam = am.oid
+          WHERE
+              %%(criteria)s
+          ORDER BY
+              c.relname,
+              i.relname
+        """ % (
+            "ix.indnkeyatts"
+            if self.server_version_info >= (11, 0)
+            else "NULL",
+        )
+        rows = self._execute_multi_table_query(
+            connection,
+            IDX_SQL,
+            schema,
+            filter_names,
+            table_name=sqltypes.Unicode,
+            relname=sqltypes.Unicode,
+            attname=sqltypes.Unicode,
+        )
+
+        rows_by_table = {}
+        for row in rows:
+            table_rows = rows_by_table.setdefault(row[0], [])
+            # tables without any indexes produce a single row of NULLs
+            if row[1] is not None:
+                table_rows.append(row[1:])
+
+        return dict(
+            (table_name, self._get_indexes_from_rows(table_rows))
+            for table_name, table_rows in rows_by_table.items()
+        )
+
+    def _get_indexes_from_rows(self, rows):
         indexes = defaultdict(lambda: defaultdict(dict))
 
         sv_idx_name = None
-        for row in c.fetchall():
+        for row in rows:
             (
                 idx_name,
                 unique,
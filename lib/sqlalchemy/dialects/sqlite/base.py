@@ -586,6 +586,7 @@ When using the per-:class:`_engine.Engine` execution option, note that
 """  # noqa
 
 import datetime
+import hashlib
 import numbers
 import re
 
@@ -1071,6 +1072,18 @@ class SQLiteCompiler(compiler.SQLCompiler):
             self.process(binary.right, **kw),
         )
 
+    def update_from_clause(
+        self, update_stmt, from_table, extra_froms, from_hints, **kw
+    ):
+        if not self.dialect.supports_update_from:
+            return super(SQLiteCompiler, self).update_from_clause(
+                update_stmt, from_table, extra_froms, from_hints, **kw
+            )
+        return "FROM " + ", ".join(
+            t._compiler_dispatch(self, asfrom=True, fromhints=from_hints, **kw)
+            for t in extra_froms
+        )
+
     def visit_empty_set_expr(self, element_types):
         return "SELECT %s FROM (SELECT %s) WHERE 1!=1" % (
             ", ".join("1" for type_ in element_types or [INTEGER()]),
@@ -1448,6 +1461,8 @@ class SQLiteDialect(default.DefaultDialect):
     supports_cast = True
     supports_multivalues_insert = True
     tuple_in_values = True
+    supports_tuple_in = True
+    _case_insensitive_names = True
 
     default_paramstyle = "qmark"
     execution_ctx_cls = SQLiteExecutionContext
@@ -1542,6 +1557,16 @@ class SQLiteDialect(default.DefaultDialect):
                 self.dbapi.sqlite_version_info
                 >= (3, 7, 11)
             )
+            self.supports_tuple_in = self.dbapi.sqlite_version_info >= (
+                3,
+                15,
+                0,
+            )
+            self.supports_update_from = self.dbapi.sqlite_version_info >= (
+                3,
+                33,
+                0,
+            )
             # see http://www.sqlalchemy.org/trac/ticket/2568
             # as well as http://www.sqlite.org/src/info/600482d161
             self._broken_fk_pragma_quotes = self.dbapi.sqlite_version_info < (
@@ -1620,6 +1645,23 @@ class SQLiteDialect(default.DefaultDialect):
         rs = connection.exec_driver_sql(s)
         return [row[0] for row in rs]
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # the DDL of every object in the schema is stored in sqlite_master,
+        # so hashing its contents is both exact and cheap.   PRAGMA
+        # schema_version alone can repeat when a database is re-created.
+        if schema is not None:
+            qschema = self.identifier_preparer.quote_identifier(schema)
+            master = "%s.sqlite_master" % qschema
+        else:
+            master = "sqlite_master"
+        s = "SELECT type, name, tbl_name, sql FROM %s ORDER BY name" % (
+            master,
+        )
+        fingerprint = hashlib.sha1()
+        for row in connection.exec_driver_sql(s):
+            fingerprint.update(repr(tuple(row)).encode("utf-8"))
+        return fingerprint.hexdigest()
+
     @reflection.cache
     def get_temp_table_names(self, connection, **kw):
         s = (
@@ -1695,13 +1737,44 @@ class SQLiteDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_columns(self, connection, table_name, schema=None, **kw):
-        pragma = "table_info"
-        # computed columns are threaded as hidden, they require table_xinfo
-        if self.server_version_info >= (3, 31):
-            pragma = "table_xinfo"
+        pragma = self._table_info_pragma
         info = self._get_table_pragma(
             connection, pragma, table_name, schema=schema
         )
+        return self._get_columns_from_pragma(
+            pragma,
+            info,
+            lambda: self._get_table_sql(connection, table_name, schema, **kw),
+        )
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self._supports_pragma_functions:
+            return super(SQLiteDialect, self).get_multi_columns(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        pragma = self._table_info_pragma
+        table_sql = self._get_multi_table_sql(connection, schema, filter_names)
+        result = {}
+        for table_name, info in self._get_multi_table_pragma(
+            connection, pragma, schema, filter_names
+        ).items():
+            result[table_name] = self._get_columns_from_pragma(
+                pragma, info, lambda: table_sql.get(table_name)
+            )
+        return result
+
+    @property
+    def _table_info_pragma(self):
+        # computed columns are threaded as hidden, they require table_xinfo
+        if self.server_version_info >= (3, 31):
+            return "table_xinfo"
+        else:
+            return "table_info"
+
+    def _get_columns_from_pragma(self, pragma, info, get_table_sql):
         columns = []
         tablesql = None
         for row in info:
@@ -1722,9 +1795,7 @@ class SQLiteDialect(default.DefaultDialect):
             persisted = hidden == 3
 
             if tablesql is None and generated:
-                tablesql = self._get_table_sql(
-                    connection, table_name, schema, **kw
-                )
+                tablesql = get_table_sql()
 
             columns.append(
                 self._get_column_info(
@@ -1839,14 +1910,35 @@ class SQLiteDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
-        constraint_name = None
         table_data = self._get_table_sql(connection, table_name, schema=schema)
+        cols = self.get_columns(connection, table_name, schema, **kw)
+        return self._get_pk_constraint_from_columns(table_data, cols)
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self._supports_pragma_functions:
+            return super(SQLiteDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        table_sql = self._get_multi_table_sql(connection, schema, filter_names)
+        result = {}
+        for table_name, cols in self.get_multi_columns(
+            connection, schema, filter_names, **kw
+        ).items():
+            result[table_name] = self._get_pk_constraint_from_columns(
+                table_sql.get(table_name), cols
+            )
+        return result
+
+    def _get_pk_constraint_from_columns(self, table_data, cols):
+        constraint_name = None
         if table_data:
             PK_PATTERN = r"CONSTRAINT (\w+) PRIMARY KEY"
             result = re.search(PK_PATTERN, table_data, re.I)
             constraint_name = result.group(1) if result else None
 
-        cols = self.get_columns(connection, table_name, schema, **kw)
         pkeys = []
         for col in cols:
             if col["primary_key"]:
@@ -1861,7 +1953,37 @@ class SQLiteDialect(default.DefaultDialect):
         pragma_fks = self._get_table_pragma(
             connection, "foreign_key_list", table_name, schema=schema
         )
+        table_data = self._get_table_sql(connection, table_name, schema=schema)
+        return self._get_foreign_keys_from_pragma(
+            connection, table_name, schema, pragma_fks, table_data, **kw
+        )
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self._supports_pragma_functions:
+            return super(SQLiteDialect, self).get_multi_foreign_keys(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        table_sql = self._get_multi_table_sql(connection, schema, filter_names)
+        result = {}
+        for table_name, pragma_fks in self._get_multi_table_pragma(
+            connection, "foreign_key_list", schema, filter_names
+        ).items():
+            result[table_name] = self._get_foreign_keys_from_pragma(
+                connection,
+                table_name,
+                schema,
+                pragma_fks,
+                table_sql.get(table_name),
+                **kw
+            )
+        return result
 
+    def _get_foreign_keys_from_pragma(
+        self, connection, table_name, schema, pragma_fks, table_data, **kw
+    ):
         fks = {}
 
         for row in pragma_fks:
@@ -1928,7 +2050,6 @@ class SQLiteDialect(default.DefaultDialect):
             for fk in fks.values()
         )
 
-        table_data = self._get_table_sql(connection, table_name, schema=schema)
         if table_data is None:
             # system tables, etc.
             return []
@@ -2122,6 +2243,159 @@ class SQLiteDialect(default.DefaultDialect):
                     idx["column_names"].append(row[2])
         return indexes
 
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if not self._supports_pragma_functions:
+            return super(SQLiteDialect, self).get_multi_indexes(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        include_auto_indexes = kw.pop("include_auto_indexes", False)
+        rows = self._get_multi_table_rows(
+            connection,
+            schema,
+            filter_names,
+            'il.name, il."unique", ii.name',
+            "LEFT OUTER JOIN pragma_index_list(m.name, :schema) AS il "
+            "LEFT OUTER JOIN pragma_index_info(il.name, :schema) AS ii",
+        )
+
+        indexes_by_table = {}
+        skipped = set()
+        for table_name, index_name, unique, column_name in rows:
+            indexes = indexes_by_table.setdefault(
+                table_name, util.OrderedDict()
+            )
+            # ignore implicit primary key index, as well as tables which
+            # have no indexes at all
+            if (
+                index_name is None
+                or (
+                    not include_auto_indexes
+                    and index_name.startswith("sqlite_autoindex")
+                )
+                or (table_name, index_name) in skipped
+            ):
+                continue
+            if column_name is None:
+                util.warn(
+                    "Skipped unsupported reflection of "
+                    "expression-based index %s" % index_name
+                )
+                indexes.pop(index_name, None)
+                skipped.add((table_name, index_name))
+                continue
+
+            if index_name not in indexes:
+                indexes[index_name] = dict(
+                    name=index_name, column_names=[], unique=unique
+                )
+            indexes[index_name]["column_names"].append(column_name)
+
+        return dict(
+            (table_name, list(indexes.values()))
+            for table_name, indexes in indexes_by_table.items()
+        )
+
+    @property
+    def _supports_pragma_functions(self):
+        # table-valued PRAGMA functions, which allow a PRAGMA to be
+        # joined to sqlite_master, are new in SQLite 3.16
+        return self.server_version_info >= (3, 16)
+
+    def _get_multi_table_rows(
+        self, connection, schema, filter_names, columns, joins=""
+    ):
+        """Return rows consisting of the name of each table in the given
+        schema followed by the given columns.
+
+        The sqlite_master table is available as "m" to the columns and
+        joins given, and the name of the schema as the bound parameter
+        "schema", for use with PRAGMA functions.
+
+        """
+        if schema is not None:
+            return self._get_schema_table_rows(
+                connection, schema, filter_names, columns, joins
+            )
+
+        # as with _get_table_pragma(), temporary tables share the
+        # namespace of the "main" schema, which takes precedence
+        rows = self._get_schema_table_rows(
+            connection, "main", filter_names, columns, joins
+        )
+        main_names = set(row[0] for row in rows)
+        rows.extend(
+            row
+            for row in self._get_schema_table_rows(
+                connection, "temp", filter_names, columns, joins
+            )
+            if row[0] not in main_names
+        )
+        return rows
+
+    def _get_schema_table_rows(
+        self, connection, schema_name, filter_names, columns, joins
+    ):
+        query = (
+            "SELECT m.name, %s FROM %s.sqlite_master AS m %s "
+            "WHERE m.type = 'table'"
+            % (
+                columns,
+                self.identifier_preparer.quote_identifier(schema_name),
+                joins,
+            )
+        )
+        if filter_names is None:
+            return connection.execute(
+                sql.text(query), dict(schema=schema_name)
+            ).fetchall()
+
+        query = sql.text(query + " AND m.name IN :filter_names").bindparams(
+            sql.bindparam("filter_names", expanding=True)
+        )
+        filter_names = list(filter_names)
+        rows = []
+        # stay well within the limit on the number of bound parameters
+        # of older SQLite versions
+        for idx in range(0, len(filter_names), 500):
+            rows.extend(
+                connection.execute(
+                    query,
+                    dict(
+                        schema=schema_name,
+                        filter_names=filter_names[idx : idx + 500],
+                    ),
+                )
+            )
+        return rows
+
+    def _get_multi_table_pragma(
+        self, connection, pragma, schema, filter_names
+    ):
+        result = {}
+        for row in self._get_multi_table_rows(
+            connection,
+            schema,
+            filter_names,
+            "p.*",
+            "LEFT OUTER JOIN pragma_%s(m.name, :schema) AS p" % pragma,
+        ):
+            rows = result.setdefault(row[0], [])
+            # a NULL row is produced for tables for which the PRAGMA
+            # returns nothing
+            if row[1] is not None:
+                rows.append(row[1:])
+        return result
+
+    def _get_multi_table_sql(self, connection, schema, filter_names):
+        return dict(
+            self._get_multi_table_rows(
+                connection, schema, filter_names, "m.sql"
+            )
+        )
+
     @reflection.cache
     def _get_table_sql(self, connection, table_name, schema=None, **kw):
         if schema:
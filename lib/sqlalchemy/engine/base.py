@@ -303,6 +303,26 @@ class Connection(Connectable):
           or piped into a script that's later invoked by
           command line tools.
 
+        :param reflection_cache: Available on: Connection, Engine.
+          A dictionary-like object, supporting ``get()`` and item
+          assignment, where an :class:`_reflection.Inspector` will store the
+          information it reflects for each schema, keyed on the SQLAlchemy
+          version, the database URL, the schema name and a fingerprint of
+          the schema's current state, as returned by the dialect.  A subsequent
+          :class:`_reflection.Inspector`, such as one in a new process when
+          the object persists its contents, is then able to reflect
+          :class:`_schema.Table` objects from the stored information
+          without emitting any reflection queries other than the one used
+          to retrieve the fingerprint; any change to the schema results in
+          a new fingerprint and hence live reflection.
+
+          Only dialects which implement a schema fingerprint make use of
+          the cache, currently SQLite and PostgreSQL.  See
+          :class:`_reflection.FileReflectionCache` for an implementation
+          which stores the information as files within a directory.
+
+          .. versionadded:: 1.4
+
         :param stream_results: Available on: Connection, statement.
           Indicate to the dialect that results should be
           "streamed" and not pre-buffered, if possible.  This is a limitation
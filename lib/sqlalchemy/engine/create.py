@@ -375,11 +375,53 @@ def create_engine(url, **kwargs):
         instantiate the pool in this case, you just indicate what type
         of pool to be used.
 
+    :param pool_eject_time=30: number of seconds for which a failing host
+        of a :class:`~sqlalchemy.pool.MultiHostPool` is ejected.  Sets the
+        :paramref:`.MultiHostPool.eject_time` parameter.
+
+        .. versionadded:: 1.4
+
+    :param pool_hosts: a list of additional hosts to which a
+        :class:`~sqlalchemy.pool.MultiHostPool` distributes connections,
+        alongside the host of the URL given.   Each element may be a database
+        URL, either as a string or a :class:`.URL` object, for which
+        connections are established using the same dialect and
+        :paramref:`_sa.create_engine.connect_args` as the URL given; it may
+        also be a creator function, or a tuple of ``(name, creator)``.  Sets
+        the :paramref:`.MultiHostPool.hosts` parameter.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :ref:`pool_multi_host`
+
     :param pool_logging_name:  String identifier which will be used within
        the "name" field of logging records generated within the
        "sqlalchemy.pool" logger. Defaults to a hexstring of the object's
        id.
 
+    :param pool_maintenance_interval: number of seconds between runs of a
+        background thread which maintains idle connections within a
+        :class:`~sqlalchemy.pool.QueuePool`, keeping a minimum number of
+        connections ready, recycling connections ahead of time and pinging
+        them.  Sets the :paramref:`.QueuePool.maintenance_interval`
+        parameter.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
+    :param pool_min_idle: number of idle connections which are kept ready
+        within a :class:`~sqlalchemy.pool.QueuePool` by the maintenance
+        thread, including upon engine creation; requires
+        :paramref:`_sa.create_engine.pool_maintenance_interval`.  Sets the
+        :paramref:`.QueuePool.min_idle` parameter.
+
+        .. versionadded:: 1.4
+
     :param pool_pre_ping: boolean, if True will enable the connection pool
         "pre-ping" feature that tests connections for liveness upon
         each checkout.
@@ -390,6 +432,24 @@ def create_engine(url, **kwargs):
 
             :ref:`pool_disconnects_pessimistic`
 
+    :param pool_pre_ping_idle_time: number of seconds within which a
+        connection that was recently returned to the pool is assumed to be
+        alive, skipping the "pre-ping" upon checkout.  Sets the
+        :paramref:`_pool.Pool.pre_ping_idle_time` parameter.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :ref:`pool_pre_ping_idle_time`
+
+    :param pool_routing="checkouts": how a
+        :class:`~sqlalchemy.pool.MultiHostPool` chooses the host for each
+        checkout, either ``"checkouts"`` or ``"latency"``.  Sets the
+        :paramref:`.MultiHostPool.routing` parameter.
+
+        .. versionadded:: 1.4
+
     :param pool_size=5: the number of connections to keep open
         inside the connection pool. This used with
         :class:`~sqlalchemy.pool.QueuePool` as
@@ -420,6 +480,12 @@ def create_engine(url, **kwargs):
 
             :paramref:`_pool.Pool.reset_on_return`
 
+    :param pool_skip_clean_reset=False: if True, skip the "reset-on-return"
+        step for connections which have no transaction in progress.  Sets
+        the :paramref:`_pool.Pool.skip_clean_reset` parameter.
+
+        .. versionadded:: 1.4
+
     :param pool_timeout=30: number of seconds to wait before giving
         up on getting a connection from the pool. This is only used
         with :class:`~sqlalchemy.pool.QueuePool`.
@@ -533,14 +599,12 @@ def create_engine(url, **kwargs):
     dialect = dialect_cls(**dialect_args)
 
     # assemble connection arguments
+    connect_args = pop_kwarg("connect_args", {})
     (cargs, cparams) = dialect.create_connect_args(u)
-    cparams.update(pop_kwarg("connect_args", {}))
+    cparams.update(connect_args)
     cargs = list(cargs)  # allow mutability
 
-    # look for existing pool or create
-    pool = pop_kwarg("pool", None)
-    if pool is None:
-
+    def connect_fn(cargs, cparams):
         def connect(connection_record=None):
             if dialect._has_events:
                 for fn in dialect.dispatch.do_connect:
@@ -549,6 +613,24 @@ def create_engine(url, **kwargs):
                         return connection
             return dialect.connect(*cargs, **cparams)
 
+        return connect
+
+    def host_creator(host):
+        if not isinstance(host, util.string_types + (_url.URL,)):
+            return host
+        host_url = _url.make_url(host)
+        (host_cargs, host_cparams) = dialect.create_connect_args(host_url)
+        host_cparams.update(connect_args)
+        return (
+            repr(host_url),
+            connect_fn(list(host_cargs), host_cparams),
+        )
+
+    # look for existing pool or create
+    pool = pop_kwarg("pool", None)
+    if pool is None:
+        connect = connect_fn(cargs, cparams)
+
         creator = pop_kwarg("creator", connect)
 
         poolclass = pop_kwarg("poolclass", None)
@@ -565,14 +647,26 @@ def create_engine(url, **kwargs):
             "recycle": "pool_recycle",
             "events": "pool_events",
             "reset_on_return": "pool_reset_on_return",
+            "skip_clean_reset": "pool_skip_clean_reset",
             "pre_ping": "pool_pre_ping",
+            "pre_ping_idle_time": "pool_pre_ping_idle_time",
+            "maintenance_interval": "pool_maintenance_interval",
+            "min_idle": "pool_min_idle",
             "use_lifo": "pool_use_lifo",
+            "hosts": "pool_hosts",
+            "routing": "pool_routing",
+            "eject_time": "pool_eject_time",
         }
         for k in util.get_cls_kwargs(poolclass):
             tk = translate.get(k, k)
             if tk in kwargs:
                 pool_args[k] = pop_kwarg(tk)
 
+        if "hosts" in pool_args:
+            pool_args["hosts"] = [
+                host_creator(host) for host in pool_args["hosts"]
+            ]
+
         for plugin in plugins:
             plugin.handle_pool_kwargs(poolclass, pool_args)
 
@@ -644,6 +738,8 @@ def create_engine(url, **kwargs):
             pool, "first_connect", first_connect, _once_unless_exception=True
         )
 
+    pool._start_maintenance()
+
     dialect_cls.engine_created(engine)
     if entrypoint is not dialect_cls:
         entrypoint.engine_created(engine)
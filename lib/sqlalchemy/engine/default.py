@@ -79,6 +79,14 @@ class DefaultDialect(interfaces.Dialect):
 
     tuple_in_values = False
 
+    # dialect supports "(x, y) IN ((x1, y1), (x2, y2), ...)"; used by
+    # the ORM to batch DELETEs of rows with composite primary keys
+    supports_tuple_in = False
+
+    # dialect supports UPDATE..FROM, or a multiple-table UPDATE, against
+    # a subquery; used by the ORM for the mapper update_from_values option
+    supports_update_from = False
+
     engine_config_types = util.immutabledict(
         [
             ("convert_unicode", util.bool_or_str("force")),
@@ -184,6 +192,12 @@ class DefaultDialect(interfaces.Dialect):
     # and denormalize_name() must be provided.
     requires_name_normalize = False
 
+    # indicates that table and sequence names are matched
+    # case insensitively within the database, such that
+    # names returned by get_table_names() and
+    # get_sequence_names() are compared in lower case.
+    _case_insensitive_names = False
+
     reflection_options = ()
 
     dbapi_exception_translation_map = util.immutabledict()
@@ -479,6 +493,87 @@ class DefaultDialect(interfaces.Dialect):
         else:
             return False
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # inherits the docstring from
+        # interfaces.Dialect.get_schema_fingerprint
+        return None
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        # inherits the docstring from interfaces.Dialect.get_multi_columns
+        return self._default_multi_reflect(
+            self.get_columns, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        # inherits the docstring from
+        # interfaces.Dialect.get_multi_pk_constraint
+        return self._default_multi_reflect(
+            self.get_pk_constraint, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        # inherits the docstring from
+        # interfaces.Dialect.get_multi_foreign_keys
+        return self._default_multi_reflect(
+            self.get_foreign_keys, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        # inherits the docstring from interfaces.Dialect.get_multi_indexes
+        return self._default_multi_reflect(
+            self.get_indexes, connection, schema, filter_names, **kw
+        )
+
+    def _default_multi_reflect(
+        self, single_tbl_method, connection, schema, filter_names, **kw
+    ):
+        """Implement a get_multi_* method in terms of the corresponding
+        single-table method, for dialects which don't provide a bulk
+        version of it.
+
+        """
+        if filter_names is None:
+            filter_names = self.get_table_names(connection, schema, **kw)
+
+        result = {}
+        for table_name in filter_names:
+            try:
+                result[table_name] = single_tbl_method(
+                    connection, table_name, schema, **kw
+                )
+            except (exc.NoSuchTableError, exc.UnreflectableTableError):
+                # left to the single-table method to report, should it be
+                # called for this table
+                pass
+        return result
+
+    def _get_multi_table_names(self, connection, schema, filter_names, **kw):
+        """Return the names of the tables in the given schema, limited to
+        those in ``filter_names`` if given.
+
+        Used by bulk get_multi_* implementations which must return an entry
+        for each table, including those that have no rows in the catalog
+        query being run.
+
+        """
+        table_names = self.get_table_names(
+            connection, schema, info_cache=kw.get("info_cache")
+        )
+        if filter_names is not None:
+            filter_names = set(filter_names)
+            table_names = [
+                name for name in table_names if name in filter_names
+            ]
+        return table_names
+
     def validate_identifier(self, ident):
         if len(ident) > self.max_identifier_length:
             raise exc.IdentifierError(
@@ -691,6 +786,15 @@ class StrCompileDialect(DefaultDialect):
     }
 
 
+# blocks of values reserved from Sequence objects which specify
+# cache_block; for each connection pool, a dictionary of the schema and
+# name of each sequence to a [mutex, next value, end of block] list.
+# the module-level mutex only guards the creation of these entries, so
+# that reserving a new block from one sequence doesn't hold up others
+_sequence_blocks = weakref.WeakKeyDictionary()
+_sequence_blocks_mutex = util.threading.Lock()
+
+
 class DefaultExecutionContext(interfaces.ExecutionContext):
     isinsert = False
     isupdate = False
@@ -1485,6 +1589,8 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     def _exec_default(self, column, default, type_):
         if default.is_sequence:
+            if default.cache_block is not None:
+                return self._next_sequence_block_value(default, type_)
             return self.fire_sequence(default, type_)
         elif default.is_callable:
             self.current_column = column
@@ -1494,6 +1600,37 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         else:
             return default.arg
 
+    def _next_sequence_block_value(self, seq, type_):
+        # hand out the next value from the block of values most recently
+        # reserved from the sequence within the database that this
+        # connection's pool connects to; when it's used up, "next value"
+        # of the sequence, which is created with an increment of
+        # cache_block, reserves the next block
+        schema = seq.schema
+        schema_translate_map = self.execution_options.get(
+            "schema_translate_map", None
+        )
+        if schema_translate_map and schema in schema_translate_map:
+            schema = schema_translate_map[schema]
+        key = (schema, seq.name)
+
+        pool = self.root_connection.engine.pool
+        with _sequence_blocks_mutex:
+            blocks = _sequence_blocks.get(pool)
+            if blocks is None:
+                blocks = _sequence_blocks[pool] = {}
+            block = blocks.get(key)
+            if block is None:
+                block = blocks[key] = [util.threading.Lock(), 0, 0]
+
+        with block[0]:
+            if block[1] >= block[2]:
+                start = self.fire_sequence(seq, type_)
+                block[1:] = [start, start + seq.cache_block]
+            value = block[1]
+            block[1] += 1
+            return value
+
     def _exec_default_clause_element(self, column, default, type_):
         # execute a default that's a complete clause element.  Here, we have
         # to re-implement a miniature version of the compile->parameters->
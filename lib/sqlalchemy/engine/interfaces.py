@@ -288,11 +288,94 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about columns in all tables in `schema`.
+
+        Given a :class:`_engine.Connection`, an optional string `schema`
+        and an optional list of table names `filter_names`, return a
+        dictionary mapping table names to lists of column dictionaries, in
+        the same format as that returned by :meth:`.Dialect.get_columns`.
+        Tables which don't exist are omitted from the result.
+
+        The default implementation calls :meth:`.Dialect.get_columns` for
+        each table; dialects may instead retrieve the information for all
+        tables using a single query.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the primary key constraints of all
+        tables in `schema`.
+
+        As :meth:`.Dialect.get_multi_columns`, where the values of the
+        dictionary returned are in the format returned by
+        :meth:`.Dialect.get_pk_constraint`.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the foreign keys of all tables in
+        `schema`.
+
+        As :meth:`.Dialect.get_multi_columns`, where the values of the
+        dictionary returned are in the format returned by
+        :meth:`.Dialect.get_foreign_keys`.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the indexes of all tables in `schema`.
+
+        As :meth:`.Dialect.get_multi_columns`, where the values of the
+        dictionary returned are in the format returned by
+        :meth:`.Dialect.get_indexes`.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
     def get_table_names(self, connection, schema=None, **kw):
         """Return a list of table names for `schema`."""
 
         raise NotImplementedError()
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        """Return a string which changes whenever the definition of any
+        object within `schema` changes, or None if not supported.
+
+        The fingerprint is used to determine if reflection information
+        stored by way of the ``reflection_cache`` execution option is still
+        current, and should be substantially cheaper to retrieve than the
+        reflection information itself.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
     def get_temp_table_names(self, connection, schema=None, **kw):
         """Return a list of temporary table names on the given connection,
         if supported by the underlying backend.
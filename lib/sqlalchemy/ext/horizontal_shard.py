@@ -13,14 +13,82 @@ distribute queries and persistence operations across multiple databases.
 For a usage example, see the :ref:`examples_sharding` example included in
 the source distribution.
 
+When a query is to be run against several shards, the shards are queried one
+after the other by default.   Passing a value greater than one to
+:paramref:`.ShardedSession.max_parallelism` instead runs the statement
+against up to that many shards at once, each on its own worker thread and
+database connection::
+
+    session = ShardedSession(
+        shard_chooser=shard_chooser,
+        id_chooser=id_chooser,
+        execute_chooser=execute_chooser,
+        shards={"north_america": db1, "asia": db2, "europe": db3},
+        max_parallelism=3,
+    )
+
+Only the execution of the statement itself takes place on the worker threads;
+the connection for each shard is procured up front, and the rows of the
+results, which are combined into a single :class:`_engine.MergedResult`,
+are loaded into ORM objects by the calling thread.   If the statement fails
+on any shard, the shards not yet started are skipped, the results of those
+already completed are closed, and the error is raised once the statements in
+progress have finished.   As the connections are used by a thread other than
+the one which procured them, the DBAPI in use must allow this; for example,
+the pysqlite driver requires that ``check_same_thread=False`` be passed to
+:func:`_sa.create_engine` within ``connect_args``.
+
+The results from each shard are combined in the order in which the shards
+were given by the ``execute_chooser``, unless the statement has an ORDER BY,
+in which case the rows of all shards are merged in that order.   The
+LIMIT and OFFSET of a statement are applied to the combined result; each
+shard is queried for no more than the sum of the two::
+
+    # each shard returns at most 30 rows, of which the 10 following the
+    # first 20 rows across all shards are returned
+    session.query(WeatherLocation).order_by(WeatherLocation.id).limit(
+        10
+    ).offset(20).all()
+
+To put the rows of different shards in order, each shard additionally
+returns the value of each ORDER BY expression, which is removed from the
+rows of the combined result.   The rows are merged as they're fetched, so
+that when :meth:`_query.Query.yield_per` is used, only a batch of rows from
+each shard is held in memory at a time.   The values are compared in the
+same way as the database sorts them, placing NULL values as the database
+places them.   If an ORDER BY expression can't be selected in this way, such
+as a :func:`_expression.text` construct, a warning is emitted and the rows
+of each shard are returned after those of the previous one, with the LIMIT
+and OFFSET applied to each shard individually.
+
+When the :class:`.Session` is flushed, as well as with the "bulk" methods
+such as :meth:`.Session.bulk_save_objects`, objects are grouped by the shard
+chosen for each of them before INSERT, UPDATE and DELETE statements are
+emitted, so that the rows for each shard are sent in as few
+``executemany()`` calls as possible.
+
 """
 
+import collections
+import heapq
+import itertools
+import sys
+
 from .. import event
 from .. import exc
 from .. import inspect
 from .. import util
+from ..engine.cursor import CursorResult
+from ..orm.base import instance_state
 from ..orm.query import Query
 from ..orm.session import Session
+from ..sql import operators
+from ..sql.elements import _label_reference
+from ..sql.elements import _textual_label_reference
+from ..sql.elements import ColumnElement
+from ..sql.elements import Label
+from ..sql.elements import UnaryExpression
+from ..sql.selectable import Select
 
 __all__ = ["ShardedSession", "ShardedQuery"]
 
@@ -59,6 +127,7 @@ class ShardedSession(Session):
         execute_chooser=None,
         shards=None,
         query_cls=ShardedQuery,
+        max_parallelism=1,
         **kwargs
     ):
         """Construct a ShardedSession.
@@ -70,6 +139,10 @@ class ShardedSession(Session):
           should set whatever state on the instance to mark it in the future as
           participating in that shard.
 
+          For :meth:`.Session.bulk_insert_mappings` and
+          :meth:`.Session.bulk_update_mappings`, the instance is a transient
+          object populated only with the values of each dictionary.
+
         :param id_chooser: A callable, passed a query and a tuple of identity
           values, which should return a list of shard ids where the ID might
           reside.  The databases will be queried in the order of this listing.
@@ -85,6 +158,13 @@ class ShardedSession(Session):
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param max_parallelism: the maximum number of shards against which a
+          single statement is run at once, each on its own thread.   Defaults
+          to one, meaning that the shards returned by the ``execute_chooser``
+          are queried one after the other.
+
+          .. versionadded:: 1.4
+
         """
         query_chooser = kwargs.pop("query_chooser", None)
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
@@ -94,6 +174,7 @@ class ShardedSession(Session):
         )
         self.shard_chooser = shard_chooser
         self.id_chooser = id_chooser
+        self.max_parallelism = max_parallelism
 
         if query_chooser:
             util.warn_deprecated(
@@ -221,7 +302,7 @@ def execute_and_instances(orm_context):
 
     session = orm_context.session
 
-    def iter_for_shard(shard_id, load_options, update_options):
+    def shard_arguments(shard_id, load_options, update_options):
         execution_options = dict(orm_context.local_execution_options)
 
         bind_arguments = dict(orm_context.bind_arguments)
@@ -234,8 +315,16 @@ def execute_and_instances(orm_context):
             update_options += {"_refresh_identity_token": shard_id}
             execution_options["_sa_orm_update_options"] = update_options
 
+        return bind_arguments, execution_options
+
+    def iter_for_shard(shard_id, load_options, update_options, statement=None):
+        bind_arguments, execution_options = shard_arguments(
+            shard_id, load_options, update_options
+        )
         return orm_context.invoke_statement(
-            bind_arguments=bind_arguments, execution_options=execution_options
+            statement=statement,
+            bind_arguments=bind_arguments,
+            execution_options=execution_options,
         )
 
     if active_options._refresh_identity_token is not None:
@@ -249,10 +338,416 @@ def execute_and_instances(orm_context):
 
     if shard_id is not None:
         return iter_for_shard(shard_id, load_options, update_options)
+
+    shard_ids = list(session.execute_chooser(orm_context))
+
+    statement = orm_context.statement
+    limit = offset = ordering = None
+    if orm_context.is_select and len(shard_ids) > 1:
+        statement, ordering = _add_order_by_columns(statement)
+        if ordering is None:
+            util.warn(
+                "Can't apply the ORDER BY of a statement to the rows of "
+                "multiple shards; the rows of each shard are returned "
+                "after those of the previous one, and the LIMIT / OFFSET "
+                "of the statement is applied to each shard individually."
+            )
+        else:
+            statement, limit, offset = _push_down_limit(statement)
+
+    # statements are run concurrently only if no other do_orm_execute
+    # handler follows this one, as those would otherwise be skipped
+    if (
+        session.max_parallelism > 1
+        and len(shard_ids) > 1
+        and not orm_context._remaining_events()
+    ):
+        partial = _execute_concurrently(
+            orm_context,
+            statement,
+            [
+                shard_arguments(shard_id, load_options, update_options)
+                for shard_id in shard_ids
+            ],
+            session.max_parallelism,
+        )
     else:
-        partial = []
-        for shard_id in session.execute_chooser(orm_context):
-            result_ = iter_for_shard(shard_id, load_options, update_options)
-            partial.append(result_)
+        partial = [
+            iter_for_shard(shard_id, load_options, update_options, statement)
+            for shard_id in shard_ids
+        ]
+
+    if ordering is not None and len(partial) > 1:
+        return _merge_ordered(orm_context, partial, ordering, limit, offset)
+    else:
+        merged = partial[0].merge(*partial[1:])
+        _use_identity_keys(merged)
+        return merged
+
+
+def _execute_concurrently(
+    orm_context, statement, shard_arguments, max_parallelism
+):
+    """Run the given statement of an :class:`.ORMExecuteState` against
+    each of the given shards on up to ``max_parallelism`` threads.
+
+    This is the equivalent of :meth:`.ORMExecuteState.invoke_statement`
+    for each shard, where only the execution of the statement on each
+    connection takes place on a worker thread.
+
+    """
+    session = orm_context.session
+    params = orm_context.parameters or {}
+    compile_state_cls = orm_context._compile_state_cls
+
+    # procure connections from the calling thread, so that the Session and
+    # its transaction are only used by one thread at a time; shards which
+    # share a connection are run one after the other by the same worker
+    executions = []
+    groups = collections.OrderedDict()
+    for idx, (bind_arguments, local_options) in enumerate(shard_arguments):
+        execution_options = dict(orm_context._execution_options)
+        execution_options.update(local_options)
+
+        bind = session.get_bind(**bind_arguments)
+        conn = session._connection_for_bind(bind, close_with_result=True)
+        executions.append((conn, bind_arguments, execution_options))
+        groups.setdefault(conn, []).append(idx)
+
+    results = {}
+    errors = []
+    pending = collections.deque(groups.items())
+    mutex = util.threading.Lock()
+
+    def run():
+        while True:
+            with mutex:
+                if errors or not pending:
+                    return
+                conn, indexes = pending.popleft()
+            for idx in indexes:
+                if errors:
+                    return
+                try:
+                    results[idx] = conn._execute_20(
+                        statement, params, executions[idx][2]
+                    )
+                except BaseException:
+                    errors.append(sys.exc_info())
+                    return
+
+    # the calling thread runs one of the workers itself
+    workers = [
+        util.threading.Thread(target=run)
+        for i in range(min(max_parallelism, len(groups)) - 1)
+    ]
+    for worker in workers:
+        worker.daemon = True
+        worker.start()
+    try:
+        run()
+    finally:
+        for worker in workers:
+            worker.join()
+
+    if errors:
+        for idx, (conn, bind_arguments, execution_options) in enumerate(
+            executions
+        ):
+            if idx in results:
+                results[idx].close()
+            elif conn.should_close_with_result and not conn.closed:
+                conn.close()
+        exc_type, exc_value, exc_tb = errors[0]
+        util.raise_(exc_value, with_traceback=exc_tb)
+
+    partial = []
+    for idx, (conn, bind_arguments, execution_options) in enumerate(
+        executions
+    ):
+        result = results[idx]
+        if compile_state_cls is not None:
+            result = compile_state_cls.orm_setup_cursor_result(
+                session, statement, execution_options, bind_arguments, result
+            )
+        partial.append(result)
+    return partial
+
+
+def _push_down_limit(statement):
+    """Return a copy of the given SELECT to be run against each shard in
+    place of its LIMIT / OFFSET, along with the integer LIMIT and OFFSET
+    which are to be applied to the merged result.
+
+    Each shard returns at most ``offset + limit`` rows, which are enough
+    for the merged result to include the rows which the statement would
+    return if all shards were a single database.
+
+    """
+    limit_clause = getattr(statement, "_limit_clause", None)
+    offset_clause = getattr(statement, "_offset_clause", None)
+    if (limit_clause is None and offset_clause is None) or (
+        (limit_clause is not None and not statement._simple_int_limit)
+        or (offset_clause is not None and not statement._simple_int_offset)
+    ):
+        return statement, None, None
+
+    limit = statement._limit
+    offset = statement._offset or 0
+
+    statement = statement.offset(None)
+    if limit is not None:
+        statement = statement.limit(offset + limit)
+    return statement, limit, offset
+
+
+# backends which sort NULL as higher than any other value, rather than
+# lower, when NULLS FIRST / NULLS LAST isn't given
+_NULLS_SORT_HIGH = frozenset(["oracle", "postgresql"])
+
+
+class _OrderKey(object):
+    """Compare the ORDER BY values of rows from different shards in the
+    same way as the database which sorted them."""
+
+    __slots__ = ("values", "ordering")
+
+    def __init__(self, values, ordering):
+        self.values = values
+        self.ordering = ordering
+
+    def _compare(self, other):
+        for value, other_value, (descending, nulls_first) in zip(
+            self.values, other.values, self.ordering
+        ):
+            if value == other_value:
+                continue
+            elif value is None:
+                return -1 if nulls_first else 1
+            elif other_value is None:
+                return 1 if nulls_first else -1
+            elif value < other_value:
+                return 1 if descending else -1
+            else:
+                return -1 if descending else 1
+        return 0
+
+    def __eq__(self, other):
+        return self._compare(other) == 0
+
+    def __lt__(self, other):
+        return self._compare(other) < 0
+
+
+def _order_by(statement):
+    """Return the expression, direction and NULLS FIRST / NULLS LAST
+    setting of each ORDER BY expression of the given statement."""
+
+    order_by = []
+    for clause in getattr(statement, "_order_by_clauses", ()):
+        descending = nulls_first = None
+        while isinstance(clause, UnaryExpression) and clause.modifier in (
+            operators.asc_op,
+            operators.desc_op,
+            operators.nullsfirst_op,
+            operators.nullslast_op,
+        ):
+            if clause.modifier is operators.nullsfirst_op:
+                nulls_first = True
+            elif clause.modifier is operators.nullslast_op:
+                nulls_first = False
+            elif descending is None:
+                descending = clause.modifier is operators.desc_op
+            clause = clause.element
+
+        # order_by("name") refers to the result column by name
+        if isinstance(clause, (_label_reference, _textual_label_reference)):
+            clause = clause.element
+        order_by.append((clause, bool(descending), nulls_first))
+    return order_by
+
+
+def _add_order_by_columns(statement):
+    """Return a copy of the given SELECT which additionally returns the
+    value of each of its ORDER BY expressions, following the columns which
+    it returns already, along with the direction and NULLS FIRST / NULLS
+    LAST setting of each.
+
+    The ordering returned is ``None`` if an ORDER BY expression can't be
+    selected in this way.
+
+    """
+    order_by = _order_by(statement)
+    if not order_by:
+        return statement, ()
+    elif not isinstance(statement, Select):
+        return statement, None
+
+    columns = []
+    for index, (clause, descending, nulls_first) in enumerate(order_by):
+        if isinstance(clause, util.string_types):
+            clause = statement.selected_columns.get(clause)
+        if isinstance(clause, Label):
+            clause = clause.element
+        if not isinstance(clause, ColumnElement):
+            return statement, None
+        columns.append(clause.label("_sa_shard_order_%d" % index))
+
+    return (
+        statement.add_columns(*columns),
+        [(descending, nulls_first) for _, descending, nulls_first in order_by],
+    )
+
+
+def _context(result):
+    if not isinstance(result, CursorResult):
+        # the CursorResult from which the ORM loads objects
+        result = getattr(result, "raw", None)
+    return getattr(result, "context", None)
+
+
+def _is_single_entity(orm_context):
+    # whether the ORM returns each row of the original statement as a
+    # single object, which loading.instances() determines from the
+    # entities of the statement that now includes the ORDER BY columns
+    compile_state_cls = orm_context._compile_state_cls
+    if (
+        compile_state_cls is None
+        or orm_context.load_options._only_return_tuples
+    ):
+        return False
+    entities = compile_state_cls._create_entities_collection(
+        orm_context.statement
+    )._entities
+    return len(entities) == 1 and entities[0].supports_single_entity
+
+
+def _keyed_rows(result, ordering, num_columns, index):
+    # the ORDER BY values of each row follow the columns of the statement;
+    # rows are pulled from the result only as the merge consumes them
+    make_row = result._row_getter
+    for row in result._raw_row_iterator():
+        yield _OrderKey(make_row(row)[num_columns:], ordering), index, row
+
+
+def _identity_key(obj):
+    # the objects of rows which have already been consumed may be garbage
+    # collected, after which their id() can be reused by the objects of
+    # later rows; the identity key of an object, which includes the shard
+    # it was loaded from, is stable
+    if obj is None:
+        return None
+    return instance_state(obj).key
+
+
+def _use_identity_keys(result):
+    """Have the ORM's uniquing of the rows of the given merged result,
+    which uses id() for mapped objects, use identity keys instead."""
+
+    metadata = result._metadata
+    if getattr(metadata, "_unique_filters", None):
+        metadata._unique_filters = [
+            _identity_key if filter_ is id else filter_
+            for filter_ in metadata._unique_filters
+        ]
+
+
+def _limit_rows(rows, limit, offset, distinct, unique_filters):
+    if not distinct:
+        return itertools.islice(
+            rows, offset, offset + limit if limit is not None else None
+        )
+
+    # eager loading of collections returns a row for each member of the
+    # collection; LIMIT and OFFSET count the distinct parent rows
+    return _limit_distinct_rows(rows, limit, offset, unique_filters)
+
 
-        return partial[0].merge(*partial[1:])
+def _limit_distinct_rows(rows, limit, offset, unique_filters):
+    skipped = set()
+    kept = set()
+    for row in rows:
+        if isinstance(row, tuple):
+            ident = tuple(
+                filter_(value) if filter_ else value
+                for filter_, value in zip(unique_filters, row)
+            )
+        else:
+            ident = _identity_key(row)
+        if ident in skipped:
+            continue
+        elif ident not in kept:
+            if len(skipped) < offset:
+                skipped.add(ident)
+                continue
+            elif len(kept) == limit:
+                return
+            kept.add(ident)
+        yield row
+
+
+def _merge_ordered(orm_context, partial, ordering, limit, offset):
+    """Merge the results from each shard into one, applying the ORDER BY,
+    LIMIT and OFFSET of the statement across all of them.
+
+    The rows of each shard are already in order, so the merged result is
+    produced by a k-way merge which pulls rows from each shard's result as
+    they're needed, rather than fetching them all up front.   The values of
+    the ORDER BY expressions, which are returned in additional columns, are
+    removed from the rows of the merged result.
+
+    """
+    merged = partial[0].merge(*partial[1:])
+    _use_identity_keys(merged)
+    if not ordering and limit is None and offset is None:
+        return merged
+
+    num_columns = len(merged.keys()) - len(ordering)
+    context = _context(partial[0])
+
+    if ordering:
+        nulls_high = (
+            context is not None and context.dialect.name in _NULLS_SORT_HIGH
+        )
+        ordering = [
+            (
+                descending,
+                nulls_first
+                if nulls_first is not None
+                else descending == nulls_high,
+            )
+            for descending, nulls_first in ordering
+        ]
+        merged.iterator = (
+            row
+            for key, index, row in heapq.merge(
+                *[
+                    _keyed_rows(result, ordering, num_columns, index)
+                    for index, result in enumerate(partial)
+                ]
+            )
+        )
+
+    if limit is not None or offset:
+        merged.iterator = _limit_rows(
+            merged.iterator,
+            limit,
+            offset,
+            context is not None
+            and getattr(
+                context.compiled.compile_state,
+                "multi_row_eager_loaders",
+                False,
+            ),
+            (getattr(merged._metadata, "_unique_filters", None) or ())[
+                :num_columns
+            ],
+        )
+
+    if ordering:
+        merged = merged.columns(*range(num_columns))
+        if _is_single_entity(orm_context):
+            merged._attributes = merged._attributes.union(
+                {"is_single_entity": True}
+            )
+    return merged
@@ -24,6 +24,7 @@ from .interfaces import EXT_STOP  # noqa
 from .interfaces import PropComparator  # noqa
 from .mapper import _mapper_registry
 from .mapper import class_mapper  # noqa
+from .mapper import configure_incrementally  # noqa
 from .mapper import configure_mappers  # noqa
 from .mapper import Mapper  # noqa
 from .mapper import reconstructor  # noqa
@@ -45,6 +46,8 @@ from .session import Session  # noqa
 from .session import sessionmaker  # noqa
 from .session import SessionTransaction  # noqa
 from .strategy_options import Load  # noqa
+from .unitofwork import FlushProfile  # noqa
+from .unitofwork import FlushStats  # noqa
 from .util import aliased  # noqa
 from .util import Bundle  # noqa
 from .util import join  # noqa
@@ -138,9 +138,8 @@ class QueryableAttribute(
         return self.impl.uses_objects
 
     def get_history(self, instance, passive=PASSIVE_OFF):
-        return self.impl.get_history(
-            instance_state(instance), instance_dict(instance), passive
-        )
+        state = instance_state(instance)
+        return self.impl.get_history(state, state.dict, passive)
 
     @util.memoized_property
     def info(self):
@@ -298,7 +297,48 @@ def _queryable_attribute_unreduce(key, mapped_class, parententity, entity):
         return getattr(entity, key)
 
 
-class InstrumentedAttribute(QueryableAttribute):
+try:
+    from sqlalchemy.cattributes import BaseInstrumentedAttribute
+
+    _instrumented_usecext = True
+except ImportError:
+    _instrumented_usecext = False
+
+    class BaseInstrumentedAttribute(object):
+        """Provide the :term:`descriptor` methods of
+        :class:`.InstrumentedAttribute`.
+
+        The C extension version of this class performs the get of an
+        already loaded value as well as the set of a scalar value with
+        no event listeners without calling into Python, deferring to the
+        :class:`.AttributeImpl` for all other cases.
+
+        """
+
+        __slots__ = ()
+
+        def __set__(self, instance, value):
+            self.impl.set(
+                instance_state(instance), instance_dict(instance), value, None
+            )
+
+        def __delete__(self, instance):
+            self.impl.delete(
+                instance_state(instance), instance_dict(instance)
+            )
+
+        def __get__(self, instance, owner):
+            if instance is None:
+                return self
+
+            dict_ = instance_dict(instance)
+            if self._supports_population and self.key in dict_:
+                return dict_[self.key]
+            else:
+                return self.impl.get(instance_state(instance), dict_)
+
+
+class InstrumentedAttribute(QueryableAttribute, BaseInstrumentedAttribute):
     """Class bound instrumented attribute which adds basic
     :term:`descriptor` methods.
 
@@ -309,23 +349,34 @@ class InstrumentedAttribute(QueryableAttribute):
 
     inherit_cache = True
 
+
+class _SlotsInstrumentedAttribute(InstrumentedAttribute):
+    """An :class:`.InstrumentedAttribute` for a class whose instances
+    have no ``__dict__``, which locates the instance dictionary by way
+    of :attr:`.InstanceState.dict`.
+
+    """
+
+    inherit_cache = True
+
     def __set__(self, instance, value):
-        self.impl.set(
-            instance_state(instance), instance_dict(instance), value, None
-        )
+        state = instance_state(instance)
+        self.impl.set(state, state.dict, value, None)
 
     def __delete__(self, instance):
-        self.impl.delete(instance_state(instance), instance_dict(instance))
+        state = instance_state(instance)
+        self.impl.delete(state, state.dict)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
 
-        dict_ = instance_dict(instance)
+        state = instance_state(instance)
+        dict_ = state.dict
         if self._supports_population and self.key in dict_:
             return dict_[self.key]
         else:
-            return self.impl.get(instance_state(instance), dict_)
+            return self.impl.get(state, dict_)
 
 
 HasEntityNamespace = util.namedtuple(
@@ -474,6 +525,7 @@ OP_REMOVE = util.symbol("REMOVE")
 OP_APPEND = util.symbol("APPEND")
 OP_REPLACE = util.symbol("REPLACE")
 OP_BULK_REPLACE = util.symbol("BULK_REPLACE")
+OP_BULK_APPEND = util.symbol("BULK_APPEND")
 OP_MODIFIED = util.symbol("MODIFIED")
 
 
@@ -500,8 +552,8 @@ class Event(object):
      initiator.
 
     :attribute op: The symbol :attr:`.OP_APPEND`, :attr:`.OP_REMOVE`,
-     :attr:`.OP_REPLACE`, or :attr:`.OP_BULK_REPLACE`, indicating the
-     source operation.
+     :attr:`.OP_REPLACE`, :attr:`.OP_BULK_REPLACE`, or
+     :attr:`.OP_BULK_APPEND`, indicating the source operation.
 
     """
 
@@ -1116,6 +1168,7 @@ class CollectionAttributeImpl(AttributeImpl):
         "_append_token",
         "_remove_token",
         "_bulk_replace_token",
+        "_bulk_append_token",
         "_duck_typed_as",
     )
 
@@ -1148,6 +1201,7 @@ class CollectionAttributeImpl(AttributeImpl):
         self._append_token = Event(self, OP_APPEND)
         self._remove_token = Event(self, OP_REMOVE)
         self._bulk_replace_token = Event(self, OP_BULK_REPLACE)
+        self._bulk_append_token = Event(self, OP_BULK_APPEND)
         self._duck_typed_as = util.duck_type_collection(
             self.collection_factory()
         )
@@ -1223,6 +1277,44 @@ class CollectionAttributeImpl(AttributeImpl):
 
         return value
 
+    def fire_bulk_append_event(self, state, dict_, values, initiator):
+        """Fire a single event for a list of values entering the collection.
+
+        The "bulk_append" listeners receive the full list, which they may
+        modify in place; "append" listeners are then invoked for each
+        value in turn.  The state is flagged as modified once for the
+        whole operation.  If a listener raises, "remove" listeners are
+        invoked for each value, as the collection is left unchanged.
+
+        """
+        initiator = initiator or self._bulk_append_token
+
+        try:
+            self.dispatch.bulk_append(state, values, initiator)
+
+            if self.dispatch.append:
+                for idx, value in enumerate(values):
+                    for fn in self.dispatch.append:
+                        value = fn(state, value, initiator)
+                    values[idx] = value
+        except Exception:
+            with util.safe_reraise():
+                # none of the values have been added to the collection;
+                # undo what listeners such as backrefs have done with them
+                for value in values:
+                    if value is not None:
+                        for fn in self.dispatch.remove:
+                            fn(state, value, self._remove_token)
+
+        state._modified_event(dict_, self, NO_VALUE, True)
+
+        if self.trackparent:
+            for value in values:
+                if value is not None:
+                    self.sethasparent(instance_state(value), state, True)
+
+        return values
+
     def fire_pre_remove_event(self, state, dict_, initiator):
         """A special event used for pop() operations.
 
@@ -1484,10 +1576,8 @@ def backref_listeners(attribute, key, uselist):
         ):
             # With lazy=None, there's no guarantee that the full collection is
             # present when updating via a backref.
-            old_state, old_dict = (
-                instance_state(oldchild),
-                instance_dict(oldchild),
-            )
+            old_state = instance_state(oldchild)
+            old_dict = old_state.dict
             impl = old_state.manager[key].impl
 
             # tokens to test for a recursive loop.
@@ -1506,10 +1596,8 @@ def backref_listeners(attribute, key, uselist):
                 )
 
         if child is not None:
-            child_state, child_dict = (
-                instance_state(child),
-                instance_dict(child),
-            )
+            child_state = instance_state(child)
+            child_dict = child_state.dict
             child_impl = child_state.manager[key].impl
 
             if (
@@ -1520,15 +1608,16 @@ def backref_listeners(attribute, key, uselist):
 
             # tokens to test for a recursive loop.
             check_append_token = child_impl._append_token
-            check_bulk_replace_token = (
-                child_impl._bulk_replace_token
-                if child_impl.collection
-                else None
-            )
+            if child_impl.collection:
+                check_bulk_replace_token = child_impl._bulk_replace_token
+                check_bulk_append_token = child_impl._bulk_append_token
+            else:
+                check_bulk_replace_token = check_bulk_append_token = None
 
             if (
                 initiator is not check_append_token
                 and initiator is not check_bulk_replace_token
+                and initiator is not check_bulk_append_token
             ):
                 child_impl.append(
                     child_state,
@@ -1543,7 +1632,13 @@ def backref_listeners(attribute, key, uselist):
         if child is None:
             return
 
-        child_state, child_dict = instance_state(child), instance_dict(child)
+        # appends that are part of a bulk operation on this collection
+        # are handled by the "bulk_append" listener below.
+        if initiator.impl is parent_impl and initiator.op in _BULK_OPS:
+            return child
+
+        child_state = instance_state(child)
+        child_dict = child_state.dict
         child_impl = child_state.manager[key].impl
 
         if (
@@ -1554,13 +1649,16 @@ def backref_listeners(attribute, key, uselist):
 
         # tokens to test for a recursive loop.
         check_append_token = child_impl._append_token
-        check_bulk_replace_token = (
-            child_impl._bulk_replace_token if child_impl.collection else None
-        )
+        if child_impl.collection:
+            check_bulk_replace_token = child_impl._bulk_replace_token
+            check_bulk_append_token = child_impl._bulk_append_token
+        else:
+            check_bulk_replace_token = check_bulk_append_token = None
 
         if (
             initiator is not check_append_token
             and initiator is not check_bulk_replace_token
+            and initiator is not check_bulk_append_token
         ):
             child_impl.append(
                 child_state,
@@ -1571,13 +1669,51 @@ def backref_listeners(attribute, key, uselist):
             )
         return child
 
+    def emit_backref_from_collection_bulk_append_event(
+        state, values, initiator
+    ):
+        obj = state.obj()
+
+        for child in values:
+            if child is None:
+                continue
+
+            child_state = instance_state(child)
+            child_dict = child_state.dict
+            child_impl = child_state.manager[key].impl
+
+            if (
+                initiator.parent_token is not parent_token
+                and initiator.parent_token is not child_impl.parent_token
+            ):
+                _acceptable_key_err(state, initiator, child_impl)
+
+            # tokens to test for a recursive loop.
+            check_append_token = child_impl._append_token
+            if child_impl.collection:
+                check_bulk_replace_token = child_impl._bulk_replace_token
+                check_bulk_append_token = child_impl._bulk_append_token
+            else:
+                check_bulk_replace_token = check_bulk_append_token = None
+
+            if (
+                initiator is not check_append_token
+                and initiator is not check_bulk_replace_token
+                and initiator is not check_bulk_append_token
+            ):
+                child_impl.append(
+                    child_state,
+                    child_dict,
+                    obj,
+                    initiator,
+                    passive=PASSIVE_NO_FETCH,
+                )
+
     def emit_backref_from_collection_remove_event(state, child, initiator):
         if child is None or child is PASSIVE_NO_RESULT or child is NO_VALUE:
             return
-        child_state, child_dict = (
-            instance_state(child),
-            instance_dict(child),
-        )
+        child_state = instance_state(child)
+        child_dict = child_state.dict
         child_impl = child_state.manager[key].impl
 
             # tokens to test for a recursive loop.
@@ -1621,6 +1757,13 @@ def backref_listeners(attribute, key, uselist):
             retval=True,
             raw=True,
         )
+        if not parent_impl.dynamic:
+            event.listen(
+                attribute,
+                "bulk_append",
+                emit_backref_from_collection_bulk_append_event,
+                raw=True,
+            )
     else:
         event.listen(
             attribute,
@@ -1639,6 +1782,8 @@ def backref_listeners(attribute, key, uselist):
     )
 
 
+_BULK_OPS = (OP_BULK_APPEND, OP_BULK_REPLACE)
+
 _NO_HISTORY = util.symbol("NO_HISTORY")
 _NO_STATE_SYMBOLS = frozenset([id(PASSIVE_NO_RESULT), id(NO_VALUE)])
 
@@ -1926,7 +2071,12 @@ def register_descriptor(
 ):
     manager = manager_of_class(class_)
 
-    descriptor = InstrumentedAttribute(
+    if manager._slot_descriptors is not None:
+        descriptor_cls = _SlotsInstrumentedAttribute
+    else:
+        descriptor_cls = InstrumentedAttribute
+
+    descriptor = descriptor_cls(
         class_, key, comparator=comparator, parententity=parententity
     )
 
@@ -1998,7 +2148,8 @@ def set_committed_value(instance, key, value):
     as though it were part of its original loaded state.
 
     """
-    state, dict_ = instance_state(instance), instance_dict(instance)
+    state = instance_state(instance)
+    dict_ = state.dict
     state.manager[key].impl.set_committed_value(state, dict_, value)
 
 
@@ -2027,7 +2178,8 @@ def set_attribute(instance, key, value, initiator=None):
      .. versionadded:: 1.2.3
 
     """
-    state, dict_ = instance_state(instance), instance_dict(instance)
+    state = instance_state(instance)
+    dict_ = state.dict
     state.manager[key].impl.set(state, dict_, value, initiator)
 
 
@@ -2041,7 +2193,8 @@ def get_attribute(instance, key):
     by SQLAlchemy.
 
     """
-    state, dict_ = instance_state(instance), instance_dict(instance)
+    state = instance_state(instance)
+    dict_ = state.dict
     return state.manager[key].impl.get(state, dict_)
 
 
@@ -2055,7 +2208,8 @@ def del_attribute(instance, key):
     by SQLAlchemy.
 
     """
-    state, dict_ = instance_state(instance), instance_dict(instance)
+    state = instance_state(instance)
+    dict_ = state.dict
     state.manager[key].impl.delete(state, dict_)
 
 
@@ -2076,7 +2230,8 @@ def flag_modified(instance, key):
         :func:`.attributes.flag_dirty`
 
     """
-    state, dict_ = instance_state(instance), instance_dict(instance)
+    state = instance_state(instance)
+    dict_ = state.dict
     impl = state.manager[key].impl
     impl.dispatch.modified(state, impl._modified_token)
     state._modified_event(dict_, impl, NO_VALUE, is_userland=True)
@@ -2102,5 +2257,6 @@ def flag_dirty(instance):
 
     """
 
-    state, dict_ = instance_state(instance), instance_dict(instance)
+    state = instance_state(instance)
+    dict_ = state.dict
     state._modified_event(dict_, None, NO_VALUE, is_userland=True)
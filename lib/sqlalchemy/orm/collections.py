@@ -727,6 +727,29 @@ class CollectionAdapter(object):
         else:
             return item
 
+    def fire_bulk_append_event(self, items, initiator=None):
+        """Notify that a list of entities is entering the collection.
+
+        A single "bulk_append" event is emitted for the full list; per-item
+        "append" listeners are invoked for each member as well.  Returns
+        the list of items, which may have been modified by listeners.
+
+        .. versionadded:: 1.4
+
+        """
+        if initiator is not False:
+            if self.invalidated:
+                self._warn_invalidated()
+
+            if self.empty:
+                self._reset_empty()
+
+            return self.attr.fire_bulk_append_event(
+                self.owner_state, self.owner_state.dict, items, initiator
+            )
+        else:
+            return items
+
     def fire_remove_event(self, item, initiator=None):
         """Notify that a entity has been removed from the collection.
 
@@ -809,10 +832,31 @@ def bulk_replace(values, existing_adapter, new_adapter, initiator=None):
 
     appender = new_adapter.bulk_appender()
 
-    for member in values or ():
-        if member in additions:
-            appender(member, _sa_initiator=initiator)
-        elif member in constants:
+    # events for all new members are emitted up front as a single
+    # "bulk_append"; listeners may replace, remove or add members
+    new_members = [member for member in values or () if member in additions]
+    if new_members:
+        added = new_adapter.fire_bulk_append_event(
+            list(new_members), initiator
+        )
+    else:
+        added = []
+
+    if len(added) == len(new_members):
+        # members were kept or replaced one for one; each stays in place
+        added = iter(added)
+        for member in values or ():
+            if member in additions:
+                appender(next(added), _sa_initiator=False)
+            elif member in constants:
+                appender(member, _sa_initiator=False)
+    else:
+        # the existing members keep their order, followed by the members
+        # as returned by the listeners
+        for member in values or ():
+            if member in constants:
+                appender(member, _sa_initiator=False)
+        for member in added:
             appender(member, _sa_initiator=False)
 
     if existing_adapter:
@@ -1090,6 +1134,21 @@ def __set(collection, item, _sa_initiator=None):
     return item
 
 
+def __set_multiple(collection, items, _sa_initiator=None):
+    """Run a single bulk set event for a list of items.
+
+    This event always occurs before the collection is actually mutated.
+
+    """
+
+    items = list(items)
+    if _sa_initiator is not False and items:
+        executor = collection._sa_adapter
+        if executor:
+            items = executor.fire_bulk_append_event(items, _sa_initiator)
+    return items
+
+
 def __del(collection, item, _sa_initiator=None):
     """Run del events.
 
@@ -1225,8 +1284,8 @@ def _list_decorators():
 
     def extend(fn):
         def extend(self, iterable):
-            for value in iterable:
-                self.append(value)
+            for value in __set_multiple(self, iterable):
+                self.append(value, _sa_initiator=False)
 
         _tidy(extend)
         return extend
@@ -1235,8 +1294,8 @@ def _list_decorators():
         def __iadd__(self, iterable):
             # list.__iadd__ takes any iterable and seems to let TypeError
             # raise as-is instead of returning NotImplemented
-            for value in iterable:
-                self.append(value)
+            for value in __set_multiple(self, iterable):
+                self.append(value, _sa_initiator=False)
             return self
 
         _tidy(__iadd__)
@@ -1370,6 +1429,12 @@ def _dict_decorators():
 _set_binop_bases = (set, frozenset)
 
 
+def _set_additions(self, values):
+    """Return the members of ``values`` not yet present in the set ``self``,
+    de-duplicated and in iteration order."""
+    return util.unique_list(value for value in values if value not in self)
+
+
 def _set_binops_check_strict(self, obj):
     """Allow only set, frozenset and self.__class__-derived
     objects in binops."""
@@ -1447,8 +1512,8 @@ def _set_decorators():
 
     def update(fn):
         def update(self, value):
-            for item in value:
-                self.add(item)
+            for item in __set_multiple(self, _set_additions(self, value)):
+                self.add(item, _sa_initiator=False)
 
         _tidy(update)
         return update
@@ -1457,8 +1522,8 @@ def _set_decorators():
         def __ior__(self, value):
             if not _set_binops_check_strict(self, value):
                 return NotImplemented
-            for item in value:
-                self.add(item)
+            for item in __set_multiple(self, _set_additions(self, value)):
+                self.add(item, _sa_initiator=False)
             return self
 
         _tidy(__ior__)
@@ -1172,6 +1172,10 @@ class ManyToManyDP(DependencyProcessor):
         self, uowcommit, secondary_insert, secondary_update, secondary_delete
     ):
         connection = uowcommit.transaction.connection(self.mapper)
+        if uowcommit.profile is not None:
+            connection = uowcommit.profile._connection(
+                connection, self.parent.base_mapper
+            )
 
         if secondary_delete:
             associationrow = secondary_delete[0]
@@ -174,8 +174,8 @@ class CompositeProperty(DescriptorProperty):
         """
 
         def fget(instance):
-            dict_ = attributes.instance_dict(instance)
             state = attributes.instance_state(instance)
+            dict_ = state.dict
 
             if self.key not in dict_:
                 # key not present.  Iterate through related
@@ -197,8 +197,8 @@ class CompositeProperty(DescriptorProperty):
             return dict_.get(self.key, None)
 
         def fset(instance, value):
-            dict_ = attributes.instance_dict(instance)
             state = attributes.instance_state(instance)
+            dict_ = state.dict
             attr = state.manager[self.key]
             previous = dict_.get(self.key, attributes.NO_VALUE)
             for fn in attr.dispatch.set:
@@ -215,7 +215,7 @@ class CompositeProperty(DescriptorProperty):
 
         def fdel(instance):
             state = attributes.instance_state(instance)
-            dict_ = attributes.instance_dict(instance)
+            dict_ = state.dict
             previous = dict_.pop(self.key, attributes.NO_VALUE)
             attr = state.manager[self.key]
             attr.dispatch.remove(state, previous, attr.impl)
@@ -550,29 +550,17 @@ class AppenderQuery(Generative):
             return self.session.execute(stmt).scalar()
 
     def extend(self, iterator):
+        state = attributes.instance_state(self.instance)
         for item in iterator:
-            self.attr.append(
-                attributes.instance_state(self.instance),
-                attributes.instance_dict(self.instance),
-                item,
-                None,
-            )
+            self.attr.append(state, state.dict, item, None)
 
     def append(self, item):
-        self.attr.append(
-            attributes.instance_state(self.instance),
-            attributes.instance_dict(self.instance),
-            item,
-            None,
-        )
+        state = attributes.instance_state(self.instance)
+        self.attr.append(state, state.dict, item, None)
 
     def remove(self, item):
-        self.attr.remove(
-            attributes.instance_state(self.instance),
-            attributes.instance_dict(self.instance),
-            item,
-            None,
-        )
+        state = attributes.instance_state(self.instance)
+        self.attr.remove(state, state.dict, item, None)
 
 
 class CollectionHistory(object):
@@ -1695,6 +1695,39 @@ class SessionEvents(event.Events):
 
         """
 
+    def flush_profile(self, session, flush_context, profile):
+        """Receive timings and statement counts for a flush which has
+        completed.
+
+        Establishing a listener for this event enables the collection of
+        a :class:`.FlushProfile` for each flush of the :class:`.Session`;
+        when no listener is present, no timings are collected.  The event is
+        invoked after the flush has completed and after
+        :meth:`.SessionEvents.after_flush_postexec`, and is not invoked for
+        a flush which had nothing to do or which failed.
+
+        The profile may be passed along to a monitoring system, or
+        retained on the :attr:`.Session.info` dictionary::
+
+            @event.listens_for(Session, "flush_profile")
+            def receive_flush_profile(session, flush_context, profile):
+                session.info.setdefault("flush_profiles", []).append(profile)
+
+        :param session: The target :class:`.Session`.
+        :param flush_context: Internal :class:`.UOWTransaction` object
+         which handled the details of the flush.
+        :param profile: a :class:`.FlushProfile` object.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :class:`.FlushProfile`
+
+            :meth:`~.SessionEvents.after_flush_postexec`
+
+        """
+
     def after_begin(self, session, transaction, connection):
         """Execute after a transaction is begun on a connection
 
@@ -2298,6 +2331,59 @@ class AttributeEvents(event.Events):
 
         """
 
+    def bulk_append(self, target, values, initiator):
+        """Receive a collection 'bulk append' event.
+
+        This event is invoked once for a list of values entering a
+        collection as part of a single operation, such as ``list.extend()``,
+        ``set.update()``, or the new members of a bulk collection set.
+        The list may be modified in place by the handler; the modified
+        values are the ones that are then added to the collection.
+
+        The :meth:`.AttributeEvents.append` event continues to be invoked
+        for each individual value, after the
+        :meth:`.AttributeEvents.bulk_append` event has been invoked for the
+        list as a whole.  A handler for both events may test the incoming
+        initiator against :attr:`~.attributes.OP_BULK_APPEND` to detect
+        values that have already been processed in bulk::
+
+            from sqlalchemy.orm.attributes import OP_BULK_APPEND
+
+            @event.listens_for(SomeObject.collection, "bulk_append")
+            def process_collection(target, values, initiator):
+                values[:] = [_make_value(value) for value in values]
+
+            @event.listens_for(SomeObject.collection, "append", retval=True)
+            def process_value(target, value, initiator):
+                # make sure bulk_append didn't already do it
+                if initiator is None or initiator.op is not OP_BULK_APPEND:
+                    return _make_value(value)
+                else:
+                    return value
+
+        When invoked as part of a bulk replace, the initiator will instead
+        carry the :attr:`~.attributes.OP_BULK_REPLACE` symbol, and the
+        values are those which were not already present in the collection.
+
+        .. versionadded:: 1.4
+
+        :param target: the object instance receiving the event.
+          If the listener is registered with ``raw=True``, this will
+          be the :class:`.InstanceState` object.
+        :param values: a list of the values being appended.  The
+          handler can modify this list in place.
+        :param initiator: An instance of :class:`.attributes.Event`
+          representing the initiation of the event.
+
+        .. seealso::
+
+            :class:`.AttributeEvents` - background on listener options such
+            as propagation to subclasses.
+
+            :meth:`.AttributeEvents.bulk_replace`
+
+        """
+
     def remove(self, target, value, initiator):
         """Receive a collection remove event.
 
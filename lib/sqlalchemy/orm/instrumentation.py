@@ -29,12 +29,14 @@ alternate instrumentation forms.
 
 """
 
+import types
 
 from . import base
 from . import collections
 from . import exc
 from . import interfaces
 from . import state
+from .. import exc as sa_exc
 from .. import util
 from ..util import HasMemoized
 
@@ -54,6 +56,11 @@ class ClassManager(HasMemoized, dict):
 
     factory = None
 
+    _slot_descriptors = None
+    """For a class whose instances have no ``__dict__``, a dictionary of
+    attribute key to the ``__slots__`` member descriptor that stores the
+    value of that key."""
+
     @property
     @util.deprecated(
         "1.4",
@@ -92,6 +99,9 @@ class ClassManager(HasMemoized, dict):
         for base_ in self._bases:
             self.update(base_)
 
+        if not class_.__dictoffset__:
+            self._setup_slots()
+
         self.dispatch._events._new_classmanager_instance(class_, self)
         # events._InstanceEventsHold.populate(class_, self)
 
@@ -110,6 +120,43 @@ class ClassManager(HasMemoized, dict):
                 "reference cycles.  Please remove this method." % class_
             )
 
+    def _setup_slots(self):
+        """Locate the ``__slots__`` storage of a class whose instances
+        have no ``__dict__``.
+
+        The member descriptors for each slot are collected before
+        instrumented attributes are installed over them, so that the
+        instance dictionary of each :class:`._SlotsInstanceState` can
+        read and write attribute values directly from the slots.
+
+        """
+        class_ = self.class_
+
+        if self.STATE_ATTR not in _slot_names(class_):
+            raise sa_exc.ArgumentError(
+                "Class %s declares __slots__ without a __dict__; "
+                "the name %r must be present in __slots__ in order "
+                "for the class to be instrumented."
+                % (class_, self.STATE_ATTR)
+            )
+        if not class_.__weakrefoffset__:
+            raise sa_exc.ArgumentError(
+                "Class %s declares __slots__ without a __dict__; "
+                "the name '__weakref__' must be present in __slots__ in "
+                "order for the class to be instrumented." % (class_,)
+            )
+
+        slot_descriptors = {}
+        for base_ in self._bases:
+            if base_._slot_descriptors:
+                slot_descriptors.update(base_._slot_descriptors)
+        for supercls in reversed(class_.__mro__):
+            for key, value in supercls.__dict__.items():
+                if isinstance(value, types.MemberDescriptorType):
+                    slot_descriptors[key] = value
+        slot_descriptors.pop(self.STATE_ATTR, None)
+        self._slot_descriptors = slot_descriptors
+
     def __hash__(self):
         return id(self)
 
@@ -214,6 +261,8 @@ class ClassManager(HasMemoized, dict):
     @util.memoized_property
     def _state_constructor(self):
         self.dispatch.first_init(self, self.class_)
+        if self._slot_descriptors is not None:
+            return state._SlotsInstanceState
         return state.InstanceState
 
     def manage(self):
@@ -243,6 +292,8 @@ class ClassManager(HasMemoized, dict):
 
     @util.hybridmethod
     def dict_getter(self):
+        if self._slot_descriptors is not None:
+            return _slots_dict_getter
         return _default_dict_getter
 
     def instrument_attribute(self, key, inst, propagated=False):
@@ -435,7 +486,7 @@ class _SerializeManager(object):
                 "Python process!" % self.class_,
             )
         elif manager.is_mapped and not manager.mapper.configured:
-            manager.mapper._configure_all()
+            manager.mapper._check_configure()
 
         # setup _sa_instance_state ahead of time so that
         # unpickle events can access the object normally.
@@ -498,6 +549,27 @@ instance_dict = _default_dict_getter = base.instance_dict
 manager_of_class = _default_manager_getter = base.manager_of_class
 
 
+def _slot_names(class_):
+    """Return the set of names declared in ``__slots__`` across the
+    inheritance hierarchy of the given class."""
+
+    names = set()
+    for supercls in class_.__mro__:
+        slots = supercls.__dict__.get("__slots__", ())
+        if isinstance(slots, util.string_types):
+            slots = (slots,)
+        names.update(slots)
+    return names
+
+
+def _slots_dict_getter(instance):
+    """Return the instance dictionary of an instance whose class
+    declares ``__slots__``, as established by its
+    :class:`._SlotsInstanceState`."""
+
+    return instance_state(instance).dict
+
+
 def register_class(class_):
     """Register class instrumentation.
 
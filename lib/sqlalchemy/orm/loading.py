@@ -167,9 +167,10 @@ def merge_frozen_result(session, statement, frozen_result, load=True):
         for newrow in frozen_result.rewrite_rows():
             for i in mapped_entities:
                 if newrow[i] is not None:
+                    state = attributes.instance_state(newrow[i])
                     newrow[i] = session._merge(
-                        attributes.instance_state(newrow[i]),
-                        attributes.instance_dict(newrow[i]),
+                        state,
+                        state.dict,
                         load=load,
                         _recursive={},
                         _resolve_conflict_map={},
@@ -211,13 +212,13 @@ def merge_result(query, iterator, load=True):
             if isinstance(ctx._entities[0], querycontext._MapperEntity):
                 result = [
                     session._merge(
-                        attributes.instance_state(instance),
-                        attributes.instance_dict(instance),
+                        state,
+                        state.dict,
                         load=load,
                         _recursive={},
                         _resolve_conflict_map={},
                     )
-                    for instance in iterator
+                    for state in map(attributes.instance_state, iterator)
                 ]
             else:
                 result = list(iterator)
@@ -238,9 +239,10 @@ def merge_result(query, iterator, load=True):
                 newrow = list(row)
                 for i in mapped_entities:
                     if newrow[i] is not None:
+                        state = attributes.instance_state(newrow[i])
                         newrow[i] = session._merge(
-                            attributes.instance_state(newrow[i]),
-                            attributes.instance_dict(newrow[i]),
+                            state,
+                            state.dict,
                             load=load,
                             _recursive={},
                             _resolve_conflict_map={},
@@ -687,7 +689,7 @@ def _instance_processor(
     if persistent_evt:
         loaded_as_persistent = context.session.dispatch.loaded_as_persistent
     instance_state = attributes.instance_state
-    instance_dict = attributes.instance_dict
+    instance_dict = mapper.class_manager.dict_getter()
     session_id = context.session.hash_key
     runid = context.runid
     identity_token = context.identity_token
@@ -113,6 +113,11 @@ class Mapper(
     _new_mappers = False
     _dispose_called = False
 
+    # incremental configuration; see configure_incrementally()
+    _incremental_configure = False
+    _configure_generation = 0
+    _configured_generation = None
+
     @util.deprecated_params(
         non_primary=(
             "1.3",
@@ -152,6 +157,7 @@ class Mapper(
         confirm_deleted_rows=True,
         eager_defaults=False,
         legacy_is_orphan=False,
+        update_from_values=False,
         _compiled_cache_size=100,
     ):
         r"""Return a new :class:`_orm.Mapper` object.
@@ -538,6 +544,24 @@ class Mapper(
            This is normally simply the primary key of the ``local_table``, but
            can be overridden here.
 
+        :param update_from_values: if True, when several rows of one of
+           this mapper's tables are to be UPDATEd with the same set of
+           columns, the values for all rows are applied in a single
+           UPDATE..FROM statement against a derived table of per-row
+           values, joined to the target table on primary key, rather than
+           by an executemany() of one UPDATE per row.  This applies to both
+           the unit of work and :meth:`.Session.bulk_update_mappings`, for
+           backends which support UPDATE..FROM against a subquery, which
+           includes PostgreSQL, MySQL, SQL Server and SQLite 3.33 and above;
+           other backends continue to use executemany().  The number of rows
+           matched is still checked against the number of rows expected.
+           Mappers which make use of a version counter, or rows which need
+           server-generated defaults fetched, always use individual
+           UPDATE statements.  Set on the base mapper of an inheritance
+           hierarchy.
+
+           .. versionadded:: 1.4
+
         :param version_id_col: A :class:`_schema.Column`
            that will be used to keep a running version id of rows
            in the table.  This is used to detect concurrent updates or
@@ -633,6 +657,7 @@ class Mapper(
         self._delete_orphans = []
         self.batch = batch
         self.eager_defaults = eager_defaults
+        self.update_from_values = update_from_values
         self.column_prefix = column_prefix
         self.polymorphic_on = (
             coercions.expect(
@@ -695,6 +720,7 @@ class Mapper(
             self._configure_polymorphic_setter()
             self._configure_pks()
             Mapper._new_mappers = True
+            Mapper._configure_generation += 1
             self._log("constructed")
             self._expire_memoizations()
 
@@ -1281,6 +1307,22 @@ class Mapper(
         """
         configure_mappers()
 
+    def _check_configure(self):
+        """Configure mappers as needed before this mapper is used.
+
+        Calls upon :func:`.configure_mappers` to configure all mappers,
+        or when incremental configuration is in effect, only those
+        mappers reachable from this one.
+
+        """
+        if not Mapper._new_mappers:
+            return
+        elif Mapper._incremental_configure:
+            if self._configured_generation != Mapper._configure_generation:
+                _configure_reachable(self)
+        else:
+            configure_mappers()
+
     def dispose(self):
         # Disable any attribute-based compilation.
         self.configured = True
@@ -1985,7 +2027,7 @@ class Mapper(
         """
 
         if _configure_mappers and Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
 
         try:
             return self._props[key]
@@ -2007,7 +2049,7 @@ class Mapper(
     def iterate_properties(self):
         """return an iterator of all MapperProperty objects."""
         if Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
         return iter(self._props.values())
 
     def _mappers_from_spec(self, spec, selectable):
@@ -2083,7 +2125,7 @@ class Mapper(
     @HasMemoized.memoized_attribute
     def _with_polymorphic_mappers(self):
         if Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
         if not self.with_polymorphic:
             return []
         return self._mappers_from_spec(*self.with_polymorphic)
@@ -2100,7 +2142,7 @@ class Mapper(
 
         """
         if Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
 
     @HasMemoized.memoized_attribute
     def _with_polymorphic_selectable(self):
@@ -2359,7 +2401,7 @@ class Mapper(
 
         """
         if Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
         return util.ImmutableProperties(self._props)
 
     @HasMemoized.memoized_attribute
@@ -2493,7 +2535,7 @@ class Mapper(
 
     def _filter_properties(self, type_):
         if Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
         return util.ImmutableProperties(
             util.OrderedDict(
                 (k, v) for k, v in self._props.items() if isinstance(v, type_)
@@ -2559,13 +2601,21 @@ class Mapper(
         return result
 
     def _is_userland_descriptor(self, obj):
-        return not isinstance(
+        if isinstance(
             obj,
             (
                 _MappedAttribute,
                 instrumentation.ClassManager,
                 expression.ColumnElement,
             ),
+        ):
+            return False
+
+        # __slots__ members of a class without a __dict__ are
+        # the storage for instrumented attributes, not user descriptors
+        return not (
+            self.class_manager._slot_descriptors is not None
+            and isinstance(obj, types.MemberDescriptorType)
         )
 
     def _should_exclude(self, name, assigned_name, local, column):
@@ -2830,9 +2880,8 @@ class Mapper(
 
     def _get_committed_attr_by_column(self, obj, column):
         state = attributes.instance_state(obj)
-        dict_ = attributes.instance_dict(obj)
         return self._get_committed_state_attr_by_column(
-            state, dict_, column, passive=attributes.PASSIVE_OFF
+            state, state.dict, column, passive=attributes.PASSIVE_OFF
         )
 
     def _get_committed_state_attr_by_column(
@@ -3257,38 +3306,8 @@ def configure_mappers():
             # the order of mapper compilation
 
             for mapper in list(_mapper_registry):
-                run_configure = None
-                for fn in mapper.dispatch.before_mapper_configured:
-                    run_configure = fn(mapper, mapper.class_)
-                    if run_configure is EXT_SKIP:
-                        has_skip = True
-                        break
-                if run_configure is EXT_SKIP:
-                    continue
-
-                if getattr(mapper, "_configure_failed", False):
-                    e = sa_exc.InvalidRequestError(
-                        "One or more mappers failed to initialize - "
-                        "can't proceed with initialization of other "
-                        "mappers. Triggering mapper: '%s'. "
-                        "Original exception was: %s"
-                        % (mapper, mapper._configure_failed)
-                    )
-                    e._configure_failed = mapper._configure_failed
-                    raise e
-
-                if not mapper.configured:
-                    try:
-                        mapper._post_configure_properties()
-                        mapper._expire_memoizations()
-                        mapper.dispatch.mapper_configured(
-                            mapper, mapper.class_
-                        )
-                    except Exception:
-                        exc = sys.exc_info()[1]
-                        if not hasattr(exc, "_configure_failed"):
-                            mapper._configure_failed = exc
-                        raise
+                if not _configure_mapper(mapper):
+                    has_skip = True
 
             if not has_skip:
                 Mapper._new_mappers = False
@@ -3297,6 +3316,167 @@ def configure_mappers():
     Mapper.dispatch._for_class(Mapper).after_configured()
 
 
+def _configure_mapper(mapper):
+    """Configure a single mapper as part of a configure step.
+
+    Returns False if a :meth:`.MapperEvents.before_mapper_configured`
+    hook requested that the mapper be skipped.
+
+    """
+    for fn in mapper.dispatch.before_mapper_configured:
+        if fn(mapper, mapper.class_) is EXT_SKIP:
+            return False
+
+    if getattr(mapper, "_configure_failed", False):
+        e = sa_exc.InvalidRequestError(
+            "One or more mappers failed to initialize - "
+            "can't proceed with initialization of other "
+            "mappers. Triggering mapper: '%s'. "
+            "Original exception was: %s" % (mapper, mapper._configure_failed)
+        )
+        e._configure_failed = mapper._configure_failed
+        raise e
+
+    if not mapper.configured:
+        try:
+            mapper._post_configure_properties()
+            mapper._expire_memoizations()
+            mapper.dispatch.mapper_configured(mapper, mapper.class_)
+        except Exception:
+            exc = sys.exc_info()[1]
+            if not hasattr(exc, "_configure_failed"):
+                mapper._configure_failed = exc
+            raise
+    return True
+
+
+def configure_incrementally(enabled=True):
+    """Establish whether mappers are configured incrementally.
+
+    By default, the first use of any mapping configures all mappers that
+    have been constructed, as though :func:`.configure_mappers` were
+    called.   With incremental configuration enabled, using a mapper
+    instead configures only that mapper along with those reachable from
+    it; that is, the other mappers within its inheritance hierarchy and
+    the targets of its relationships, followed transitively, as well as
+    mappers not yet configured which would establish a backref onto any of
+    these.   Applications with a very large number of mappings, of which
+    only a few are used by a particular process, will start up more
+    quickly.
+
+    The :meth:`.MapperEvents.before_configured` and
+    :meth:`.MapperEvents.after_configured` events are emitted around each
+    incremental step that configures at least one mapper.  An explicit call
+    to :func:`.configure_mappers` continues to configure all mappers.
+
+    :param enabled: if False, restore the default behavior of configuring
+     all mappers on first use.
+
+    .. versionadded:: 1.4
+
+    """
+    Mapper._incremental_configure = enabled
+
+
+def _configure_reachable(start):
+    """Configure the given mapper and all mappers reachable from it.
+
+    This is the incremental form of :func:`.configure_mappers`.
+
+    """
+    configured = False
+
+    with _CONFIGURE_MUTEX:
+        global _already_compiling
+        if _already_compiling:
+            return
+        _already_compiling = True
+        try:
+            generation = Mapper._configure_generation
+
+            # double-check inside mutex
+            if start._configured_generation == generation:
+                return
+
+            backref_sources = _backref_sources()
+            seen = set()
+            todo = [start]
+            has_skip = False
+
+            while todo:
+                mapper = todo.pop()
+                if mapper in seen:
+                    continue
+                for m in mapper.base_mapper.self_and_descendants:
+                    if m in seen:
+                        continue
+                    seen.add(m)
+
+                    if not m.configured:
+                        if not configured:
+                            configured = True
+                            Mapper.dispatch._for_class(
+                                Mapper
+                            ).before_configured()
+                        if not _configure_mapper(m):
+                            has_skip = True
+                            continue
+
+                    todo.extend(_relationship_targets(m))
+
+                todo.extend(backref_sources.get(mapper.base_mapper, ()))
+
+            if not has_skip:
+                for m in seen:
+                    m._configured_generation = generation
+
+                if all(m.configured for m in _mapper_registry):
+                    Mapper._new_mappers = False
+        finally:
+            _already_compiling = False
+
+    if configured:
+        Mapper.dispatch._for_class(Mapper).after_configured()
+
+
+@util.preload_module("sqlalchemy.orm.relationships")
+def _relationship_targets(mapper):
+    """Return the target mappers of the relationships on a mapper."""
+
+    relationships = util.preloaded.orm_relationships
+    return [
+        prop.mapper
+        for prop in mapper._props.values()
+        if isinstance(prop, relationships.RelationshipProperty)
+    ]
+
+
+@util.preload_module("sqlalchemy.orm.relationships")
+def _backref_sources():
+    """Return a dictionary of base mappers to the not yet configured
+    mappers which would establish a backref upon them."""
+
+    relationships = util.preloaded.orm_relationships
+    sources = util.defaultdict(list)
+    for mapper in list(_mapper_registry):
+        if mapper.configured:
+            continue
+        for prop in mapper._props.values():
+            if (
+                not isinstance(prop, relationships.RelationshipProperty)
+                or not prop.backref
+            ):
+                continue
+            try:
+                target = prop.mapper
+            except Exception:
+                # a target which can't be resolved yet will raise when
+                # the mapper itself is configured
+                continue
+            sources[target.base_mapper].append(mapper)
+    return sources
+
+
 def reconstructor(fn):
     """Decorate a method as the 'reconstructor' hook.
 
@@ -3388,7 +3568,7 @@ def _event_on_first_init(manager, cls):
 
     instrumenting_mapper = manager.info.get(_INSTRUMENTOR)
     if instrumenting_mapper and Mapper._new_mappers:
-        configure_mappers()
+        instrumenting_mapper._check_configure()
 
 
 def _event_on_init(state, args, kwargs):
@@ -3403,7 +3583,7 @@ def _event_on_init(state, args, kwargs):
     instrumenting_mapper = state.manager.info.get(_INSTRUMENTOR)
     if instrumenting_mapper:
         if Mapper._new_mappers:
-            configure_mappers()
+            instrumenting_mapper._check_configure()
         if instrumenting_mapper._set_polymorphic_identity:
             instrumenting_mapper._set_polymorphic_identity(state)
 
@@ -54,22 +54,46 @@ def _bulk_insert(
 
     cached_connections = _cached_connection_dict(base_mapper)
 
-    if session_transaction.session.connection_callable:
-        raise NotImplementedError(
-            "connection_callable / per-instance sharding "
-            "not supported in bulk_insert()"
-        )
-
+    states = None
     if isstates:
-        if return_defaults:
-            states = [(state, state.dict) for state in mappings]
-            mappings = [dict_ for (state, dict_) in states]
-        else:
-            mappings = [state.dict for state in mappings]
+        states = list(mappings)
+        mappings = [state.dict for state in states]
     else:
         mappings = list(mappings)
 
-    connection = session_transaction.connection(base_mapper)
+    for connection, connection_mappings in _connections_for_mappings(
+        mapper, session_transaction, mappings, states
+    ):
+        _bulk_insert_for_connection(
+            mapper,
+            base_mapper,
+            cached_connections,
+            connection,
+            connection_mappings,
+            return_defaults,
+            render_nulls,
+        )
+
+    if return_defaults and isstates:
+        identity_cls = mapper._identity_class
+        identity_props = [p.key for p in mapper._identity_key_props]
+        for state in states:
+            state.key = (
+                identity_cls,
+                tuple(state.dict[key] for key in identity_props),
+                state.identity_token,
+            )
+
+
+def _bulk_insert_for_connection(
+    mapper,
+    base_mapper,
+    cached_connections,
+    connection,
+    mappings,
+    return_defaults,
+    render_nulls,
+):
     for table, super_mapper in base_mapper._sorted_tables.items():
         if not mapper.isa(super_mapper):
             continue
@@ -112,12 +136,6 @@ def _bulk_insert(
             bookkeeping=return_defaults,
         )
 
-    if return_defaults and isstates:
-        identity_cls = mapper._identity_class
-        identity_props = [p.key for p in mapper._identity_key_props]
-        for state, dict_ in states:
-            state.key = (identity_cls, tuple(dict_[key] for key in identity_props))
-
 
 def _bulk_update(
     mapper, mappings, session_transaction, isstates, update_changed_only
@@ -134,22 +152,31 @@ def _bulk_update(
         return {k: v for k, v in state.dict.items()
                 if k in state.committed_state or k in search_keys}
 
+    states = None
     if isstates:
+        states = list(mappings)
         if update_changed_only:
-            mappings = [_changed_dict(mapper, state) for state in mappings]
+            mappings = [_changed_dict(mapper, state) for state in states]
         else:
-            mappings = [state.dict for state in mappings]
+            mappings = [state.dict for state in states]
     else:
         mappings = list(mappings)
 
-    if session_transaction.session.connection_callable:
-        raise NotImplementedError(
-            "connection_callable / per-instance sharding "
-            "not supported in bulk_update()"
+    for connection, connection_mappings in _connections_for_mappings(
+        mapper, session_transaction, mappings, states
+    ):
+        _bulk_update_for_connection(
+            mapper,
+            base_mapper,
+            cached_connections,
+            connection,
+            connection_mappings,
         )
 
-    connection = session_transaction.connection(base_mapper)
 
+def _bulk_update_for_connection(
+    mapper, base_mapper, cached_connections, connection, mappings
+):
     for table, super_mapper in base_mapper._sorted_tables.items():
         if not mapper.isa(super_mapper):
             continue
@@ -204,7 +231,11 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
 
     states_to_update = []
     states_to_insert = []
-    cached_connections = _cached_connection_dict(base_mapper)
+    profile = uowtransaction.profile
+    cached_connections = _cached_connection_dict(base_mapper, profile)
+
+    if profile is not None:
+        profile._begin("collect", base_mapper)
 
     for (
         state,
@@ -222,6 +253,9 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
         else:
             states_to_insert.append((state, dict_, mapper, connection))
 
+    if profile is not None:
+        profile._end()
+
     for table, mapper in base_mapper._sorted_tables.items():
         if table not in mapper._pks_by_table:
             continue
@@ -231,6 +265,15 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
             uowtransaction, table, states_to_update
         )
 
+        if profile is not None:
+            # collect parameters up front, so that their assembly is
+            # timed separately from statement execution
+            profile._begin("collect", base_mapper, table)
+            insert = list(insert)
+            update = list(update)
+            profile._end()
+            profile._begin("postfetch", base_mapper, table)
+
         _emit_update_statements(
             base_mapper,
             uowtransaction,
@@ -249,6 +292,12 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
             insert,
         )
 
+        if profile is not None:
+            profile._end()
+
+    if profile is not None:
+        profile._begin("postfetch", base_mapper)
+
     _finalize_insert_update_commands(
         base_mapper,
         uowtransaction,
@@ -270,18 +319,28 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
         ),
     )
 
+    if profile is not None:
+        profile._end()
+
 
 def post_update(base_mapper, states, uowtransaction, post_update_cols):
     """Issue UPDATE statements on behalf of a relationship() which
     specifies post_update.
 
     """
-    cached_connections = _cached_connection_dict(base_mapper)
+    profile = uowtransaction.profile
+    cached_connections = _cached_connection_dict(base_mapper, profile)
+
+    if profile is not None:
+        profile._begin("collect", base_mapper)
 
     states_to_update = list(
         _organize_states_for_post_update(base_mapper, states, uowtransaction)
     )
 
+    if profile is not None:
+        profile._end()
+
     for table, mapper in base_mapper._sorted_tables.items():
         if table not in mapper._pks_by_table:
             continue
@@ -306,6 +365,12 @@ def post_update(base_mapper, states, uowtransaction, post_update_cols):
             base_mapper, uowtransaction, table, update, post_update_cols
         )
 
+        if profile is not None:
+            profile._begin("collect", base_mapper, table)
+            update = list(update)
+            profile._end()
+            profile._begin("postfetch", base_mapper, table)
+
         _emit_post_update_statements(
             base_mapper,
             uowtransaction,
@@ -315,6 +380,9 @@ def post_update(base_mapper, states, uowtransaction, post_update_cols):
             update,
         )
 
+        if profile is not None:
+            profile._end()
+
 
 def delete_obj(base_mapper, states, uowtransaction):
     """Issue ``DELETE`` statements for a list of objects.
@@ -324,12 +392,19 @@ def delete_obj(base_mapper, states, uowtransaction):
 
     """
 
-    cached_connections = _cached_connection_dict(base_mapper)
+    profile = uowtransaction.profile
+    cached_connections = _cached_connection_dict(base_mapper, profile)
+
+    if profile is not None:
+        profile._begin("collect", base_mapper)
 
     states_to_delete = list(
         _organize_states_for_delete(base_mapper, states, uowtransaction)
     )
 
+    if profile is not None:
+        profile._end()
+
     table_to_mapper = base_mapper._sorted_tables
 
     for table in reversed(list(table_to_mapper.keys())):
@@ -343,6 +418,12 @@ def delete_obj(base_mapper, states, uowtransaction):
             base_mapper, uowtransaction, table, states_to_delete
         )
 
+        if profile is not None:
+            profile._begin("collect", base_mapper, table)
+            delete = list(delete)
+            profile._end()
+            profile._begin("postfetch", base_mapper, table)
+
         _emit_delete_statements(
             base_mapper,
             uowtransaction,
@@ -352,6 +433,12 @@ def delete_obj(base_mapper, states, uowtransaction):
             delete,
         )
 
+        if profile is not None:
+            profile._end()
+
+    if profile is not None:
+        profile._begin("postfetch", base_mapper)
+
     for (
         state,
         state_dict,
@@ -361,6 +448,9 @@ def delete_obj(base_mapper, states, uowtransaction):
     ) in states_to_delete:
         mapper.dispatch.after_delete(mapper, connection, state)
 
+    if profile is not None:
+        profile._end()
+
 
 def _organize_states_for_save(base_mapper, states, uowtransaction):
     """Make an initial pass across a set of states for INSERT or
@@ -535,7 +625,11 @@ def _collect_insert_commands(
         if not bulk or return_defaults:
             # params are in terms of Column key objects, so
             # compare to pk_keys_by_table
-            has_all_pks = mapper._pk_keys_by_table[table].issubset(params)
+            has_all_pks = mapper._pk_keys_by_table[table].issubset(
+                params
+            ) or _pks_from_sequence_blocks(
+                mapper, table, params, connection.dialect
+            )
 
             if mapper.base_mapper.eager_defaults:
                 has_all_defaults = mapper._server_default_cols[table].issubset(
@@ -567,6 +661,26 @@ def _collect_insert_commands(
         )
 
 
+def _pks_from_sequence_blocks(mapper, table, params, dialect):
+    """Return True if each primary key column not present in the given
+    INSERT parameters will receive a value generated ahead of the INSERT,
+    from a :class:`.Sequence` which specifies ``cache_block``."""
+
+    for col in mapper._pks_by_table[table]:
+        if col.key in params:
+            continue
+        seq = col.default
+        if (
+            seq is None
+            or not seq.is_sequence
+            or seq.cache_block is None
+            or not dialect.supports_sequences
+            or (seq.optional and dialect.sequences_optional)
+        ):
+            return False
+    return True
+
+
 def _collect_update_commands(
     uowtransaction, table, states_to_update, bulk=False
 ):
@@ -887,6 +1001,16 @@ def _emit_update_statements(
 
     cached_stmt = base_mapper._memo(("update", table), update_stmt)
 
+    update_from_values = mapper.base_mapper.update_from_values
+    if update_from_values:
+        # columns which would otherwise receive a Python-side onupdate
+        # default per row
+        python_onupdate_keys = {
+            col.key
+            for col in table.c
+            if col.onupdate is not None and not col.onupdate.is_clause_element
+        }
+
     for (
         (connection, paramkeys, hasvalue, has_all_defaults, has_all_pks),
         records,
@@ -960,7 +1084,25 @@ def _emit_update_statements(
                 rows += c.rowcount
                 check_rowcount = assert_singlerow
         else:
-            if not allow_multirow:
+            if (
+                allow_multirow
+                and update_from_values
+                and not return_defaults
+                and len(records) > 1
+                and connection.dialect.supports_update_from
+                and python_onupdate_keys.issubset(paramkeys)
+            ):
+                rows += _emit_update_from_values_statements(
+                    mapper,
+                    uowtransaction,
+                    cached_connections[connection],
+                    table,
+                    records,
+                    sorted(paramkeys),
+                    bookkeeping,
+                )
+                check_rowcount = assert_singlerow
+            elif not allow_multirow:
                 check_rowcount = assert_singlerow
                 for (
                     state,
@@ -1046,6 +1188,88 @@ def _emit_update_statements(
             )
 
 
+# maximum number of bound values per UPDATE..FROM statement; this also
+# stays within SQLite's default limit of 500 SELECTs in a compound SELECT
+_UPDATE_BATCH_SIZE = 500
+
+
+def _emit_update_from_values_statements(
+    mapper, uowtransaction, connection, table, records, keys, bookkeeping
+):
+    """Emit UPDATE..FROM statements against a derived table of the
+    per-row values in the given records, for a group of records which
+    all have the same parameter keys.  Returns the number of rows
+    matched."""
+
+    cols_by_key = {}
+    for key in keys:
+        if key in table.c:
+            cols_by_key[key] = table.c[key]
+    pk_cols = mapper._pks_by_table[table]
+    for col in pk_cols:
+        cols_by_key[col._label] = col
+    set_keys = [key for key in keys if key in table.c]
+
+    # PostgreSQL infers the types of the derived table's columns from
+    # the first row, so those values are CAST to the target column types
+    cast_first_row = connection.dialect.name == "postgresql"
+
+    chunksize = max(1, _UPDATE_BATCH_SIZE // len(keys))
+    rows = 0
+    for idx in range(0, len(records), chunksize):
+        chunk = records[idx : idx + chunksize]
+
+        selects = []
+        for rec in chunk:
+            params = rec[2]
+            row = []
+            for key in keys:
+                col = cols_by_key[key]
+                elem = sql.bindparam(None, params[key], type_=col.type)
+                if cast_first_row and not selects:
+                    elem = sql.cast(elem, col.type)
+                row.append(elem.label(key))
+            selects.append(select(*row))
+        values = sql.union_all(*selects).subquery("update_values")
+
+        statement = (
+            table.update()
+            .values({table.c[key]: values.c[key] for key in set_keys})
+            .where(sql.and_(*[col == values.c[col._label] for col in pk_cols]))
+        )
+        c = connection.execute(statement)
+        rows += c.rowcount
+
+        if bookkeeping:
+            # the columns SET from the derived table are reported as
+            # "postfetch", however their values are those already present
+            # on each object
+            postfetch_cols = [
+                col
+                for col in c.context.compiled.postfetch
+                if col.key not in set_keys
+            ]
+            for (
+                state,
+                state_dict,
+                params,
+                mapper_rec,
+                connection_rec,
+                value_params,
+                has_all_defaults,
+                has_all_pks,
+            ) in chunk:
+                _postfetch_update_from(
+                    mapper_rec,
+                    uowtransaction,
+                    table,
+                    state,
+                    state_dict,
+                    postfetch_cols,
+                )
+    return rows
+
+
 def _emit_insert_statements(
     base_mapper,
     uowtransaction,
@@ -1362,6 +1586,12 @@ def _emit_post_update_statements(
             )
 
 
+# name of the expanding parameter, and the maximum number of bound
+# values per statement, used when rows are deleted in batches
+_DELETE_BATCH_KEY = "pk_batch"
+_DELETE_BATCH_SIZE = 500
+
+
 def _emit_delete_statements(
     base_mapper, uowtransaction, cached_connections, mapper, table, delete
 ):
@@ -1391,6 +1621,18 @@ def _emit_delete_statements(
 
         return table.delete().where(clauses)
 
+    pk_cols = [col for col in table.c if col in mapper._pks_by_table[table]]
+
+    def delete_batch_stmt():
+        if len(pk_cols) == 1:
+            (col,) = pk_cols
+            crit = col.in_(sql.bindparam(_DELETE_BATCH_KEY, expanding=True))
+        else:
+            crit = sql.tuple_(*pk_cols).in_(
+                sql.bindparam(_DELETE_BATCH_KEY, expanding=True)
+            )
+        return table.delete().where(crit)
+
     statement = base_mapper._memo(("delete", table), delete_stmt)
     for connection, recs in groupby(delete, lambda rec: rec[1]):  # connection
         del_objects = [params for params, connection in recs]
@@ -1401,7 +1643,43 @@ def _emit_delete_statements(
         rows_matched = -1
         only_warn = False
 
-        if (
+        batched = (
+            not need_version_id
+            and expected > 1
+            and (len(pk_cols) == 1 or connection.dialect.supports_tuple_in)
+        )
+
+        if batched:
+            # without a version counter to verify, rows can be deleted
+            # by primary key in chunks of "WHERE pk IN (...)", rather
+            # than by executemany() of one "WHERE pk = :pk" per row.
+            # the states arrive in primary key order via _sort_states(),
+            # so the IN lists and their chunks are deterministic
+            batch_statement = base_mapper._memo(
+                ("delete_batch", table), delete_batch_stmt
+            )
+            keys = [col.key for col in pk_cols]
+            if len(keys) == 1:
+                pk_values = [params[keys[0]] for params in del_objects]
+            else:
+                pk_values = [
+                    tuple(params[key] for key in keys)
+                    for params in del_objects
+                ]
+
+            chunksize = max(1, _DELETE_BATCH_SIZE // len(keys))
+            rows_matched = 0
+            for idx in range(0, expected, chunksize):
+                c = connection.execute(
+                    batch_statement,
+                    {_DELETE_BATCH_KEY: pk_values[idx : idx + chunksize]},
+                )
+                rows_matched += c.rowcount
+
+            if not connection.dialect.supports_sane_rowcount:
+                rows_matched = -1
+            only_warn = True
+        elif (
             need_version_id
             and not connection.dialect.supports_sane_multi_rowcount
         ):
@@ -1432,7 +1710,8 @@ def _emit_delete_statements(
             and rows_matched > -1
             and expected != rows_matched
             and (
-                connection.dialect.supports_sane_multi_rowcount
+                batched
+                or connection.dialect.supports_sane_multi_rowcount
                 or len(del_objects) == 1
             )
         ):
@@ -1664,6 +1943,35 @@ def _postfetch(
         )
 
 
+def _postfetch_update_from(
+    mapper, uowtransaction, table, state, dict_, postfetch_cols
+):
+    """Expire attributes in need of newly persisted database state after
+    an UPDATE..FROM statement emitted by
+    _emit_update_from_values_statements()."""
+
+    if postfetch_cols:
+        state._expire_attributes(
+            state.dict,
+            [
+                mapper._columntoproperty[c].key
+                for c in postfetch_cols
+                if c in mapper._columntoproperty
+            ],
+        )
+
+    for m, equated_pairs in mapper._table_to_equated[table]:
+        sync.populate(
+            state,
+            m,
+            state,
+            m,
+            equated_pairs,
+            uowtransaction,
+            mapper.passive_updates,
+        )
+
+
 def _postfetch_bulk_save(mapper, dict_, table):
     for m, equated_pairs in mapper._table_to_equated[table]:
         sync.bulk_populate_inherit_keys(dict_, m, equated_pairs)
@@ -1686,17 +1994,72 @@ def _connections_for_states(base_mapper, uowtransaction, states):
         connection = uowtransaction.transaction.connection(base_mapper)
         connection_callable = None
 
-    for state in _sort_states(base_mapper, states):
-        if connection_callable:
-            connection = connection_callable(base_mapper, state.obj())
+    if connection_callable:
+        # group the states by connection, keeping their order within each,
+        # so that the statements for each connection are batched together
+        # however the states of different connections were interleaved
+        by_connection = util.OrderedDict()
+        for state in _sort_states(base_mapper, states):
+            by_connection.setdefault(
+                connection_callable(base_mapper, state.obj()), []
+            ).append(state)
+
+        for connection, connection_states in by_connection.items():
+            for state in connection_states:
+                yield state, state.dict, state.manager.mapper, connection
+        return
 
+    for state in _sort_states(base_mapper, states):
         mapper = state.manager.mapper
 
         yield state, state.dict, mapper, connection
 
 
-def _cached_connection_dict(base_mapper):
+def _connections_for_mappings(mapper, session_transaction, mappings, states):
+    """Return a list of (connection, mappings) for a bulk operation.
+
+    If the session has a connection callable, the mappings are grouped by
+    the connection each belongs to, so that the statements for each
+    connection are batched together; the connection callable is passed the
+    object of each state, or for plain dictionaries a transient object
+    populated from the dictionary.
+
+    """
+    base_mapper = mapper.base_mapper
+    connection_callable = session_transaction.session.connection_callable
+    if not connection_callable:
+        return [(session_transaction.connection(base_mapper), mappings)]
+
+    if states is not None:
+        objects = (state.obj() for state in states)
+    else:
+        objects = (_transient_for_mapping(mapper, m) for m in mappings)
+
+    by_connection = util.OrderedDict()
+    for obj, mapping in zip(objects, mappings):
+        connection = connection_callable(base_mapper, obj)
+        by_connection.setdefault(connection, []).append(mapping)
+    return list(by_connection.items())
+
+
+def _transient_for_mapping(mapper, mapping):
+    obj = mapper.class_manager.new_instance()
+    attributes.instance_state(obj).dict.update(mapping)
+    return obj
+
+
+def _cached_connection_dict(base_mapper, profile=None):
     # dictionary of connection->connection_with_cache_options.
+    if profile is not None:
+        return util.PopulateDict(
+            lambda conn: profile._connection(
+                conn.execution_options(
+                    compiled_cache=base_mapper._compiled_cache
+                ),
+                base_mapper,
+            )
+        )
+
     return util.PopulateDict(
         lambda conn: conn.execution_options(
             compiled_cache=base_mapper._compiled_cache
@@ -2109,10 +2472,8 @@ class BulkORMUpdate(UpdateDMLState, BulkUDCompileState):
         attrib = set(k for k, v in values)
         for obj in update_options._matched_objects:
 
-            state, dict_ = (
-                attributes.instance_state(obj),
-                attributes.instance_dict(obj),
-            )
+            state = attributes.instance_state(obj)
+            dict_ = state.dict
 
             # the evaluated states were gathered across all identity tokens.
             # however the post_sync events are called per identity token,
@@ -2174,10 +2535,8 @@ class BulkORMUpdate(UpdateDMLState, BulkUDCompileState):
         attrib = set(k for k, v in values)
 
         for obj in objs:
-            state, dict_ = (
-                attributes.instance_state(obj),
-                attributes.instance_dict(obj),
-            )
+            state = attributes.instance_state(obj)
+            dict_ = state.dict
 
             to_evaluate = state.unmodified.intersection(evaluated_keys)
             for key in to_evaluate:
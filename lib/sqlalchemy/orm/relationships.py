@@ -1612,7 +1612,7 @@ class RelationshipProperty(StrategizedProperty):
         def property(self):
             mapperlib = util.preloaded.orm_mapper
             if mapperlib.Mapper._new_mappers:
-                mapperlib.Mapper._configure_all()
+                self.prop.parent._check_configure()
             return self.prop
 
     def _with_parent(self, instance, alias_secondary=True, from_entity=None):
@@ -1673,7 +1673,7 @@ class RelationshipProperty(StrategizedProperty):
         else:
             mapper = self.parent
 
-        dict_ = attributes.instance_dict(state.obj())
+        dict_ = state.dict
 
         def visit_bindparam(bindparam):
             if bindparam._identifying_key in bind_to_col:
@@ -1855,7 +1855,7 @@ class RelationshipProperty(StrategizedProperty):
             dest_list = []
             for current in instances_iterable:
                 current_state = attributes.instance_state(current)
-                current_dict = attributes.instance_dict(current)
+                current_dict = current_state.dict
                 _recursive[(current_state, self)] = True
                 obj = session._merge(
                     current_state,
@@ -1881,7 +1881,7 @@ class RelationshipProperty(StrategizedProperty):
             current = source_dict[self.key]
             if current is not None:
                 current_state = attributes.instance_state(current)
-                current_dict = attributes.instance_dict(current)
+                current_dict = current_state.dict
                 _recursive[(current_state, self)] = True
                 obj = session._merge(
                     current_state,
@@ -1955,7 +1955,7 @@ class RelationshipProperty(StrategizedProperty):
                 # see [ticket:2229]
                 continue
 
-            instance_dict = attributes.instance_dict(c)
+            instance_dict = instance_state.dict
 
             if halt_on and halt_on(instance_state):
                 continue
@@ -26,6 +26,7 @@ from .base import instance_str
 from .base import object_mapper
 from .base import object_state
 from .base import state_str
+from .unitofwork import FlushProfile
 from .unitofwork import UOWTransaction
 from .. import engine
 from .. import exc as sa_exc
@@ -2735,9 +2736,10 @@ class Session(_SessionClassMethods):
         autoflush = self.autoflush
         try:
             self.autoflush = False
+            state = attributes.instance_state(instance)
             return self._merge(
-                attributes.instance_state(instance),
-                attributes.instance_dict(instance),
+                state,
+                state.dict,
                 load=load,
                 _recursive=_recursive,
                 _resolve_conflict_map=_resolve_conflict_map,
@@ -2818,12 +2820,12 @@ class Session(_SessionClassMethods):
         if merged is None:
             merged = mapper.class_manager.new_instance()
             merged_state = attributes.instance_state(merged)
-            merged_dict = attributes.instance_dict(merged)
+            merged_dict = merged_state.dict
             new_instance = True
             self._save_or_update_state(merged_state)
         else:
             merged_state = attributes.instance_state(merged)
-            merged_dict = attributes.instance_dict(merged)
+            merged_dict = merged_state.dict
 
         _recursive[state] = merged
         _resolve_conflict_map[key] = merged
@@ -3131,15 +3133,26 @@ class Session(_SessionClassMethods):
 
     def _flush(self, objects=None):
 
+        if self.dispatch.flush_profile:
+            profile = FlushProfile()
+            profile._begin("dirty_detection")
+        else:
+            profile = None
+
         dirty = self._dirty_states
         if not dirty and not self._deleted and not self._new:
             self.identity_map._modified.clear()
             return
 
         flush_context = UOWTransaction(self)
+        flush_context.profile = profile
 
         if self.dispatch.before_flush:
+            if profile is not None:
+                profile._end()
             self.dispatch.before_flush(self, flush_context, objects)
+            if profile is not None:
+                profile._begin("dirty_detection")
             # re-establish "dirty states" in case the listeners
             # added
             dirty = self._dirty_states
@@ -3205,6 +3218,9 @@ class Session(_SessionClassMethods):
         if not flush_context.has_work:
             return
 
+        if profile is not None:
+            profile._end()
+
         flush_context.transaction = transaction = self.begin(_subtrans=True)
         try:
             self._warn_on_events = True
@@ -3251,6 +3267,10 @@ class Session(_SessionClassMethods):
             with util.safe_reraise():
                 transaction.rollback(_capture_exception=True)
 
+        if profile is not None:
+            profile._finish()
+            self.dispatch.flush_profile(self, flush_context, profile)
+
     def bulk_save_objects(
         self,
         objects,
@@ -839,6 +839,119 @@ class InstanceState(interfaces.InspectionAttrInfo):
             state._strong_obj = None
 
 
+class _SlotsInstanceState(InstanceState):
+    """An :class:`.InstanceState` for an instance that has no
+    ``__dict__``, as its class declares ``__slots__``.
+
+    The instance dictionary is a :class:`._SlotsDict` which is created
+    once per state and reads and writes the slots directly.
+
+    """
+
+    @util.memoized_property
+    def _slots_dict(self):
+        return _SlotsDict(self, self.manager._slot_descriptors)
+
+    @property
+    def dict(self):
+        if self.obj() is not None:
+            return self._slots_dict
+        else:
+            return {}
+
+
+class _SlotsDict(util.collections_abc.MutableMapping):
+    """Present the attribute values of an instance that has no
+    ``__dict__`` as the instance dictionary used by the ORM.
+
+    Values for keys that have a corresponding member in the class'
+    ``__slots__`` are stored directly in that slot; any other keys,
+    such as those of backrefs that were not declared in ``__slots__``,
+    are stored in an overflow dictionary that is created only when
+    first needed.
+
+    """
+
+    __slots__ = ("state", "slots", "overflow")
+
+    def __init__(self, state, slots):
+        self.state = state
+        self.slots = slots
+        self.overflow = None
+
+    def __getitem__(self, key):
+        desc = self.slots.get(key)
+        if desc is not None:
+            obj = self.state.obj()
+            if obj is None:
+                raise KeyError(key)
+            try:
+                return desc.__get__(obj, None)
+            except AttributeError:
+                raise KeyError(key)
+        if self.overflow is None:
+            raise KeyError(key)
+        return self.overflow[key]
+
+    def __setitem__(self, key, value):
+        desc = self.slots.get(key)
+        if desc is not None:
+            desc.__set__(self.state.obj(), value)
+        else:
+            if self.overflow is None:
+                self.overflow = {}
+            self.overflow[key] = value
+
+    def __delitem__(self, key):
+        desc = self.slots.get(key)
+        if desc is not None:
+            try:
+                desc.__delete__(self.state.obj())
+            except AttributeError:
+                raise KeyError(key)
+        else:
+            if self.overflow is None:
+                raise KeyError(key)
+            del self.overflow[key]
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        else:
+            return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        obj = self.state.obj()
+        if obj is not None:
+            for key, desc in self.slots.items():
+                try:
+                    desc.__get__(obj, None)
+                except AttributeError:
+                    pass
+                else:
+                    yield key
+        if self.overflow:
+            for key in list(self.overflow):
+                yield key
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def copy(self):
+        return dict(self)
+
+    def __repr__(self):
+        return "_SlotsDict(%r)" % dict(self)
+
+
 class AttributeState(object):
     """Provide an inspection interface corresponding
     to a particular attribute on a particular mapped object.
@@ -747,8 +747,7 @@ class LazyLoader(AbstractRelationshipLoader, util.MemoizedSlots):
 
         mapper = self.parent_property.parent
 
-        o = state.obj()  # strong ref
-        dict_ = attributes.instance_dict(o)
+        dict_ = state.dict
 
         if passive & attributes.INIT_OK:
             passive ^= attributes.INIT_OK
@@ -2849,12 +2848,25 @@ def single_parent_validator(desc, prop):
         return value
 
     def append(state, value, initiator):
+        # members of a bulk append on this collection are checked
+        # by the "bulk_append" listener.
+        if (
+            initiator.op in attributes._BULK_OPS
+            and initiator.impl is state.manager[prop.key].impl
+        ):
+            return value
         return _do_check(state, value, None, initiator)
 
+    def bulk_append(state, values, initiator):
+        for value in values:
+            _do_check(state, value, None, initiator)
+
     def set_(state, value, oldvalue, initiator):
         return _do_check(state, value, oldvalue, initiator)
 
     event.listen(
         desc, "append", append, raw=True, retval=True, active_history=True
     )
+    if prop.uselist:
+        event.listen(desc, "bulk_append", bulk_append, raw=True)
     event.listen(desc, "set", set_, raw=True, retval=True, active_history=True)
@@ -35,6 +35,14 @@ def track_cascade_events(descriptor, prop):
         if item is None:
             return
 
+        # members of a bulk append on this collection are handled
+        # by the "bulk_append" listener.
+        if (
+            initiator.op in attributes._BULK_OPS
+            and initiator.impl is state.manager[key].impl
+        ):
+            return item
+
         sess = state.session
         if sess:
             if sess._warn_on_events:
@@ -50,6 +58,30 @@ def track_cascade_events(descriptor, prop):
                 sess._save_or_update_state(item_state)
         return item
 
+    def bulk_append(state, items, initiator):
+        # process "save_update" cascade rules for a list of instances
+        # appended to the collection of another instance at once
+
+        sess = state.session
+        if not sess:
+            return
+
+        if sess._warn_on_events:
+            sess._flush_warning("collection append")
+
+        prop = state.manager.mapper._props[key]
+        if not prop._cascade.save_update or not (
+            prop.cascade_backrefs or key == initiator.key
+        ):
+            return
+
+        for item in items:
+            if item is None:
+                continue
+            item_state = attributes.instance_state(item)
+            if not sess._contains_state(item_state):
+                sess._save_or_update_state(item_state)
+
     def remove(state, item, initiator):
         if item is None:
             return
@@ -121,10 +153,17 @@ def track_cascade_events(descriptor, prop):
         return newvalue
 
     event.listen(descriptor, "append", append, raw=True, retval=True)
+    if prop.uselist:
+        event.listen(descriptor, "bulk_append", bulk_append, raw=True)
     event.listen(descriptor, "remove", remove, raw=True, retval=True)
     event.listen(descriptor, "set", set_, raw=True, retval=True)
 
 
+# memoized cycles and execution order for graphs of per-mapper flush
+# actions; see UOWTransaction._plan_actions()
+_action_plans = util.LRUCache(100)
+
+
 class UOWTransaction(object):
     def __init__(self, session):
         self.session = session
@@ -171,6 +210,10 @@ class UOWTransaction(object):
         # columns which should be included in the update.
         self.post_update_states = util.defaultdict(lambda: (set(), set()))
 
+        # a FlushProfile which collects timings for the flush, if
+        # the Session has a flush_profile event listener.
+        self.profile = None
+
     @property
     def has_work(self):
         return bool(self.states)
@@ -363,9 +406,8 @@ class UOWTransaction(object):
                 break
 
         # see if the graph of mapper dependencies has cycles.
-        self.cycles = cycles = topological.find_cycles(
-            self.dependencies, list(self.postsort_actions.values())
-        )
+        self.cycles, self._sorted_actions = self._plan_actions()
+        cycles = self.cycles
 
         if cycles:
             # if yes, break the per-mapper actions into
@@ -396,8 +438,71 @@ class UOWTransaction(object):
             a for a in self.postsort_actions.values() if not a.disabled
         }.difference(cycles)
 
+    def _plan_actions(self):
+        """Return the set of PostSortRecs involved in cycles, and if there
+        are none, the PostSortRecs in the order they should be executed.
+
+        Both depend only on the structure of the graph of per-mapper actions,
+        so are memoized against that structure, which is the same for
+        each flush of a given set of mappers and operations.  The graph is
+        described using object ids so that the cache doesn't refer to
+        mappers or dependency processors; as the result is a function of
+        the structure alone, it applies to any graph of the same shape.
+
+        """
+        node_for_rec = {
+            rec: tuple(map(id, key))
+            for key, rec in self.postsort_actions.items()
+        }
+        graph = (
+            frozenset(
+                (node, rec.disabled) for rec, node in node_for_rec.items()
+            ),
+            frozenset(
+                (node_for_rec.get(parent), node_for_rec.get(child))
+                for parent, child in self.dependencies
+            ),
+        )
+
+        plan = _action_plans.get(graph)
+        if plan is None:
+            cycles = topological.find_cycles(
+                self.dependencies, list(self.postsort_actions.values())
+            )
+            if cycles:
+                sorted_nodes = None
+            else:
+                sorted_nodes = tuple(
+                    node_for_rec[rec]
+                    for rec in topological.sort(
+                        self.dependencies,
+                        [
+                            rec
+                            for rec in self.postsort_actions.values()
+                            if not rec.disabled
+                        ],
+                    )
+                )
+            plan = _action_plans[graph] = (
+                frozenset(node_for_rec[rec] for rec in cycles),
+                sorted_nodes,
+            )
+
+        cycle_nodes, sorted_nodes = plan
+        rec_for_node = {node: rec for rec, node in node_for_rec.items()}
+        cycles = {rec_for_node[node] for node in cycle_nodes}
+        if sorted_nodes is not None:
+            return cycles, [rec_for_node[node] for node in sorted_nodes]
+        else:
+            return cycles, None
+
     def execute(self):
+        profile = self.profile
+        if profile is not None:
+            profile._begin("sort")
         postsort_actions = self._generate_actions()
+        if profile is not None:
+            profile._end()
 
         # sort = topological.sort(self.dependencies, postsort_actions)
         # print "--------------"
@@ -415,7 +520,7 @@ class UOWTransaction(object):
                     n = set_.pop()
                     n.execute_aggregate(self, set_)
         else:
-            for rec in topological.sort(self.dependencies, postsort_actions):
+            for rec in self._sorted_actions:
                 rec.execute(self)
 
     def finalize_flush_changes(self):
@@ -529,10 +634,18 @@ class ProcessAll(IterateMappersMixin, PostSortRec):
 
     def execute(self, uow):
         states = self._elements(uow)
+        profile = uow.profile
+        if profile is not None:
+            profile._begin(
+                "relationships",
+                self.dependency_processor.parent.base_mapper,
+            )
         if self.isdelete:
             self.dependency_processor.process_deletes(uow, states)
         else:
             self.dependency_processor.process_saves(uow, states)
+        if profile is not None:
+            profile._end()
 
     def per_state_flush_actions(self, uow):
         # this is handled by SaveUpdateAll and DeleteAll,
@@ -665,10 +778,17 @@ class ProcessState(PostSortRec):
         ]
         recs.difference_update(our_recs)
         states = [self.state] + [r.state for r in our_recs]
+        profile = uow.profile
+        if profile is not None:
+            profile._begin(
+                "relationships", dependency_processor.parent.base_mapper
+            )
         if isdelete:
             dependency_processor.process_deletes(uow, states)
         else:
             dependency_processor.process_saves(uow, states)
+        if profile is not None:
+            profile._end()
 
     def __repr__(self):
         return "%s(%s, %s, delete=%s)" % (
@@ -732,3 +852,185 @@ class DeleteState(PostSortRec):
             self.__class__.__name__,
             orm_util.state_str(self.state),
         )
+
+
+class FlushStats(object):
+    """Timings and statement counts for one part of a flush.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :class:`.FlushProfile`
+
+    """
+
+    __slots__ = ("phases", "statements", "rows")
+
+    def __init__(self):
+        self.phases = util.defaultdict(float)
+        """Dictionary of phase name to the number of seconds spent in
+        that phase; see :class:`.FlushProfile` for the phase names."""
+
+        self.statements = 0
+        """The number of INSERT, UPDATE and DELETE statements executed."""
+
+        self.rows = 0
+        """The number of parameter sets passed to those statements, i.e.
+        the number of rows they were intended to affect."""
+
+    def __repr__(self):
+        return "%s(statements=%d, rows=%d, phases=%r)" % (
+            self.__class__.__name__,
+            self.statements,
+            self.rows,
+            dict(self.phases),
+        )
+
+
+class FlushProfile(FlushStats):
+    """Timings and statement counts collected for a single flush.
+
+    A :class:`.FlushProfile` is collected for each flush of a
+    :class:`.Session` for which the :meth:`.SessionEvents.flush_profile`
+    event is established, and is delivered to that event once the flush
+    completes.
+
+    The time spent is broken into the following phases, which are
+    exclusive of each other:
+
+    * ``"dirty_detection"`` - assembling the new, modified and deleted
+      objects into the flush, including locating orphans.
+
+    * ``"sort"`` - processing the relationships of those objects to locate
+      further objects which are part of the flush, and sorting the actions
+      of the flush in dependency order.
+
+    * ``"relationships"`` - synchronizing foreign key values among related
+      objects, and assembling rows for many-to-many association tables.
+
+    * ``"collect"`` - assembling the parameters for each INSERT, UPDATE and
+      DELETE statement, including the ``before_insert``, ``before_update``
+      and ``before_delete`` mapper events.
+
+    * ``"execute"`` - executing INSERT, UPDATE and DELETE statements.
+
+    * ``"postfetch"`` - processing the results of those statements, such as
+      newly generated primary keys and server defaults, including the
+      ``after_insert``, ``after_update`` and ``after_delete`` mapper
+      events.
+
+    The totals for the whole flush are present on the profile itself; the
+    same figures are broken down in :attr:`.FlushProfile.mappers` and
+    :attr:`.FlushProfile.tables`.
+
+    .. versionadded:: 1.4
+
+    """
+
+    __slots__ = ("elapsed", "mappers", "tables", "_stack", "_mark")
+
+    def __init__(self):
+        super(FlushProfile, self).__init__()
+
+        self.elapsed = 0
+        """Total number of seconds taken by the flush."""
+
+        self.mappers = {}
+        """Dictionary of :class:`_orm.Mapper` to :class:`.FlushStats`.
+
+        Statements and time spent persisting objects are associated with
+        the base mapper of the objects' inheritance hierarchy; time spent
+        synchronizing a relationship is associated with the base mapper of
+        the relationship's parent.
+
+        """
+
+        self.tables = {}
+        """Dictionary of :class:`_schema.Table` to :class:`.FlushStats`."""
+
+        self._stack = [(None, None, None)]
+        self._mark = util.perf_counter()
+
+    def _stats_for(self, collection, key):
+        try:
+            return collection[key]
+        except KeyError:
+            collection[key] = stats = FlushStats()
+            return stats
+
+    def _accrue(self, now):
+        elapsed = now - self._mark
+        self._mark = now
+        self.elapsed += elapsed
+
+        phase, mapper, table = self._stack[-1]
+        if phase is None:
+            return
+        self.phases[phase] += elapsed
+        if mapper is not None:
+            self._stats_for(self.mappers, mapper).phases[phase] += elapsed
+        if table is not None:
+            self._stats_for(self.tables, table).phases[phase] += elapsed
+
+    def _begin(self, phase, mapper=None, table=None):
+        self._accrue(util.perf_counter())
+        self._stack.append((phase, mapper, table))
+
+    def _end(self):
+        self._accrue(util.perf_counter())
+        self._stack.pop()
+
+    def _finish(self):
+        self._accrue(util.perf_counter())
+
+    def _record_statement(self, mapper, table, rows):
+        collections = [self, self._stats_for(self.mappers, mapper)]
+        if table is not None:
+            collections.append(self._stats_for(self.tables, table))
+        for stats in collections:
+            stats.statements += 1
+            stats.rows += rows
+
+    def _connection(self, connection, mapper):
+        return _ProfiledConnection(connection, self, mapper)
+
+
+class _ProfiledConnection(object):
+    """Proxy a :class:`_engine.Connection` so that the DML statements it
+    executes are timed and counted on a :class:`.FlushProfile`."""
+
+    __slots__ = ("_connection", "_profile", "_mapper")
+
+    def __init__(self, connection, profile, mapper):
+        self._connection = connection
+        self._profile = profile
+        self._mapper = mapper
+
+    def __getattr__(self, key):
+        return getattr(self._connection, key)
+
+    @util.preload_module("sqlalchemy.orm.persistence")
+    def execute(self, statement, *multiparams, **params):
+        batch_key = util.preloaded.orm_persistence._DELETE_BATCH_KEY
+        profile = self._profile
+        # textual and other statements which don't target a single
+        # table are counted against the mapper only
+        table = getattr(statement, "table", None)
+        profile._begin("execute", self._mapper, table)
+        try:
+            return self._connection.execute(statement, *multiparams, **params)
+        finally:
+            profile._end()
+            if multiparams and isinstance(multiparams[0], list):
+                rows = len(multiparams[0])
+            elif (
+                multiparams
+                and isinstance(multiparams[0], dict)
+                and batch_key in multiparams[0]
+            ):
+                # a batched DELETE; see _emit_delete_statements()
+                rows = len(multiparams[0][batch_key])
+            else:
+                rows = 1
+            profile._record_statement(self._mapper, table, rows)
@@ -136,16 +136,28 @@ def _validator_events(desc, key, validator, include_removes, include_backrefs):
             impl = state.manager[key].impl
             return initiator.impl is not impl
 
+    def is_bulk(state, initiator):
+        # values that are part of a bulk operation on this attribute
+        # are validated by the bulk listeners
+        return initiator.op is attributes.OP_BULK_REPLACE or (
+            initiator.op is attributes.OP_BULK_APPEND
+            and initiator.impl is state.manager[key].impl
+        )
+
     if include_removes:
 
         def append(state, value, initiator):
-            if initiator.op is not attributes.OP_BULK_REPLACE and (
+            if not is_bulk(state, initiator) and (
                 include_backrefs or not detect_is_backref(state, initiator)
             ):
                 return validator(state.obj(), key, value, False)
             else:
                 return value
 
+        def bulk_append(state, values, initiator):
+            if initiator.op is not attributes.OP_BULK_REPLACE:
+                bulk_set(state, values, initiator)
+
         def bulk_set(state, values, initiator):
             if include_backrefs or not detect_is_backref(state, initiator):
                 obj = state.obj()
@@ -166,13 +178,17 @@ def _validator_events(desc, key, validator, include_removes, include_backrefs):
     else:
 
         def append(state, value, initiator):
-            if initiator.op is not attributes.OP_BULK_REPLACE and (
+            if not is_bulk(state, initiator) and (
                 include_backrefs or not detect_is_backref(state, initiator)
             ):
                 return validator(state.obj(), key, value)
             else:
                 return value
 
+        def bulk_append(state, values, initiator):
+            if initiator.op is not attributes.OP_BULK_REPLACE:
+                bulk_set(state, values, initiator)
+
         def bulk_set(state, values, initiator):
             if include_backrefs or not detect_is_backref(state, initiator):
                 obj = state.obj()
@@ -186,6 +202,7 @@ def _validator_events(desc, key, validator, include_removes, include_backrefs):
 
     event.listen(desc, "append", append, raw=True, retval=True)
     event.listen(desc, "bulk_replace", bulk_set, raw=True)
+    event.listen(desc, "bulk_append", bulk_append, raw=True)
     event.listen(desc, "set", set_, raw=True, retval=True)
     if include_removes:
         event.listen(desc, "remove", remove, raw=True, retval=True)
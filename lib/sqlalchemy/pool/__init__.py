@@ -22,30 +22,38 @@ from .base import _ConnectionFairy  # noqa
 from .base import _ConnectionRecord  # noqa
 from .base import _finalize_fairy  # noqa
 from .base import Pool
+from .base import PoolMetrics
 from .base import reset_commit
 from .base import reset_none
 from .base import reset_rollback
 from .dbapi_proxy import clear_managers
 from .dbapi_proxy import manage
 from .impl import AssertionPool
+from .impl import MultiHostPool
 from .impl import NullPool
+from .impl import PoolHost
 from .impl import QueuePool
 from .impl import SingletonThreadPool
 from .impl import StaticPool
+from .impl import ThreadAffinityPool
 
 
 __all__ = [
     "Pool",
+    "PoolMetrics",
     "reset_commit",
     "reset_none",
     "reset_rollback",
     "clear_managers",
     "manage",
     "AssertionPool",
+    "MultiHostPool",
     "NullPool",
+    "PoolHost",
     "QueuePool",
     "SingletonThreadPool",
     "StaticPool",
+    "ThreadAffinityPool",
 ]
 
 # as these are likely to be used in various test suites, debugging
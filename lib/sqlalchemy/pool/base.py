@@ -10,6 +10,7 @@
 
 """
 
+from bisect import bisect_left
 from collections import deque
 import time
 import weakref
@@ -53,12 +54,184 @@ class _ConnDialect(object):
         )
 
 
+class PoolMetrics(object):
+    """Statistics describing the activity of a :class:`_pool.Pool`.
+
+    An instance of :class:`.PoolMetrics` is present on every
+    :class:`_pool.Pool` as the :attr:`_pool.Pool.metrics` attribute.
+    The values are maintained on the connection checkout path without
+    any locking, and may be read at any time from any thread; under
+    heavy concurrency, the counters should be regarded as approximate.
+
+    Histograms are expressed as lists of counts, where the count at
+    index ``n`` is the number of observations less than or equal to the
+    bound at index ``n`` of the corresponding ``*_buckets`` tuple, and
+    greater than the previous bound; the final count is the number of
+    observations greater than the largest bound.
+
+    E.g. to report on the connection pool of an :class:`_engine.Engine`::
+
+        metrics = engine.pool.metrics
+        print(
+            "checkouts: %d  waiting: %d  overflow connections: %d"
+            % (metrics.checkouts, metrics.waiters,
+               metrics.overflow_creations)
+        )
+        print(metrics.snapshot())
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`pool_metrics`
+
+    """
+
+    wait_time_buckets = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30)
+    """Upper bounds, in seconds, of the buckets within
+    :attr:`.PoolMetrics.wait_time_histogram`."""
+
+    connection_age_buckets = (1, 10, 60, 300, 900, 1800, 3600, 14400, 86400)
+    """Upper bounds, in seconds, of the buckets within
+    :attr:`.PoolMetrics.connection_age_histogram`."""
+
+    rate_interval = 1
+    """Minimum number of seconds over which
+    :attr:`.PoolMetrics.checkouts_per_second` is measured."""
+
+    checkouts = 0
+    """Total number of connections checked out from the pool."""
+
+    wait_time_total = 0.0
+    """Total number of seconds spent acquiring connections."""
+
+    wait_time_histogram = None
+    """Histogram of the time spent acquiring a connection upon each
+    checkout, including the time taken to establish new connections."""
+
+    connection_age_histogram = None
+    """Histogram of the age of each DBAPI connection as of its checkout."""
+
+    overflow_creations = 0
+    """Number of connections created beyond the
+    :paramref:`.QueuePool.pool_size` of a :class:`.QueuePool`."""
+
+    invalidations = 0
+    """Number of connections invalidated, including soft invalidations."""
+
+    pre_pings = 0
+    """Number of "pre ping" operations performed, including those performed
+    in the background by :paramref:`.QueuePool.maintenance_interval`."""
+
+    pre_ping_failures = 0
+    """Number of "pre ping" operations which detected a disconnect."""
+
+    waiters = 0
+    """Number of threads currently waiting for a connection to be returned
+    to a :class:`.QueuePool`."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset all counters and histograms to zero.
+
+        The :attr:`.PoolMetrics.waiters` gauge is not affected.
+
+        """
+        self.checkouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_histogram = [0] * (len(self.wait_time_buckets) + 1)
+        self.connection_age_histogram = [0] * (
+            len(self.connection_age_buckets) + 1
+        )
+        self.overflow_creations = 0
+        self.invalidations = 0
+        self.pre_pings = 0
+        self.pre_ping_failures = 0
+
+        self._window_start = time.time()
+        self._window_checkouts = 0
+        self._checkout_rate = None
+
+    @property
+    def checkouts_per_second(self):
+        """The rate of checkouts over the most recently completed interval
+        of :attr:`.PoolMetrics.rate_interval` seconds, or over the time
+        elapsed so far if no interval has completed yet."""
+
+        if self._checkout_rate is not None:
+            return self._checkout_rate
+        elapsed = time.time() - self._window_start
+        return self._window_checkouts / elapsed if elapsed else 0.0
+
+    def snapshot(self):
+        """Return a dictionary containing the current values of all
+        metrics, suitable for logging or for export to a monitoring
+        system."""
+
+        return {
+            "checkouts": self.checkouts,
+            "checkouts_per_second": self.checkouts_per_second,
+            "wait_time_total": self.wait_time_total,
+            "wait_time_histogram": list(
+                zip(
+                    self.wait_time_buckets + (None,), self.wait_time_histogram,
+                )
+            ),
+            "connection_age_histogram": list(
+                zip(
+                    self.connection_age_buckets + (None,),
+                    self.connection_age_histogram,
+                )
+            ),
+            "overflow_creations": self.overflow_creations,
+            "invalidations": self.invalidations,
+            "pre_pings": self.pre_pings,
+            "pre_ping_failures": self.pre_ping_failures,
+            "waiters": self.waiters,
+        }
+
+    def _record_checkout(self, start, starttime):
+        now = time.time()
+        wait = now - start
+
+        self.checkouts += 1
+        self.wait_time_total += wait
+        self.wait_time_histogram[
+            bisect_left(self.wait_time_buckets, wait)
+        ] += 1
+        if starttime is not None:
+            self.connection_age_histogram[
+                bisect_left(self.connection_age_buckets, now - starttime)
+            ] += 1
+
+        self._window_checkouts += 1
+        elapsed = now - self._window_start
+        if elapsed >= self.rate_interval:
+            self._checkout_rate = self._window_checkouts / elapsed
+            self._window_start = now
+            self._window_checkouts = 0
+
+
 class Pool(log.Identified):
 
     """Abstract base class for connection pools."""
 
     _dialect = _ConnDialect()
 
+    metrics = None
+    """A :class:`.PoolMetrics` object which maintains statistics on the
+    activity of this :class:`_pool.Pool`.
+
+    A new :class:`.PoolMetrics` object is established for the new pool
+    returned by :meth:`_pool.Pool.recreate`, such as when
+    :meth:`_engine.Engine.dispose` is called.
+
+    .. versionadded:: 1.4
+
+    """
+
     def __init__(
         self,
         creator,
@@ -69,6 +242,8 @@ class Pool(log.Identified):
         events=None,
         dialect=None,
         pre_ping=False,
+        pre_ping_idle_time=None,
+        skip_clean_reset=False,
         _dispatch=None,
     ):
         """
@@ -138,6 +313,10 @@ class Pool(log.Identified):
           * ``False`` - same as None, this is here for
             backwards compatibility.
 
+          .. seealso::
+
+            :paramref:`_pool.Pool.skip_clean_reset`
+
         :param events: a list of 2-tuples, each of the form
          ``(callable, target)`` which will be passed to :func:`.event.listen`
          upon construction.   Provided here so that event listeners
@@ -163,6 +342,39 @@ class Pool(log.Identified):
 
          .. versionadded:: 1.2
 
+        :param pre_ping_idle_time: when used with
+         :paramref:`_pool.Pool.pre_ping`, a number of seconds within which
+         a connection that was last returned to the pool in a usable state
+         is assumed to still be alive, so that the "ping" is skipped upon
+         checkout.   Connections which have been idle for longer than this
+         period are pinged as usual.   Disconnects detected by other means,
+         including invalidation of the pool as a whole, continue to be
+         handled as before.   When used with :class:`.QueuePool`, the
+         :paramref:`.QueuePool.maintenance_interval` parameter may be used
+         to ping idle connections in the background as well.   Defaults to
+         ``None``, meaning a ping is emitted upon every checkout.
+
+         .. versionadded:: 1.4
+
+         .. seealso::
+
+            :ref:`pool_pre_ping_idle_time`
+
+        :param skip_clean_reset: if True, the "reset-on-return" step
+         configured by :paramref:`_pool.Pool.reset_on_return` is skipped
+         for connections which are known to have no transaction in
+         progress, that is, connections which were last committed or rolled
+         back through the pool's connection proxy with no cursor acquired
+         from them afterwards.   This applies to connections used by
+         :class:`_engine.Connection`, which acquires a new cursor for each
+         statement executed.   Applications which work with the DBAPI
+         connection directly should not enable this setting if they may
+         execute further statements on a cursor acquired before a commit or
+         rollback, as the transaction begun by those statements would not
+         be reset.   Defaults to False.
+
+         .. versionadded:: 1.4
+
         """
         if logging_name:
             self.logging_name = self._orig_logging_name = logging_name
@@ -175,6 +387,9 @@ class Pool(log.Identified):
         self._recycle = recycle
         self._invalidate_time = 0
         self._pre_ping = pre_ping
+        self._pre_ping_idle_time = pre_ping_idle_time
+        self._skip_clean_reset = skip_clean_reset
+        self.metrics = PoolMetrics()
         self._reset_on_return = util.symbol.parse_user_argument(
             reset_on_return,
             {
@@ -212,7 +427,7 @@ class Pool(log.Identified):
         """
 
         try:
-            argspec = util.get_callable_argspec(self._creator, no_self=True)
+            argspec = util.get_callable_argspec(creator, no_self=True)
         except TypeError:
             return lambda crec: creator()
 
@@ -319,6 +534,15 @@ class Pool(log.Identified):
 
         raise NotImplementedError()
 
+    def _start_maintenance(self):
+        """Start background maintenance of this pool, if configured.
+
+        This is called by :func:`_sa.create_engine` once the pool's event
+        listeners are established, as maintenance may create new
+        connections.
+
+        """
+
     def status(self):
         raise NotImplementedError()
 
@@ -368,6 +592,8 @@ class _ConnectionRecord(object):
 
     starttime = None
 
+    last_used_time = None
+
     connection = None
     """A reference to the actual DBAPI connection being tracked.
 
@@ -416,12 +642,14 @@ class _ConnectionRecord(object):
 
     @classmethod
     def checkout(cls, pool):
+        start = time.time()
         rec = pool._do_get()
         try:
             dbapi_connection = rec.get_connection()
         except Exception as err:
             with util.safe_reraise():
                 rec._checkin_failed(err)
+        pool.metrics._record_checkout(start, rec.starttime)
         echo = pool._should_log_debug()
         fairy = _ConnectionFairy(dbapi_connection, rec, echo)
         rec.fairy_ref = weakref.ref(
@@ -449,6 +677,8 @@ class _ConnectionRecord(object):
         while self.finalize_callback:
             finalizer = self.finalize_callback.pop()
             finalizer(connection)
+        if connection is not None and pool._pre_ping_idle_time is not None:
+            self.last_used_time = time.time()
         if pool.dispatch.checkin:
             pool.dispatch.checkin(connection, self)
         pool._return_conn(self)
@@ -457,6 +687,67 @@ class _ConnectionRecord(object):
     def in_use(self):
         return self.fairy_ref is not None
 
+    def _used_recently(self, margin=0):
+        idle_time = self.__pool._pre_ping_idle_time
+        return (
+            idle_time is not None
+            and self.last_used_time is not None
+            and time.time() - self.last_used_time < idle_time - margin
+        )
+
+    def _reconnect(self):
+        """Replace the DBAPI connection of an idle record with a new one."""
+
+        pool = self.__pool
+        pool.logger.info(
+            "Connection %r approaching recycle time; recycling",
+            self.connection,
+        )
+        self.__close()
+        self.info.clear()
+        try:
+            self.__connect()
+        except Exception:
+            # the record will attempt to connect again upon checkout
+            pool.logger.error(
+                "Exception recycling idle connection", exc_info=True
+            )
+
+    def _ping(self):
+        """Ping the DBAPI connection of an idle record.
+
+        Upon a disconnect, the record as well as the pool are invalidated,
+        in the same way as when a ping upon checkout fails.
+
+        """
+        pool = self.__pool
+        pool.logger.debug("Pool ping on idle connection %s", self.connection)
+        pool.metrics.pre_pings += 1
+        try:
+            result = pool._dialect.do_ping(self.connection)
+        except Exception as err:
+            pool.logger.error(
+                "Exception during ping of idle connection %s",
+                self.connection,
+                exc_info=True,
+            )
+            self.invalidate(err)
+            return False
+
+        if result:
+            self.last_used_time = time.time()
+            return True
+
+        pool.metrics.pre_ping_failures += 1
+        pool.logger.info(
+            "Pool ping on idle connection %s failed, will invalidate pool",
+            self.connection,
+        )
+        err = exc.InvalidatePoolError()
+        self.invalidate(err)
+        pool._invalidate(None, err, _checkin=False)
+        return False
+
     @property
     def last_connect_time(self):
         return self.starttime
@@ -489,6 +780,7 @@ class _ConnectionRecord(object):
         # already invalidated
         if self.connection is None:
             return
+        self.__pool.metrics.invalidations += 1
         if soft:
             self.__pool.dispatch.soft_invalidate(self.connection, self, e)
         else:
@@ -692,6 +984,19 @@ class _ConnectionFairy(object):
     can only be one "reset agent" at a time.
     """
 
+    _reset_needed = True
+    """Indicate that a transaction may be in progress on the DBAPI
+    connection, so that the "reset-on-return" step is needed.
+
+    This is cleared after :meth:`._ConnectionFairy.commit` or
+    :meth:`._ConnectionFairy.rollback` is called, and is set again when
+    a cursor is acquired via :meth:`._ConnectionFairy.cursor`.  As the
+    state of the DBAPI connection isn't known upon checkout, where
+    event handlers or the "pre ping" may have already made use of it,
+    it starts out as set.  The flag is only consulted when
+    :paramref:`_pool.Pool.skip_clean_reset` is enabled.
+    """
+
     @classmethod
     def _checkout(cls, pool, threadconns=None, fairy=None):
         if not fairy:
@@ -722,14 +1027,29 @@ class _ConnectionFairy(object):
             fairy._connection_record.fresh = False
             try:
                 if pool._pre_ping:
-                    if not connection_is_fresh:
+                    if connection_is_fresh:
+                        if fairy._echo:
+                            pool.logger.debug(
+                                "Connection %s is fresh, skipping pre-ping",
+                                fairy.connection,
+                            )
+                    elif fairy._connection_record._used_recently():
+                        if fairy._echo:
+                            pool.logger.debug(
+                                "Connection %s was used recently, "
+                                "skipping pre-ping",
+                                fairy.connection,
+                            )
+                    else:
                         if fairy._echo:
                             pool.logger.debug(
                                 "Pool pre-ping on connection %s",
                                 fairy.connection,
                             )
+                        pool.metrics.pre_pings += 1
                         result = pool._dialect.do_ping(fairy.connection)
                         if not result:
+                            pool.metrics.pre_ping_failures += 1
                             if fairy._echo:
                                 pool.logger.debug(
                                     "Pool pre-ping on connection %s failed, "
@@ -737,11 +1057,6 @@ class _ConnectionFairy(object):
                                     fairy.connection,
                                 )
                             raise exc.InvalidatePoolError()
-                    elif fairy._echo:
-                        pool.logger.debug(
-                            "Connection %s is fresh, skipping pre-ping",
-                            fairy.connection,
-                        )
 
                 pool.dispatch.checkout(
                     fairy.connection, fairy._connection_record, fairy
@@ -799,7 +1114,18 @@ class _ConnectionFairy(object):
     def _reset(self, pool):
         if pool.dispatch.reset:
             pool.dispatch.reset(self, self._connection_record)
-        if pool._reset_on_return is reset_rollback:
+        if (
+            pool._skip_clean_reset
+            and not self._reset_needed
+            and self._reset_agent is None
+        ):
+            if self._echo:
+                pool.logger.debug(
+                    "Connection %s has no transaction in progress, "
+                    "skipping reset-on-return",
+                    self.connection,
+                )
+        elif pool._reset_on_return is reset_rollback:
             if self._echo:
                 pool.logger.debug(
                     "Connection %s rollback-on-return%s",
@@ -924,8 +1250,41 @@ class _ConnectionFairy(object):
         method.
 
         """
+        self._reset_needed = True
         return self.connection.cursor(*args, **kwargs)
 
+    def commit(self, *args, **kwargs):
+        """Commit the transaction in progress on the underlying connection.
+
+        This method is a proxy for the ``connection.commit()`` DBAPI
+        method, which additionally notes that no transaction is in progress,
+        so that the "reset-on-return" step may be skipped if the connection
+        is returned to the pool without further use.
+
+        .. versionadded:: 1.4
+
+        """
+        self.connection.commit(*args, **kwargs)
+
+        # DBAPI-specific arguments, such as the "retaining" flag of
+        # kinterbasdb, may leave a transaction in progress
+        self._reset_needed = bool(args or kwargs)
+
+    def rollback(self, *args, **kwargs):
+        """Roll back the transaction in progress on the underlying
+        connection.
+
+        This method is a proxy for the ``connection.rollback()`` DBAPI
+        method, which additionally notes that no transaction is in progress,
+        so that the "reset-on-return" step may be skipped if the connection
+        is returned to the pool without further use.
+
+        .. versionadded:: 1.4
+
+        """
+        self.connection.rollback(*args, **kwargs)
+        self._reset_needed = bool(args or kwargs)
+
     def __getattr__(self, key):
         return getattr(self.connection, key)
 
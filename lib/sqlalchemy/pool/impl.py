@@ -10,6 +10,9 @@
 
 """
 
+import collections
+import random
+import time
 import traceback
 import weakref
 
@@ -40,6 +43,8 @@ class QueuePool(Pool):
         max_overflow=10,
         timeout=30,
         use_lifo=False,
+        maintenance_interval=None,
+        min_idle=0,
         **kw
     ):
         r"""
@@ -88,6 +93,49 @@ class QueuePool(Pool):
 
             :ref:`pool_disconnects`
 
+        :param maintenance_interval: if set to a number of seconds, a
+          background daemon thread is started which performs maintenance
+          on idle connections at this interval:
+
+          * when :paramref:`.QueuePool.min_idle` is set, new connections are
+            established until that many connections are idle in the pool.
+
+          * when :paramref:`_pool.Pool.recycle` is set, idle connections are
+            recycled ahead of time, at random points within the final
+            quarter of their lifespan, so that connections which were
+            established together aren't all replaced upon checkout at the
+            same moment.
+
+          * when :paramref:`_pool.Pool.pre_ping` and
+            :paramref:`_pool.Pool.pre_ping_idle_time` are in use,
+            connections that would otherwise exceed the idle time before
+            the next run are pinged, so that the ping is normally skipped
+            upon checkout.
+
+          The thread is started when the :class:`_engine.Engine` is
+          created, or upon first checkout for a pool that's used directly,
+          and makes its first run right away.   It stops when the pool is
+          disposed or garbage collected, and is started again upon the next
+          checkout from a disposed pool.   Note that the DBAPI connections
+          must be usable from a thread other than the one which created
+          them.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :ref:`pool_maintenance`
+
+        :param min_idle: when used with
+          :paramref:`.QueuePool.maintenance_interval`, the number of idle
+          connections the maintenance thread keeps ready in the pool, up to
+          the value of :paramref:`.QueuePool.pool_size`.   As the thread
+          makes its first run when the :class:`_engine.Engine` is created,
+          this also has the effect of establishing these connections up
+          front.   Defaults to zero.
+
+          .. versionadded:: 1.4
+
         :param \**kw: Other keyword arguments including
           :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
           :paramref:`_pool.Pool.reset_on_return` and others are passed to the
@@ -100,6 +148,9 @@ class QueuePool(Pool):
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._maintenance_interval = maintenance_interval
+        self._maintenance_stop = None
+        self._min_idle = min_idle
 
     def _do_return_conn(self, conn):
         try:
@@ -111,11 +162,19 @@ class QueuePool(Pool):
                 self._dec_overflow()
 
     def _do_get(self):
+        if (
+            self._maintenance_stop is None
+            and self._maintenance_interval is not None
+        ):
+            self._start_maintenance()
+
         use_overflow = self._max_overflow > -1
 
         try:
             wait = use_overflow and self._overflow >= self._max_overflow
-            return self._pool.get(wait, self._timeout)
+            if wait:
+                return self._wait_for_conn()
+            return self._pool.get(False)
         except sqla_queue.Empty:
             # don't do things inside of "except Empty", because when we say
             # we timed out or can't connect and raise, Python 3 tells
@@ -134,13 +193,26 @@ class QueuePool(Pool):
 
         if self._inc_overflow():
             try:
-                return self._create_connection()
+                conn = self._create_connection()
             except:
                 with util.safe_reraise():
                     self._dec_overflow()
+            if self._overflow > 0:
+                self.metrics.overflow_creations += 1
+            return conn
         else:
             return self._do_get()
 
+    def _wait_for_conn(self):
+        metrics = self.metrics
+        with self._overflow_lock:
+            metrics.waiters += 1
+        try:
+            return self._pool.get(True, self._timeout)
+        finally:
+            with self._overflow_lock:
+                metrics.waiters -= 1
+
     def _inc_overflow(self):
         if self._max_overflow == -1:
             self._overflow += 1
@@ -160,22 +232,138 @@ class QueuePool(Pool):
             self._overflow -= 1
             return True
 
+    def _start_maintenance(self):
+        if self._maintenance_interval is None:
+            return
+        with self._overflow_lock:
+            if self._maintenance_stop is not None:
+                return
+            self._maintenance_stop = stop = threading.Event()
+        thread = threading.Thread(
+            target=_run_maintenance,
+            args=(weakref.ref(self), self._maintenance_interval, stop),
+            name="sqlalchemy pool maintenance",
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _maintain(self):
+        """Perform one round of maintenance on idle connections.
+
+        This is invoked periodically by the maintenance thread when
+        :paramref:`.QueuePool.maintenance_interval` is set.
+
+        """
+        if self._recycle > -1:
+            self._recycle_idle_connections()
+        if self._pre_ping and self._pre_ping_idle_time is not None:
+            self._ping_idle_connections()
+        if self._min_idle:
+            self._fill_idle_connections()
+
+    def _for_idle_connections(self, filter_fn, fn):
+        """Remove idle records matching filter_fn from the queue one at a
+        time, passing each one to fn and then returning it to the pool."""
+
+        with self._pool.mutex:
+            candidates = [rec for rec in self._pool.queue if filter_fn(rec)]
+
+        for rec in candidates:
+            # skip records that were checked out in the meantime
+            with self._pool.mutex:
+                try:
+                    self._pool.queue.remove(rec)
+                except ValueError:
+                    continue
+            try:
+                fn(rec)
+            finally:
+                self._do_return_conn(rec)
+
+    def _recycle_idle_connections(self):
+        # recycle each connection at a random point during the final
+        # quarter of its lifespan; the chance of recycling on a given run
+        # increases as the remaining time shrinks, spreading recycles
+        # evenly over that window
+        now = time.time()
+        interval = self._maintenance_interval or 0
+        window_start = self._recycle * 0.75
+        # an interval longer than the final quarter of the lifespan
+        # recycles connections as soon as they enter it
+        deadline = max(self._recycle - interval, window_start)
+
+        def should_recycle(rec):
+            if rec.connection is None:
+                return False
+            age = now - rec.starttime
+            if age >= deadline:
+                return True
+            elif age < window_start:
+                return False
+            return random.random() < interval / (deadline - age + interval)
+
+        self._for_idle_connections(
+            should_recycle, _ConnectionRecord._reconnect
+        )
+
+    def _ping_idle_connections(self):
+        # ping connections which would exceed the pre-ping idle time
+        # before the next run, so that checkouts don't need to
+        margin = self._maintenance_interval or 0
+
+        self._for_idle_connections(
+            lambda rec: rec.connection is not None
+            and not rec.fresh
+            and not rec._used_recently(margin),
+            _ConnectionRecord._ping,
+        )
+
+    def _fill_idle_connections(self):
+        min_idle = self._min_idle
+        if self._pool.maxsize:
+            min_idle = min(min_idle, self._pool.maxsize)
+
+        while self._pool.qsize() < min_idle and self._inc_overflow():
+            try:
+                rec = self._create_connection()
+            except Exception:
+                self._dec_overflow()
+                self.logger.error(
+                    "Exception establishing idle connection", exc_info=True
+                )
+                return
+            self._do_return_conn(rec)
+
     def recreate(self):
         self.logger.info("Pool recreating")
-        return self.__class__(
+        pool = self.__class__(
             self._creator,
             pool_size=self._pool.maxsize,
             max_overflow=self._max_overflow,
             timeout=self._timeout,
+            maintenance_interval=self._maintenance_interval,
+            min_idle=self._min_idle,
+            pre_ping=self._pre_ping,
+            pre_ping_idle_time=self._pre_ping_idle_time,
             recycle=self._recycle,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
+            skip_clean_reset=self._skip_clean_reset,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
+        # event listeners are already in place
+        pool._start_maintenance()
+        return pool
 
     def dispose(self):
+        with self._overflow_lock:
+            if self._maintenance_stop is not None:
+                self._maintenance_stop.set()
+                # restarted upon the next checkout
+                self._maintenance_stop = None
+
         while True:
             try:
                 conn = self._pool.get(False)
@@ -215,6 +403,728 @@ class QueuePool(Pool):
         return self._pool.maxsize - self._pool.qsize() + self._overflow
 
 
+class ThreadAffinityPool(Pool):
+
+    """A :class:`_pool.Pool` that imposes a limit on the number of open
+    connections, while avoiding lock contention between threads.
+
+    :class:`.ThreadAffinityPool` accepts the same sizing options as
+    :class:`.QueuePool`, and is intended for applications where a large
+    number of threads make frequent, short checkouts.   Where
+    :class:`.QueuePool` synchronizes every checkout and checkin on a
+    single lock, this pool instead has each thread prefer the connection
+    it used most recently; when that connection is idle it's checked out
+    again without acquiring any lock.   Otherwise, the most recently
+    returned idle connection is taken from a shared stack, also without
+    locking.   A lock is only acquired when a new connection needs to be
+    established, or when the pool is exhausted and the thread has to wait.
+
+    As connections aren't handed out in any particular order, waiting
+    threads aren't guaranteed to receive connections in the order in which
+    they began to wait.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`pool_thread_affinity`
+
+    """
+
+    def __init__(
+        self, creator, pool_size=5, max_overflow=10, timeout=30, **kw
+    ):
+        r"""
+        Construct a ThreadAffinityPool.
+
+        :param creator: a callable function that returns a DB-API
+          connection object, same as that of :paramref:`_pool.Pool.creator`.
+
+        :param pool_size: The size of the pool to be maintained, defaults
+          to 5; same as that of :paramref:`.QueuePool.pool_size`.
+
+        :param max_overflow: The maximum overflow size of the pool, defaults
+          to 10; same as that of :paramref:`.QueuePool.max_overflow`.
+
+        :param timeout: The number of seconds to wait before giving up
+          on returning a connection. Defaults to 30.
+
+        :param \**kw: Other keyword arguments including
+          :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
+          :paramref:`_pool.Pool.reset_on_return` and others are passed to the
+          :class:`_pool.Pool` constructor.
+
+        """
+        Pool.__init__(self, creator, **kw)
+        self._pool_size = pool_size
+        self._overflow = 0 - pool_size
+        self._max_overflow = max_overflow
+        self._timeout = timeout
+        self._overflow_lock = threading.Lock()
+
+        # idle records, as keys; records are claimed using dict.pop()
+        # and pushed onto / popped from the deque, all of which are atomic
+        self._idle = {}
+        self._stack = collections.deque()
+
+        # records which have an entry in the stack; an entry may be stale
+        # if its record was claimed by its thread directly, in which case
+        # it's skipped when popped
+        self._stacked = set()
+
+        self._affinity = threading.local()
+        self._available = threading.Condition(threading.Lock())
+        self._waiters = 0
+
+    def _do_return_conn(self, conn):
+        if self._pool_size and len(self._idle) >= self._pool_size:
+            try:
+                conn.close()
+            finally:
+                self._dec_overflow()
+            return
+
+        self._idle[conn] = True
+        if conn not in self._stacked:
+            self._stacked.add(conn)
+            self._stack.append(conn)
+
+        if self._waiters:
+            self._notify_waiter()
+
+    def _do_get(self):
+        rec = self._claim()
+        if rec is None:
+            if self._inc_overflow():
+                rec = self._create_connection_or_dec()
+            else:
+                rec = self._wait_for_conn()
+        self._affinity.record = weakref.ref(rec)
+        return rec
+
+    def _claim(self):
+        """Claim an idle record without locking, preferring the one last
+        used by the current thread; returns None if no record is idle."""
+
+        idle = self._idle
+        try:
+            rec = self._affinity.record()
+        except AttributeError:
+            pass
+        else:
+            if rec is not None and idle.pop(rec, None):
+                return rec
+
+        stack = self._stack
+        while True:
+            try:
+                rec = stack.pop()
+            except IndexError:
+                return None
+            self._stacked.discard(rec)
+            if idle.pop(rec, None):
+                return rec
+
+    def _create_connection_or_dec(self):
+        try:
+            rec = self._create_connection()
+        except:
+            with util.safe_reraise():
+                self._dec_overflow()
+        if self._overflow > 0:
+            self.metrics.overflow_creations += 1
+        return rec
+
+    def _wait_for_conn(self):
+        metrics = self.metrics
+        deadline = time.time() + self._timeout
+        with self._available:
+            self._waiters += 1
+            metrics.waiters += 1
+            try:
+                while True:
+                    # registered as a waiter before looking, so that a
+                    # connection returned after this point notifies us
+                    rec = self._claim()
+                    if rec is not None:
+                        return rec
+                    if self._inc_overflow():
+                        break
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise exc.TimeoutError(
+                            "ThreadAffinityPool limit of size %d overflow "
+                            "%d reached, connection timed out, timeout %d"
+                            % (self.size(), self.overflow(), self._timeout),
+                            code="3o7r",
+                        )
+                    self._available.wait(remaining)
+            finally:
+                self._waiters -= 1
+                metrics.waiters -= 1
+        return self._create_connection_or_dec()
+
+    def _notify_waiter(self):
+        with self._available:
+            self._available.notify()
+
+    def _inc_overflow(self):
+        if self._max_overflow == -1:
+            self._overflow += 1
+            return True
+        with self._overflow_lock:
+            if self._overflow < self._max_overflow:
+                self._overflow += 1
+                return True
+            else:
+                return False
+
+    def _dec_overflow(self):
+        if self._max_overflow == -1:
+            self._overflow -= 1
+        else:
+            with self._overflow_lock:
+                self._overflow -= 1
+        if self._waiters:
+            self._notify_waiter()
+        return True
+
+    def recreate(self):
+        self.logger.info("Pool recreating")
+        return self.__class__(
+            self._creator,
+            pool_size=self._pool_size,
+            max_overflow=self._max_overflow,
+            timeout=self._timeout,
+            pre_ping=self._pre_ping,
+            pre_ping_idle_time=self._pre_ping_idle_time,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            skip_clean_reset=self._skip_clean_reset,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
+
+    def dispose(self):
+        while True:
+            try:
+                conn, _ = self._idle.popitem()
+            except KeyError:
+                break
+            conn.close()
+
+        self._stack.clear()
+        self._stacked.clear()
+        self._overflow = 0 - self.size()
+        self.logger.info("Pool disposed. %s", self.status())
+
+    def status(self):
+        return (
+            "Pool size: %d  Connections in pool: %d "
+            "Current Overflow: %d Current Checked out "
+            "connections: %d"
+            % (
+                self.size(),
+                self.checkedin(),
+                self.overflow(),
+                self.checkedout(),
+            )
+        )
+
+    def size(self):
+        return self._pool_size
+
+    def timeout(self):
+        return self._timeout
+
+    def checkedin(self):
+        return len(self._idle)
+
+    def overflow(self):
+        return self._overflow
+
+    def checkedout(self):
+        return self._pool_size - len(self._idle) + self._overflow
+
+
+class PoolHost(object):
+    """A database host to which a :class:`.MultiHostPool` distributes
+    connections, along with statistics for its use.
+
+    :class:`.PoolHost` objects are available from the
+    :attr:`.MultiHostPool.hosts` list.   As with :class:`.PoolMetrics`,
+    the values are maintained without locking and may be read at any time
+    from any thread.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`pool_multi_host`
+
+    """
+
+    latency_weight = 0.2
+    """The weight given to the duration of each new connection when updating
+    :attr:`.PoolHost.latency`."""
+
+    name = None
+    """The name of the host.
+
+    For hosts given as database URLs to :func:`_sa.create_engine`, this is
+    the URL with any password obscured.
+
+    """
+
+    checkouts = 0
+    """Total number of connections checked out from this host."""
+
+    failures = 0
+    """Number of times this host has been ejected, due to an error
+    establishing a connection or a disconnect error."""
+
+    latency = None
+    """Exponentially weighted moving average of the number of seconds taken
+    to establish a new DBAPI connection to this host; ``None`` until a
+    connection is first established."""
+
+    ejected_until = None
+    """The time, as returned by ``time.time()``, until which this host was
+    most recently ejected; ``None`` if the host has never been ejected."""
+
+    def __init__(self, name, creator, pool_size, max_overflow):
+        self.name = name
+        self.creator = creator
+        self._idle = sqla_queue.Queue(pool_size)
+        self._overflow = 0 - pool_size
+        self._max_overflow = max_overflow
+        self._overflow_lock = threading.Lock()
+        self._invalidate_time = 0
+
+    def __repr__(self):
+        return "<PoolHost %s>" % self.name
+
+    @property
+    def ejected(self):
+        """True if this host is currently ejected."""
+        return (
+            self.ejected_until is not None and self.ejected_until > time.time()
+        )
+
+    @property
+    def checkedout(self):
+        """Number of connections currently checked out from this host."""
+        return self._idle.maxsize - self._idle.qsize() + self._overflow
+
+    @property
+    def checkedin(self):
+        """Number of idle connections to this host."""
+        return self._idle.qsize()
+
+    def snapshot(self):
+        """Return a dictionary of the current statistics for this host."""
+
+        return {
+            "name": self.name,
+            "checkedout": self.checkedout,
+            "checkedin": self.checkedin,
+            "checkouts": self.checkouts,
+            "failures": self.failures,
+            "latency": self.latency,
+            "ejected": self.ejected,
+        }
+
+    def _record_latency(self, elapsed):
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += (elapsed - self.latency) * self.latency_weight
+
+    def _inc_overflow(self):
+        if self._max_overflow == -1:
+            self._overflow += 1
+            return True
+        with self._overflow_lock:
+            if self._overflow < self._max_overflow:
+                self._overflow += 1
+                return True
+            else:
+                return False
+
+    def _dec_overflow(self):
+        if self._max_overflow == -1:
+            self._overflow -= 1
+            return True
+        with self._overflow_lock:
+            self._overflow -= 1
+            return True
+
+
+class _HostConnectionRecord(_ConnectionRecord):
+    """A :class:`._ConnectionRecord` which connects to a particular host
+    of a :class:`.MultiHostPool`."""
+
+    def __init__(self, pool, host):
+        self.host = host
+        self._host_pool = pool
+        _ConnectionRecord.__init__(self, pool)
+
+    def get_connection(self):
+        if (
+            self.connection is not None
+            and self.host._invalidate_time > self.starttime
+        ):
+            self.invalidate(soft=True)
+        return _ConnectionRecord.get_connection(self)
+
+    def _checkin_failed(self, err):
+        self._host_pool._host_failed(self.host, err)
+        _ConnectionRecord._checkin_failed(self, err)
+
+
+class MultiHostPool(Pool):
+
+    """A :class:`_pool.Pool` that distributes connections among several
+    equivalent database hosts, such as a group of read replicas.
+
+    Each checkout is routed to the host which is least loaded, as
+    determined by the :paramref:`.MultiHostPool.routing` parameter; idle
+    connections are maintained separately for each host, with
+    :paramref:`.MultiHostPool.pool_size` and
+    :paramref:`.MultiHostPool.max_overflow` applying to each host
+    individually.
+
+    A host which fails to establish a connection, or whose connection
+    reports a disconnect error, is ejected for
+    :paramref:`.MultiHostPool.eject_time` seconds, during which checkouts
+    are routed to the remaining hosts; if all hosts are ejected, each is
+    tried in turn.   Statistics for each host are available from the
+    :attr:`.MultiHostPool.hosts` list.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`pool_multi_host`
+
+    """
+
+    def __init__(
+        self,
+        creator,
+        hosts=(),
+        pool_size=5,
+        max_overflow=10,
+        timeout=30,
+        routing="checkouts",
+        eject_time=30,
+        **kw
+    ):
+        r"""
+        Construct a MultiHostPool.
+
+        :param creator: a callable function that returns a DB-API
+          connection object for the first host, same as that of
+          :paramref:`_pool.Pool.creator`.   This host is named ``default``.
+
+        :param hosts: a sequence of additional hosts, each of which is
+          either a creator function, or a tuple of ``(name, creator)``.
+          Hosts without a name are named after their position, e.g.
+          ``host1``, ``host2``.   When using :func:`_sa.create_engine`,
+          database URLs may be given as well; see
+          :paramref:`_sa.create_engine.pool_hosts`.
+
+        :param pool_size: The number of connections to keep persistently
+          for each host, defaults to 5; see
+          :paramref:`.QueuePool.pool_size`.
+
+        :param max_overflow: The maximum overflow size for each host,
+          defaults to 10; see :paramref:`.QueuePool.max_overflow`.
+
+        :param timeout: The number of seconds to wait before giving up
+          on returning a connection, when all hosts are at their limit.
+          Defaults to 30.
+
+        :param routing: how the host for each checkout is chosen, among
+          those that aren't ejected:
+
+          * ``"checkouts"`` - the default; the host with the fewest
+            connections checked out.
+
+          * ``"latency"`` - the host with the lowest recent
+            :attr:`.PoolHost.latency`, that is the time taken to establish
+            a new connection, multiplied by the number of connections
+            checked out from it plus one; hosts for which no latency has
+            been recorded yet are preferred.
+
+        :param eject_time: number of seconds for which a host is ejected
+          after a failure.  Defaults to 30.
+
+        :param \**kw: Other keyword arguments including
+          :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
+          :paramref:`_pool.Pool.reset_on_return` and others are passed to the
+          :class:`_pool.Pool` constructor.
+
+        """
+        if routing not in ("checkouts", "latency"):
+            raise exc.ArgumentError(
+                "Invalid value for 'routing': %r; expected 'checkouts' "
+                "or 'latency'" % (routing,)
+            )
+        Pool.__init__(self, creator, **kw)
+        self._host_specs = hosts
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._timeout = timeout
+        self._routing = routing
+        self._eject_time = eject_time
+        self._available = threading.Condition(threading.Lock())
+        self._waiters = 0
+
+        self.hosts = []
+        for index, spec in enumerate([("default", creator)] + list(hosts)):
+            if isinstance(spec, tuple):
+                name, host_creator = spec
+            else:
+                name, host_creator = "host%d" % index, spec
+            host = PoolHost(name, host_creator, pool_size, max_overflow)
+            host._invoke_creator = Pool._should_wrap_creator(
+                self, host_creator
+            )
+            self.hosts.append(host)
+
+    hosts = ()
+    """The list of :class:`.PoolHost` objects for this pool, which include
+    statistics for each host."""
+
+    def _should_wrap_creator(self, creator):
+        # connections are established using the creator of the record's
+        # host, timing each one for PoolHost.latency
+        def connect(rec):
+            host = rec.host
+            start = time.time()
+            connection = host._invoke_creator(rec)
+            host._record_latency(time.time() - start)
+            return connection
+
+        return connect
+
+    def _candidate_hosts(self):
+        now = time.time()
+        hosts = [
+            host
+            for host in self.hosts
+            if host.ejected_until is None or host.ejected_until <= now
+        ]
+        if not hosts:
+            # all hosts are ejected; try each one, starting with the
+            # one ejected the longest ago
+            return sorted(self.hosts, key=lambda host: host.ejected_until)
+
+        if self._routing == "latency":
+
+            def key(host):
+                return (
+                    (host.latency or 0) * (host.checkedout + 1),
+                    random.random(),
+                )
+
+        else:
+
+            def key(host):
+                return (host.checkedout, random.random())
+
+        return sorted(hosts, key=key)
+
+    def _do_get(self):
+        hosts = self._candidate_hosts()
+        for host in hosts:
+            try:
+                rec = host._idle.get(False)
+            except sqla_queue.Empty:
+                pass
+            else:
+                return self._host_checkout(host, rec)
+
+            if host._inc_overflow():
+                try:
+                    rec = self._create_host_connection(host)
+                except Exception:
+                    if host is hosts[-1]:
+                        raise
+                    continue
+                return self._host_checkout(host, rec)
+
+        # every host is at its limit; wait for a connection to be
+        # returned to any of them
+        host, rec = self._wait_for_conn()
+        if rec is None:
+            rec = self._create_host_connection(host)
+        return self._host_checkout(host, rec)
+
+    def _wait_for_conn(self):
+        """Wait for an idle connection, or room for a new one, on any
+        candidate host; returns a tuple of the host and its record, which
+        is None if a new connection is to be established."""
+
+        metrics = self.metrics
+        deadline = time.time() + self._timeout
+        with self._available:
+            self._waiters += 1
+            metrics.waiters += 1
+            try:
+                while True:
+                    # registered as a waiter before looking, so that a
+                    # connection returned after this point notifies us
+                    for host in self._candidate_hosts():
+                        try:
+                            return host, host._idle.get(False)
+                        except sqla_queue.Empty:
+                            pass
+                        if host._inc_overflow():
+                            return host, None
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise exc.TimeoutError(
+                            "MultiHostPool limit of size %d overflow %d "
+                            "reached, connection timed out, timeout %d"
+                            % (self.size(), self.overflow(), self._timeout),
+                            code="3o7r",
+                        )
+                    self._available.wait(remaining)
+            finally:
+                self._waiters -= 1
+                metrics.waiters -= 1
+
+    def _create_host_connection(self, host):
+        try:
+            rec = _HostConnectionRecord(self, host)
+        except Exception as err:
+            with util.safe_reraise():
+                self._dec_overflow(host)
+                self._host_failed(host, err)
+        if host._overflow > 0:
+            self.metrics.overflow_creations += 1
+        return rec
+
+    def _host_checkout(self, host, rec):
+        host.checkouts += 1
+        return rec
+
+    def _do_return_conn(self, conn):
+        host = conn.host
+        try:
+            host._idle.put(conn, False)
+        except sqla_queue.Full:
+            try:
+                conn.close()
+            finally:
+                self._dec_overflow(host)
+        else:
+            if self._waiters:
+                self._notify_waiter()
+
+    def _dec_overflow(self, host):
+        host._dec_overflow()
+        if self._waiters:
+            self._notify_waiter()
+
+    def _notify_waiter(self):
+        with self._available:
+            self._available.notify()
+
+    def _host_failed(self, host, err):
+        now = time.time()
+        host.failures += 1
+        host.ejected_until = now + self._eject_time
+        self.logger.warning(
+            "Host %s failed (%s); ejecting for %d seconds",
+            host.name,
+            err,
+            self._eject_time,
+        )
+
+    def _invalidate(self, connection, exception=None, _checkin=True):
+        rec = getattr(connection, "_connection_record", None)
+        if rec is None:
+            Pool._invalidate(self, connection, exception, _checkin)
+            return
+
+        # limit the invalidation to the connections of the host upon
+        # which the disconnect occurred, which is then ejected
+        host = rec.host
+        if host._invalidate_time < rec.starttime:
+            host._invalidate_time = time.time()
+            self._host_failed(host, exception)
+        if _checkin and getattr(connection, "is_valid", False):
+            connection.invalidate(exception)
+
+    def recreate(self):
+        self.logger.info("Pool recreating")
+        return self.__class__(
+            self._creator,
+            hosts=self._host_specs,
+            pool_size=self._pool_size,
+            max_overflow=self._max_overflow,
+            timeout=self._timeout,
+            routing=self._routing,
+            eject_time=self._eject_time,
+            pre_ping=self._pre_ping,
+            pre_ping_idle_time=self._pre_ping_idle_time,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            skip_clean_reset=self._skip_clean_reset,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
+
+    def dispose(self):
+        for host in self.hosts:
+            while True:
+                try:
+                    conn = host._idle.get(False)
+                    conn.close()
+                except sqla_queue.Empty:
+                    break
+            host._overflow = 0 - self._pool_size
+
+        self.logger.info("Pool disposed. %s", self.status())
+
+    def status(self):
+        return "MultiHostPool size: %d %s" % (
+            self._pool_size,
+            " ".join(
+                "Host %s: Connections in pool: %d Checked out: %d%s"
+                % (
+                    host.name,
+                    host.checkedin,
+                    host.checkedout,
+                    " (ejected)" if host.ejected else "",
+                )
+                for host in self.hosts
+            ),
+        )
+
+    def size(self):
+        return self._pool_size
+
+    def timeout(self):
+        return self._timeout
+
+    def checkedin(self):
+        return sum(host.checkedin for host in self.hosts)
+
+    def overflow(self):
+        return sum(host._overflow for host in self.hosts)
+
+    def checkedout(self):
+        return sum(host.checkedout for host in self.hosts)
+
+
 class NullPool(Pool):
 
     """A Pool which does not pool connections.
@@ -246,6 +1156,7 @@ class NullPool(Pool):
             echo=self.echo,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
+            skip_clean_reset=self._skip_clean_reset,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -301,6 +1212,7 @@ class SingletonThreadPool(Pool):
             echo=self.echo,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
+            skip_clean_reset=self._skip_clean_reset,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -400,6 +1312,7 @@ class StaticPool(Pool):
             creator=self._creator,
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
+            skip_clean_reset=self._skip_clean_reset,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             _dispatch=self.dispatch,
@@ -475,3 +1388,21 @@ class AssertionPool(Pool):
         if self._store_traceback:
             self._checkout_traceback = traceback.format_stack()
         return self._conn
+
+
+def _run_maintenance(pool_ref, interval, stop):
+    # refer to the pool weakly in between runs, so that the thread
+    # doesn't prevent it from being garbage collected
+    while True:
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            pool._maintain()
+        except Exception:
+            pool.logger.error(
+                "Exception during pool maintenance", exc_info=True
+            )
+        del pool
+        if stop.wait(interval):
+            return
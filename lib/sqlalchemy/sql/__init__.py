@@ -103,7 +103,6 @@ def __go(lcls):
     from .elements import AnnotatedColumnElement
     from .elements import ClauseList  # noqa
     from .selectable import AnnotatedFromClause  # noqa
-    from .traversals import _preconfigure_traversals
 
     from . import base
     from . import coercions
@@ -130,8 +129,6 @@ def __go(lcls):
     _prepare_annotations(FromClause, AnnotatedFromClause)
     _prepare_annotations(ClauseList, Annotated)
 
-    _preconfigure_traversals(ClauseElement)
-
     _sa_util.preloaded.import_prefix("sqlalchemy.sql")
 
     from . import naming  # noqa
@@ -467,7 +467,9 @@ def _append_param_insert_pk_returning(compiler, stmt, c, values, kw):
 
     """
     if c.default is not None:
-        if c.default.is_sequence:
+        if c.default.is_sequence and _prefetch_sequence(compiler, c.default):
+            values.append((c, _create_insert_prefetch_bind_param(compiler, c)))
+        elif c.default.is_sequence:
             if compiler.dialect.supports_sequences and (
                 not c.default.optional
                 or not compiler.dialect.sequences_optional
@@ -490,6 +492,18 @@ def _append_param_insert_pk_returning(compiler, stmt, c, values, kw):
         _warn_pk_with_no_anticipated_value(c)
 
 
+def _prefetch_sequence(compiler, sequence):
+    """Return True if the given :class:`.Sequence` hands out values on the
+    client side, and so is to be "pre-executed" like a Python-side default,
+    rather than rendered inline."""
+
+    return (
+        sequence.cache_block is not None
+        and compiler.dialect.supports_sequences
+        and (not sequence.optional or not compiler.dialect.sequences_optional)
+    )
+
+
 def _create_insert_prefetch_bind_param(compiler, c, process=True, name=None):
     param = _create_bind_param(compiler, c, None, process=process, name=name)
     compiler.insert_prefetch.append(c)
@@ -593,7 +607,9 @@ def _append_param_insert_hasdefault(
     compiler, stmt, c, implicit_return_defaults, values, kw
 ):
 
-    if c.default.is_sequence:
+    if c.default.is_sequence and _prefetch_sequence(compiler, c.default):
+        values.append((c, _create_insert_prefetch_bind_param(compiler, c)))
+    elif c.default.is_sequence:
         if compiler.dialect.supports_sequences and (
             not c.default.optional or not compiler.dialect.sequences_optional
         ):
@@ -604,13 +604,112 @@ class DDLBase(SchemaVisitor):
     def __init__(self, connection):
         self.connection = connection
 
+        # per-schema sets of existing table and sequence names; populated
+        # only for the duration of a bulk_checkfirst metadata operation.
+        self._existing_names = None
+
+    def _name_key(self, name):
+        """Return the form of a name which is compared against the names
+        listed by the dialect, matching how the database itself compares
+        them.
+
+        """
+        dialect = self.dialect
+        if dialect.requires_name_normalize:
+            # case insensitive names are listed in lower case, and are
+            # the same as their upper case equivalent
+            return dialect.denormalize_name(name)
+        elif dialect._case_insensitive_names:
+            return name.lower()
+        else:
+            return name
+
+    def _listed_names(self, kind, schema):
+        """Return the set of names of the given kind which exist in the
+        given schema, using one listing query per schema, or None if the
+        dialect doesn't implement the listing and names should be checked
+        individually.
+
+        """
+        if self._existing_names is None:
+            return None
+
+        key = (kind, schema)
+        if key in self._existing_names:
+            return self._existing_names[key]
+
+        try:
+            if kind == "table":
+                names = list(
+                    self.dialect.get_table_names(
+                        self.connection, schema=schema
+                    )
+                )
+                # has_table() reports views and, for the default schema,
+                # temporary tables on most backends; match that here
+                try:
+                    names.extend(
+                        self.dialect.get_view_names(
+                            self.connection, schema=schema
+                        )
+                    )
+                    if schema is None:
+                        names.extend(
+                            self.dialect.get_temp_table_names(self.connection)
+                        )
+                except NotImplementedError:
+                    pass
+            else:
+                names = self.dialect.get_sequence_names(
+                    self.connection, schema=schema
+                )
+        except NotImplementedError:
+            names = None
+        else:
+            names = set(self._name_key(name) for name in names)
+
+        self._existing_names[key] = names
+        return names
+
+    def _has_table(self, table_name, schema):
+        names = self._listed_names("table", schema)
+        if names is None:
+            return self.dialect.has_table(
+                self.connection, table_name, schema=schema
+            )
+        return self._name_key(table_name) in names
+
+    def _has_sequence(self, sequence_name, schema):
+        names = self._listed_names("sequence", schema)
+        if names is None:
+            return self.dialect.has_sequence(
+                self.connection, sequence_name, schema=schema
+            )
+        return self._name_key(sequence_name) in names
+
+    def _set_exists(self, kind, name, schema, exists):
+        if self._existing_names is not None:
+            names = self._existing_names.get((kind, schema))
+            if names is not None:
+                if exists:
+                    names.add(self._name_key(name))
+                else:
+                    names.discard(self._name_key(name))
+
 
 class SchemaGenerator(DDLBase):
     def __init__(
-        self, dialect, connection, checkfirst=False, tables=None, **kwargs
+        self,
+        dialect,
+        connection,
+        checkfirst=False,
+        tables=None,
+        bulk_checkfirst=True,
+        **kwargs
     ):
         super(SchemaGenerator, self).__init__(connection, **kwargs)
         self.checkfirst = checkfirst
+        self.bulk_checkfirst = bulk_checkfirst
         self.tables = tables
         self.preparer = dialect.identifier_preparer
         self.dialect = dialect
@@ -621,8 +720,8 @@ class SchemaGenerator(DDLBase):
         effective_schema = self.connection.schema_for_object(table)
         if effective_schema:
             self.dialect.validate_identifier(effective_schema)
-        return not self.checkfirst or not self.dialect.has_table(
-            self.connection, table.name, schema=effective_schema
+        return not self.checkfirst or not self._has_table(
+            table.name, effective_schema
         )
 
     def _can_create_index(self, index):
@@ -643,13 +742,19 @@ class SchemaGenerator(DDLBase):
             (not self.dialect.sequences_optional or not sequence.optional)
             and (
                 not self.checkfirst
-                or not self.dialect.has_sequence(
-                    self.connection, sequence.name, schema=effective_schema
-                )
+                or not self._has_sequence(sequence.name, effective_schema)
             )
         )
 
     def visit_metadata(self, metadata):
+        if self.checkfirst and self.bulk_checkfirst:
+            self._existing_names = {}
+        try:
+            self._visit_metadata(metadata)
+        finally:
+            self._existing_names = None
+
+    def _visit_metadata(self, metadata):
         if self.tables is not None:
             tables = self.tables
         else:
@@ -762,6 +867,12 @@ class SchemaGenerator(DDLBase):
         if not create_ok and not self._can_create_sequence(sequence):
             return
         self.connection.execute(CreateSequence(sequence))
+        self._set_exists(
+            "sequence",
+            sequence.name,
+            self.connection.schema_for_object(sequence),
+            True,
+        )
 
     def visit_index(self, index, create_ok=False):
         if not create_ok and not self._can_create_index(index):
@@ -771,16 +882,31 @@ class SchemaGenerator(DDLBase):
 
 class SchemaDropper(DDLBase):
     def __init__(
-        self, dialect, connection, checkfirst=False, tables=None, **kwargs
+        self,
+        dialect,
+        connection,
+        checkfirst=False,
+        tables=None,
+        bulk_checkfirst=True,
+        **kwargs
     ):
         super(SchemaDropper, self).__init__(connection, **kwargs)
         self.checkfirst = checkfirst
+        self.bulk_checkfirst = bulk_checkfirst
         self.tables = tables
         self.preparer = dialect.identifier_preparer
         self.dialect = dialect
         self.memo = {}
 
     def visit_metadata(self, metadata):
+        if self.checkfirst and self.bulk_checkfirst:
+            self._existing_names = {}
+        try:
+            self._visit_metadata(metadata)
+        finally:
+            self._existing_names = None
+
+    def _visit_metadata(self, metadata):
         if self.tables is not None:
             tables = self.tables
         else:
@@ -876,8 +1002,8 @@ class SchemaDropper(DDLBase):
         effective_schema = self.connection.schema_for_object(table)
         if effective_schema:
             self.dialect.validate_identifier(effective_schema)
-        return not self.checkfirst or self.dialect.has_table(
-            self.connection, table.name, schema=effective_schema
+        return not self.checkfirst or self._has_table(
+            table.name, effective_schema
         )
 
     def _can_drop_index(self, index):
@@ -897,9 +1023,7 @@ class SchemaDropper(DDLBase):
             (not self.dialect.sequences_optional or not sequence.optional)
             and (
                 not self.checkfirst
-                or self.dialect.has_sequence(
-                    self.connection, sequence.name, schema=effective_schema
-                )
+                or self._has_sequence(sequence.name, effective_schema)
             )
         )
 
@@ -950,6 +1074,12 @@ class SchemaDropper(DDLBase):
         if not drop_ok and not self._can_drop_sequence(sequence):
             return
         self.connection.execute(DropSequence(sequence))
+        self._set_exists(
+            "sequence",
+            sequence.name,
+            self.connection.schema_for_object(sequence),
+            False,
+        )
 
 
 def sort_tables(
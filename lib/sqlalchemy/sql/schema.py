@@ -2457,6 +2457,7 @@ class Sequence(IdentityOptions, roles.StatementRole, DefaultGenerator):
         metadata=None,
         quote_schema=None,
         for_update=False,
+        cache_block=None,
     ):
         """Construct a :class:`.Sequence` object.
 
@@ -2595,7 +2596,34 @@ class Sequence(IdentityOptions, roles.StatementRole, DefaultGenerator):
          on that column's table, rather than for INSERT statements, when
          no value is otherwise present for that column in the statement.
 
+        :param cache_block: optional integer value; when set, values are
+         reserved from the sequence in blocks of this size, using a single
+         "next value" call per block, and are then handed out on the client
+         side.  The sequence is created with an ``INCREMENT BY`` of the same
+         value, so that each "next value" returned by the database marks
+         the start of a block of values which no other process will be
+         given.  As the values are generated before the INSERT statement
+         proceeds, a :class:`_schema.Column` using the sequence as its
+         default no longer requires that each row is INSERTed individually
+         in order to get at the new primary key; in particular the ORM is
+         able to INSERT many new objects using a single executemany() call.
+         Blocks are kept separately for each connection pool and for each
+         schema the sequence is translated to using the
+         ``schema_translate_map`` execution option.   Values which have been
+         reserved but not used, such as when a process exits, are skipped,
+         resulting in gaps in the sequence.
+
+         .. versionadded:: 1.4
+
         """
+        if cache_block is not None:
+            if increment is None:
+                increment = cache_block
+            elif increment != cache_block:
+                raise exc.ArgumentError(
+                    "Sequence increment %r must be the same as the value "
+                    "of cache_block %r" % (increment, cache_block)
+                )
         DefaultGenerator.__init__(self, for_update=for_update)
         IdentityOptions.__init__(
             self,
@@ -2612,6 +2640,7 @@ class Sequence(IdentityOptions, roles.StatementRole, DefaultGenerator):
         )
         self.name = quoted_name(name, quote)
         self.optional = optional
+        self.cache_block = cache_block
         if schema is BLANK_SCHEMA:
             self.schema = schema = None
         elif metadata is not None and schema is None and metadata.schema:
@@ -4251,6 +4280,7 @@ class MetaData(SchemaItem):
         extend_existing=False,
         autoload_replace=True,
         resolve_fks=True,
+        workers=None,
         **dialect_kwargs
     ):
         r"""Load all available table definitions from the database.
@@ -4323,6 +4353,22 @@ class MetaData(SchemaItem):
 
             :paramref:`_schema.Table.resolve_fks`
 
+        :param workers: if greater than one, the number of threads among
+         which the tables to be reflected are divided, each of which
+         retrieves the information for its tables using its own connection
+         from the connection pool of the :class:`_engine.Engine`.  The
+         :class:`_schema.Table` objects are then created from the combined
+         information in the same order as when reflecting serially.  As the
+         threads don't make use of the given connection, tables which are
+         not visible outside of its current transaction may not be
+         reflected in this way.  Has no effect for connection pools which
+         provide a single connection per thread or process, such as that
+         used for a SQLite ``:memory:`` database, and is limited to one
+         less than the number of connections the pool may hand out, taking
+         its ``pool_size`` and ``max_overflow`` into account.
+
+         .. versionadded:: 1.4
+
         :param \**dialect_kwargs: Additional keyword arguments not mentioned
          above are dialect specific, and passed in the form
          ``<dialectname>_<argname>``.  See the documentation regarding an
@@ -4338,7 +4384,11 @@ class MetaData(SchemaItem):
         if bind is None:
             bind = _bind_or_error(self)
 
-        with inspection.inspect(bind)._inspection_context() as insp:
+        if schema is None:
+            schema = self.schema
+
+        insp_context = inspection.inspect(bind)._inspection_context()
+        with insp_context as insp, insp._reflection_cache_context(schema):
             reflect_opts = {
                 "autoload_with": insp,
                 "extend_existing": extend_existing,
@@ -4349,9 +4399,6 @@ class MetaData(SchemaItem):
 
             reflect_opts.update(dialect_kwargs)
 
-            if schema is None:
-                schema = self.schema
-
             if schema is not None:
                 reflect_opts["schema"] = schema
 
@@ -4395,13 +4442,27 @@ class MetaData(SchemaItem):
                     if extend_existing or name not in current
                 ]
 
+            if load and workers is not None and workers > 1:
+                insp._load_parallel(schema, load, workers, **dialect_kwargs)
+            elif load:
+                # retrieve columns, constraints and indexes for all the
+                # tables using as few queries as the dialect allows, rather
+                # than emitting several queries for each table
+                insp._load_multi(
+                    schema,
+                    None if len(load) == len(available) else load,
+                    **dialect_kwargs
+                )
+
             for name in load:
                 try:
                     Table(name, self, **reflect_opts)
                 except exc.UnreflectableTableError as uerr:
                     util.warn("Skipping table %s: %s" % (name, uerr))
 
-    def create_all(self, bind=None, tables=None, checkfirst=True):
+    def create_all(
+        self, bind=None, tables=None, checkfirst=True, bulk_checkfirst=True
+    ):
         """Create all tables stored in this metadata.
 
         Conditional by default, will not attempt to recreate tables already
@@ -4420,14 +4481,34 @@ class MetaData(SchemaItem):
           Defaults to True, don't issue CREATEs for tables already present
           in the target database.
 
+        :param bulk_checkfirst:
+          Defaults to True; when used with ``checkfirst``, determine which
+          tables and sequences are present using a single
+          :meth:`.Dialect.get_table_names` /
+          :meth:`.Dialect.get_sequence_names` query per schema, rather than
+          a ``has_table()`` or ``has_sequence()`` query for each object.
+          Set to False to check each object individually, such as when
+          statements are rewritten as they're executed such that the
+          listing queries would not succeed, or when ``has_table()`` should
+          locate tables outside of the listed schema, as with the
+          PostgreSQL ``search_path``.
+
+          .. versionadded:: 1.4
+
         """
         if bind is None:
             bind = _bind_or_error(self)
         bind._run_ddl_visitor(
-            ddl.SchemaGenerator, self, checkfirst=checkfirst, tables=tables
+            ddl.SchemaGenerator,
+            self,
+            checkfirst=checkfirst,
+            tables=tables,
+            bulk_checkfirst=bulk_checkfirst,
         )
 
-    def drop_all(self, bind=None, tables=None, checkfirst=True):
+    def drop_all(
+        self, bind=None, tables=None, checkfirst=True, bulk_checkfirst=True
+    ):
         """Drop all tables stored in this metadata.
 
         Conditional by default, will not attempt to drop tables not present in
@@ -4446,11 +4527,29 @@ class MetaData(SchemaItem):
           Defaults to True, only issue DROPs for tables confirmed to be
           present in the target database.
 
+        :param bulk_checkfirst:
+          Defaults to True; when used with ``checkfirst``, determine which
+          tables and sequences are present using a single
+          :meth:`.Dialect.get_table_names` /
+          :meth:`.Dialect.get_sequence_names` query per schema, rather than
+          a ``has_table()`` or ``has_sequence()`` query for each object.
+          Set to False to check each object individually, such as when
+          statements are rewritten as they're executed such that the
+          listing queries would not succeed, or when ``has_table()`` should
+          locate tables outside of the listed schema, as with the
+          PostgreSQL ``search_path``.
+
+          .. versionadded:: 1.4
+
         """
         if bind is None:
             bind = _bind_or_error(self)
         bind._run_ddl_visitor(
-            ddl.SchemaDropper, self, checkfirst=checkfirst, tables=tables
+            ddl.SchemaDropper,
+            self,
+            checkfirst=checkfirst,
+            tables=tables,
+            bulk_checkfirst=bulk_checkfirst,
         )
 
 
@@ -32,27 +32,6 @@ def compare(obj1, obj2, **kw):
     return strategy.compare(obj1, obj2, **kw)
 
 
-def _preconfigure_traversals(target_hierarchy):
-
-    stack = [target_hierarchy]
-    while stack:
-        cls = stack.pop()
-        stack.extend(cls.__subclasses__())
-
-        if hasattr(cls, "_traverse_internals"):
-            cls._generate_cache_attrs()
-            _copy_internals.generate_dispatch(
-                cls,
-                cls._traverse_internals,
-                "_generated_copy_internals_traversal",
-            )
-            _get_children.generate_dispatch(
-                cls,
-                cls._traverse_internals,
-                "_generated_get_children_traversal",
-            )
-
-
 class HasCacheKey(object):
     _cache_key_traversal = NO_CACHE
     __slots__ = ()
@@ -135,10 +114,8 @@ class HasCacheKey(object):
         try:
             dispatcher = cls.__dict__["_generated_cache_key_traversal"]
         except KeyError:
-            # most of the dispatchers are generated up front
-            # in sqlalchemy/sql/__init__.py ->
-            # traversals.py-> _preconfigure_traversals().
-            # this block will generate any remaining dispatchers.
+            # dispatchers are generated on first use for each class,
+            # rather than for the whole class hierarchy at import time.
             dispatcher = cls._generate_cache_attrs()
 
         if dispatcher is NO_CACHE:
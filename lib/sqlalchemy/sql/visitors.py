@@ -217,10 +217,8 @@ class InternalTraversal(util.with_metaclass(_InternalTraversalType, object)):
         try:
             dispatcher = target.__class__.__dict__[generate_dispatcher_name]
         except KeyError:
-            # most of the dispatchers are generated up front
-            # in sqlalchemy/sql/__init__.py ->
-            # traversals.py-> _preconfigure_traversals().
-            # this block will generate any remaining dispatchers.
+            # dispatchers are generated on first use for each class,
+            # rather than for the whole class hierarchy at import time.
             dispatcher = self.generate_dispatch(
                 target.__class__, internal_dispatch, generate_dispatcher_name
             )
@@ -263,16 +263,7 @@ def function_call_count(variance=0.05, times=1, warmup=0):
 
 @contextlib.contextmanager
 def count_functions(variance=0.05):
-    if cProfile is None:
-        raise config._skip_test_exception("cProfile is not installed")
-
-    if not _profile_stats.has_stats() and not _profile_stats.write:
-        config.skip_test(
-            "No profiling stats available on this "
-            "platform for this function.  Run tests with "
-            "--write-profiles to add statistics to %s for "
-            "this platform." % _profile_stats.short_fname
-        )
+    _check_profiling_available()
 
     gc_collect()
 
@@ -287,8 +278,79 @@ def count_functions(variance=0.05):
     stats = pstats.Stats(pr, stream=sys.stdout)
 
     # timespent = ended - began
-    callcount = stats.total_calls
+    _assert_call_count(stats.total_calls, variance, stats)
+
+
+_subprocess_profile = """
+import cProfile
+import os
+import pstats
+import sys
+
+code = sys.stdin.read()
+pr = cProfile.Profile()
+pr.enable()
+exec(compile(code, "<profiled>", "exec"))
+pr.disable()
+
+token = os.sep + "sqlalchemy" + os.sep
+print(
+    sum(
+        ncalls
+        for (filename, lineno, name), (cc, ncalls, tt, ct, callers) in (
+            pstats.Stats(pr).stats.items()
+        )
+        if token in filename
+    )
+)
+"""
+
+
+def subprocess_call_count(code, variance=0.05):
+    """Assert a target for the function call count of the given Python
+    source code, run within a new interpreter.
+
+    This is used for operations which are only meaningful in a fresh
+    process, such as importing the ``sqlalchemy`` package itself.  Only
+    calls to functions within the ``sqlalchemy`` package are counted, so
+    that the result does not depend on the state of bytecode caches
+    or on the interpreter's import machinery.
+
+    """
+    import subprocess
+
+    _check_profiling_available()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _subprocess_profile],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=env,
+    )
+    out, err = proc.communicate(code.encode("ascii"))
+    if proc.returncode:
+        raise AssertionError(
+            "Profiled subprocess exited with code %d" % proc.returncode
+        )
+    _assert_call_count(int(out.strip().splitlines()[-1]), variance)
+
+
+def _check_profiling_available():
+    if cProfile is None:
+        raise config._skip_test_exception("cProfile is not installed")
+
+    if not _profile_stats.has_stats() and not _profile_stats.write:
+        config.skip_test(
+            "No profiling stats available on this "
+            "platform for this function.  Run tests with "
+            "--write-profiles to add statistics to %s for "
+            "this platform." % _profile_stats.short_fname
+        )
+
 
+def _assert_call_count(callcount, variance, stats=None):
     expected = _profile_stats.result(callcount)
 
     if expected is None:
@@ -297,14 +359,15 @@ def count_functions(variance=0.05):
         line_no, expected_count = expected
 
     print(("Pstats calls: %d Expected %s" % (callcount, expected_count)))
-    stats.sort_stats(*re.split(r"[, ]", _profile_stats.sort))
-    stats.print_stats()
-    if _profile_stats.dump:
-        base, ext = os.path.splitext(_profile_stats.dump)
-        test_name = _current_test.split(".")[-1]
-        dumpfile = "%s_%s%s" % (base, test_name, ext or ".profile")
-        stats.dump_stats(dumpfile)
-        print("Dumped stats to file %s" % dumpfile)
+    if stats is not None:
+        stats.sort_stats(*re.split(r"[, ]", _profile_stats.sort))
+        stats.print_stats()
+        if _profile_stats.dump:
+            base, ext = os.path.splitext(_profile_stats.dump)
+            test_name = _current_test.split(".")[-1]
+            dumpfile = "%s_%s%s" % (base, test_name, ext or ".profile")
+            stats.dump_stats(dumpfile)
+            print("Dumped stats to file %s" % dumpfile)
     # stats.print_callers()
     if _profile_stats.force_write:
         _profile_stats.replace(callcount)
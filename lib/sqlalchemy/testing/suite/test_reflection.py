@@ -1231,6 +1231,84 @@ class ComponentReflectionTest(fixtures.TablesTest):
         oid = insp.get_table_oid(table_name, schema)
         self.assert_(isinstance(oid, int))
 
+    def _multi_reflect_compare(self, result):
+        # types don't compare on equality; compare their repr instead
+        if isinstance(result, list):
+            return [
+                dict(rec, type=repr(rec["type"])) if "type" in rec else rec
+                for rec in result
+            ]
+        return result
+
+    def _test_get_multi(self, schema=None, filter_names=None):
+        if filter_names is None:
+            table_names = inspect(testing.db).get_table_names(schema)
+        else:
+            table_names = filter_names
+
+        for kind in ("columns", "pk_constraint", "foreign_keys", "indexes"):
+            multi = getattr(inspect(testing.db), "get_multi_%s" % kind)(
+                schema=schema, filter_names=filter_names
+            )
+            if filter_names is not None:
+                eq_(sorted(multi), sorted(filter_names))
+            for table_name in table_names:
+                single = getattr(inspect(testing.db), "get_%s" % kind)(
+                    table_name, schema=schema
+                )
+                eq_(
+                    self._multi_reflect_compare(multi[table_name]),
+                    self._multi_reflect_compare(single),
+                )
+
+        eq_(
+            list(
+                inspect(testing.db).get_multi_columns(
+                    schema=schema, filter_names=["users", "nonexistent"]
+                )
+            ),
+            ["users"],
+        )
+
+    @testing.requires.table_reflection
+    @testing.requires.primary_key_constraint_reflection
+    @testing.requires.foreign_key_constraint_reflection
+    @testing.requires.index_reflection
+    def test_get_multi(self):
+        self._test_get_multi()
+
+    @testing.requires.table_reflection
+    @testing.requires.primary_key_constraint_reflection
+    @testing.requires.foreign_key_constraint_reflection
+    @testing.requires.index_reflection
+    @testing.requires.schemas
+    def test_get_multi_with_schema(self):
+        self._test_get_multi(testing.config.test_schema)
+
+    @testing.requires.table_reflection
+    @testing.requires.primary_key_constraint_reflection
+    @testing.requires.foreign_key_constraint_reflection
+    @testing.requires.index_reflection
+    def test_get_multi_filter_names(self):
+        self._test_get_multi(filter_names=["email_addresses", "users"])
+
+    @testing.requires.table_reflection
+    @testing.requires.primary_key_constraint_reflection
+    @testing.requires.foreign_key_constraint_reflection
+    @testing.requires.index_reflection
+    @testing.requires.schemas
+    def test_get_multi_filter_names_with_schema(self):
+        self._test_get_multi(
+            testing.config.test_schema,
+            filter_names=["email_addresses", "users"],
+        )
+
+    @testing.requires.temp_table_reflection
+    @testing.requires.primary_key_constraint_reflection
+    @testing.requires.index_reflection
+    def test_get_multi_temp_table(self):
+        self._test_get_multi(filter_names=["user_tmp"])
+
     def test_get_table_oid(self):
         self._test_get_table_oid("users")
 
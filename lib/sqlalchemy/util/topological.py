@@ -15,6 +15,12 @@ __all__ = ["sort", "sort_as_subsets", "find_cycles"]
 
 
 def sort_as_subsets(tuples, allitems, deterministic_order=False):
+    """Sort the given items by dependency, yielding successive sets of
+    items which depend only on items in preceding sets.
+
+    Each item and each dependency is visited a fixed number of times.
+
+    """
 
     edges = util.defaultdict(set)
     for parent, child in tuples:
@@ -24,21 +30,49 @@ def sort_as_subsets(tuples, allitems, deterministic_order=False):
 
     todo = Set(allitems)
 
-    while todo:
-        output = Set()
-        for node in todo:
-            if todo.isdisjoint(edges[node]):
-                output.add(node)
-
-        if not output:
-            raise CircularDependencyError(
-                "Circular dependency detected.",
-                find_cycles(tuples, allitems),
-                _gen_edges(edges),
-            )
+    # for each item, the items which depend on it and the number of
+    # items it still waits on; parents not in allitems are ignored
+    dependents = util.defaultdict(list)
+    waiting = {}
+    for node in todo:
+        count = 0
+        for parent in edges.get(node, ()):
+            if parent in todo:
+                dependents[parent].append(node)
+                count += 1
+        waiting[node] = count
+
+    if deterministic_order:
+        position = dict((node, idx) for idx, node in enumerate(todo))
+
+    output = Set(node for node in todo if not waiting[node])
+    remaining = len(todo)
+
+    while output:
+        remaining -= len(output)
+
+        # determine the next set before yielding, as the caller may
+        # consume the set it receives
+        ready = []
+        for node in output:
+            for child in dependents.get(node, ()):
+                waiting[child] -= 1
+                if not waiting[child]:
+                    ready.append(child)
+
+        if deterministic_order:
+            # retain the order of allitems within each set
+            ready.sort(key=position.__getitem__)
 
-        todo.difference_update(output)
         yield output
+        output = Set(ready)
+
+    if remaining:
+        raise CircularDependencyError(
+            "Circular dependency detected.",
+            find_cycles(tuples, allitems),
+            _gen_edges(edges),
+        )
 
 
 def sort(tuples, allitems, deterministic_order=False):
@@ -48,6 +48,11 @@ ext_modules = [
         sources=["lib/sqlalchemy/cextension/utils.c"],
         extra_compile_args=extra_compile_args,
     ),
+    Extension(
+        "sqlalchemy.cattributes",
+        sources=["lib/sqlalchemy/cextension/attributes.c"],
+        extra_compile_args=extra_compile_args,
+    ),
 ]
 
 
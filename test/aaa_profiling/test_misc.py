@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 from sqlalchemy import Column
 from sqlalchemy import Enum
 from sqlalchemy import ForeignKey
@@ -14,6 +18,7 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import profiling
 from sqlalchemy.util import classproperty
+from sqlalchemy.util import topological
 
 
 class EnumTest(fixtures.TestBase):
@@ -49,6 +54,40 @@ class EnumTest(fixtures.TestBase):
         Enum(self.SomeEnum)
 
 
+class TopologicalSortTest(fixtures.TestBase):
+    __requires__ = ("cpython", "python_profiling_backend", "python3")
+
+    @testing.fixture(scope="class")
+    def graph_fixture(self):
+        # 10000 nodes, each depending on the two nodes which precede it,
+        # producing 10000 dependency levels
+        allitems = list(reversed(range(10000)))
+        tuples = [(i, i + 1) for i in range(9999)] + [
+            (i, i + 2) for i in range(9998)
+        ]
+        return tuples, allitems
+
+    def test_sort(self, graph_fixture):
+        tuples, allitems = graph_fixture
+
+        @profiling.function_call_count(variance=0.10)
+        def go():
+            return list(topological.sort(tuples, allitems))
+
+        eq_(go(), list(range(10000)))
+
+    def test_sort_deterministic(self, graph_fixture):
+        tuples, allitems = graph_fixture
+
+        @profiling.function_call_count(variance=0.10)
+        def go():
+            return list(
+                topological.sort(tuples, allitems, deterministic_order=True)
+            )
+
+        eq_(go(), list(range(10000)))
+
+
 class CacheKeyTest(fixtures.TestBase):
     # python3 is just to have less variability in test counts
     __requires__ = ("cpython", "python_profiling_backend", "python3")
@@ -127,3 +166,21 @@ class CacheKeyTest(fixtures.TestBase):
                 eq_(key, current_key)
             else:
                 current_key = key
+
+
+class ImportTest(fixtures.TestBase):
+    __requires__ = ("cpython", "python_profiling_backend")
+
+    def test_import_sqlalchemy(self):
+        profiling.subprocess_call_count("import sqlalchemy", variance=0.10)
+
+    def test_import_defers_dialects_and_orm(self):
+        code = (
+            "import sys; import sqlalchemy; "
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith(('sqlalchemy.dialects.', 'sqlalchemy.orm'))))"
+        )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+        out = subprocess.check_output([sys.executable, "-c", code], env=env)
+        eq_(out.decode("ascii").strip(), "[]")
@@ -476,6 +476,32 @@ class AttributeOverheadTest(NoCache, fixtures.MappedTest):
 
         go()
 
+    def test_scalar_attribute_get(self):
+        Parent = self.classes.Parent
+        parents = [Parent(data="p%d" % i) for i in range(100)]
+
+        @profiling.function_call_count()
+        def go():
+            for p in parents:
+                p.data
+                p.data
+                p.children
+
+        go()
+
+    def test_scalar_attribute_set(self):
+        Parent = self.classes.Parent
+        parents = [Parent(data="p%d" % i) for i in range(100)]
+
+        @profiling.function_call_count()
+        def go():
+            for p in parents:
+                p.data = "x"
+                p.data = "y"
+                del p.data
+
+        go()
+
     def test_collection_append_remove(self):
         Parent, Child = self.classes.Parent, self.classes.Child
         p1 = Parent()
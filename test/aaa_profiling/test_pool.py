@@ -1,5 +1,9 @@
+import threading
+
 from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import ThreadAffinityPool
 from sqlalchemy.testing import AssertsExecutionResults
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import profiling
 
@@ -10,6 +14,8 @@ pool = None
 class QueuePoolTest(fixtures.TestBase, AssertsExecutionResults):
     __requires__ = ("cpython", "python_profiling_backend")
 
+    poolclass = QueuePool
+
     class Connection(object):
         def rollback(self):
             pass
@@ -22,11 +28,15 @@ class QueuePoolTest(fixtures.TestBase, AssertsExecutionResults):
         # has the effect of initializing
         # class-level event listeners on Pool,
         # if not present already.
-        p1 = QueuePool(creator=self.Connection, pool_size=3, max_overflow=-1)
+        p1 = self.poolclass(
+            creator=self.Connection, pool_size=3, max_overflow=-1
+        )
         p1.connect()
 
         global pool
-        pool = QueuePool(creator=self.Connection, pool_size=3, max_overflow=-1)
+        pool = self.poolclass(
+            creator=self.Connection, pool_size=3, max_overflow=-1
+        )
 
     @profiling.function_call_count()
     def test_first_connect(self):
@@ -42,3 +52,73 @@ class QueuePoolTest(fixtures.TestBase, AssertsExecutionResults):
             return conn2
 
         go()
+
+
+class ThreadAffinityPoolTest(QueuePoolTest):
+    poolclass = ThreadAffinityPool
+
+
+class PoolContentionTest(fixtures.TestBase):
+    """Check out connections from many threads at once against a pool
+    much smaller than the number of threads, and check that every
+    checkout succeeds and every connection is returned.
+
+    """
+
+    __requires__ = ("cpython", "timing_intensive")
+
+    thread_count = 200
+    checkouts = 100
+
+    class Connection(object):
+        def rollback(self):
+            pass
+
+        def close(self):
+            pass
+
+    def _run_contention(self, poolclass):
+        p = poolclass(
+            creator=self.Connection, pool_size=20, max_overflow=10, timeout=60
+        )
+        errors = []
+        checkouts = [0]
+        checkouts_lock = threading.Lock()
+        start_event = threading.Event()
+
+        def checkout():
+            start_event.wait()
+            try:
+                for i in range(self.checkouts):
+                    conn = p.connect()
+                    with checkouts_lock:
+                        checkouts[0] += 1
+                    conn.close()
+            except Exception as err:
+                errors.append(err)
+
+        threads = [
+            threading.Thread(target=checkout) for i in range(self.thread_count)
+        ]
+        for t in threads:
+            t.start()
+
+        start_event.set()
+        for t in threads:
+            t.join(60)
+
+        eq_(errors, [])
+        eq_(checkouts[0], self.thread_count * self.checkouts)
+
+        # the metrics are updated without locking, so increments may be
+        # lost under contention
+        assert 0 < p.metrics.checkouts <= checkouts[0]
+        eq_(p.checkedout(), 0)
+        eq_(p.metrics.waiters, 0)
+        assert p.checkedin() <= 20
+
+    def test_queuepool(self):
+        self._run_contention(QueuePool)
+
+    def test_thread_affinity_pool(self):
+        self._run_contention(ThreadAffinityPool)
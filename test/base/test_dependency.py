@@ -206,6 +206,43 @@ class DependencySortTest(fixtures.TestBase):
         tuples = [(i, i + 1) for i in range(0, 1500, 2)]
         self.assert_sort(tuples)
 
+    def test_large_chain_sort(self):
+        tuples = [(i, i + 1) for i in range(5000)]
+        self.assert_sort_deterministic(
+            tuples, list(reversed(range(5001))), list(range(5001))
+        )
+
+    def test_sort_as_subsets(self):
+        tuples = [(1, 2), (1, 3), (2, 4), (3, 4), (0, 4), (6, 5)]
+        eq_(
+            [
+                list(s)
+                for s in topological.sort_as_subsets(
+                    tuples, [6, 5, 4, 3, 2, 1, 0], deterministic_order=True
+                )
+            ],
+            [[6, 1, 0], [5, 3, 2], [4]],
+        )
+
+    def test_sort_as_subsets_consumed(self):
+        """the caller may empty each set as it's received"""
+
+        tuples = [(1, 2), (1, 3), (2, 4), (3, 4)]
+        result = []
+        for set_ in topological.sort_as_subsets(tuples, [1, 2, 3, 4]):
+            subset = set()
+            while set_:
+                subset.add(set_.pop())
+            result.append(subset)
+        eq_(result, [{1}, {2, 3}, {4}])
+
+    def test_sort_ignores_outside_items(self):
+        tuples = [(1, 2), (2, 3), (3, 4)]
+        eq_(
+            list(topological.sort(tuples, [4, 2], deterministic_order=True)),
+            [4, 2],
+        )
+
     def test_ticket_1380(self):
 
         # ticket:1380 regression: would raise a KeyError
@@ -267,6 +267,29 @@ class CompileTest(fixtures.TestBase, AssertsCompiledSQL):
                 "WHERE sometable.somecolumn = othertable.somecolumn",
             )
 
+    def test_update_from_derived_values(self):
+        # the statement emitted for mapper(update_from_values=True)
+        t = table("sometable", column("id", Integer), column("data"))
+        values = sql.union_all(
+            *[
+                select(
+                    sql.bindparam("id_%d" % i, type_=Integer).label("id"),
+                    sql.bindparam("data_%d" % i).label("data"),
+                )
+                for i in range(2)
+            ]
+        ).subquery("update_values")
+
+        self.assert_compile(
+            t.update()
+            .values({t.c.data: values.c.data})
+            .where(t.c.id == values.c.id),
+            "UPDATE sometable SET data=update_values.data "
+            "FROM sometable, (SELECT :id_0 AS id, :data_0 AS data "
+            "UNION ALL SELECT :id_1 AS id, :data_1 AS data) AS update_values "
+            "WHERE sometable.id = update_values.id",
+        )
+
     def test_update_to_select_schema(self):
         meta = MetaData()
         table = Table(
@@ -1,5 +1,6 @@
 import collections
 import random
+import sqlite3
 import threading
 import time
 import weakref
@@ -15,6 +16,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_not_
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing.engines import testing_engine
@@ -114,6 +116,8 @@ class PoolTest(PoolTestBase):
             pool.QueuePool,
             pool.NullPool,
             pool.AssertionPool,
+            pool.ThreadAffinityPool,
+            pool.MultiHostPool,
         ):
             p = cls(creator=creator)
             p.dispose()
@@ -1665,6 +1669,739 @@ class QueuePoolTest(PoolTestBase):
         pc1.close()
 
 
+class QueuePoolMaintenanceTest(PoolTestBase):
+    def _maintenance_fixture(self, **kw):
+        dbapi, p = self._queuepool_dbapi_fixture(maintenance_interval=10, **kw)
+        # run maintenance explicitly rather than in the background
+        p._start_maintenance = Mock()
+        return dbapi, p
+
+    def test_fill_idle(self):
+        dbapi, p = self._maintenance_fixture(pool_size=3, min_idle=2)
+
+        p._maintain()
+        eq_(p.checkedin(), 2)
+        eq_(dbapi.connect.call_count, 2)
+
+        c1 = p.connect()
+        eq_(p.checkedin(), 1)
+
+        p._maintain()
+        eq_(p.checkedin(), 2)
+        eq_(p.checkedout(), 1)
+        eq_(dbapi.connect.call_count, 3)
+
+        p._maintain()
+        eq_(dbapi.connect.call_count, 3)
+        c1.close()
+
+    def test_fill_idle_limited_to_pool_size(self):
+        dbapi, p = self._maintenance_fixture(pool_size=2, min_idle=5)
+
+        p._maintain()
+        eq_(p.checkedin(), 2)
+        eq_(p.overflow(), 0)
+
+    def test_fill_idle_respects_max_overflow(self):
+        dbapi, p = self._maintenance_fixture(
+            pool_size=2, max_overflow=0, min_idle=2
+        )
+
+        c1, c2 = p.connect(), p.connect()
+        p._maintain()
+        eq_(p.checkedin(), 0)
+        eq_(dbapi.connect.call_count, 2)
+
+        c1.close()
+        c2.close()
+
+    def test_fill_idle_connect_fails(self):
+        dbapi, p = self._maintenance_fixture(pool_size=3, min_idle=2)
+
+        dbapi.shutdown(True)
+        p._maintain()
+        eq_(p.checkedin(), 0)
+        eq_(p.overflow(), -3)
+
+        dbapi.shutdown(False)
+        p._maintain()
+        eq_(p.checkedin(), 2)
+        eq_(p.overflow(), -1)
+
+    def _recycle_fixture(self):
+        dbapi, p = self._maintenance_fixture(pool_size=3, recycle=100)
+
+        conns = [p.connect() for i in range(3)]
+        dbapi_conns = [c.connection for c in conns]
+        for c in conns:
+            c.close()
+        return dbapi, p, dbapi_conns
+
+    def _set_ages(self, p, *ages):
+        now = time.time()
+        for rec, age in zip(p._pool.queue, ages):
+            rec.starttime = now - age
+
+    def test_recycle_idle(self):
+        dbapi, p, dbapi_conns = self._recycle_fixture()
+
+        # 91 seconds is past the deadline of 100 - interval of 10
+        self._set_ages(p, 10, 91, 50)
+        p._maintain()
+
+        eq_(
+            [rec.connection for rec in p._pool.queue],
+            [dbapi_conns[0], dbapi_conns[2], ANY],
+        )
+        assert dbapi_conns[1].close.called
+        assert not dbapi_conns[0].close.called
+        eq_(dbapi.connect.call_count, 4)
+
+    def test_recycle_idle_staggered(self):
+        dbapi, p, dbapi_conns = self._recycle_fixture()
+
+        # within the last quarter of the lifespan
+        self._set_ages(p, 80, 80, 80)
+        with patch("sqlalchemy.pool.impl.random.random") as random:
+            random.side_effect = [0.9, 0.1, 0.9]
+            p._maintain()
+
+        # chance is interval / (time remaining + interval), 10 / 20
+        eq_(dbapi.connect.call_count, 4)
+        eq_(
+            [c.close.called for c in dbapi_conns], [False, True, False],
+        )
+
+    def test_recycle_idle_long_interval(self):
+        dbapi, p, dbapi_conns = self._recycle_fixture()
+        p._maintenance_interval = 150
+
+        # with an interval longer than the lifespan, only connections in
+        # the final quarter of it are recycled
+        self._set_ages(p, 10, 80, 50)
+        p._maintain()
+
+        eq_(
+            [c.close.called for c in dbapi_conns], [False, True, False],
+        )
+        eq_(dbapi.connect.call_count, 4)
+
+    def test_no_recycle_when_checked_out(self):
+        dbapi, p, dbapi_conns = self._recycle_fixture()
+
+        self._set_ages(p, 95, 95, 95)
+        c1 = p.connect()
+        p._maintain()
+
+        is_(c1.connection, dbapi_conns[0])
+        assert not dbapi_conns[0].close.called
+        eq_(dbapi.connect.call_count, 5)
+        c1.close()
+
+    def test_recreate_starts_maintenance(self):
+        p = self._queuepool_fixture(maintenance_interval=10, min_idle=1)
+        is_(p._maintenance_stop, None)
+
+        p2 = p.recreate()
+        eq_(p2._min_idle, 1)
+        stop = p2._maintenance_stop
+        is_not_(stop, None)
+        p2.dispose()
+        is_true(stop.is_set())
+
+    def test_start_on_checkout(self):
+        p = self._queuepool_fixture(maintenance_interval=10, min_idle=2)
+        is_(p._maintenance_stop, None)
+
+        c1 = p.connect()
+        stop = p._maintenance_stop
+        is_not_(stop, None)
+
+        c1.close()
+        p.connect().close()
+        is_(p._maintenance_stop, stop)
+        p.dispose()
+        is_true(stop.is_set())
+
+        # a disposed pool starts a new thread when used again
+        p.connect().close()
+        is_not_(p._maintenance_stop, None)
+        is_not_(p._maintenance_stop, stop)
+        p.dispose()
+
+    @testing.requires.timing_intensive
+    def test_engine_warms_pool(self):
+        e = tsa.create_engine(
+            "sqlite://",
+            poolclass=pool.QueuePool,
+            connect_args={"check_same_thread": False},
+            pool_maintenance_interval=10,
+            pool_min_idle=2,
+        )
+
+        for i in range(200):
+            if e.pool.checkedin() == 2:
+                break
+            time.sleep(0.01)
+        eq_(e.pool.checkedin(), 2)
+
+        # dialect was initialized by the connections made in the background
+        is_not_(e.dialect.default_isolation_level, None)
+        e.dispose()
+
+
+class ThreadAffinityPoolTest(PoolTestBase):
+    def _fixture(self, **kw):
+        dbapi = MockDBAPI()
+        return (
+            dbapi,
+            pool.ThreadAffinityPool(
+                creator=lambda: dbapi.connect("foo.db"), **kw
+            ),
+        )
+
+    def _status(self, p):
+        return (p.size(), p.checkedin(), p.overflow(), p.checkedout())
+
+    def test_status(self):
+        dbapi, p = self._fixture(pool_size=2, max_overflow=-1)
+
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        eq_(self._status(p), (2, 0, 1, 3))
+
+        c1.close()
+        eq_(self._status(p), (2, 1, 1, 2))
+        c2.close()
+        eq_(self._status(p), (2, 2, 1, 1))
+
+        # overflow connection is discarded
+        c3.close()
+        eq_(self._status(p), (2, 2, 0, 0))
+        assert c3.connection is None
+
+    def test_thread_affinity(self):
+        dbapi, p = self._fixture(pool_size=3)
+        conns = {}
+
+        def checkout(name):
+            c = p.connect()
+            conns[name] = c.connection
+            c.close()
+
+        for name in ("t1", "t2"):
+            # both threads check out at the same time, so that they
+            # acquire different connections
+            c = p.connect()
+            t = threading.Thread(target=checkout, args=(name,))
+            t.start()
+            t.join(join_timeout)
+            c.close()
+
+        c = p.connect()
+        main_conn = c.connection
+        c.close()
+
+        # the main thread gets back the connection it used last, even
+        # though other connections were returned after it
+        c = p.connect()
+        is_(c.connection, main_conn)
+        c.close()
+
+    def test_shared_stack_lifo(self):
+        dbapi, p = self._fixture(pool_size=3)
+        c1, c2 = p.connect(), p.connect()
+        dbapi_conns = [c1.connection, c2.connection]
+        c2.close()
+        c1.close()
+
+        received = []
+
+        def checkout():
+            c = p.connect()
+            received.append(c.connection)
+            c.close()
+
+        t = threading.Thread(target=checkout)
+        t.start()
+        t.join(join_timeout)
+
+        # a thread with no connection of its own gets the most recently
+        # returned connection
+        eq_(received, [dbapi_conns[0]])
+        eq_(dbapi.connect.call_count, 2)
+
+    def test_claimed_connection_skipped_on_stack(self):
+        dbapi, p = self._fixture(pool_size=3)
+        c1 = p.connect()
+        first = c1.connection
+        c1.close()
+
+        # reclaimed by this thread directly, leaving its stack entry
+        # in place
+        c1 = p.connect()
+        is_(c1.connection, first)
+
+        received = []
+
+        def checkout():
+            c = p.connect()
+            received.append(c.connection)
+            c.close()
+
+        t = threading.Thread(target=checkout)
+        t.start()
+        t.join(join_timeout)
+
+        is_not_(received[0], first)
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 1)
+        c1.close()
+        eq_(p.checkedin(), 2)
+
+    def test_wait_for_returned_connection(self):
+        dbapi, p = self._fixture(pool_size=1, max_overflow=0, timeout=10)
+        c1 = p.connect()
+        first = c1.connection
+
+        received = []
+
+        def checkout():
+            c = p.connect()
+            received.append(c.connection)
+            c.close()
+
+        t = threading.Thread(target=checkout)
+        t.start()
+        for i in range(200):
+            if p.metrics.waiters:
+                break
+            time.sleep(0.01)
+        eq_(p.metrics.waiters, 1)
+
+        c1.close()
+        t.join(join_timeout)
+        eq_(received, [first])
+        eq_(p.metrics.waiters, 0)
+        eq_(dbapi.connect.call_count, 1)
+
+    @testing.requires.timing_intensive
+    def test_timeout(self):
+        dbapi, p = self._fixture(pool_size=2, max_overflow=0, timeout=2)
+        c1, c2 = p.connect(), p.connect()  # noqa
+        now = time.time()
+
+        assert_raises_message(
+            tsa.exc.TimeoutError,
+            "ThreadAffinityPool limit of size 2 overflow 0 reached",
+            p.connect,
+        )
+        assert int(time.time() - now) == 2
+        eq_(p.metrics.waiters, 0)
+
+    def test_connect_error_decrements_overflow(self):
+        dbapi, p = self._fixture(pool_size=2, max_overflow=0)
+
+        dbapi.shutdown(True)
+        assert_raises(Exception, p.connect)
+        eq_(p.overflow(), -2)
+
+        dbapi.shutdown(False)
+        c1, c2 = p.connect(), p.connect()
+        eq_(p.overflow(), 0)
+        c1.close()
+        c2.close()
+
+    @testing.requires.threading_with_mock
+    def test_concurrent_checkouts(self):
+        dbapi, p = self._fixture(pool_size=3, max_overflow=2, timeout=20)
+        checked_out = []
+        errors = []
+
+        def checkout():
+            try:
+                for i in range(50):
+                    c = p.connect()
+                    checked_out.append(p.checkedout())
+                    time.sleep(0.001)
+                    c.close()
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=checkout) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(join_timeout)
+
+        eq_(errors, [])
+        eq_(len(checked_out), 1000)
+        assert max(checked_out) <= 5
+        eq_(p.checkedout(), 0)
+        eq_(p.checkedin(), 3)
+        eq_(p.overflow(), 0)
+
+    def test_dispose(self):
+        dbapi, p = self._fixture(pool_size=3)
+        c1, c2 = p.connect(), p.connect()
+        dbapi_conns = [c1.connection, c2.connection]
+        c1.close()
+        c2.close()
+
+        p.dispose()
+        eq_(self._status(p), (3, 0, -3, 0))
+        assert all(c.close.called for c in dbapi_conns)
+
+        c1 = p.connect()
+        eq_(dbapi.connect.call_count, 3)
+        c1.close()
+
+    def test_recreate(self):
+        dbapi, p = self._fixture(
+            pool_size=4, max_overflow=2, timeout=15, pre_ping=True
+        )
+        p2 = p.recreate()
+        is_(p2.__class__, pool.ThreadAffinityPool)
+        eq_(p2.size(), 4)
+        eq_(p2._max_overflow, 2)
+        eq_(p2.timeout(), 15)
+        is_true(p2._pre_ping)
+
+    def test_create_engine(self):
+        e = tsa.create_engine(
+            "sqlite://",
+            poolclass=pool.ThreadAffinityPool,
+            pool_size=2,
+            max_overflow=0,
+        )
+        with e.connect() as conn:
+            eq_(conn.scalar(select([1])), 1)
+        eq_(e.pool.size(), 2)
+        eq_(e.pool.checkedin(), 1)
+
+
+class MultiHostPoolTest(PoolTestBase):
+    def _fixture(self, **kw):
+        dbapis = [MockDBAPI() for i in range(3)]
+        p = pool.MultiHostPool(
+            creator=lambda: dbapis[0].connect("foo.db"),
+            hosts=[
+                lambda: dbapis[1].connect("foo.db"),
+                ("replica", lambda: dbapis[2].connect("foo.db")),
+            ],
+            **kw
+        )
+        return dbapis, p
+
+    def _host_of(self, p, conn):
+        return conn._connection_record.host
+
+    def test_host_names(self):
+        dbapis, p = self._fixture()
+        eq_([host.name for host in p.hosts], ["default", "host1", "replica"])
+
+    def test_invalid_routing(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "Invalid value for 'routing': 'random'",
+            pool.MultiHostPool,
+            creator=Mock(),
+            routing="random",
+        )
+
+    def test_route_by_checkouts(self):
+        dbapis, p = self._fixture(pool_size=2)
+
+        conns = [p.connect() for i in range(6)]
+        eq_([host.checkedout for host in p.hosts], [2, 2, 2])
+        eq_([d.connect.call_count for d in dbapis], [2, 2, 2])
+
+        # a connection returned to a host makes it the least loaded
+        host = self._host_of(p, conns[0])
+        conns[0].close()
+        conns[0] = p.connect()
+        is_(self._host_of(p, conns[0]), host)
+        eq_(host.checkouts, 3)
+        eq_(p.checkedout(), 6)
+
+        for c in conns:
+            c.close()
+        eq_(p.checkedin(), 6)
+        eq_(p.checkedout(), 0)
+
+    @patch.object(pool.PoolHost, "_record_latency", Mock())
+    def test_route_by_latency(self):
+        dbapis, p = self._fixture(routing="latency")
+        default, host1, replica = p.hosts
+
+        # hosts without any latency recorded are tried first
+        default.latency = 0.7
+        host1.latency = 0.25
+        c1 = p.connect()
+        is_(self._host_of(p, c1), replica)
+        replica.latency = 0.3
+
+        # latency is weighted by connections checked out plus one;
+        # 0.25 * 1 < 0.3 * 2 < 0.7 * 1
+        c2 = p.connect()
+        is_(self._host_of(p, c2), host1)
+
+        # 0.25 * 2 < 0.3 * 2
+        c3 = p.connect()
+        is_(self._host_of(p, c3), host1)
+
+        # 0.25 * 3 > 0.3 * 2
+        c4 = p.connect()
+        is_(self._host_of(p, c4), replica)
+
+        for c in (c1, c2, c3, c4):
+            c.close()
+
+    def test_latency_recorded(self):
+        clock = [100]
+        dbapi = MockDBAPI()
+
+        def creator():
+            clock[0] += connect_time.pop(0)
+            return dbapi.connect("foo.db")
+
+        connect_time = [2, 7]
+        p = pool.MultiHostPool(creator=creator, pool_size=1, max_overflow=1)
+        host = p.hosts[0]
+
+        with patch("sqlalchemy.pool.impl.time.time", lambda: clock[0]):
+            c1 = p.connect()
+            eq_(host.latency, 2)
+
+            # checking a connection out of the pool isn't counted
+            c1.close()
+            c1 = p.connect()
+            eq_(host.latency, 2)
+
+            c2 = p.connect()
+            c1.close()
+            c2.close()
+
+        # moving average, weighting the new value by 0.2
+        eq_(host.latency, 3)
+        eq_(
+            host.snapshot(),
+            {
+                "name": host.name,
+                "checkedout": 0,
+                "checkedin": 1,
+                "checkouts": 3,
+                "failures": 0,
+                "latency": 3,
+                "ejected": False,
+            },
+        )
+
+    def test_connect_failure_ejects_host(self):
+        dbapis, p = self._fixture(eject_time=30)
+        default, host1, replica = p.hosts
+        dbapis[1].shutdown(True)
+
+        conns = [p.connect() for i in range(4)]
+        eq_(host1.failures, 1)
+        is_true(host1.ejected)
+        eq_(host1.checkedout, 0)
+        eq_(host1._overflow, -5)
+        eq_([default.checkedout, replica.checkedout], [2, 2])
+
+        # ejection has expired
+        dbapis[1].shutdown(False)
+        host1.ejected_until = time.time() - 1
+        c5 = p.connect()
+        is_(self._host_of(p, c5), host1)
+        is_(host1.ejected, False)
+
+        for c in conns + [c5]:
+            c.close()
+
+    def test_connect_failure_all_hosts(self):
+        dbapis, p = self._fixture()
+        for dbapi in dbapis:
+            dbapi.shutdown(True)
+
+        assert_raises_message(Exception, "connect failed", p.connect)
+        eq_([host.failures for host in p.hosts], [1, 1, 1])
+        eq_(p.overflow(), -15)
+
+        # with every host ejected, each is tried in turn, starting with
+        # the one ejected the longest ago
+        p.hosts[2].ejected_until -= 10
+        dbapis[2].shutdown(False)
+        c1 = p.connect()
+        is_(self._host_of(p, c1), p.hosts[2])
+        eq_([host.failures for host in p.hosts], [1, 1, 1])
+        c1.close()
+
+    def test_wait_skips_failed_host(self):
+        dbapis, p = self._fixture(pool_size=1, max_overflow=0, timeout=0.2)
+        default, host1, replica = p.hosts
+        default.ejected_until = time.time() + 1000
+        conns = [p.connect() for i in range(2)]
+
+        # the host which fails to connect is tried first, as it has the
+        # fewest connections checked out, and isn't tried again while
+        # waiting
+        default.ejected_until = None
+        dbapis[0].shutdown(True)
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+
+        is_true(default.ejected)
+        eq_(dbapis[0].connect.call_count, 1)
+        eq_(p.metrics.waiters, 0)
+
+        for c in conns:
+            c.close()
+
+    def test_wait_for_any_host(self):
+        dbapis, p = self._fixture(pool_size=1, max_overflow=0, timeout=10)
+        conns = [p.connect() for i in range(3)]
+        for host, latency in zip(p.hosts, [0.001, 0.002, 0.003]):
+            host.latency = latency
+        p._routing = "latency"
+
+        # a connection returned to the host which would be chosen last
+        # is handed to the waiting checkout
+        conn = next(c for c in conns if self._host_of(p, c) is p.hosts[2])
+
+        def release():
+            time.sleep(0.1)
+            conn.close()
+
+        th = threading.Thread(target=release)
+        th.start()
+        now = time.time()
+        c = p.connect()
+        th.join()
+
+        is_(self._host_of(p, c), p.hosts[2])
+        assert time.time() - now < 5
+        eq_(p.metrics.waiters, 0)
+
+    def test_reconnect_failure_ejects_host(self):
+        dbapis, p = self._fixture(pool_size=1, max_overflow=0)
+        conns = [p.connect() for i in range(3)]
+        host = self._host_of(p, conns[0])
+        conns[0].invalidate()
+        conns[0].close()
+        for c in conns[1:]:
+            c.close()
+
+        dbapis[p.hosts.index(host)].shutdown(True)
+        with patch.object(p, "_candidate_hosts", return_value=[host]):
+            assert_raises_message(Exception, "connect failed", p.connect)
+        eq_(host.failures, 1)
+        is_true(host.ejected)
+        eq_(host.checkedin, 1)
+
+    def test_disconnect_invalidates_host(self):
+        dbapis, p = self._fixture(pool_size=1, max_overflow=0)
+        conns = [p.connect() for i in range(3)]
+        dbapi_conns = [c.connection for c in conns]
+        time.sleep(0.05)
+
+        host = self._host_of(p, conns[0])
+        p._invalidate(conns[0], Exception("disconnect"))
+        is_(conns[0].is_valid, False)
+        eq_(host.failures, 1)
+        is_true(host.ejected)
+
+        for c in conns:
+            c.close()
+        host.ejected_until = None
+
+        # only connections to the failed host are replaced
+        conns = [p.connect() for i in range(3)]
+        expected = [1, 1, 1]
+        expected[p.hosts.index(host)] = 2
+        eq_([d.connect.call_count for d in dbapis], expected)
+        eq_(
+            [c.connection in dbapi_conns for c in conns].count(True), 2,
+        )
+        for c in conns:
+            c.close()
+
+    def test_pool_wide_invalidate(self):
+        dbapis, p = self._fixture(pool_size=1, max_overflow=0)
+        conns = [p.connect() for i in range(3)]
+        for c in conns:
+            c.close()
+        time.sleep(0.05)
+
+        p._invalidate(None)
+        eq_([host.failures for host in p.hosts], [0, 0, 0])
+        conns = [p.connect() for i in range(3)]
+        eq_([d.connect.call_count for d in dbapis], [2, 2, 2])
+        for c in conns:
+            c.close()
+
+    @testing.requires.timing_intensive
+    def test_timeout(self):
+        dbapis, p = self._fixture(pool_size=1, max_overflow=0, timeout=2)
+        conns = [p.connect() for i in range(3)]  # noqa
+        now = time.time()
+
+        assert_raises_message(
+            tsa.exc.TimeoutError,
+            "MultiHostPool limit of size 1 overflow 0 reached",
+            p.connect,
+        )
+        assert int(time.time() - now) == 2
+        eq_(p.metrics.waiters, 0)
+
+    def test_dispose(self):
+        dbapis, p = self._fixture(pool_size=1)
+        conns = [p.connect() for i in range(4)]
+        dbapi_conns = [c.connection for c in conns]
+        for c in conns:
+            c.close()
+        eq_(p.checkedin(), 3)
+
+        p.dispose()
+        eq_(p.checkedin(), 0)
+        eq_(p.overflow(), -3)
+        assert all(c.close.called for c in dbapi_conns)
+
+    def test_recreate(self):
+        dbapis, p = self._fixture(pool_size=2, routing="latency", eject_time=5)
+        p2 = p.recreate()
+        eq_([host.name for host in p2.hosts], ["default", "host1", "replica"])
+        eq_(p2.size(), 2)
+        eq_(p2._routing, "latency")
+        eq_(p2._eject_time, 5)
+
+        c1 = p2.connect()
+        eq_(sum(d.connect.call_count for d in dbapis), 1)
+        c1.close()
+
+    def test_create_engine(self):
+        e = tsa.create_engine(
+            "sqlite://",
+            poolclass=pool.MultiHostPool,
+            pool_hosts=["sqlite://", ("other", lambda: Mock())],
+            pool_routing="latency",
+            pool_eject_time=10,
+        )
+        eq_(
+            [host.name for host in e.pool.hosts],
+            ["default", "sqlite://", "other"],
+        )
+        eq_(e.pool._routing, "latency")
+        eq_(e.pool._eject_time, 10)
+
+        # route to the two sqlite hosts
+        e.pool.hosts[2].ejected_until = time.time() + 1000
+        c1 = e.pool.connect()
+        c2 = e.pool.connect()
+        for c in (c1, c2):
+            eq_(c.cursor().execute("select 1").fetchall(), [(1,)])
+        c1.close()
+        c2.close()
+
+
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
         dbapi = Mock()
@@ -1762,6 +2499,168 @@ class ResetOnReturnTest(PoolTestBase):
         assert not dbapi.connect().rollback.called
         assert dbapi.connect().commit.called
 
+    def test_reset_after_commit_by_default(self):
+        dbapi, p = self._fixture(reset_on_return="rollback")
+
+        c1 = p.connect()
+        c1.cursor().execute("insert")
+        c1.commit()
+        c1.close()
+
+        eq_(dbapi.connect().commit.call_count, 1)
+        eq_(dbapi.connect().rollback.call_count, 1)
+
+    def test_reset_after_commit_cursor_reused(self):
+        dbapi, p = self._fixture(reset_on_return="rollback")
+
+        c1 = p.connect()
+        cursor = c1.cursor()
+        cursor.execute("create")
+        c1.commit()
+        cursor.execute("insert")
+        c1.close()
+
+        eq_(dbapi.connect().rollback.call_count, 1)
+
+    @testing.requires.python3
+    def test_reset_after_commit_cursor_reused_sqlite(self):
+        p = pool.QueuePool(
+            creator=lambda: sqlite3.connect(":memory:"),
+            pool_size=1,
+            max_overflow=0,
+        )
+
+        c1 = p.connect()
+        cursor = c1.cursor()
+        cursor.execute("create table t (x integer)")
+        c1.commit()
+        cursor.execute("insert into t (x) values (1)")
+        dbapi_conn = c1.connection
+        is_true(dbapi_conn.in_transaction)
+        c1.close()
+
+        c2 = p.connect()
+        is_(c2.connection, dbapi_conn)
+        is_false(c2.connection.in_transaction)
+        eq_(c2.cursor().execute("select x from t").fetchall(), [])
+        c2.close()
+
+    def test_no_reset_after_commit(self):
+        dbapi, p = self._fixture(
+            reset_on_return="rollback", skip_clean_reset=True
+        )
+
+        c1 = p.connect()
+        c1.cursor().execute("insert")
+        c1.commit()
+        c1.close()
+
+        eq_(dbapi.connect().commit.call_count, 1)
+        assert not dbapi.connect().rollback.called
+
+    def test_no_reset_after_rollback(self):
+        dbapi, p = self._fixture(
+            reset_on_return="commit", skip_clean_reset=True
+        )
+
+        c1 = p.connect()
+        c1.cursor().execute("select")
+        c1.rollback()
+        c1.close()
+
+        eq_(dbapi.connect().rollback.call_count, 1)
+        assert not dbapi.connect().commit.called
+
+    def test_reset_after_cursor_following_commit(self):
+        dbapi, p = self._fixture(
+            reset_on_return="rollback", skip_clean_reset=True
+        )
+
+        c1 = p.connect()
+        c1.commit()
+        c1.cursor().execute("select")
+        c1.close()
+
+        eq_(dbapi.connect().rollback.call_count, 1)
+
+    def test_reset_with_dbapi_specific_commit(self):
+        dbapi, p = self._fixture(
+            reset_on_return="rollback", skip_clean_reset=True
+        )
+
+        c1 = p.connect()
+        c1.commit(True)
+        c1.close()
+
+        eq_(dbapi.connect().commit.mock_calls, [call(True)])
+        eq_(dbapi.connect().rollback.call_count, 1)
+
+    def test_reset_on_new_checkout(self):
+        dbapi, p = self._fixture(
+            reset_on_return="rollback", skip_clean_reset=True
+        )
+
+        c1 = p.connect()
+        c1.commit()
+        c1.close()
+        assert not dbapi.connect().rollback.called
+
+        # the state of the connection upon checkout isn't known
+        c1 = p.connect()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 1)
+
+    def test_reset_agent_after_commit(self):
+        dbapi, p = self._fixture(
+            reset_on_return="rollback", skip_clean_reset=True
+        )
+
+        class Agent(object):
+            is_active = True
+
+            def rollback(self):
+                dbapi.connect().special_rollback()
+
+        c1 = p.connect()
+        c1.commit()
+        c1._reset_agent = Agent()
+        c1.close()
+
+        assert dbapi.connect().special_rollback.called
+
+    def test_engine_no_reset_after_commit(self):
+        engine = testing_engine(
+            options={
+                "poolclass": pool.QueuePool,
+                "pool_size": 1,
+                "pool_skip_clean_reset": True,
+            }
+        )
+        engine.connect().close()
+
+        with patch.object(
+            engine.dialect, "do_rollback", wraps=engine.dialect.do_rollback
+        ) as do_rollback:
+            with engine.connect() as conn:
+                with conn.begin():
+                    conn.execute(select([1]))
+            eq_(do_rollback.call_count, 0)
+
+            with engine.connect() as conn:
+                conn.execute(select([1]))
+            eq_(do_rollback.call_count, 1)
+
+            with engine.connect() as conn:
+                trans = conn.begin()
+                conn.execute(select([1]))
+                trans.rollback()
+            eq_(do_rollback.call_count, 2)
+
+            with engine.connect() as conn:
+                trans = conn.begin()
+                conn.execute(select([1]))
+            eq_(do_rollback.call_count, 3)
+
     def test_reset_agent_disconnect(self):
         dbapi, p = self._fixture(reset_on_return="rollback")
 
@@ -1784,6 +2683,163 @@ class ResetOnReturnTest(PoolTestBase):
         # QueuePoolTest.test_no_double_checkin
 
 
+class PoolMetricsTest(PoolTestBase):
+    def test_checkouts(self):
+        p = self._queuepool_fixture(pool_size=2, max_overflow=0)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        c1.close()
+        c1 = p.connect()
+
+        metrics = p.metrics
+        eq_(metrics.checkouts, 3)
+        eq_(sum(metrics.wait_time_histogram), 3)
+        eq_(sum(metrics.connection_age_histogram), 3)
+        eq_(metrics.connection_age_histogram[0], 3)
+        is_true(metrics.wait_time_total >= 0)
+
+        # checkouts of an already checked out connection are not counted
+        c1._checkout_existing()
+        eq_(metrics.checkouts, 3)
+
+        c1.close()
+        c2.close()
+
+    def test_histogram_buckets(self):
+        p = self._queuepool_fixture()
+
+        with patch("sqlalchemy.pool.base.time") as mock_time:
+            mock_time.time.side_effect = [100, 100, 100.02]
+            p.connect().close()
+
+            conn_rec = p._pool.queue[0]
+            conn_rec.starttime = 80
+            mock_time.time.side_effect = [200, 201.5]
+            p.connect().close()
+
+        metrics = p.metrics
+        eq_(
+            metrics.wait_time_histogram, [0, 0, 0, 1, 0, 0, 0, 1, 0, 0],
+        )
+        eq_(
+            metrics.connection_age_histogram, [1, 0, 0, 1, 0, 0, 0, 0, 0, 0],
+        )
+        eq_(
+            metrics.snapshot()["wait_time_histogram"][-3:],
+            [(5, 1), (30, 0), (None, 0)],
+        )
+
+    def test_checkouts_per_second(self):
+        with patch("sqlalchemy.pool.base.time") as mock_time:
+            mock_time.time.return_value = 1000
+            p = self._queuepool_fixture()
+
+            mock_time.time.return_value = 1000.5
+            for i in range(3):
+                p.connect().close()
+            eq_(p.metrics.checkouts_per_second, 6)
+
+            mock_time.time.return_value = 1002
+            p.connect().close()
+            eq_(p.metrics.checkouts_per_second, 2)
+
+            mock_time.time.return_value = 1010
+            eq_(p.metrics.checkouts_per_second, 2)
+
+    def test_overflow_creations(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=2)
+
+        c1 = p.connect()
+        eq_(p.metrics.overflow_creations, 0)
+        c2 = p.connect()
+        c3 = p.connect()
+        eq_(p.metrics.overflow_creations, 2)
+
+        c3.close()
+        c2.close()
+
+        # connection from the pool, no overflow
+        c2 = p.connect()
+        eq_(p.metrics.overflow_creations, 2)
+
+        c2.close()
+        c1.close()
+
+    def test_invalidations(self):
+        p = self._queuepool_fixture()
+
+        c1 = p.connect()
+        c1.invalidate(soft=True)
+        eq_(p.metrics.invalidations, 1)
+        c1.invalidate()
+        eq_(p.metrics.invalidations, 2)
+
+        c1 = p.connect()
+        c1.close()
+        eq_(p.metrics.invalidations, 2)
+
+    @testing.requires.timing_intensive
+    def test_waiters(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=5)
+
+        c1 = p.connect()
+        got = []
+
+        def waiter():
+            got.append(p.connect())
+
+        t = threading.Thread(target=waiter)
+        t.start()
+
+        for i in range(100):
+            if p.metrics.waiters:
+                break
+            time.sleep(0.01)
+        eq_(p.metrics.waiters, 1)
+
+        c1.close()
+        t.join(join_timeout)
+
+        eq_(len(got), 1)
+        eq_(p.metrics.waiters, 0)
+        eq_(p.metrics.checkouts, 2)
+        got[0].close()
+
+    def test_reset(self):
+        p = self._queuepool_fixture()
+
+        p.connect().invalidate()
+        p.connect().close()
+        eq_(p.metrics.checkouts, 2)
+
+        p.metrics.reset()
+        eq_(
+            p.metrics.snapshot(),
+            {
+                "checkouts": 0,
+                "checkouts_per_second": ANY,
+                "wait_time_total": 0,
+                "wait_time_histogram": ANY,
+                "connection_age_histogram": ANY,
+                "overflow_creations": 0,
+                "invalidations": 0,
+                "pre_pings": 0,
+                "pre_ping_failures": 0,
+                "waiters": 0,
+            },
+        )
+        eq_(sum(p.metrics.wait_time_histogram), 0)
+
+    def test_new_metrics_on_recreate(self):
+        p = self._queuepool_fixture()
+        p.connect().close()
+
+        p2 = p.recreate()
+        eq_(p2.metrics.checkouts, 0)
+        is_not_(p2.metrics, p.metrics)
+
+
 class SingletonThreadPoolTest(PoolTestBase):
     @testing.requires.threading_with_mock
     def test_cleanup(self):
@@ -21,6 +21,7 @@ from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_not_
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing import ne_
@@ -261,6 +262,21 @@ class PrePingMockTest(fixtures.TestBase):
         stale_cursor = stale_connection.cursor()
         assert_raises(MockDisconnect, stale_cursor.execute, "hi")
 
+    def test_pre_ping_failure_metrics(self):
+        pool = self._pool_fixture(pre_ping=True)
+
+        conn = pool.connect()
+        conn.close()
+        eq_(pool.metrics.pre_ping_failures, 0)
+
+        self.dbapi.shutdown("execute")
+        self.dbapi.restart()
+
+        conn = pool.connect()
+        conn.close()
+        eq_(pool.metrics.pre_ping_failures, 1)
+        eq_(pool.metrics.invalidations, 1)
+
     def test_raise_db_is_stopped(self):
         pool = self._pool_fixture(pre_ping=True)
 
@@ -310,6 +326,140 @@ class PrePingMockTest(fixtures.TestBase):
             "foo",
         )
 
+    def test_ping_skipped_within_idle_time(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(pool_size=1, max_overflow=0, pre_ping_idle_time=10),
+        )
+
+        conn = pool.connect()
+        dbapi_conn = conn.connection
+        conn_rec = conn._connection_record
+        conn.close()
+
+        # no ping, as the connection was used recently
+        conn = pool.connect()
+        is_(conn.connection, dbapi_conn)
+        eq_(dbapi_conn.mock_calls, [call.rollback()])
+        conn.close()
+
+        conn_rec.last_used_time -= 20
+
+        # ping, as the connection has been idle
+        conn = pool.connect()
+        is_(conn.connection, dbapi_conn)
+        eq_(
+            dbapi_conn.mock_calls,
+            [call.rollback(), call.rollback(), call.cursor()],
+        )
+        conn.close()
+        eq_(pool.metrics.pre_pings, 1)
+
+    def test_idle_time_pool_invalidation(self):
+        pool = self._pool_fixture(
+            pre_ping=True, pool_kw=dict(pre_ping_idle_time=10)
+        )
+
+        c1 = pool.connect()
+        dbapi_conn = c1.connection
+        c1._connection_record.starttime -= 5
+        c1.close()
+
+        # disconnect detected elsewhere
+        pool._invalidate(None)
+
+        # the recently used connection is recycled regardless
+        c1 = pool.connect()
+        is_not_(c1.connection, dbapi_conn)
+        eq_(dbapi_conn.mock_calls, [call.rollback(), call.close()])
+        c1.close()
+
+    def test_ping_idle_connections(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(
+                pool_size=2, pre_ping_idle_time=10, maintenance_interval=2
+            ),
+        )
+        # run maintenance explicitly rather than in the background
+        pool._start_maintenance = Mock()
+
+        c1 = pool.connect()
+        c2 = pool.connect()
+        dbapi_conn1, dbapi_conn2 = c1.connection, c2.connection
+        c1.close()
+        c2.close()
+
+        # nothing is idle long enough yet
+        pool._maintain()
+        eq_(pool.metrics.pre_pings, 0)
+
+        for rec in list(pool._pool.queue):
+            rec.last_used_time -= 20
+
+        pool._maintain()
+        eq_(pool.metrics.pre_pings, 2)
+        eq_(dbapi_conn1.mock_calls, [call.rollback(), call.cursor()])
+        eq_(dbapi_conn2.mock_calls, [call.rollback(), call.cursor()])
+        eq_(pool.checkedin(), 2)
+
+        # no ping upon checkout
+        c1 = pool.connect()
+        c2 = pool.connect()
+        eq_(pool.metrics.pre_pings, 2)
+        eq_(dbapi_conn1.mock_calls, [call.rollback(), call.cursor()])
+        c1.close()
+        c2.close()
+
+    def test_ping_idle_connections_disconnect(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(
+                pool_size=2, pre_ping_idle_time=10, maintenance_interval=2
+            ),
+        )
+        # run maintenance explicitly rather than in the background
+        pool._start_maintenance = Mock()
+
+        c1 = pool.connect()
+        conn_rec = c1._connection_record
+        dbapi_conn = c1.connection
+        c1.close()
+        conn_rec.last_used_time -= 20
+
+        self.dbapi.shutdown("execute")
+        self.dbapi.restart()
+
+        pool._maintain()
+        eq_(pool.metrics.pre_ping_failures, 1)
+        is_(conn_rec.connection, None)
+        eq_(pool.checkedin(), 1)
+        is_true(pool._invalidate_time >= conn_rec.starttime)
+
+        c1 = pool.connect()
+        is_not_(c1.connection, dbapi_conn)
+        is_(c1._connection_record, conn_rec)
+        c1.close()
+
+    def test_maintenance_thread(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(pre_ping_idle_time=0.1, maintenance_interval=0.02),
+        )
+
+        c1 = pool.connect()
+        c1.close()
+
+        for i in range(200):
+            if pool.metrics.pre_pings:
+                break
+            time.sleep(0.01)
+        is_true(pool.metrics.pre_pings > 0)
+
+        stop = pool._maintenance_stop
+        pool.dispose()
+        is_true(stop.is_set())
+
     @testing.requires.predictable_gc
     def test_pre_ping_weakref_finalizer(self):
         pool = self._pool_fixture(pre_ping=True)
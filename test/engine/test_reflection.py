@@ -1,22 +1,31 @@
+import os
+import shutil
+import tempfile
+import threading
 import unicodedata
 
 import sqlalchemy as sa
 from sqlalchemy import Computed
+from sqlalchemy import create_engine
 from sqlalchemy import DefaultClause
+from sqlalchemy import event
 from sqlalchemy import FetchedValue
 from sqlalchemy import ForeignKey
 from sqlalchemy import Index
 from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
+from sqlalchemy import pool
 from sqlalchemy import schema
 from sqlalchemy import sql
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.engine.reflection import FileReflectionCache
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
+from sqlalchemy.testing import AssertsExecutionResults
 from sqlalchemy.testing import ComparesTables
 from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
@@ -33,8 +42,10 @@ from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing import not_in_
 from sqlalchemy.testing import skip
+from sqlalchemy.testing.assertsql import CountStatements
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
+from sqlalchemy.util import pickle
 from sqlalchemy.util import ue
 
 
@@ -1302,6 +1313,45 @@ class ReflectionTest(fixtures.TestBase, ComparesTables):
                 autoload_with=testing.db,
             )
 
+    @testing.only_on(["sqlite", "postgresql", "oracle", "mssql"])
+    @testing.provide_metadata
+    def test_reflect_all_uses_multi(self):
+        names = ["rt_%s" % name for name in ("a", "b", "c", "d", "e")]
+        for name in names:
+            Table(
+                name,
+                self.metadata,
+                Column("id", sa.Integer, primary_key=True),
+                Column("data", sa.String(20), index=True),
+                Column("a_id", sa.Integer, ForeignKey("rt_a.id")),
+            )
+        self.metadata.create_all()
+
+        # get_indexes() is left out, as some dialects make use of it
+        # when reflecting unique constraints
+        dialect = testing.db.dialect
+        single_tbl_methods = [
+            "get_columns",
+            "get_pk_constraint",
+            "get_foreign_keys",
+        ]
+        with testing.db.connect() as conn:
+            with mock.patch.multiple(
+                dialect,
+                **dict(
+                    (name, mock.Mock(side_effect=AssertionError(name)))
+                    for name in single_tbl_methods
+                )
+            ):
+                m1 = MetaData()
+                m1.reflect(conn, only=names)
+
+        for name in names:
+            self.assert_tables_equal(
+                self.metadata.tables[name], m1.tables[name]
+            )
+            eq_(len(m1.tables[name].indexes), 1)
+
     def test_reflect_all_conn_closing(self):
         m1 = MetaData()
         c = testing.db.connect()
@@ -1464,6 +1514,287 @@ class ReflectionTest(fixtures.TestBase, ComparesTables):
             _drop_views(metadata.bind)
 
 
+class ReflectionCacheTest(
+    fixtures.TestBase, ComparesTables, AssertsExecutionResults
+):
+    __only_on__ = ("sqlite", "postgresql")
+    __backend__ = True
+
+    def _create_tables(self, metadata):
+        Table(
+            "rc_a",
+            metadata,
+            Column("id", sa.Integer, primary_key=True),
+            Column("data", sa.String(20), index=True),
+        )
+        Table(
+            "rc_b",
+            metadata,
+            Column("id", sa.Integer, primary_key=True),
+            Column("a_id", sa.Integer, ForeignKey("rc_a.id")),
+        )
+        metadata.create_all(testing.db)
+
+    @testing.provide_metadata
+    def test_reflect_from_cache(self):
+        self._create_tables(self.metadata)
+
+        reflection_cache = {}
+        eng = testing.db.execution_options(reflection_cache=reflection_cache)
+
+        m1 = MetaData()
+        m1.reflect(eng, only=["rc_a", "rc_b"])
+        eq_(len(reflection_cache), 1)
+        eq_(list(reflection_cache)[0][0:2], (sa.__version__, repr(eng.url)))
+
+        m2 = MetaData()
+        with self.sql_execution_asserter(testing.db) as asserter:
+            m2.reflect(eng, only=["rc_a", "rc_b"])
+
+        # only the schema fingerprint is queried
+        asserter.assert_(CountStatements(1))
+
+        for name in ("rc_a", "rc_b"):
+            self.assert_tables_equal(
+                self.metadata.tables[name], m2.tables[name]
+            )
+        eq_([idx.name for idx in m2.tables["rc_a"].indexes], ["ix_rc_a_data"])
+        eq_(len(m2.tables["rc_b"].foreign_keys), 1)
+
+    @testing.provide_metadata
+    def test_reflect_from_file_cache(self):
+        self._create_tables(self.metadata)
+
+        directory = tempfile.mkdtemp()
+        try:
+            eng = testing.db.execution_options(
+                reflection_cache=FileReflectionCache(directory)
+            )
+            MetaData().reflect(eng, only=["rc_a", "rc_b"])
+
+            eng = testing.db.execution_options(
+                reflection_cache=FileReflectionCache(directory)
+            )
+            m2 = MetaData()
+            with self.sql_execution_asserter(testing.db) as asserter:
+                m2.reflect(eng, only=["rc_a", "rc_b"])
+            asserter.assert_(CountStatements(1))
+
+            for name in ("rc_a", "rc_b"):
+                self.assert_tables_equal(
+                    self.metadata.tables[name], m2.tables[name]
+                )
+        finally:
+            shutil.rmtree(directory)
+
+    @testing.provide_metadata
+    def test_autoload_from_cache(self):
+        self._create_tables(self.metadata)
+
+        eng = testing.db.execution_options(reflection_cache={})
+
+        Table("rc_b", MetaData(), autoload_with=eng)
+
+        m2 = MetaData()
+        with self.sql_execution_asserter(testing.db) as asserter:
+            rc_b = Table("rc_b", m2, autoload_with=eng)
+        asserter.assert_(CountStatements(1))
+
+        self.assert_tables_equal(self.metadata.tables["rc_b"], rc_b)
+        self.assert_tables_equal(
+            self.metadata.tables["rc_a"], m2.tables["rc_a"]
+        )
+
+    @testing.provide_metadata
+    def test_schema_change_reflects_live(self):
+        self._create_tables(self.metadata)
+
+        eng = testing.db.execution_options(reflection_cache={})
+
+        m1 = MetaData()
+        m1.reflect(eng, only=lambda name, meta: name.startswith("rc_"))
+        eq_(set(m1.tables), set(["rc_a", "rc_b"]))
+
+        Table(
+            "rc_c", self.metadata, Column("id", sa.Integer, primary_key=True)
+        ).create(testing.db)
+
+        m2 = MetaData()
+        m2.reflect(eng, only=lambda name, meta: name.startswith("rc_"))
+        eq_(set(m2.tables), set(["rc_a", "rc_b", "rc_c"]))
+
+
+class ParallelReflectionTest(fixtures.TestBase, ComparesTables):
+    __backend__ = True
+
+    names = ["pr_%d" % idx for idx in range(10)]
+
+    def _create_tables(self, metadata, bind):
+        for name in self.names:
+            Table(
+                name,
+                metadata,
+                Column("id", sa.Integer, primary_key=True),
+                Column("data", sa.String(20), index=True),
+                Column("parent_id", sa.Integer, ForeignKey("pr_0.id")),
+            )
+        metadata.create_all(bind)
+
+    def _assert_reflect_parallel(self, bind):
+        m1 = MetaData()
+        m1.reflect(bind, only=self.names)
+
+        m2 = MetaData()
+        m2.reflect(bind, only=self.names, workers=3)
+
+        eq_(list(m2.tables), list(m1.tables))
+        for name in self.names:
+            self.assert_tables_equal(m1.tables[name], m2.tables[name])
+            eq_(
+                [idx.name for idx in m2.tables[name].indexes],
+                [idx.name for idx in m1.tables[name].indexes],
+            )
+
+    @testing.provide_metadata
+    def test_reflect_parallel(self):
+        self._create_tables(self.metadata, testing.db)
+        self._assert_reflect_parallel(testing.db)
+
+    @testing.provide_metadata
+    def test_reflect_parallel_error(self):
+        self._create_tables(self.metadata, testing.db)
+
+        dialect = testing.db.dialect
+        get_check_constraints = dialect.get_check_constraints
+
+        def fail(connection, table_name, schema=None, **kw):
+            if table_name == "pr_7":
+                raise Exception("check constraints for pr_7 failed")
+            return get_check_constraints(connection, table_name, schema, **kw)
+
+        with mock.patch.object(dialect, "get_check_constraints", fail):
+            assert_raises_message(
+                Exception,
+                "check constraints for pr_7 failed",
+                MetaData().reflect,
+                testing.db,
+                only=self.names,
+                workers=3,
+            )
+
+    def _assert_reflect_threads(self, expected, **engine_kw):
+        directory = tempfile.mkdtemp()
+        try:
+            eng = create_engine(
+                "sqlite:///%s" % os.path.join(directory, "parallel.db"),
+                **engine_kw
+            )
+            self._create_tables(MetaData(), eng)
+
+            threads = set()
+
+            @event.listens_for(eng, "before_cursor_execute")
+            def before_cursor_execute(conn, cursor, statement, *arg):
+                threads.add(threading.current_thread())
+
+            self._assert_reflect_parallel(eng)
+
+            eq_(len(threads), expected)
+            eng.dispose()
+        finally:
+            shutil.rmtree(directory)
+
+    @testing.only_on("sqlite")
+    def test_reflect_parallel_uses_threads(self):
+        self._assert_reflect_threads(4)
+
+    @testing.only_on("sqlite")
+    def test_reflect_parallel_limited_by_pool(self):
+        self._assert_reflect_threads(
+            3, poolclass=pool.QueuePool, pool_size=2, max_overflow=1
+        )
+
+    @testing.only_on("sqlite")
+    def test_reflect_parallel_serial_for_pool(self):
+        self._assert_reflect_threads(
+            1, poolclass=pool.QueuePool, pool_size=1, max_overflow=0
+        )
+
+
+class FileReflectionCacheTest(fixtures.TestBase):
+    def setup(self):
+        self.directory = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+    def _key(self, schema=None, fingerprint="abc", version="1.4"):
+        return (version, "sqlite://", schema, fingerprint)
+
+    def test_roundtrip(self):
+        key = self._key()
+        FileReflectionCache(self.directory)[key] = {"x": [1, 2]}
+
+        cache = FileReflectionCache(self.directory)
+        eq_(cache.get(key), {"x": [1, 2]})
+        eq_(cache.get(self._key(schema="other")), None)
+        eq_(cache.get(self._key(version="1.3")), None)
+
+    def test_new_fingerprint_replaces(self):
+        cache = FileReflectionCache(self.directory)
+        cache[self._key(fingerprint="abc")] = {"x": 1}
+        cache[self._key(fingerprint="def")] = {"x": 2}
+
+        eq_(len(os.listdir(self.directory)), 1)
+        eq_(cache.get(self._key(fingerprint="abc")), None)
+        eq_(cache.get(self._key(fingerprint="def")), {"x": 2})
+
+    def test_new_entries_appended(self):
+        cache = FileReflectionCache(self.directory)
+        key = self._key()
+        cache[key] = {"x": 1}
+        cache[key] = {"x": 1, "y": 2}
+        cache[key] = {"x": 1, "y": 2}
+
+        records = []
+        with open(cache._path(key), "rb") as file_:
+            while True:
+                try:
+                    records.append(pickle.load(file_))
+                except EOFError:
+                    break
+        eq_(records, [(key, {"x": 1}), (key, {"y": 2})])
+
+        eq_(FileReflectionCache(self.directory).get(key), {"x": 1, "y": 2})
+
+    def test_appended_entries_for_other_fingerprint_ignored(self):
+        old_key, new_key = self._key(), self._key(fingerprint="def")
+        cache = FileReflectionCache(self.directory)
+        cache[old_key] = {"x": 1}
+
+        # another process replaces the file for a new fingerprint
+        FileReflectionCache(self.directory)[new_key] = {"x": 2}
+
+        cache[old_key] = {"x": 1, "y": 1}
+        eq_(cache.get(new_key), {"x": 2})
+
+    def test_unreadable_file(self):
+        cache = FileReflectionCache(self.directory)
+        key = self._key()
+        cache[key] = {"x": 1}
+        with open(cache._path(key), "wb") as file_:
+            file_.write(b"not a pickle")
+        eq_(cache.get(key, "default"), "default")
+
+    def test_unexpected_contents(self):
+        cache = FileReflectionCache(self.directory)
+        key = self._key()
+        cache[key] = {"x": 1}
+        with open(cache._path(key), "wb") as file_:
+            pickle.dump(5, file_)
+        eq_(cache.get(key, "default"), "default")
+
+
 class CreateDropTest(fixtures.TablesTest):
     __backend__ = True
 
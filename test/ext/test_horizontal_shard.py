@@ -1,12 +1,16 @@
 import datetime
 import os
+import threading
+import time
 
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import delete
 from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
+from sqlalchemy import func
 from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
@@ -15,12 +19,14 @@ from sqlalchemy import sql
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
+from sqlalchemy import text
 from sqlalchemy import update
 from sqlalchemy import util
 from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import create_session
 from sqlalchemy.orm import deferred
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
@@ -28,7 +34,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import SingletonThreadPool
 from sqlalchemy.sql import operators
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import provision
@@ -78,13 +86,16 @@ class ShardTest(object):
         )
 
         for db in (db1, db2, db3, db4):
-            meta.create_all(db)
+            self._create_tables(meta, db)
 
         db1.execute(ids.insert(), nextid=1)
 
         self.setup_session()
         self.setup_mappers()
 
+    def _create_tables(self, metadata, db):
+        metadata.create_all(db)
+
     @classmethod
     def setup_session(cls):
         global create_session
@@ -321,6 +332,264 @@ class ShardTest(object):
         eq_(inspect(newyork_report).identity_token, "north_america")
         eq_(inspect(tokyo_report).identity_token, "asia")
 
+    def test_order_by_across_shards(self):
+        sess = self._fixture_data()
+
+        eq_(
+            [
+                loc.id
+                for loc in sess.query(WeatherLocation)
+                .order_by(WeatherLocation.id.desc())
+                .all()
+            ],
+            [7, 6, 5, 4, 3, 2, 1],
+        )
+        eq_(
+            sess.execute(
+                select(weather_locations.c.id.label("lid")).order_by(
+                    sql.desc("lid")
+                )
+            )
+            .scalars()
+            .all(),
+            [7, 6, 5, 4, 3, 2, 1],
+        )
+        eq_(
+            sess.query(WeatherLocation.continent, WeatherLocation.id)
+            .order_by(WeatherLocation.continent, WeatherLocation.id.desc())
+            .all(),
+            [
+                ("Asia", 1),
+                ("Europe", 5),
+                ("Europe", 4),
+                ("North America", 3),
+                ("North America", 2),
+                ("South America", 7),
+                ("South America", 6),
+            ],
+        )
+
+    def test_limit_offset_across_shards(self):
+        sess = self._fixture_data()
+
+        q = sess.query(WeatherLocation).order_by(WeatherLocation.id)
+        eq_([loc.id for loc in q.limit(3).offset(2)], [3, 4, 5])
+        eq_([loc.id for loc in q.offset(5)], [6, 7])
+        eq_(q.first().id, 1)
+        eq_(
+            sess.execute(
+                select(WeatherLocation.id)
+                .order_by(WeatherLocation.id.desc())
+                .limit(2)
+                .offset(1)
+            ).all(),
+            [(6,), (5,)],
+        )
+
+        # without ORDER BY, any of the rows may be returned
+        eq_(len(sess.query(WeatherLocation).limit(3).all()), 3)
+        eq_(len(sess.query(WeatherLocation).offset(4).all()), 3)
+
+    def test_limit_counts_eagerly_loaded_parents(self):
+        sess = self._fixture_data()
+        newyork = sess.query(WeatherLocation).filter_by(id=2).one()
+        newyork.reports.append(Report(60))
+        sess.commit()
+        sess.close()
+
+        locs = (
+            sess.query(WeatherLocation)
+            .options(joinedload(WeatherLocation.reports))
+            .order_by(WeatherLocation.id)
+            .limit(2)
+            .offset(1)
+            .all()
+        )
+        eq_([loc.id for loc in locs], [2, 3])
+        eq_(sorted(r.temperature for r in locs[0].reports), [60, 75])
+
+    @testing.requires.nullsordering
+    def test_order_by_nulls_across_shards(self):
+        sess = self._fixture_data()
+        london = sess.query(WeatherLocation).filter_by(id=4).one()
+        london.reports.append(Report(None))
+        sess.commit()
+
+        q = sess.query(Report.temperature)
+        eq_(
+            q.order_by(Report.temperature.nullsfirst()).all(),
+            [(None,), (75,), (80,), (85,)],
+        )
+        eq_(
+            q.order_by(Report.temperature.desc().nullslast()).all(),
+            [(85,), (80,), (75,), (None,)],
+        )
+        eq_(
+            q.order_by(Report.temperature.desc().nullsfirst()).limit(2).all(),
+            [(None,), (85,)],
+        )
+
+    def test_order_by_column_not_returned(self):
+        sess = self._fixture_data()
+
+        # "city" is deferred, so isn't among the columns returned
+        q = sess.query(WeatherLocation).order_by(WeatherLocation.city)
+        eq_([loc.id for loc in q.all()], [6, 5, 4, 2, 7, 1, 3])
+        locs = q.limit(2).offset(1).all()
+        eq_([loc.id for loc in locs], [5, 4])
+        assert "city" not in locs[0].__dict__
+
+        result = sess.execute(
+            select(WeatherLocation.id)
+            .order_by(func.lower(WeatherLocation.city).desc())
+            .limit(3)
+        )
+        eq_(list(result.keys()), ["id"])
+        eq_(result.all(), [(3,), (1,), (7,)])
+
+        result = sess.execute(
+            select(WeatherLocation)
+            .order_by(WeatherLocation.continent, "city")
+            .limit(2)
+        )
+        eq_(list(result.keys()), ["WeatherLocation"])
+        eq_([loc.id for loc, in result], [1, 5])
+
+    def test_order_by_not_applied(self):
+        sess = self._fixture_data()
+
+        q = sess.query(WeatherLocation).order_by(text("city"))
+        with expect_warnings("Can't apply the ORDER BY of a statement"):
+            eq_(len(q.all()), 7)
+        with expect_warnings("Can't apply the ORDER BY of a statement"):
+            # the LIMIT is applied to each shard
+            eq_(len(q.limit(1).all()), 4)
+
+    def test_order_by_yield_per(self):
+        sess = self._fixture_data()
+
+        rows = iter(
+            sess.query(WeatherLocation)
+            .order_by(WeatherLocation.id)
+            .yield_per(1)
+        )
+        first = next(rows)
+        eq_(first.id, 1)
+
+        # only the first row of each shard has been loaded
+        eq_(len(sess.identity_map), 4)
+        eq_([loc.id for loc in rows], [2, 3, 4, 5, 6, 7])
+
+    def _capture_location_inserts(self):
+        executed = {}
+
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            if stmt.startswith("INSERT") and "weather_locations" in stmt:
+                executed[id(context)] = (
+                    context,
+                    len(params) if executemany else 1,
+                )
+
+        for db in self._dbs:
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+        return executed
+
+    def _interleaved_locations(self):
+        locations = []
+        for i in range(8):
+            loc = WeatherLocation(["Asia", "Europe"][i % 2], "City %d" % i)
+            loc.id = 100 + i
+            locations.append(loc)
+        return locations
+
+    def _assert_shard_ids(self, sess, expected):
+        for shard_id, ids in expected.items():
+            eq_(
+                {
+                    loc.id
+                    for loc in sess.query(WeatherLocation)
+                    .set_shard(shard_id)
+                    .filter(WeatherLocation.id >= 100)
+                    .all()
+                },
+                ids,
+            )
+
+    def test_flush_batches_by_shard(self):
+        sess = create_session()
+        executed = self._capture_location_inserts()
+
+        sess.add_all(self._interleaved_locations())
+        sess.flush()
+
+        # one executemany() for each shard, rather than a statement
+        # for each change of shard
+        eq_(sorted(count for ctx, count in executed.values()), [4, 4])
+        self._assert_shard_ids(
+            sess,
+            {"asia": {100, 102, 104, 106}, "europe": {101, 103, 105, 107}},
+        )
+
+    def test_bulk_save_objects_by_shard(self):
+        sess = create_session()
+        executed = self._capture_location_inserts()
+
+        locations = self._interleaved_locations()
+        sess.bulk_save_objects(locations, return_defaults=True)
+
+        eq_(sorted(count for ctx, count in executed.values()), [4, 4])
+        eq_(
+            [inspect(loc).key for loc in locations[0:2]],
+            [
+                (WeatherLocation, (100,), "asia"),
+                (WeatherLocation, (101,), "europe"),
+            ],
+        )
+        self._assert_shard_ids(
+            sess,
+            {"asia": {100, 102, 104, 106}, "europe": {101, 103, 105, 107}},
+        )
+
+    def test_bulk_mappings_by_shard(self):
+        sess = create_session()
+        executed = self._capture_location_inserts()
+
+        sess.bulk_insert_mappings(
+            WeatherLocation,
+            [
+                {
+                    "id": 100 + i,
+                    "continent": ["Asia", "Europe"][i % 2],
+                    "city": "City %d" % i,
+                }
+                for i in range(8)
+            ],
+        )
+        eq_(sorted(count for ctx, count in executed.values()), [4, 4])
+
+        sess.bulk_update_mappings(
+            WeatherLocation,
+            [
+                {"id": 100 + i, "continent": "Europe", "city": "Town"}
+                for i in range(1, 8, 2)
+            ],
+        )
+        self._assert_shard_ids(
+            sess,
+            {"asia": {100, 102, 104, 106}, "europe": {101, 103, 105, 107}},
+        )
+        eq_(
+            {
+                loc.city
+                for loc in sess.query(WeatherLocation)
+                .filter(WeatherLocation.id >= 100)
+                .all()
+            },
+            {"City 0", "City 2", "City 4", "City 6", "Town"},
+        )
+
     def test_get_baked_query(self):
         sess = self._fixture_data()
 
@@ -670,6 +939,179 @@ class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
         for i in range(1, 5):
             os.remove("shard%d_%s.db" % (i, provision.FOLLOWER_IDENT))
 
+    def test_limit_pushed_down_to_shards(self):
+        sess = self._fixture_data()
+        executed = []
+
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            executed.append((stmt, params))
+
+        for db in self.dbs:
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+
+        eq_(
+            [
+                loc.id
+                for loc in sess.query(WeatherLocation)
+                .order_by(WeatherLocation.id)
+                .limit(2)
+                .offset(3)
+                .all()
+            ],
+            [4, 5],
+        )
+        # each shard returns its first five rows; SQLite renders OFFSET 0
+        # along with any LIMIT
+        eq_(len(executed), 4)
+        for stmt, params in executed:
+            eq_(params, (5, 0))
+
+
+class ParallelShardTest(DistinctEngineShardTest):
+    """Run the statements against all shards on worker threads."""
+
+    def _init_dbs(self):
+        self.dbs = [
+            testing_engine(
+                "sqlite:///shard%d_%s.db" % (i, provision.FOLLOWER_IDENT),
+                options=dict(connect_args={"check_same_thread": False}),
+            )
+            for i in range(1, 5)
+        ]
+        self.dbs[0] = testing_engine(
+            "sqlite:///shard1_%s.db" % provision.FOLLOWER_IDENT,
+            options=dict(
+                poolclass=SingletonThreadPool,
+                connect_args={"check_same_thread": False},
+            ),
+        )
+        return self.dbs
+
+    @classmethod
+    def setup_session(cls):
+        super(ParallelShardTest, cls).setup_session()
+        create_session.configure(max_parallelism=4)
+
+    def _wait_for_all_shards(self):
+        cond = threading.Condition()
+        waiting = []
+
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            deadline = time.time() + 5
+            with cond:
+                waiting.append(threading.current_thread())
+                cond.notify_all()
+                while len(waiting) < 4 and time.time() < deadline:
+                    cond.wait(deadline - time.time())
+            assert len(waiting) == 4, "shards weren't run at once"
+
+        for db in self.dbs:
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+        return waiting
+
+    def test_shards_run_concurrently(self):
+        sess = self._fixture_data()
+        threads = self._wait_for_all_shards()
+
+        eq_(
+            {city for city, in sess.query(WeatherLocation.city)},
+            {
+                "Tokyo",
+                "New York",
+                "Toronto",
+                "London",
+                "Dublin",
+                "Brasila",
+                "Quito",
+            },
+        )
+        eq_(len(set(threads)), 4)
+        assert threading.current_thread() in threads
+
+    def test_max_parallelism(self):
+        sess = self._fixture_data()
+        sess.max_parallelism = 2
+
+        mutex = threading.Lock()
+        running = []
+        max_running = [0]
+
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            with mutex:
+                running.append(conn)
+                max_running[0] = max(max_running[0], len(running))
+            time.sleep(0.05)
+
+        def after_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            with mutex:
+                running.remove(conn)
+
+        for db in self.dbs:
+            event.listen(db, "before_cursor_execute", before_cursor_execute)
+            event.listen(db, "after_cursor_execute", after_cursor_execute)
+
+        eq_(len(sess.query(WeatherLocation).all()), 7)
+        assert max_running[0] <= 2
+
+    def test_result_order_follows_shards(self):
+        sess = self._fixture_data()
+        eq_(
+            [
+                inspect(c).identity_token
+                for c in sess.query(WeatherLocation).all()
+            ],
+            [
+                "north_america",
+                "north_america",
+                "asia",
+                "europe",
+                "europe",
+                "south_america",
+                "south_america",
+            ],
+        )
+
+    def test_error_on_one_shard(self):
+        sess = self._fixture_data()
+        with self.dbs[2].connect() as conn:
+            conn.exec_driver_sql("DROP TABLE weather_reports")
+
+        assert_raises_message(
+            exc.OperationalError,
+            "no such table: weather_reports",
+            sess.query(Report).all,
+        )
+        sess.rollback()
+
+        eq_(len(sess.query(WeatherLocation).all()), 7)
+
+    def test_other_orm_execute_handler(self):
+        sess = self._fixture_data()
+        threads = []
+
+        @event.listens_for(sess, "do_orm_execute")
+        def go(orm_context):
+            pass
+
+        @event.listens_for(self.dbs[0], "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            threads.append(threading.current_thread())
+
+        # the handler following that of the ShardedSession is invoked
+        # for each shard, so the shards are queried by the calling thread
+        eq_(len(sess.query(WeatherLocation).all()), 7)
+        eq_(threads, [threading.current_thread()])
+
 
 class AttachedFileShardTest(ShardTest, fixtures.TestBase):
     """Use modern schema conventions along with SQLite ATTACH."""
@@ -738,6 +1180,11 @@ class TableNameConventionShardTest(ShardTest, fixtures.TestBase):
 
         return db1, db2, db3, db4
 
+    def _create_tables(self, metadata, db):
+        # the "schema" here is only a table name prefix, which the
+        # sqlite_master listing can't be rewritten to follow
+        metadata.create_all(db, bulk_checkfirst=False)
+
 
 class MultipleDialectShardTest(ShardTest, fixtures.TestBase):
     __only_on__ = "postgresql"
@@ -0,0 +1,196 @@
+from sqlalchemy import Column
+from sqlalchemy import event
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import text
+from sqlalchemy import update
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.read_replica import ReadReplicaSession
+from sqlalchemy.orm import clear_mappers
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing.engines import testing_engine
+
+
+class ReadReplicaTest(fixtures.TestBase):
+    def setup(self):
+        global User, Address
+
+        self.metadata = MetaData()
+        Base = declarative_base(metadata=self.metadata)
+
+        class User(Base):
+            __tablename__ = "users"
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+            addresses = relationship("Address")
+
+        class Address(Base):
+            __tablename__ = "addresses"
+            id = Column(Integer, primary_key=True)
+            user_id = Column(ForeignKey("users.id"))
+            email = Column(String(50))
+
+        self.primary = testing_engine()
+        self.replica = testing_engine()
+        self.executed = []
+        for name, engine in (
+            ("primary", self.primary),
+            ("replica", self.replica),
+        ):
+            self.metadata.create_all(engine)
+            event.listen(
+                engine, "before_cursor_execute", self._log_execute(name)
+            )
+
+    def teardown(self):
+        clear_mappers()
+        for engine in (self.primary, self.replica):
+            self.metadata.drop_all(engine)
+            engine.dispose()
+
+    def _log_execute(self, name):
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            self.executed.append((name, statement.split()[0]))
+
+        return before_cursor_execute
+
+    def _session(self, **kw):
+        return sessionmaker(
+            class_=ReadReplicaSession,
+            bind=self.primary,
+            replica=self.replica,
+            **kw
+        )()
+
+    def _assert_executed(self, *expected):
+        eq_(self.executed, list(expected))
+        del self.executed[:]
+
+    def test_reads_to_replica(self):
+        sess = self._session()
+        sess.query(User).all()
+        sess.execute(select(User.__table__)).fetchall()
+        sess.query(User).filter(User.id == 5).count()
+
+        self._assert_executed(
+            ("replica", "SELECT"), ("replica", "SELECT"), ("replica", "SELECT")
+        )
+        is_(sess.get_bind(clause=select(User.__table__)), self.replica)
+
+    def test_writes_to_primary(self):
+        sess = self._session()
+        sess.execute(User.__table__.insert(), {"id": 1, "name": "u1"})
+        sess.commit()
+        sess.execute(text("select * from users")).fetchall()
+        self._assert_executed(("primary", "INSERT"), ("primary", "select"))
+
+    def test_for_update_to_primary(self):
+        sess = self._session()
+        sess.execute(select(User.__table__).with_for_update()).fetchall()
+        eq_(self.executed[0][0], "primary")
+        is_(sess.uses_primary, True)
+
+    def test_stick_to_primary_after_flush(self):
+        sess = self._session()
+        sess.query(User).all()
+        is_(sess.uses_primary, False)
+
+        sess.add(User(id=1, name="u1"))
+        u1 = sess.query(User).filter_by(name="u1").one()
+        eq_(u1.addresses, [])
+        is_(sess.uses_primary, True)
+
+        self._assert_executed(
+            ("replica", "SELECT"),
+            ("primary", "INSERT"),
+            ("primary", "SELECT"),
+            ("primary", "SELECT"),
+        )
+
+        sess.commit()
+        is_(sess.uses_primary, False)
+
+        # the next transaction reads from the replica again
+        sess.query(User).all()
+        self._assert_executed(("replica", "SELECT"))
+
+    def test_stick_to_primary_after_dml(self):
+        sess = self._session()
+        sess.execute(update(User.__table__).values(name="x"))
+        sess.query(User).all()
+        self._assert_executed(("primary", "UPDATE"), ("primary", "SELECT"))
+
+        sess.rollback()
+        sess.query(User).all()
+        self._assert_executed(("replica", "SELECT"))
+
+    def test_stick_through_savepoint(self):
+        sess = self._session()
+        sess.begin_nested()
+        sess.add(User(id=1, name="u1"))
+        sess.commit()
+        is_(sess.uses_primary, True)
+
+        sess.close()
+        is_(sess.uses_primary, False)
+
+    def test_autocommit(self):
+        sess = self._session(autocommit=True)
+        sess.execute(User.__table__.insert(), {"id": 1, "name": "u1"})
+        is_(sess.uses_primary, False)
+
+        sess.add(User(id=2, name="u2"))
+        sess.flush()
+        is_(sess.uses_primary, False)
+
+        sess.query(User).all()
+        self._assert_executed(
+            ("primary", "INSERT"), ("primary", "INSERT"), ("replica", "SELECT")
+        )
+
+    def test_execution_option_primary(self):
+        sess = self._session()
+        sess.query(User).execution_options(use_replica=False).all()
+        sess.execute(
+            select(User.__table__), execution_options={"use_replica": False}
+        ).fetchall()
+        sess.execute(
+            select(User.__table__), bind_arguments={"use_replica": False}
+        ).fetchall()
+        self._assert_executed(
+            ("primary", "SELECT"), ("primary", "SELECT"), ("primary", "SELECT")
+        )
+
+        # reads from the primary don't stick
+        is_(sess.uses_primary, False)
+        sess.query(User).all()
+        self._assert_executed(("replica", "SELECT"))
+
+    def test_execution_option_replica(self):
+        sess = self._session()
+        sess.add(User(id=1, name="u1"))
+        sess.flush()
+        del self.executed[:]
+
+        sess.query(User).execution_options(use_replica=True).all()
+        sess.execute(
+            text("select * from users").execution_options(use_replica=True)
+        ).fetchall()
+        sess.query(User).all()
+        self._assert_executed(
+            ("replica", "SELECT"), ("replica", "select"), ("primary", "SELECT")
+        )
+
+    def test_get_bind(self):
+        sess = self._session()
+        is_(sess.get_bind(User), self.primary)
+        is_(sess.get_bind(User, use_replica=True), self.replica)
@@ -3399,6 +3399,173 @@ class ListenerTest(fixtures.ORMTest):
         f1.barlist.remove(None)
         eq_(canary, [(f1, b1), (f1, None), (f1, b2), (f1, None)])
 
+    def _bulk_append_fixture(self):
+        class Foo(object):
+            pass
+
+        class Bar(object):
+            pass
+
+        instrumentation.register_class(Foo)
+        instrumentation.register_class(Bar)
+        attributes.register_attribute(
+            Foo, "barlist", uselist=True, useobject=True
+        )
+        attributes.register_attribute(
+            Foo, "barset", typecallable=set, uselist=True, useobject=True
+        )
+        return Foo, Bar
+
+    def test_bulk_append_list(self):
+        Foo, Bar = self._bulk_append_fixture()
+
+        canary = Mock()
+        event.listen(Foo.barlist, "bulk_append", canary.bulk_append)
+        event.listen(Foo.barlist, "append", canary.append)
+
+        b1, b2, b3 = Bar(), Bar(), Bar()
+        f1 = Foo()
+        f1.barlist.extend([b1, b2])
+        f1.barlist += [b3]
+        eq_(f1.barlist, [b1, b2, b3])
+
+        tok = Foo.barlist.impl._bulk_append_token
+        eq_(
+            canary.mock_calls,
+            [
+                call.bulk_append(f1, [b1, b2], tok),
+                call.append(f1, b1, tok),
+                call.append(f1, b2, tok),
+                call.bulk_append(f1, [b3], tok),
+                call.append(f1, b3, tok),
+            ],
+        )
+        eq_(tok.op, attributes.OP_BULK_APPEND)
+
+    def test_bulk_append_set(self):
+        Foo, Bar = self._bulk_append_fixture()
+
+        canary = Mock()
+        event.listen(Foo.barset, "bulk_append", canary.bulk_append)
+
+        b1, b2, b3 = Bar(), Bar(), Bar()
+        f1 = Foo()
+        f1.barset.add(b1)
+        f1.barset.update([b1, b2, b2])
+        f1.barset |= set([b2, b3])
+        eq_(f1.barset, set([b1, b2, b3]))
+
+        tok = Foo.barset.impl._bulk_append_token
+        eq_(
+            canary.mock_calls,
+            [call.bulk_append(f1, [b2], tok), call.bulk_append(f1, [b3], tok)],
+        )
+
+    def test_bulk_append_modifies_values(self):
+        Foo, Bar = self._bulk_append_fixture()
+
+        b1, b2, b3 = Bar(), Bar(), Bar()
+
+        def bulk_append(target, values, initiator):
+            values[:] = [b3 if value is b2 else value for value in values]
+
+        event.listen(Foo.barlist, "bulk_append", bulk_append)
+
+        f1 = Foo()
+        f1.barlist.extend([b1, b2])
+        eq_(f1.barlist, [b1, b3])
+
+    def test_bulk_append_on_bulk_replace(self):
+        Foo, Bar = self._bulk_append_fixture()
+
+        canary = Mock()
+        event.listen(Foo.barlist, "bulk_append", canary.bulk_append)
+
+        b1, b2, b3 = Bar(), Bar(), Bar()
+        f1 = Foo()
+        f1.barlist.append(b1)
+        f1.barlist = [b1, b2, b3]
+        eq_(f1.barlist, [b1, b2, b3])
+        eq_(
+            canary.mock_calls,
+            [
+                call.bulk_append(
+                    f1, [b2, b3], Foo.barlist.impl._bulk_replace_token
+                )
+            ],
+        )
+
+    def test_bulk_append_listener_raises(self):
+        class Post(object):
+            pass
+
+        class Blog(object):
+            pass
+
+        instrumentation.register_class(Post)
+        instrumentation.register_class(Blog)
+        attributes.register_attribute(
+            Post,
+            "blog",
+            uselist=False,
+            backref="posts",
+            trackparent=True,
+            useobject=True,
+        )
+        attributes.register_attribute(
+            Blog,
+            "posts",
+            uselist=True,
+            backref="blog",
+            trackparent=True,
+            useobject=True,
+        )
+
+        p1, p2, p3 = Post(), Post(), Post()
+
+        def append(target, value, initiator):
+            if value is p2:
+                raise ValueError("no p2")
+
+        event.listen(Blog.posts, "append", append)
+
+        b1 = Blog()
+        assert_raises_message(
+            ValueError, "no p2", b1.posts.extend, [p1, p2, p3]
+        )
+
+        # the backrefs established for the whole list are undone
+        eq_(b1.posts, [])
+        for post in (p1, p2, p3):
+            is_(post.blog, None)
+
+    def test_bulk_append_filters_bulk_replace(self):
+        Foo, Bar = self._bulk_append_fixture()
+
+        b1, b2, b3, b4 = Bar(), Bar(), Bar(), Bar()
+
+        def bulk_append(target, values, initiator):
+            values[:] = [value for value in values if value is not b2]
+
+        event.listen(Foo.barlist, "bulk_append", bulk_append)
+
+        f1 = Foo()
+        f1.barlist.append(b1)
+        f1.barlist = [b2, b1, b3]
+        eq_(f1.barlist, [b1, b3])
+
+        # replacing members one for one keeps them in place
+        event.remove(Foo.barlist, "bulk_append", bulk_append)
+        event.listen(
+            Foo.barlist,
+            "bulk_append",
+            lambda target, values, initiator: values.__setitem__(
+                slice(None), [b4]
+            ),
+        )
+        f1.barlist = [b2, b1]
+        eq_(f1.barlist, [b4, b1])
+
     def test_flag_modified(self):
         canary = Mock()
 
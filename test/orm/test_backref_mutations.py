@@ -371,6 +371,24 @@ class O2MCollectionTest(_fixtures.FixtureTest):
         assert a3.user is None
         eq_(u1.addresses, [a1, a2, a1])
 
+    def test_bulk_append(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        sess = Session()
+        u1 = User(name="jack")
+        sess.add(u1)
+
+        a1 = Address(email_address="1")
+        a2 = Address(email_address="2")
+        a3 = Address(email_address="3")
+        u1.addresses.extend([a1, a2])
+        u1.addresses += [a3]
+
+        eq_(u1.addresses, [a1, a2, a3])
+        for a in (a1, a2, a3):
+            is_(a.user, u1)
+            assert a in sess
+
 
 class O2OScalarBackrefMoveTest(_fixtures.FixtureTest):
     run_inserts = None
@@ -773,6 +791,21 @@ class M2MCollectionMoveTest(_fixtures.FixtureTest):
         assert i2 in k3.items
         assert i1 not in k1.items
 
+    def test_bulk_append(self):
+        Item, Keyword = (self.classes.Item, self.classes.Keyword)
+
+        k1 = Keyword(name="k1")
+        k2 = Keyword(name="k2")
+        i1 = Item(description="i1")
+        i2 = Item(description="i2", keywords=[k2])
+
+        i1.keywords.extend([k1, k2])
+        eq_(k1.items, [i1])
+        eq_(k2.items, [i2, i1])
+
+        k1.items.extend([i2])
+        eq_(i2.keywords, [k2, k1])
+
 
 class M2MScalarMoveTest(_fixtures.FixtureTest):
     run_inserts = None
@@ -964,7 +964,10 @@ class OneToManyManyToOneTest(fixtures.MappedTest):
                 lambda ctx: {"person_id": p.id, "favorite_ball_id": None},
             ),
             # lambda ctx:[{'id': 1L}, {'id': 4L}, {'id': 3L}, {'id': 2L}])
-            CompiledSQL("DELETE FROM ball WHERE ball.id = :id", None),
+            CompiledSQL(
+                "DELETE FROM ball WHERE ball.id IN ([POSTCOMPILE_pk_batch])",
+                None,
+            ),
             CompiledSQL(
                 "DELETE FROM person WHERE person.id = :id",
                 lambda ctx: [{"id": p.id}],
@@ -1145,13 +1148,8 @@ class OneToManyManyToOneTest(fixtures.MappedTest):
                 lambda ctx: [{"id": p.id}],
             ),
             CompiledSQL(
-                "DELETE FROM ball WHERE ball.id = :id",
-                lambda ctx: [
-                    {"id": b.id},
-                    {"id": b2.id},
-                    {"id": b3.id},
-                    {"id": b4.id},
-                ],
+                "DELETE FROM ball WHERE ball.id IN ([POSTCOMPILE_pk_batch])",
+                lambda ctx: {"pk_batch": [b.id, b2.id, b3.id, b4.id]},
             ),
         )
 
@@ -4,6 +4,8 @@ from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy import text
+from sqlalchemy import util
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import attributes
 from sqlalchemy.orm import class_mapper
@@ -12,6 +14,7 @@ from sqlalchemy.orm import create_session
 from sqlalchemy.orm import deferred
 from sqlalchemy.orm import events
 from sqlalchemy.orm import EXT_SKIP
+from sqlalchemy.orm import FlushProfile
 from sqlalchemy.orm import instrumentation
 from sqlalchemy.orm import Mapper
 from sqlalchemy.orm import mapper
@@ -31,6 +34,7 @@ from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.mock import ANY
 from sqlalchemy.testing.mock import call
 from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing.mock import patch
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.util import gc_collect
@@ -1937,6 +1941,203 @@ class SessionEventsTest(_RemoveListeners, _fixtures.FixtureTest):
         sess.rollback()
         assert "name" not in u1.__dict__
 
+    def test_flush_profile(self):
+        users, addresses, orders, items, order_items = (
+            self.tables.users,
+            self.tables.addresses,
+            self.tables.orders,
+            self.tables.items,
+            self.tables.order_items,
+        )
+        User, Address, Order, Item = (
+            self.classes.User,
+            self.classes.Address,
+            self.classes.Order,
+            self.classes.Item,
+        )
+
+        mapper(User, users, properties={"addresses": relationship(Address)})
+        mapper(Address, addresses)
+        mapper(
+            Order,
+            orders,
+            properties={"items": relationship(Item, secondary=order_items)},
+        )
+        item_mapper = mapper(Item, items)
+        user_mapper = class_mapper(User)
+        address_mapper = class_mapper(Address)
+        order_mapper = class_mapper(Order)
+
+        sess = Session()
+        canary = Mock()
+        event.listen(sess, "flush_profile", canary)
+
+        sess.add_all(
+            [
+                User(
+                    id=1,
+                    name="u1",
+                    addresses=[
+                        Address(id=1, email_address="a1"),
+                        Address(id=2, email_address="a2"),
+                    ],
+                ),
+                Order(
+                    id=1,
+                    description="o1",
+                    items=[Item(id=1, description="i1")],
+                ),
+            ]
+        )
+        sess.flush()
+
+        eq_(canary.mock_calls, [call(sess, ANY, ANY)])
+        profile = canary.mock_calls[0][1][2]
+
+        eq_(
+            set(profile.phases),
+            {
+                "dirty_detection",
+                "sort",
+                "relationships",
+                "collect",
+                "execute",
+                "postfetch",
+            },
+        )
+        assert profile.elapsed >= sum(profile.phases.values())
+
+        eq_(profile.statements, 5)
+        eq_(profile.rows, 6)
+        eq_(
+            {
+                table.name: (stats.statements, stats.rows)
+                for table, stats in profile.tables.items()
+                if stats.statements
+            },
+            {
+                "users": (1, 1),
+                "addresses": (1, 2),
+                "orders": (1, 1),
+                "items": (1, 1),
+                "order_items": (1, 1),
+            },
+        )
+        eq_(
+            {
+                mapper: (stats.statements, stats.rows)
+                for mapper, stats in profile.mappers.items()
+            },
+            {
+                user_mapper: (1, 1),
+                address_mapper: (1, 2),
+                # the association row is counted against the
+                # relationship's parent
+                order_mapper: (2, 2),
+                item_mapper: (1, 1),
+            },
+        )
+        assert "execute" in profile.tables[addresses].phases
+        assert "relationships" in profile.mappers[user_mapper].phases
+
+        sess.delete(sess.query(Address).get(2))
+        sess.flush()
+
+        profile = canary.mock_calls[1][1][2]
+        eq_(
+            {
+                table.name: (stats.statements, stats.rows)
+                for table, stats in profile.tables.items()
+                if stats.statements
+            },
+            {"addresses": (1, 1)},
+        )
+
+    def test_flush_profile_not_collected(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        sess = Session()
+        canary = Mock()
+        event.listen(
+            sess,
+            "after_flush",
+            lambda session, flush_context: canary(flush_context.profile),
+        )
+        sess.add(User(name="u1"))
+        sess.flush()
+
+        eq_(canary.mock_calls, [call(None)])
+
+    def test_flush_profile_not_invoked_wo_work(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        sess = Session()
+        canary = Mock()
+        event.listen(sess, "flush_profile", canary)
+
+        u1 = User(name="u1")
+        sess.add(u1)
+        sess.flush()
+        sess.flush()
+
+        # an expunged pending object leaves nothing to do
+        sess.add(User(name="u2"))
+        sess.expunge_all()
+        sess.flush()
+
+        eq_(len(canary.mock_calls), 1)
+
+    def test_flush_profile_dirty_detection(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        u1 = User(name="u1")
+        sess = Session()
+        sess.add(u1)
+        sess.flush()
+        u1.name = "u2"
+
+        clock = [0]
+        canary = Mock()
+        event.listen(sess, "flush_profile", canary)
+        event.listen(sess, "before_flush", lambda *arg: clock.append(1))
+
+        dirty_states = Session._dirty_states
+
+        def _dirty_states(session):
+            clock.append(10)
+            return dirty_states.fget(session)
+
+        with patch.object(
+            Session, "_dirty_states", property(_dirty_states)
+        ), patch.object(util, "perf_counter", lambda: sum(clock)):
+            sess.flush()
+
+        profile = canary.mock_calls[0][1][2]
+
+        # both evaluations of the dirty states are timed; the
+        # before_flush listener is not
+        eq_(profile.phases["dirty_detection"], 20)
+        eq_(profile.elapsed, 21)
+
+    def test_flush_profile_textual_statement(self):
+        users, User = self.tables.users, self.classes.User
+
+        user_mapper = mapper(User, users)
+
+        profile = FlushProfile()
+        with testing.db.connect() as conn:
+            profile._connection(conn, user_mapper).execute(text("select 1"))
+
+        eq_(profile.statements, 1)
+        eq_(profile.mappers[user_mapper].statements, 1)
+        eq_(profile.tables, {})
+
 
 class SessionLifecycleEventsTest(_RemoveListeners, _fixtures.FixtureTest):
     run_inserts = None
@@ -11,10 +11,12 @@ from sqlalchemy.orm import create_session
 from sqlalchemy.orm import instrumentation
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import state
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import ne_
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -613,6 +615,184 @@ class NativeInstrumentationTest(fixtures.ORMTest):
         assert_raises(KeyError, mapper, T, t)
 
 
+class SlotsTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", sa.String(30)),
+            Column("type", sa.String(30)),
+            Column("extra", sa.String(30)),
+        )
+        Table(
+            "addresses",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("user_id", Integer, ForeignKey("users.id")),
+            Column("email", sa.String(30)),
+        )
+
+    def _fixture(self):
+        users, addresses = self.tables.users, self.tables.addresses
+
+        class User(object):
+            __slots__ = (
+                "id",
+                "name",
+                "type",
+                "extra",
+                "addresses",
+                "_sa_instance_state",
+                "__weakref__",
+            )
+
+        class Address(object):
+            __slots__ = (
+                "id",
+                "user_id",
+                "email",
+                "_sa_instance_state",
+                "__weakref__",
+            )
+
+        mapper(
+            User,
+            users,
+            properties={"addresses": relationship(Address, backref="user")},
+        )
+        mapper(Address, addresses)
+        return User, Address
+
+    def test_no_instance_dict(self):
+        User, Address = self._fixture()
+
+        u1 = User()
+        assert not hasattr(u1, "__dict__")
+
+        u1.name = "u1"
+        dict_ = attributes.instance_state(u1).dict
+        assert isinstance(dict_, state._SlotsDict)
+        eq_(dict(dict_), {"name": "u1"})
+        eq_(User.__dict__["name"].__get__(u1, User), "u1")
+
+        # the same dictionary is used for each access, and is located
+        # through the class' own dict getter
+        is_(attributes.instance_state(u1).dict, dict_)
+        is_(instrumentation.manager_of_class(User).dict_getter()(u1), dict_)
+
+    def test_default_dict_getter_unchanged(self):
+        User, Address = self._fixture()
+
+        is_(attributes.instance_dict, instrumentation._default_dict_getter)
+        is_(
+            instrumentation.manager_of_class(User).dict_getter(),
+            instrumentation._slots_dict_getter,
+        )
+
+    def test_backref_not_in_slots(self):
+        User, Address = self._fixture()
+
+        u1, a1 = User(), Address()
+        a1.user = u1
+        eq_(u1.addresses, [a1])
+        assert "user" in attributes.instance_state(a1).dict
+        eq_(attributes.instance_state(a1).dict.overflow, {"user": u1})
+
+    def test_persistence(self):
+        User, Address = self._fixture()
+
+        u1 = User()
+        u1.name = "u1"
+        a1 = Address()
+        a1.email = "a1"
+        u1.addresses.append(a1)
+
+        sess = create_session()
+        sess.add(u1)
+        sess.flush()
+
+        u1.name = "u2"
+        eq_(attributes.get_history(u1, "name"), (["u2"], (), ["u1"]))
+        sess.flush()
+        sess.expunge_all()
+
+        u1 = sess.query(User).one()
+        eq_(u1.name, "u2")
+        eq_([a.email for a in u1.addresses], ["a1"])
+        assert u1.addresses[0].user is u1
+
+        sess.expire(u1, ["name"])
+        assert "name" not in attributes.instance_state(u1).dict
+        eq_(u1.name, "u2")
+
+        sess.delete(u1)
+        sess.flush()
+        eq_(sess.query(User).count(), 0)
+
+    def test_inheritance(self):
+        users = self.tables.users
+
+        class Person(object):
+            __slots__ = (
+                "id",
+                "name",
+                "type",
+                "_sa_instance_state",
+                "__weakref__",
+            )
+
+        class Engineer(Person):
+            __slots__ = ("extra",)
+
+        mapper(
+            Person,
+            users,
+            polymorphic_on=users.c.type,
+            polymorphic_identity="p",
+        )
+        mapper(Engineer, inherits=Person, polymorphic_identity="e")
+
+        e1 = Engineer()
+        e1.name, e1.extra = "e1", "x"
+        eq_(
+            set(instrumentation.manager_of_class(Engineer)._slot_descriptors),
+            {"id", "name", "type", "extra"},
+        )
+
+        sess = create_session()
+        sess.add(e1)
+        sess.flush()
+        sess.expunge_all()
+
+        e1 = sess.query(Person).one()
+        assert isinstance(e1, Engineer)
+        eq_((e1.name, e1.extra), ("e1", "x"))
+
+    def test_state_attr_required(self):
+        class T(object):
+            __slots__ = ("id", "__weakref__")
+
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "the name '_sa_instance_state' must be present in __slots__",
+            instrumentation.register_class,
+            T,
+        )
+
+    def test_weakref_required(self):
+        class T(object):
+            __slots__ = ("id", "_sa_instance_state")
+
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "the name '__weakref__' must be present in __slots__",
+            instrumentation.register_class,
+            T,
+        )
+
+
 class Py3KFunctionInstTest(fixtures.ORMTest):
     __requires__ = ("python3",)
 
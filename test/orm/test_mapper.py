@@ -4,6 +4,7 @@ import logging
 import logging.handlers
 
 import sqlalchemy as sa
+from sqlalchemy import event
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import Integer
@@ -19,6 +20,7 @@ from sqlalchemy.orm import backref
 from sqlalchemy.orm import class_mapper
 from sqlalchemy.orm import column_property
 from sqlalchemy.orm import composite
+from sqlalchemy.orm import configure_incrementally
 from sqlalchemy.orm import configure_mappers
 from sqlalchemy.orm import create_session
 from sqlalchemy.orm import deferred
@@ -36,6 +38,8 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing.assertsql import CompiledSQL
+from sqlalchemy.testing.mock import call
+from sqlalchemy.testing.mock import Mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from test.orm import _fixtures
@@ -1997,6 +2001,150 @@ class MapperTest(_fixtures.FixtureTest, AssertsCompiledSQL):
         mapper(B, users)
 
 
+class IncrementalConfigureTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    def setup(self):
+        super(IncrementalConfigureTest, self).setup()
+        configure_incrementally()
+
+    def teardown(self):
+        configure_incrementally(False)
+        sa.orm.events.MapperEvents._clear()
+        super(IncrementalConfigureTest, self).teardown()
+
+    def test_configures_reachable_only(self):
+        users, addresses, dingalings, orders = (
+            self.tables.users,
+            self.tables.addresses,
+            self.tables.dingalings,
+            self.tables.orders,
+        )
+        User, Address, Dingaling, Order = (
+            self.classes.User,
+            self.classes.Address,
+            self.classes.Dingaling,
+            self.classes.Order,
+        )
+
+        um = mapper(
+            User, users, properties={"addresses": relationship(Address)}
+        )
+        am = mapper(
+            Address,
+            addresses,
+            properties={"dingalings": relationship(Dingaling)},
+        )
+        dm = mapper(Dingaling, dingalings)
+        om = mapper(Order, orders)
+
+        User()
+        is_(um.configured, True)
+        is_(am.configured, True)
+        is_(dm.configured, True)
+        is_(om.configured, False)
+        is_(sa.orm.mapperlib.Mapper._new_mappers, True)
+
+        Order()
+        is_(om.configured, True)
+        is_(sa.orm.mapperlib.Mapper._new_mappers, False)
+
+    def test_backref_from_unreached_mapper(self):
+        users, addresses, orders = (
+            self.tables.users,
+            self.tables.addresses,
+            self.tables.orders,
+        )
+        User, Address, Order = (
+            self.classes.User,
+            self.classes.Address,
+            self.classes.Order,
+        )
+
+        um = mapper(User, users)
+        am = mapper(
+            Address,
+            addresses,
+            properties={"user": relationship(User, backref="addresses")},
+        )
+        om = mapper(Order, orders)
+
+        is_(um.get_property("addresses").mapper, am)
+        is_(am.configured, True)
+        is_(om.configured, False)
+
+    def test_inheritance_hierarchy(self):
+        users, orders = self.tables.users, self.tables.orders
+        User, Order = self.classes.User, self.classes.Order
+
+        class SubUser(User):
+            pass
+
+        um = mapper(User, users)
+        sm = mapper(SubUser, inherits=um)
+        om = mapper(Order, orders)
+
+        SubUser()
+        is_(um.configured, True)
+        is_(sm.configured, True)
+        is_(om.configured, False)
+
+    def test_new_mapper_reconfigures(self):
+        users, addresses = self.tables.users, self.tables.addresses
+        User, Address = self.classes.User, self.classes.Address
+
+        mapper(User, users)
+        User()
+
+        am = mapper(
+            Address,
+            addresses,
+            properties={"user": relationship(User, backref="addresses")},
+        )
+        is_(am.configured, False)
+        User()
+        is_(am.configured, True)
+        assert User.addresses
+
+    def test_configure_mappers_configures_all(self):
+        users, orders = self.tables.users, self.tables.orders
+        User, Order = self.classes.User, self.classes.Order
+
+        um = mapper(User, users)
+        om = mapper(Order, orders)
+
+        configure_mappers()
+        is_(um.configured, True)
+        is_(om.configured, True)
+
+    def test_configure_events_per_step(self):
+        users, orders = self.tables.users, self.tables.orders
+        User, Order = self.classes.User, self.classes.Order
+
+        canary = Mock()
+        event.listen(mapper, "before_configured", canary.before_configured)
+        event.listen(mapper, "after_configured", canary.after_configured)
+        event.listen(mapper, "mapper_configured", canary.mapper_configured)
+
+        um = mapper(User, users)
+        om = mapper(Order, orders)
+
+        User()
+        User()
+        Order()
+        eq_(
+            canary.mock_calls,
+            [
+                call.before_configured(),
+                call.mapper_configured(um, User),
+                call.after_configured(),
+                call.before_configured(),
+                call.mapper_configured(om, Order),
+                call.after_configured(),
+            ],
+        )
+
+
 class DocumentTest(fixtures.TestBase):
     def test_doc_propagate(self):
         metadata = MetaData()
@@ -8,6 +8,7 @@ from sqlalchemy import Integer
 from sqlalchemy import JSON
 from sqlalchemy import literal
 from sqlalchemy import select
+from sqlalchemy import Sequence
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import text
@@ -17,6 +18,7 @@ from sqlalchemy.orm import backref
 from sqlalchemy.orm import create_session
 from sqlalchemy.orm import exc as orm_exc
 from sqlalchemy.orm import mapper
+from sqlalchemy.orm import persistence
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import unitofwork
@@ -133,8 +135,9 @@ class RudimentaryFlushTest(UOWTest):
             testing.db,
             sess.flush,
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                [{"id": a1.id}, {"id": a2.id}],
+                "DELETE FROM addresses WHERE addresses.id "
+                "IN ([POSTCOMPILE_pk_batch])",
+                {"pk_batch": [a1.id, a2.id]},
             ),
             CompiledSQL(
                 "DELETE FROM users WHERE users.id = :id", {"id": u1.id}
@@ -253,8 +256,9 @@ class RudimentaryFlushTest(UOWTest):
             testing.db,
             sess.flush,
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                [{"id": a1.id}, {"id": a2.id}],
+                "DELETE FROM addresses WHERE addresses.id "
+                "IN ([POSTCOMPILE_pk_batch])",
+                {"pk_batch": [a1.id, a2.id]},
             ),
             CompiledSQL(
                 "DELETE FROM users WHERE users.id = :id", {"id": u1.id}
@@ -370,8 +374,9 @@ class RudimentaryFlushTest(UOWTest):
                     lambda ctx: {"param_1": pid},
                 ),
                 CompiledSQL(
-                    "DELETE FROM addresses WHERE addresses.id = :id",
-                    lambda ctx: [{"id": c1id}, {"id": c2id}],
+                    "DELETE FROM addresses WHERE addresses.id "
+                    "IN ([POSTCOMPILE_pk_batch])",
+                    lambda ctx: {"pk_batch": [c1id, c2id]},
                 ),
                 CompiledSQL(
                     "DELETE FROM users WHERE users.id = :id",
@@ -440,8 +445,9 @@ class RudimentaryFlushTest(UOWTest):
                 ),
             ),
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                lambda ctx: [{"id": c1id}, {"id": c2id}],
+                "DELETE FROM addresses WHERE addresses.id "
+                "IN ([POSTCOMPILE_pk_batch])",
+                lambda ctx: {"pk_batch": [c1id, c2id]},
             ),
         )
 
@@ -504,8 +510,9 @@ class RudimentaryFlushTest(UOWTest):
                 ),
             ),
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                lambda ctx: [{"id": c1id}, {"id": c2id}],
+                "DELETE FROM addresses WHERE addresses.id "
+                "IN ([POSTCOMPILE_pk_batch])",
+                lambda ctx: {"pk_batch": [c1id, c2id]},
             ),
         )
 
@@ -770,6 +777,79 @@ class RudimentaryFlushTest(UOWTest):
         self._assert_uow_size(sess, 6)
 
 
+class ActionPlanCacheTest(UOWTest):
+    def setup(self):
+        unitofwork._action_plans.clear()
+
+    def teardown(self):
+        engines.testing_reaper.rollback_all()
+        testing.db.execute(self.tables.nodes.update().values(parent_id=None))
+        super(ActionPlanCacheTest, self).teardown()
+
+    def _flush_counting_plans(self, sess):
+        with patch.object(
+            unitofwork.topological,
+            "find_cycles",
+            Mock(side_effect=unitofwork.topological.find_cycles),
+        ) as find_cycles:
+            sess.flush()
+        return find_cycles.call_count
+
+    def test_plan_reused(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        mapper(User, users, properties={"addresses": relationship(Address)})
+        mapper(Address, addresses)
+        sess = create_session()
+
+        sess.add(User(name="u1", addresses=[Address(email_address="a1")]))
+        eq_(self._flush_counting_plans(sess), 1)
+
+        sess.add(User(name="u2", addresses=[Address(email_address="a2")]))
+        eq_(self._flush_counting_plans(sess), 0)
+
+        # a different set of operations is a different plan
+        sess.delete(sess.query(Address).filter_by(email_address="a1").one())
+        eq_(self._flush_counting_plans(sess), 1)
+
+        sess.expunge_all()
+        eq_(
+            [
+                (u.name, [a.email_address for a in u.addresses])
+                for u in sess.query(User).order_by(User.name)
+            ],
+            [("u1", []), ("u2", ["a2"])],
+        )
+
+    def test_plan_reused_w_cycles(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        mapper(Node, nodes, properties={"children": relationship(Node)})
+        sess = create_session()
+
+        n1 = Node(data="n1", children=[Node(data="n2")])
+        sess.add(n1)
+        eq_(self._flush_counting_plans(sess), 1)
+
+        n3 = Node(data="n3", children=[Node(data="n4")])
+        sess.add(n3)
+        eq_(self._flush_counting_plans(sess), 0)
+
+        sess.expunge_all()
+        eq_(
+            sorted(
+                (n.data, [c.data for c in n.children])
+                for n in sess.query(Node)
+            ),
+            [("n1", ["n2"]), ("n2", []), ("n3", ["n4"]), ("n4", [])],
+        )
+
+
 class SingleCycleTest(UOWTest):
     def teardown(self):
         engines.testing_reaper.rollback_all()
@@ -846,8 +926,8 @@ class SingleCycleTest(UOWTest):
             testing.db,
             sess.flush,
             CompiledSQL(
-                "DELETE FROM nodes WHERE nodes.id = :id",
-                lambda ctx: [{"id": n2.id}, {"id": n3.id}],
+                "DELETE FROM nodes WHERE nodes.id IN ([POSTCOMPILE_pk_batch])",
+                lambda ctx: {"pk_batch": [n2.id, n3.id]},
             ),
             CompiledSQL(
                 "DELETE FROM nodes WHERE nodes.id = :id",
@@ -962,8 +1042,8 @@ class SingleCycleTest(UOWTest):
             testing.db,
             sess.flush,
             CompiledSQL(
-                "DELETE FROM nodes WHERE nodes.id = :id",
-                lambda ctx: [{"id": n2.id}, {"id": n3.id}],
+                "DELETE FROM nodes WHERE nodes.id IN ([POSTCOMPILE_pk_batch])",
+                lambda ctx: {"pk_batch": [n2.id, n3.id]},
             ),
             CompiledSQL(
                 "DELETE FROM nodes WHERE nodes.id = :id",
@@ -1231,8 +1311,9 @@ class SingleCycleTest(UOWTest):
                 ),
                 AllOf(
                     CompiledSQL(
-                        "DELETE FROM nodes WHERE nodes.id = :id",
-                        lambda ctx: [{"id": c1id}, {"id": c2id}],
+                        "DELETE FROM nodes WHERE nodes.id "
+                        "IN ([POSTCOMPILE_pk_batch])",
+                        lambda ctx: {"pk_batch": [c1id, c2id]},
                     ),
                     CompiledSQL(
                         "DELETE FROM nodes WHERE nodes.id = :id",
@@ -1452,12 +1533,13 @@ class SingleCycleM2MTest(
                 ],
             ),
             CompiledSQL(
-                "DELETE FROM nodes WHERE nodes.id = :id",
-                lambda ctx: [{"id": n4.id}, {"id": n5.id}],
+                "DELETE FROM nodes WHERE nodes.id IN ([POSTCOMPILE_pk_batch])",
+                # batched primary keys are in primary key order
+                lambda ctx: {"pk_batch": sorted([n4.id, n5.id])},
             ),
             CompiledSQL(
-                "DELETE FROM nodes WHERE nodes.id = :id",
-                lambda ctx: [{"id": n2.id}, {"id": n3.id}],
+                "DELETE FROM nodes WHERE nodes.id IN ([POSTCOMPILE_pk_batch])",
+                lambda ctx: {"pk_batch": [n2.id, n3.id]},
             ),
         )
 
@@ -1918,7 +2000,8 @@ class BasicStaleChecksTest(fixtures.MappedTest):
                 sess.flush,
             )
 
-    def test_delete_multi_broken_multi_rowcount_doesnt_warn(self):
+    @testing.requires.sane_rowcount
+    def test_delete_multi_broken_multi_rowcount_batched_still_warns(self):
         Parent, Child = self._fixture()
         sess = Session()
         p1 = Parent(id=1, data=2, child=None)
@@ -1930,15 +2013,17 @@ class BasicStaleChecksTest(fixtures.MappedTest):
         sess.delete(p1)
         sess.delete(p2)
 
-        # if the dialect reports supports_sane_multi_rowcount as false,
-        # if there were more than one row deleted, need to ensure the
-        # rowcount result is ignored.  psycopg2 + batch mode reports the
-        # wrong number, not -1. see issue #4661
+        # the rows are deleted with a single "IN" statement, so the
+        # rowcount is checked even without supports_sane_multi_rowcount
         with patch.object(
             config.db.dialect, "supports_sane_multi_rowcount", False
         ):
-            # no warning
-            sess.flush()
+            assert_raises_message(
+                exc.SAWarning,
+                r"DELETE statement on table 'parent' expected to "
+                r"delete 2 row\(s\); 0 were matched.",
+                sess.flush,
+            )
 
     def test_delete_multi_missing_allow(self):
         Parent, Child = self._fixture(confirm_deleted_rows=False)
@@ -2047,6 +2132,445 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
         )
 
 
+class BatchDeletesTest(fixtures.MappedTest, testing.AssertsExecutionResults):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+        Table(
+            "t_composite",
+            metadata,
+            Column("a", Integer, primary_key=True),
+            Column("b", String(10), primary_key=True),
+            Column("data", String(50)),
+        )
+        Table(
+            "t_versioned",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("version_id", Integer, nullable=False),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Basic):
+            pass
+
+        class TComposite(cls.Basic):
+            pass
+
+        class TVersioned(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.T, cls.tables.t)
+        mapper(cls.classes.TComposite, cls.tables.t_composite)
+        mapper(
+            cls.classes.TVersioned,
+            cls.tables.t_versioned,
+            version_id_col=cls.tables.t_versioned.c.version_id,
+        )
+
+    def _persist(self, objects):
+        sess = Session()
+        sess.add_all(objects)
+        sess.flush()
+        for obj in objects:
+            sess.delete(obj)
+        return sess
+
+    def test_delete_batched(self):
+        T = self.classes.T
+        sess = self._persist([T(id=i, data="d%d" % i) for i in range(1, 5)])
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "DELETE FROM t WHERE t.id IN ([POSTCOMPILE_pk_batch])",
+                [{"pk_batch": [1, 2, 3, 4]}],
+            ),
+        )
+        eq_(sess.query(T).count(), 0)
+
+    def test_delete_batched_pk_order(self):
+        T = self.classes.T
+        sess = self._persist(
+            [T(id=i, data="d%d" % i) for i in (3, 1, 4, 2)][::-1]
+        )
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "DELETE FROM t WHERE t.id IN ([POSTCOMPILE_pk_batch])",
+                [{"pk_batch": [1, 2, 3, 4]}],
+            ),
+        )
+
+    def test_delete_single_not_batched(self):
+        T = self.classes.T
+        sess = self._persist([T(id=1, data="d1")])
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL("DELETE FROM t WHERE t.id = :id", [{"id": 1}]),
+        )
+
+    def test_delete_batched_chunks(self):
+        T = self.classes.T
+        sess = self._persist([T(id=i, data="d%d" % i) for i in range(1, 6)])
+
+        with patch.object(persistence, "_DELETE_BATCH_SIZE", 2):
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                CompiledSQL(
+                    "DELETE FROM t WHERE t.id IN ([POSTCOMPILE_pk_batch])",
+                    [{"pk_batch": [1, 2]}],
+                ),
+                CompiledSQL(
+                    "DELETE FROM t WHERE t.id IN ([POSTCOMPILE_pk_batch])",
+                    [{"pk_batch": [3, 4]}],
+                ),
+                CompiledSQL(
+                    "DELETE FROM t WHERE t.id IN ([POSTCOMPILE_pk_batch])",
+                    [{"pk_batch": [5]}],
+                ),
+            )
+        eq_(sess.query(T).count(), 0)
+
+    @testing.requires.tuple_in
+    def test_delete_batched_composite(self):
+        TComposite = self.classes.TComposite
+        sess = self._persist(
+            [TComposite(a=i, b="b%d" % i, data="d") for i in range(1, 4)]
+        )
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "DELETE FROM t_composite WHERE (t_composite.a, t_composite.b) "
+                "IN ([POSTCOMPILE_pk_batch])",
+                [{"pk_batch": [(1, "b1"), (2, "b2"), (3, "b3")]}],
+            ),
+        )
+        eq_(sess.query(TComposite).count(), 0)
+
+    def test_delete_composite_no_tuple_in(self):
+        TComposite = self.classes.TComposite
+        sess = self._persist(
+            [TComposite(a=i, b="b%d" % i, data="d") for i in range(1, 3)]
+        )
+
+        with patch.object(testing.db.dialect, "supports_tuple_in", False):
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                CompiledSQL(
+                    "DELETE FROM t_composite WHERE t_composite.a = :a "
+                    "AND t_composite.b = :b",
+                    [{"a": 1, "b": "b1"}, {"a": 2, "b": "b2"}],
+                ),
+            )
+        eq_(sess.query(TComposite).count(), 0)
+
+    def test_delete_composite_no_tuple_in_broken_multi_rowcount(self):
+        TComposite = self.classes.TComposite
+        sess = self._persist(
+            [TComposite(a=i, b="b%d" % i, data="d") for i in range(1, 3)]
+        )
+        sess.execute(self.tables.t_composite.delete())
+
+        # if the dialect reports supports_sane_multi_rowcount as false,
+        # if there were more than one row deleted, need to ensure the
+        # rowcount result is ignored.  psycopg2 + batch mode reports the
+        # wrong number, not -1. see issue #4661
+        with patch.object(
+            testing.db.dialect, "supports_tuple_in", False
+        ), patch.object(
+            testing.db.dialect, "supports_sane_multi_rowcount", False
+        ):
+            # no warning
+            sess.flush()
+
+    def test_delete_versioned_not_batched(self):
+        TVersioned = self.classes.TVersioned
+        sess = self._persist([TVersioned(id=1), TVersioned(id=2)])
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            Conditional(
+                testing.db.dialect.supports_sane_multi_rowcount,
+                [
+                    CompiledSQL(
+                        "DELETE FROM t_versioned WHERE t_versioned.id = :id "
+                        "AND t_versioned.version_id = :version_id",
+                        [
+                            {"id": 1, "version_id": 1},
+                            {"id": 2, "version_id": 1},
+                        ],
+                    )
+                ],
+                [
+                    CompiledSQL(
+                        "DELETE FROM t_versioned WHERE t_versioned.id = :id "
+                        "AND t_versioned.version_id = :version_id",
+                        {"id": 1, "version_id": 1},
+                    ),
+                    CompiledSQL(
+                        "DELETE FROM t_versioned WHERE t_versioned.id = :id "
+                        "AND t_versioned.version_id = :version_id",
+                        {"id": 2, "version_id": 1},
+                    ),
+                ],
+            ),
+        )
+
+    @testing.requires.sane_rowcount
+    def test_delete_batched_missing_warning(self):
+        T = self.classes.T
+        sess = self._persist([T(id=i, data="d%d" % i) for i in range(1, 4)])
+        sess.execute(self.tables.t.delete().where(self.tables.t.c.id == 2))
+
+        assert_raises_message(
+            exc.SAWarning,
+            r"DELETE statement on table 't' expected to "
+            r"delete 3 row\(s\); 2 were matched.",
+            sess.flush,
+        )
+
+
+class UpdateFromValuesTest(
+    fixtures.MappedTest, testing.AssertsExecutionResults
+):
+    __requires__ = ("update_from",)
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("x", Integer),
+        )
+        Table(
+            "t_onupdate",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("counter", Integer, onupdate=5),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Basic):
+            pass
+
+        class TOnUpdate(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.T, cls.tables.t, update_from_values=True)
+        mapper(
+            cls.classes.TOnUpdate,
+            cls.tables.t_onupdate,
+            update_from_values=True,
+        )
+
+    def _persist(self, cls, num):
+        sess = Session()
+        objects = [cls(id=i, data="d%d" % i) for i in range(1, num + 1)]
+        sess.add_all(objects)
+        sess.flush()
+        return sess, objects
+
+    def _rows(self, sess, table):
+        return sess.execute(
+            select(table.c.id, table.c.data).order_by(table.c.id)
+        ).fetchall()
+
+    def test_update_from_values(self):
+        T = self.classes.T
+        sess, objects = self._persist(T, 4)
+        for obj in objects:
+            obj.data = "u%d" % obj.id
+            obj.x = obj.id * 10
+
+        self.assert_sql_count(testing.db, sess.flush, 1)
+        eq_(
+            sess.execute(
+                select(self.tables.t).order_by(self.tables.t.c.id)
+            ).fetchall(),
+            [(i, "u%d" % i, i * 10) for i in range(1, 5)],
+        )
+
+    def test_update_from_values_chunks(self):
+        T = self.classes.T
+        sess, objects = self._persist(T, 5)
+        for obj in objects:
+            obj.data = "u%d" % obj.id
+
+        # two parameter keys per row, "data" and the primary key
+        with patch.object(persistence, "_UPDATE_BATCH_SIZE", 4):
+            self.assert_sql_count(testing.db, sess.flush, 3)
+        eq_(
+            self._rows(sess, self.tables.t),
+            [(i, "u%d" % i) for i in range(1, 6)],
+        )
+
+    def test_update_from_values_pk_change(self):
+        T = self.classes.T
+        sess, objects = self._persist(T, 3)
+        for obj in objects:
+            obj.id = obj.id + 10
+            obj.data = "u%d" % obj.id
+
+        self.assert_sql_count(testing.db, sess.flush, 1)
+        eq_(
+            self._rows(sess, self.tables.t),
+            [(11, "u11"), (12, "u12"), (13, "u13")],
+        )
+        eq_(
+            sorted(sess.identity_map),
+            sorted(attributes.instance_state(obj).key for obj in objects),
+        )
+
+    def test_update_single_not_batched(self):
+        T = self.classes.T
+        sess, objects = self._persist(T, 2)
+        objects[0].data = "u1"
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET data=:data WHERE t.id = :t_id",
+                [{"data": "u1", "t_id": 1}],
+            ),
+        )
+
+    def test_update_python_onupdate_not_batched(self):
+        TOnUpdate = self.classes.TOnUpdate
+        sess, objects = self._persist(TOnUpdate, 2)
+        for obj in objects:
+            obj.data = "u%d" % obj.id
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t_onupdate SET data=:data, counter=:counter "
+                "WHERE t_onupdate.id = :t_onupdate_id",
+                [
+                    {"data": "u1", "t_onupdate_id": 1},
+                    {"data": "u2", "t_onupdate_id": 2},
+                ],
+            ),
+        )
+        eq_([obj.counter for obj in objects], [5, 5])
+
+    @testing.requires.sane_rowcount
+    def test_update_from_values_missing_row(self):
+        T = self.classes.T
+        sess, objects = self._persist(T, 3)
+        sess.execute(self.tables.t.delete().where(self.tables.t.c.id == 2))
+        for obj in objects:
+            obj.data = "u%d" % obj.id
+
+        assert_raises_message(
+            orm_exc.StaleDataError,
+            r"UPDATE statement on table 't' expected to "
+            r"update 3 row\(s\); 2 were matched.",
+            sess.flush,
+        )
+
+    def test_bulk_update_mappings(self):
+        T = self.classes.T
+        sess, objects = self._persist(T, 3)
+
+        self.assert_sql_count(
+            testing.db,
+            lambda: sess.bulk_update_mappings(
+                T, [{"id": i, "data": "b%d" % i} for i in range(1, 4)]
+            ),
+            1,
+        )
+        eq_(
+            self._rows(sess, self.tables.t),
+            [(i, "b%d" % i) for i in range(1, 4)],
+        )
+
+
+class SequenceCacheBlockInsertTest(
+    fixtures.MappedTest, testing.AssertsExecutionResults
+):
+    __requires__ = ("sequences",)
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "t",
+            metadata,
+            Column(
+                "id",
+                Integer,
+                Sequence("t_id_seq", cache_block=4),
+                primary_key=True,
+            ),
+            Column("data", String(50)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class T(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.T, cls.tables.t)
+
+    def test_insert_batched(self):
+        T = self.classes.T
+        sess = Session()
+        objects = [T(data="d%d" % i) for i in range(6)]
+        sess.add_all(objects)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "INSERT INTO t (id, data) VALUES (:id, :data)",
+                [{"data": "d%d" % i} for i in range(6)],
+            ),
+        )
+
+        dsb = testing.db.dialect.default_sequence_base
+        eq_([obj.id for obj in objects], [dsb + i for i in range(6)])
+        eq_(
+            sess.execute(
+                select(self.tables.t.c.id, self.tables.t.c.data).order_by(
+                    self.tables.t.c.id
+                )
+            ).fetchall(),
+            [(dsb + i, "d%d" % i) for i in range(6)],
+        )
+
+
 class LoadersUsingCommittedTest(UOWTest):
 
     """Test that events which occur within a flush()
@@ -8,6 +8,7 @@ from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import ne_
 from sqlalchemy.testing.mock import call
 from sqlalchemy.testing.mock import Mock
@@ -196,6 +197,74 @@ class ValidatorTest(_fixtures.FixtureTest):
             [Address(email_address="e3"), Address(email_address="e4")],
         )
 
+    def test_validator_bulk_collection_append(self):
+        users, addresses, Address = (
+            self.tables.users,
+            self.tables.addresses,
+            self.classes.Address,
+        )
+
+        canary = Mock()
+
+        class User(fixtures.ComparableEntity):
+            @validates("addresses")
+            def validate_address(self, key, item):
+                canary(item)
+                assert isinstance(item, str)
+                return Address(email_address=item)
+
+        mapper(User, users, properties={"addresses": relationship(Address)})
+        mapper(Address, addresses)
+
+        u1 = User()
+        u1.addresses.extend(["e1", "e2"])
+        u1.addresses.extend(["e3"])
+        eq_(
+            u1.addresses,
+            [
+                Address(email_address="e1"),
+                Address(email_address="e2"),
+                Address(email_address="e3"),
+            ],
+        )
+        eq_(canary.mock_calls, [call("e1"), call("e2"), call("e3")])
+
+    def test_validator_bulk_collection_append_raises(self):
+        users, addresses, Address = (
+            self.tables.users,
+            self.tables.addresses,
+            self.classes.Address,
+        )
+
+        class User(fixtures.ComparableEntity):
+            @validates("addresses")
+            def validate_address(self, key, item):
+                if item.email_address == "bad":
+                    raise ValueError("bad address")
+                return item
+
+        mapper(
+            User,
+            users,
+            properties={"addresses": relationship(Address, backref="user")},
+        )
+        mapper(Address, addresses)
+
+        u1 = User()
+        a1, a2, a3 = (
+            Address(email_address="e1"),
+            Address(email_address="bad"),
+            Address(email_address="e3"),
+        )
+        assert_raises_message(
+            ValueError, "bad address", u1.addresses.extend, [a1, a2, a3]
+        )
+
+        # the collection is unchanged, as is the other side of the backref
+        eq_(u1.addresses, [])
+        for address in (a1, a2, a3):
+            is_(address.user, None)
+
     def test_validator_bulk_dict_set(self):
         users, addresses, Address = (
             self.tables.users,
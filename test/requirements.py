@@ -456,8 +456,14 @@ class DefaultRequirements(SuiteRequirements):
     def update_from(self):
         """Target must support UPDATE..FROM syntax"""
 
+        def _sqlite_update_from(config):
+            return (
+                against(config, "sqlite")
+                and config.db.dialect.supports_update_from
+            )
+
         return only_on(
-            ["postgresql", "mssql", "mysql"],
+            ["postgresql", "mssql", "mysql", _sqlite_update_from],
             "Backend does not support UPDATE..FROM",
         )
 
@@ -8,24 +8,39 @@ from sqlalchemy import Sequence
 from sqlalchemy import Table
 from sqlalchemy.sql.ddl import SchemaDropper
 from sqlalchemy.sql.ddl import SchemaGenerator
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.mock import Mock
 
 
 class EmitDDLTest(fixtures.TestBase):
-    def _mock_connection(self, item_exists):
+    def _mock_connection(
+        self, item_exists, existing_names=None, case_insensitive=False
+    ):
         def has_item(connection, name, schema):
             return item_exists(name)
 
         def has_index(connection, tablename, idxname, schema):
             return item_exists(idxname)
 
+        def get_names(connection, schema=None):
+            if existing_names is None:
+                raise NotImplementedError()
+            return list(existing_names)
+
         return Mock(
             dialect=Mock(
                 supports_sequences=True,
+                requires_name_normalize=False,
+                _case_insensitive_names=case_insensitive,
                 has_table=Mock(side_effect=has_item),
                 has_sequence=Mock(side_effect=has_item),
                 has_index=Mock(side_effect=has_index),
+                get_table_names=Mock(side_effect=get_names),
+                get_view_names=Mock(return_value=[]),
+                get_temp_table_names=Mock(return_value=[]),
+                get_sequence_names=Mock(side_effect=get_names),
                 supports_comments=True,
                 inline_comments=False,
             ),
@@ -33,9 +48,16 @@ class EmitDDLTest(fixtures.TestBase):
         )
 
     def _mock_create_fixture(
-        self, checkfirst, tables, item_exists=lambda item: False
+        self,
+        checkfirst,
+        tables,
+        item_exists=lambda item: False,
+        existing_names=None,
+        case_insensitive=False,
     ):
-        connection = self._mock_connection(item_exists)
+        connection = self._mock_connection(
+            item_exists, existing_names, case_insensitive
+        )
 
         return SchemaGenerator(
             connection.dialect,
@@ -45,9 +67,13 @@ class EmitDDLTest(fixtures.TestBase):
         )
 
     def _mock_drop_fixture(
-        self, checkfirst, tables, item_exists=lambda item: True
+        self,
+        checkfirst,
+        tables,
+        item_exists=lambda item: True,
+        existing_names=None,
     ):
-        connection = self._mock_connection(item_exists)
+        connection = self._mock_connection(item_exists, existing_names)
 
         return SchemaDropper(
             connection.dialect,
@@ -305,6 +331,147 @@ class EmitDDLTest(fixtures.TestBase):
 
         self._assert_drop_tables([t2, t4], generator, m)
 
+    def test_create_metadata_checkfirst_listing(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_create_fixture(
+            True, None, existing_names=["t1", "t3", "t5"]
+        )
+
+        self._assert_create_tables([t2, t4], generator, m)
+
+        dialect = generator.dialect
+        eq_(dialect.get_table_names.call_count, 1)
+        eq_(dialect.has_table.call_count, 0)
+
+    def test_drop_metadata_checkfirst_listing(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_drop_fixture(
+            True, None, existing_names=["t2", "t4"]
+        )
+
+        self._assert_drop_tables([t2, t4], generator, m)
+
+        dialect = generator.dialect
+        eq_(dialect.get_table_names.call_count, 1)
+        eq_(dialect.has_table.call_count, 0)
+
+    def test_create_metadata_checkfirst_listing_case_insensitive(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_create_fixture(
+            True,
+            None,
+            existing_names=["T1", "T3", "T4", "T5"],
+            case_insensitive=True,
+        )
+
+        self._assert_create_tables([t2], generator, m)
+
+        dialect = generator.dialect
+        eq_(dialect.has_table.call_count, 0)
+
+    def test_create_metadata_checkfirst_listing_case_sensitive(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_create_fixture(
+            True, None, existing_names=["T1", "t3", "T4", "t5"]
+        )
+
+        self._assert_create_tables([t1, t2, t4], generator, m)
+
+    def test_create_metadata_checkfirst_listing_normalized(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        Table("T6", m, Column("x", Integer))
+        generator = self._mock_create_fixture(
+            True, None, existing_names=["t1", "t3", "t5", "t6"]
+        )
+        dialect = generator.dialect
+        dialect.requires_name_normalize = True
+        dialect.denormalize_name = lambda name: (
+            name.upper() if name.lower() == name else name
+        )
+
+        # "t6" is the normalized form of the case insensitive name T6
+        self._assert_create_tables([t2, t4], generator, m)
+        eq_(dialect.has_table.call_count, 0)
+
+    def test_create_metadata_checkfirst_listing_fails(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_create_fixture(
+            True, None, existing_names=["t1"]
+        )
+        generator.dialect.get_table_names.side_effect = Exception("fails")
+
+        # only NotImplementedError falls back to has_table()
+        assert_raises_message(Exception, "fails", generator.traverse_single, m)
+
+    def test_create_metadata_checkfirst_not_implemented(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_create_fixture(
+            True, None, item_exists=lambda t: t not in ("t2", "t4")
+        )
+
+        self._assert_create_tables([t2, t4], generator, m)
+
+        dialect = generator.dialect
+        eq_(dialect.get_table_names.call_count, 1)
+        eq_(dialect.has_table.call_count, 5)
+
+    def test_create_metadata_checkfirst_no_bulk(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        connection = self._mock_connection(
+            lambda t: t not in ("t2", "t4"), ["t1", "t3", "t5"]
+        )
+        generator = SchemaGenerator(
+            connection.dialect,
+            connection,
+            checkfirst=True,
+            bulk_checkfirst=False,
+        )
+
+        self._assert_create_tables([t2, t4], generator, m)
+
+        dialect = generator.dialect
+        eq_(dialect.get_table_names.call_count, 0)
+        eq_(dialect.has_table.call_count, 5)
+
+    def test_create_seq_checkfirst_listing(self):
+        m, t1, t2, s1, s2 = self._table_seq_fixture()
+        s3 = Sequence("s3", metadata=m)
+        generator = self._mock_create_fixture(
+            True, None, existing_names=["t2", "s2"]
+        )
+
+        self._assert_create([t1, s1, s3], generator, m)
+
+        dialect = generator.dialect
+        eq_(dialect.get_sequence_names.call_count, 1)
+        eq_(dialect.has_sequence.call_count, 0)
+
+    def test_drop_shared_seq_checkfirst_listing(self):
+        m = MetaData()
+        s1 = Sequence("s1")
+        t1 = Table("t1", m, Column("x", Integer, s1, primary_key=True))
+        t2 = Table("t2", m, Column("x", Integer, s1, primary_key=True))
+        generator = self._mock_drop_fixture(
+            True, None, existing_names=["t1", "t2", "s1"]
+        )
+
+        # the sequence is dropped along with the first table only
+        self._assert_drop([t1, t2, s1], generator, m)
+
+    def test_create_table_checkfirst_no_listing(self):
+        """a single table create continues to use has_table()"""
+
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_create_fixture(
+            True, None, existing_names=["t1"]
+        )
+
+        self._assert_create_tables([t2], generator, t2)
+
+        dialect = generator.dialect
+        eq_(dialect.get_table_names.call_count, 0)
+        eq_(dialect.has_table.call_count, 1)
+
     def test_create_metadata_nocheck(self):
         m, t1, t2, t3, t4, t5 = self._table_fixture()
         generator = self._mock_create_fixture(
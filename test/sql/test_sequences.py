@@ -1,3 +1,5 @@
+import threading
+
 import sqlalchemy as sa
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
@@ -5,6 +7,8 @@ from sqlalchemy import Sequence
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import util
+from sqlalchemy.dialects import oracle
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects import sqlite
 from sqlalchemy.schema import CreateSequence
 from sqlalchemy.schema import DropSequence
@@ -13,6 +17,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import AllOf
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.assertsql import EachOf
@@ -573,3 +578,254 @@ class SequenceAsServerDefaultTest(
                 {},
             ),
         )
+
+
+class SequenceCacheBlockTest(fixtures.TestBase, testing.AssertsCompiledSQL):
+    __dialect__ = "default"
+
+    def _table(self, **kw):
+        return Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, Sequence("t_seq", **kw), primary_key=True,),
+            Column("data", String(50)),
+            Column("counter", Integer, Sequence("t_counter_seq", **kw)),
+        )
+
+    def test_ddl(self):
+        self.assert_compile(
+            CreateSequence(Sequence("foo_seq", cache_block=50)),
+            "CREATE SEQUENCE foo_seq INCREMENT BY 50 START WITH 1",
+        )
+
+        self.assert_compile(
+            CreateSequence(Sequence("foo_seq", increment=50, cache_block=50)),
+            "CREATE SEQUENCE foo_seq INCREMENT BY 50 START WITH 1",
+        )
+
+    def test_increment_mismatch(self):
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "Sequence increment 10 must be the same as the value "
+            "of cache_block 50",
+            Sequence,
+            "foo_seq",
+            increment=10,
+            cache_block=50,
+        )
+
+    def test_insert_rendered_inline(self):
+        t = self._table()
+
+        self.assert_compile(
+            t.insert().values(data="d1"),
+            "INSERT INTO t (id, data, counter) VALUES "
+            "(nextval('t_seq'), %(data)s, nextval('t_counter_seq')) "
+            "RETURNING t.id",
+            dialect=postgresql.dialect(),
+        )
+
+    def test_insert_prefetched(self):
+        t = self._table(cache_block=10)
+
+        self.assert_compile(
+            t.insert().values(data="d1"),
+            "INSERT INTO t (id, data, counter) VALUES "
+            "(%(id)s, %(data)s, %(counter)s)",
+            dialect=postgresql.dialect(),
+        )
+
+        self.assert_compile(
+            t.insert().values(data="d1"),
+            "INSERT INTO t (id, data, counter) VALUES (:id, :data, :counter)",
+            dialect=oracle.dialect(),
+        )
+
+    def test_insert_optional_not_prefetched(self):
+        t = self._table(cache_block=10, optional=True)
+
+        self.assert_compile(
+            t.insert().values(data="d1"),
+            "INSERT INTO t (data) VALUES (%(data)s) RETURNING t.id",
+            dialect=postgresql.dialect(),
+        )
+
+    def _fire_sequence_fixture(self, fired):
+        def fire_sequence(ctx, seq, type_):
+            fired.append(
+                (
+                    ctx.root_connection.engine.pool,
+                    ctx.execution_options.get("schema_translate_map"),
+                )
+            )
+            return 1 + 10 * (len(fired) - 1)
+
+        return fire_sequence
+
+    def test_block_allocation(self):
+        seq = Sequence("foo_seq", cache_block=10)
+        fired = []
+
+        e1 = engines.testing_engine()
+        e2 = engines.testing_engine()
+        ctx_cls = e1.dialect.execution_ctx_cls
+        with mock.patch.object(
+            ctx_cls,
+            "fire_sequence",
+            self._fire_sequence_fixture(fired),
+            create=True,
+        ):
+            with e1.connect() as conn:
+                eq_([conn.execute(seq) for i in range(15)], list(range(1, 16)))
+            eq_(fired, [(e1.pool, None), (e1.pool, None)])
+
+            # each database reserves its own blocks
+            with e2.connect() as conn:
+                eq_(conn.execute(seq), 21)
+            with e1.connect() as conn:
+                eq_(conn.execute(seq), 16)
+
+            # an engine sharing the pool shares the blocks
+            with e1.execution_options(foo="bar").connect() as conn:
+                eq_(conn.execute(seq), 17)
+            eq_(fired, [(e1.pool, None), (e1.pool, None), (e2.pool, None)])
+
+    def test_block_allocation_shared_dialect(self):
+        seq = Sequence("foo_seq", cache_block=10)
+        fired = []
+
+        e1 = engines.testing_engine()
+        e2 = sa.engine.Engine(
+            e1.pool.recreate(), e1.dialect, e1.url, logging_name="e2"
+        )
+        ctx_cls = e1.dialect.execution_ctx_cls
+        with mock.patch.object(
+            ctx_cls,
+            "fire_sequence",
+            self._fire_sequence_fixture(fired),
+            create=True,
+        ):
+            with e1.connect() as conn:
+                eq_(conn.execute(seq), 1)
+            with e2.connect() as conn:
+                eq_(conn.execute(seq), 11)
+            with e1.connect() as conn:
+                eq_(conn.execute(seq), 2)
+            eq_(fired, [(e1.pool, None), (e2.pool, None)])
+
+    def test_block_allocation_schema_translate(self):
+        seq = Sequence("foo_seq", cache_block=10)
+        fired = []
+
+        e1 = engines.testing_engine()
+        ctx_cls = e1.dialect.execution_ctx_cls
+        with mock.patch.object(
+            ctx_cls,
+            "fire_sequence",
+            self._fire_sequence_fixture(fired),
+            create=True,
+        ):
+            with e1.connect() as conn:
+                eq_(conn.execute(seq), 1)
+
+            s1_map = {None: "s1"}
+            with e1.connect().execution_options(
+                schema_translate_map=s1_map
+            ) as conn:
+                eq_(conn.execute(seq), 11)
+                eq_(conn.execute(seq), 12)
+
+            with e1.connect() as conn:
+                eq_(conn.execute(seq), 2)
+            eq_(fired, [(e1.pool, None), (e1.pool, s1_map)])
+
+    def test_block_allocation_not_serialized(self):
+        seq1 = Sequence("foo_seq", cache_block=10)
+        seq2 = Sequence("bar_seq", cache_block=10)
+        entered = threading.Event()
+        release = threading.Event()
+
+        def fire_sequence(ctx, seq, type_):
+            if seq is seq1:
+                entered.set()
+                release.wait(10)
+            return 1
+
+        e1 = engines.testing_engine()
+        ctx_cls = e1.dialect.execution_ctx_cls
+        results = []
+
+        def go():
+            with e1.connect() as conn:
+                results.append(conn.execute(seq1))
+
+        with mock.patch.object(
+            ctx_cls, "fire_sequence", fire_sequence, create=True
+        ):
+            t = threading.Thread(target=go)
+            t.start()
+            try:
+                assert entered.wait(10)
+
+                # reserving a block from another sequence doesn't wait on
+                # the one in progress
+                with e1.connect() as conn:
+                    eq_(conn.execute(seq2), 1)
+            finally:
+                release.set()
+                t.join(10)
+        eq_(results, [1])
+
+
+class SequenceCacheBlockExecTest(
+    testing.AssertsExecutionResults, fixtures.TablesTest
+):
+    __requires__ = ("sequences",)
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "cache_block_test",
+            metadata,
+            Column(
+                "id",
+                Integer,
+                Sequence("cache_block_seq", cache_block=5),
+                primary_key=True,
+            ),
+            Column("data", String(50)),
+        )
+
+    def test_executemany(self, connection):
+        t = self.tables.cache_block_test
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            connection.execute(
+                t.insert(), [{"data": "d%d" % i} for i in range(12)]
+            )
+
+        asserter.assert_(
+            CompiledSQL(
+                "INSERT INTO cache_block_test (id, data) VALUES (:id, :data)",
+                [{"data": "d%d" % i} for i in range(12)],
+            )
+        )
+
+        dsb = testing.db.dialect.default_sequence_base
+        eq_(
+            connection.execute(
+                select([t.c.id, t.c.data]).order_by(t.c.id)
+            ).fetchall(),
+            [(dsb + i, "d%d" % i) for i in range(12)],
+        )
+
+    def test_inserted_primary_key(self, connection):
+        t = self.tables.cache_block_test
+
+        r1 = connection.execute(t.insert(), {"data": "d1"})
+        r2 = connection.execute(t.insert(), {"data": "d2"})
+
+        dsb = testing.db.dialect.default_sequence_base
+        eq_(r1.inserted_primary_key, (dsb,))
+        eq_(r2.inserted_primary_key, (dsb + 1,))